@@ -0,0 +1,108 @@
+import asyncio
+import time
+import cascade as cs
+from cascade.adapters.executors.local import LocalExecutor
+from cascade.adapters.solvers.native import NativeSolver
+from cascade.adapters.state.in_memory import InMemoryStateBackend
+from cascade.graph.build import build_graph
+from cascade.runtime.bus import MessageBus
+from cascade.runtime.engine import Engine
+from cascade.runtime.resolvers import ArgumentResolver
+
+# --- Task Definitions ---
+
+
+@cs.resource
+def counter_db():
+    yield {"hits": 0}
+
+
+@cs.task
+def source():
+    return 1
+
+
+@cs.task
+def wide(a, b, c, d, e, f=0, g=0, h=0):
+    return a
+
+
+@cs.task
+def wide_injected(a, b, c, d, e, f=0, g=0, h=0, db=cs.inject("counter_db")):
+    return a
+
+
+@cs.task
+def countdown(n: int, step: int = 1, label: str = "loop"):
+    if n <= 0:
+        return cs.Jump(target_key="exit", data="done")
+    return cs.Jump(target_key="loop", data=n - step)
+
+
+@cs.task
+def countdown_injected(n: int, step: int = 1, db=cs.inject("counter_db")):
+    db["hits"] += 1
+    if n <= 0:
+        return cs.Jump(target_key="exit", data="done")
+    return cs.Jump(target_key="loop", data=n - step)
+
+
+def create_loop(task, n: int):
+    step = task(n, step=1)
+    cs.bind(step, cs.select_jump({"loop": step, "exit": None}))
+    return step
+
+
+async def time_resolve(label: str, target, iterations: int) -> None:
+    """Times ArgumentResolver.resolve alone on a node with literals and edges."""
+    graph, instance_map = build_graph(target)
+    state = InMemoryStateBackend("bench")
+    for node in graph.nodes:
+        await state.put_result(node.structural_id, 1)
+    root = instance_map[target._uuid]
+    resources = {"counter_db": {"hits": 0}}
+    resolver = ArgumentResolver()
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        await resolver.resolve(root, graph, state, resources, instance_map)
+    elapsed = time.perf_counter() - start
+    print(f" {label:<34} {elapsed / iterations * 1e6:8.2f} us/resolve")
+
+
+async def time_loop(label: str, task, iterations: int) -> None:
+    """Runs a TCO loop, which re-resolves the same node on every iteration."""
+    engine = Engine(solver=NativeSolver(), executor=LocalExecutor(), bus=MessageBus())
+    engine.register(counter_db)
+
+    start = time.perf_counter()
+    result = await engine.run(create_loop(task, iterations))
+    elapsed = time.perf_counter() - start
+
+    assert result == "done"
+    print(f" {label:<34} {elapsed:8.3f} s ({iterations / elapsed:,.0f} iterations/s)")
+
+
+async def main():
+    resolves, iterations = 50_000, 5_000
+
+    print("--- Cascade Argument Binding Benchmark ---\n")
+    print(f"ArgumentResolver.resolve ({resolves} calls):")
+    await time_resolve(
+        "simple node, 5 edges + 3 literals",
+        wide(source(), source(), source(), 4, 5, f=source(), g=7, h=8),
+        resolves,
+    )
+    await time_resolve(
+        "complex node (inject default)",
+        wide_injected(source(), source(), source(), 4, 5, f=source(), g=7, h=8),
+        resolves,
+    )
+
+    print(f"\nTCO loops ({iterations} iterations):")
+    await time_loop("simple step", countdown, iterations)
+    await time_loop("step with injected resource", countdown_injected, iterations)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
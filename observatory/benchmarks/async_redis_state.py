@@ -0,0 +1,177 @@
+import asyncio
+import time
+import cascade as cs
+from cascade.adapters.executors.local import LocalExecutor
+from cascade.adapters.solvers.native import NativeSolver
+from cascade.adapters.state.redis import AsyncRedisStateBackend, RedisStateBackend
+from cascade.runtime.bus import MessageBus
+from cascade.runtime.engine import Engine
+
+try:
+    import fakeredis
+except ImportError:
+    fakeredis = None
+
+# Simulated network latency of one Redis round-trip
+LATENCY = 0.0005
+
+# --- Task Definitions ---
+
+
+@cs.task
+def leaf(i: int) -> int:
+    return i
+
+
+@cs.task
+def total(*values: int) -> int:
+    return sum(values)
+
+
+@cs.task
+def countdown(n: int):
+    if n <= 0:
+        return cs.Jump(target_key="exit", data="done")
+    return cs.Jump(target_key="loop", data=n - 1)
+
+
+def create_loop(n: int):
+    step = countdown(n)
+    cs.bind(step, cs.select_jump({"loop": step, "exit": None}))
+    return step
+
+
+class SyncLatencyClient:
+    """Wraps a sync Redis client, adding (and counting) latency per round-trip."""
+
+    def __init__(self, client):
+        self._client = client
+        self.round_trips = 0
+
+    def _trip(self):
+        self.round_trips += 1
+        time.sleep(LATENCY)
+
+    def __getattr__(self, name):
+        attr = getattr(self._client, name)
+        if name == "pipeline":
+            return lambda *a, **kw: _SyncPipeline(self, attr(*a, **kw))
+
+        def call(*args, **kwargs):
+            self._trip()
+            return attr(*args, **kwargs)
+
+        return call
+
+
+class _SyncPipeline:
+    def __init__(self, owner, pipe):
+        self._owner = owner
+        self._pipe = pipe
+
+    def __getattr__(self, name):
+        return getattr(self._pipe, name)
+
+    def execute(self):
+        self._owner._trip()
+        return self._pipe.execute()
+
+
+class AsyncLatencyClient:
+    """Wraps an async Redis client, adding (and counting) latency per round-trip."""
+
+    def __init__(self, client):
+        self._client = client
+        self.round_trips = 0
+
+    async def _trip(self):
+        self.round_trips += 1
+        await asyncio.sleep(LATENCY)
+
+    def __getattr__(self, name):
+        attr = getattr(self._client, name)
+        if name == "pipeline":
+            return lambda *a, **kw: _AsyncPipeline(self, attr(*a, **kw))
+
+        async def call(*args, **kwargs):
+            await self._trip()
+            return await attr(*args, **kwargs)
+
+        return call
+
+
+class _AsyncPipeline:
+    def __init__(self, owner, pipe):
+        self._owner = owner
+        self._pipe = pipe
+
+    async def __aenter__(self):
+        await self._pipe.__aenter__()
+        return self
+
+    async def __aexit__(self, *exc):
+        return await self._pipe.__aexit__(*exc)
+
+    def __getattr__(self, name):
+        return getattr(self._pipe, name)
+
+    async def execute(self):
+        await self._owner._trip()
+        return await self._pipe.execute()
+
+
+async def measure(label: str, target, expected, make_client, make_backend) -> None:
+    client = make_client()
+    engine = Engine(
+        solver=NativeSolver(),
+        executor=LocalExecutor(),
+        bus=MessageBus(),
+        state_backend_factory=lambda run_id: make_backend(run_id, client),
+    )
+    start = time.perf_counter()
+    result = await engine.run(target)
+    elapsed = time.perf_counter() - start
+
+    assert result == expected
+    print(f" {label:<26} {client.round_trips:6d} round-trips, {elapsed:7.3f} s")
+
+
+async def main():
+    if fakeredis is None:
+        print("This benchmark needs the 'fakeredis' package.")
+        return
+
+    width, iterations = 500, 500
+    backends = (
+        (
+            "RedisStateBackend",
+            lambda: SyncLatencyClient(fakeredis.FakeRedis()),
+            RedisStateBackend,
+        ),
+        (
+            "AsyncRedisStateBackend",
+            lambda: AsyncLatencyClient(fakeredis.FakeAsyncRedis()),
+            AsyncRedisStateBackend,
+        ),
+    )
+
+    print("--- Cascade Async Redis State Benchmark ---")
+    print(f"Redis stand-in with {LATENCY * 1e3} ms per round-trip\n")
+
+    print(f"Fan-in of {width} tasks:")
+    for label, make_client, make_backend in backends:
+        await measure(
+            label,
+            total(*[leaf(i) for i in range(width)]),
+            sum(range(width)),
+            make_client,
+            make_backend,
+        )
+
+    print(f"\nTCO loop of {iterations} iterations:")
+    for label, make_client, make_backend in backends:
+        await measure(label, create_loop(iterations), "done", make_client, make_backend)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
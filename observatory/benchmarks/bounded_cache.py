@@ -0,0 +1,60 @@
+import asyncio
+import random
+import time
+from cascade.adapters.cache import InMemoryCacheBackend
+
+VALUE = b"x" * 1024
+
+
+def zipf_keys(count: int, universe: int, seed: int = 0):
+    """Keys with a skewed popularity, as a long-lived service sees them."""
+    rng = random.Random(seed)
+    weights = [1 / (rank + 1) for rank in range(universe)]
+    return [f"key-{k}" for k in rng.choices(range(universe), weights, k=count)]
+
+
+async def replay(cache: InMemoryCacheBackend, keys, ttl=None) -> float:
+    start = time.perf_counter()
+    for key in keys:
+        if await cache.get(key) is None:
+            await cache.set(key, VALUE, ttl=ttl)
+    return time.perf_counter() - start
+
+
+async def main():
+    requests, universe, capacity = 200_000, 50_000, 2_000
+    keys = zipf_keys(requests, universe)
+    print("--- Cascade Bounded In-Memory Cache Benchmark ---")
+    print(
+        f"{requests} get-or-set requests over {universe} keys (Zipf), "
+        f"1 KiB values, bound of {capacity} entries\n"
+    )
+
+    for label, cache in (
+        ("Unbounded", InMemoryCacheBackend()),
+        ("LRU", InMemoryCacheBackend(max_entries=capacity)),
+        ("LFU", InMemoryCacheBackend(max_entries=capacity, eviction="lfu")),
+        ("LRU, max_bytes=1 MiB", InMemoryCacheBackend(max_bytes=2**20)),
+    ):
+        elapsed = await replay(cache, keys)
+        stats = cache.stats()
+        hit_rate = stats["hits"] / requests
+        print(
+            f" {label:<22} hit rate {hit_rate:6.1%}  entries {stats['entries']:6d}  "
+            f"evictions {stats['evictions']:7d}  {requests / elapsed / 1e3:7.1f} k req/s"
+        )
+
+    print("\nShort-lived entries (ttl=0.05 s) that are never read again:")
+    for label, interval in (("Lazy expiry only", None), ("Sweeper every 0.1 s", 0.1)):
+        cache = InMemoryCacheBackend(sweep_interval=interval)
+        for i in range(20):
+            for j in range(1_000):
+                await cache.set(f"job-{i}-{j}", VALUE, ttl=0.05)
+            await asyncio.sleep(0.02)
+        await asyncio.sleep(0.2)
+        print(f" {label:<22} entries left {cache.stats()['entries']:6d}")
+        await cache.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,71 @@
+import gc
+import time
+import tracemalloc
+from cascade.graph.model import CompactGraph, Edge, EdgeType, Graph, Node
+
+# --- Graph Shape ---
+# A map-heavy topology: `fan_out` sources, each feeding `width` mapped workers,
+# all of which are gathered by a single reducer.
+
+
+def make_nodes(n_sources: int, width: int):
+    sources = [Node(structural_id=f"src-{i}", name="source") for i in range(n_sources)]
+    workers = [
+        Node(structural_id=f"map-{i}-{j}", name="worker", node_type="map")
+        for i in range(n_sources)
+        for j in range(width)
+    ]
+    reducer = Node(structural_id="reduce", name="reduce")
+    return sources, workers, reducer
+
+
+def populate(graph: Graph, sources, workers, reducer, width: int):
+    for node in sources + workers + [reducer]:
+        graph.add_node(node)
+    for k, worker in enumerate(workers):
+        graph.add_edge(Edge(sources[k // width], worker, "item"))
+        graph.add_edge(Edge(worker, reducer, f"{k}"))
+        graph.add_edge(
+            Edge(sources[k // width], worker, "<sequence>", EdgeType.SEQUENCE)
+        )
+
+
+def measure(graph_cls, sources, workers, reducer, width: int):
+    """Returns (MiB held by the graph, build seconds, in-edge query seconds)."""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    graph = graph_cls()
+    populate(graph, sources, workers, reducer, width)
+    build_time = time.perf_counter() - start
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for worker in workers:
+        graph.get_in_edges(worker.structural_id, EdgeType.DATA)
+    query_time = time.perf_counter() - start
+
+    return size / 2**20, build_time, query_time, len(graph.edges)
+
+
+def main():
+    n_sources, width = 100, 1000
+    sources, workers, reducer = make_nodes(n_sources, width)
+
+    print("--- Cascade Compact Graph Benchmark ---")
+    print(f"Nodes: {len(sources) + len(workers) + 1}\n")
+    print(f"{'graph':<14} {'edges':>8} {'MiB':>8} {'build s':>8} {'query s':>8}")
+    for graph_cls in (Graph, CompactGraph):
+        mib, build_s, query_s, n_edges = measure(
+            graph_cls, sources, workers, reducer, width
+        )
+        print(
+            f"{graph_cls.__name__:<14} {n_edges:>8} {mib:>8.1f} "
+            f"{build_s:>8.2f} {query_s:>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
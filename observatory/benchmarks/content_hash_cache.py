@@ -0,0 +1,70 @@
+import time
+import cascade as cs
+from cascade.adapters.cache import InMemoryCacheBackend
+from cascade.adapters.caching import ContentHashCache
+
+# Simulated work per task
+WORK = 0.005
+
+# --- Task Definitions ---
+
+
+@cs.task(pure=True)
+def load(i: int) -> list:
+    time.sleep(WORK)
+    return list(range(i, i + 1000))
+
+
+@cs.task(pure=True)
+def transform(values: list) -> int:
+    time.sleep(WORK)
+    return sum(values)
+
+
+@cs.task(pure=True)
+def report(*totals: int) -> int:
+    return sum(totals)
+
+
+def create_workflow(width: int, policy=None):
+    totals = []
+    for i in range(width):
+        loaded = load(i)
+        total = transform(loaded)
+        if policy is not None:
+            loaded.with_cache(policy)
+            total.with_cache(policy)
+        totals.append(total)
+    return report(*totals)
+
+
+def timed(width: int, policy=None):
+    start = time.perf_counter()
+    result = cs.run(create_workflow(width, policy), log_level="ERROR")
+    return result, time.perf_counter() - start
+
+
+def main():
+    width, repeats = 50, 3
+    print("--- Cascade Content-Hash Cache Benchmark ---")
+    print(f"{width} load+transform chains ({WORK * 1e3} ms per task), {repeats} runs\n")
+
+    expected = None
+    for label, policy in (
+        ("No cache", None),
+        ("ContentHashCache", ContentHashCache(InMemoryCacheBackend())),
+    ):
+        times = []
+        for _ in range(repeats):
+            result, elapsed = timed(width, policy)
+            assert expected is None or result == expected
+            expected = result
+            times.append(elapsed)
+        runs = "  ".join(f"{t:6.3f} s" for t in times)
+        print(f" {label:<18} {runs}")
+        if policy is not None:
+            print(f" {'':<18} {policy.stats()}")
+
+
+if __name__ == "__main__":
+    main()
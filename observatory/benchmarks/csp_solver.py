@@ -0,0 +1,63 @@
+import random
+import time
+from cascade.adapters.solvers.csp import CSPSolver
+from cascade.graph.model import Edge, Graph, Node
+from cascade.spec.constraint import ResourceConstraint
+
+# --- Graph Shape ---
+# A layered DAG of `width * depth` nodes. Every node depends on `fan_in` random
+# nodes of the previous layer; about a third of them need GPUs and memory.
+
+SYSTEM_RESOURCES = {"gpu": 4, "memory_gb": 48}
+
+
+def make_graph(width: int, depth: int, fan_in: int, seed: int = 0) -> Graph:
+    rng = random.Random(seed)
+    graph = Graph()
+    previous = []
+    for layer in range(depth):
+        current = []
+        for _ in range(width):
+            requirements = {}
+            if rng.random() < 0.3:
+                requirements = {
+                    "gpu": rng.choice([1, 2, 3]),
+                    "memory_gb": rng.choice([8, 16, 24]),
+                }
+            node = Node(
+                structural_id=f"{rng.getrandbits(64):016x}",
+                name=f"L{layer}",
+                constraints=ResourceConstraint(requirements=requirements)
+                if requirements
+                else None,
+            )
+            graph.add_node(node)
+            for source in rng.sample(previous, min(fan_in, len(previous))):
+                graph.add_edge(Edge(source, node, "x"))
+            current.append(node)
+        previous = current
+    return graph
+
+
+def main():
+    shapes = [(10, 10, 2), (15, 15, 2), (25, 20, 3), (50, 20, 3)]
+
+    print("--- Cascade CSP Solver Benchmark ---")
+    print(f"System resources: {SYSTEM_RESOURCES}\n")
+    print(f"{'nodes':>6} {'edges':>6} {'critical':>9} {'stages':>7} {'seconds':>8}")
+    for width, depth, fan_in in shapes:
+        graph = make_graph(width, depth, fan_in)
+        solver = CSPSolver(SYSTEM_RESOURCES)
+
+        start = time.perf_counter()
+        plan = solver.resolve(graph)
+        elapsed = time.perf_counter() - start
+
+        print(
+            f"{len(graph.nodes):>6} {len(graph.edges):>6} {depth:>9}"
+            f" {len(plan):>7} {elapsed:>8.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+import sys
+import time
+import cascade as cs
+from cascade.graph.build import build_graph
+from cascade.graph.compiler import BlueprintBuilder
+
+# --- Task Definitions ---
+
+
+@cs.task(pure=True)
+def step(x):
+    return x + 1
+
+
+@cs.task
+def tick():
+    return None
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    depth = 100_000
+
+    print("--- Cascade Deep Chain Build Benchmark ---")
+    print(f"Chain depth: {depth} (recursion limit: {sys.getrecursionlimit()})\n")
+
+    data_chain, t_chain = timed(cs.pipeline, 0, [step] * depth)
+    print(f" Construct cs.pipeline chain:   {t_chain:8.3f} s")
+
+    (graph, _), t_build = timed(build_graph, data_chain)
+    print(
+        f" build_graph (pipeline):        {t_build:8.3f} s "
+        f"({t_build / depth * 1e6:.1f} us/node, {len(graph.nodes)} nodes)"
+    )
+
+    blueprint, t_compile = timed(BlueprintBuilder().build, data_chain)
+    print(
+        f" BlueprintBuilder (pipeline):   {t_compile:8.3f} s "
+        f"({t_compile / depth * 1e6:.1f} us/node, "
+        f"{len(blueprint.instructions)} instructions)"
+    )
+
+    sequenced = cs.sequence([tick() for _ in range(depth)])
+    (graph, _), t_seq = timed(build_graph, sequenced)
+    print(
+        f" build_graph (sequence):        {t_seq:8.3f} s "
+        f"({t_seq / depth * 1e6:.1f} us/node, {len(graph.edges)} edges)"
+    )
+
+
+if __name__ == "__main__":
+    main()
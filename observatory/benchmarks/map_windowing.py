@@ -0,0 +1,82 @@
+import asyncio
+import time
+import tracemalloc
+import cascade as cs
+from cascade.adapters.executors.local import LocalExecutor
+from cascade.adapters.solvers.native import NativeSolver
+from cascade.runtime.bus import MessageBus
+from cascade.runtime.engine import Engine
+
+# --- Task Definitions ---
+
+
+@cs.task
+async def fetch(i: int) -> bytes:
+    """An I/O-bound element producing a sizeable payload."""
+    await asyncio.sleep(0.001)
+    return bytes(16 * 1024)
+
+
+@cs.task
+def total_size(payloads) -> int:
+    return sum(len(p) for p in payloads)
+
+
+@cs.task
+async def total_size_streamed(payloads) -> int:
+    size = 0
+    async for payload in payloads:
+        size += len(payload)
+    return size
+
+
+async def measure(label: str, target, map_chunk_size: int) -> None:
+    engine = Engine(
+        solver=NativeSolver(),
+        executor=LocalExecutor(),
+        bus=MessageBus(),
+        map_chunk_size=map_chunk_size,
+    )
+    tracemalloc.start()
+    start = time.perf_counter()
+    await engine.run(target)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f" {label:<38} {elapsed:7.3f} s, peak {peak / 2**20:8.1f} MiB")
+
+
+async def main():
+    items, window = 3_000, 32
+
+    print("--- Cascade Map Windowing Benchmark ---")
+    print(f"{items} elements of 16 KiB each, window of {window}\n")
+
+    print("Sub-graph per element (map_chunk_size=0):")
+    await measure("all at once", total_size(fetch.map(i=range(items))), 0)
+    await measure(
+        "with_concurrency",
+        total_size(fetch.map(i=range(items)).with_concurrency(window)),
+        0,
+    )
+    await measure(
+        "with_concurrency + as_stream",
+        total_size_streamed(
+            fetch.map(i=range(items)).with_concurrency(window).as_stream()
+        ),
+        0,
+    )
+
+    print("\nChunked fast path:")
+    await measure("all at once", total_size(fetch.map(i=range(items))), 1024)
+    await measure(
+        "with_concurrency + as_stream",
+        total_size_streamed(
+            fetch.map(i=range(items)).with_concurrency(window).as_stream()
+        ),
+        1024,
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
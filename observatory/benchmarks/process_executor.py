@@ -0,0 +1,61 @@
+import asyncio
+import os
+import time
+import cascade as cs
+from cascade.adapters.executors.local import LocalExecutor
+from cascade.adapters.executors.process import ProcessExecutor
+from cascade.adapters.solvers.native import NativeSolver
+from cascade.runtime.bus import MessageBus
+from cascade.runtime.engine import Engine
+
+# --- Task Definitions ---
+
+
+@cs.task(mode="compute")
+def count_primes(limit: int) -> int:
+    """Pure-Python CPU-bound work: holds the GIL for its whole duration."""
+    count = 0
+    for n in range(2, limit):
+        for d in range(2, int(n**0.5) + 1):
+            if n % d == 0:
+                break
+        else:
+            count += 1
+    return count
+
+
+@cs.task
+def total(counts):
+    return sum(counts)
+
+
+async def timed_run(executor, items: int, limit: int) -> float:
+    engine = Engine(solver=NativeSolver(), executor=executor, bus=MessageBus())
+    start = time.perf_counter()
+    await engine.run(total(count_primes.map(limit=[limit] * items)))
+    return time.perf_counter() - start
+
+
+async def main():
+    items, limit = 32, 60_000
+    workers = os.cpu_count() or 1
+
+    print("--- Cascade Process Executor Benchmark ---")
+    print(f"CPU-bound .map(): {items} x count_primes({limit}), {workers} CPUs\n")
+
+    threads = await timed_run(LocalExecutor(), items, limit)
+    print(f" LocalExecutor (threads):     {threads:8.3f} s")
+
+    executor = ProcessExecutor(max_workers=workers, warm_up=True)
+    try:
+        processes = await timed_run(executor, items, limit)
+    finally:
+        executor.shutdown()
+    print(f" ProcessExecutor ({workers} procs): {processes:8.3f} s")
+    print(f"  {executor.stats()}")
+
+    print(f"\nSpeedup: {threads / processes:.2f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
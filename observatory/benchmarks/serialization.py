@@ -0,0 +1,91 @@
+import pickle
+import time
+from cascade.adapters.serializers import ResultCodec
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def make_payloads():
+    payloads = {
+        "records (10k dicts)": [
+            {"id": i, "name": f"user-{i}", "score": i * 0.5, "tags": ["a", "b"]}
+            for i in range(10_000)
+        ],
+        "text (2 MiB of logs)": "\n".join(
+            f"2024-01-01 12:00:{i % 60:02d} INFO worker-{i % 8} processed item {i}"
+            for i in range(30_000)
+        ),
+    }
+    if np is not None:
+        payloads["float64 array (32 MiB)"] = np.random.default_rng(0).random(
+            4 * 1024 * 1024
+        )
+        payloads["int32 image (16 MiB, sparse)"] = np.zeros(
+            (2048, 2048), dtype=np.int32
+        )
+    return payloads
+
+
+def make_codecs():
+    configs = [
+        ("pickle", None),
+        ("numpy", None),
+        ("msgpack", None),
+        ("pickle", "zlib"),
+        ("pickle", "zstd"),
+        ("pickle", "lz4"),
+        ("numpy", "zstd"),
+    ]
+    codecs = []
+    for serializer, compression in configs:
+        label = serializer + (f"+{compression}" if compression else "")
+        try:
+            codecs.append((label, ResultCodec(serializer, compression=compression)))
+        except ImportError as e:
+            print(f" (skipping {label}: {e})")
+    # Read-only views of the payload instead of writable copies
+    codecs.insert(1, ("pickle (zero-copy)", ResultCodec(zero_copy=True)))
+    return codecs
+
+
+def timed(func, *args, repeat: int = 3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def main():
+    print("--- Cascade Result Serialization Benchmark ---")
+    codecs = make_codecs()
+    print()
+
+    for name, payload in make_payloads().items():
+        print(f"{name}:")
+        data, dump = timed(pickle.dumps, payload)
+        _, load = timed(pickle.loads, data)
+        print(
+            f" {'pickle.dumps (before)':<24} {len(data) / 2**20:8.2f} MiB "
+            f"encode {dump * 1e3:8.2f} ms  decode {load * 1e3:8.2f} ms"
+        )
+        for label, codec in codecs:
+            try:
+                data, encode = timed(codec.encode, payload)
+            except Exception as e:
+                print(f" {label:<24} unsupported ({type(e).__name__})")
+                continue
+            _, decode = timed(codec.decode, data)
+            print(
+                f" {label:<24} {len(data) / 2**20:8.2f} MiB "
+                f"encode {encode * 1e3:8.2f} ms  decode {decode * 1e3:8.2f} ms"
+            )
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+import asyncio
+import resource
+import subprocess
+import sys
+import cascade as cs
+from cascade.adapters.executors.local import LocalExecutor
+from cascade.adapters.solvers.native import NativeSolver
+from cascade.adapters.state import InMemoryStateBackend, SpillingStateBackend
+from cascade.runtime.bus import MessageBus
+from cascade.runtime.engine import Engine
+
+# --- Pipeline Shape ---
+# An ETL-like pipeline: `LANES` independent lanes, each extracting a CHUNK_MB
+# chunk and refining it through `STEPS` steps that each produce a new chunk.
+# Every intermediate chunk stays in the state backend until the run ends.
+LANES = 4
+STEPS = 12
+CHUNK_MB = 16
+
+
+@cs.task
+def extract(i: int) -> bytes:
+    return bytes([i % 256]) * (CHUNK_MB * 1024 * 1024)
+
+
+@cs.task
+def refine(chunk) -> bytes:
+    # Produces a new chunk of the same size from the previous one
+    return bytes(chunk[1:]) + b"!"
+
+
+@cs.task
+def checksum(chunk) -> int:
+    return chunk[0] + chunk[-1] + len(chunk)
+
+
+@cs.task
+def load(*checksums) -> int:
+    return sum(checksums)
+
+
+def make_workflow():
+    checksums = []
+    for lane in range(LANES):
+        chunk = extract(lane)
+        for _ in range(STEPS):
+            chunk = refine(chunk)
+        checksums.append(checksum(chunk))
+    return load(*checksums)
+
+
+def run_pipeline(backend: str) -> None:
+    """Runs the pipeline once and prints the peak RSS of this process, in MiB."""
+    if backend == "spilling":
+        factory = lambda run_id: SpillingStateBackend(  # noqa: E731
+            run_id, threshold_bytes=1024 * 1024
+        )
+    else:
+        factory = InMemoryStateBackend
+
+    engine = Engine(
+        solver=NativeSolver(),
+        executor=LocalExecutor(),
+        bus=MessageBus(),
+        state_backend_factory=factory,
+    )
+    asyncio.run(engine.run(make_workflow()))
+
+    # ru_maxrss is in KiB on Linux
+    print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024)
+
+
+def peak_rss(backend: str) -> float:
+    # Each backend runs in a fresh process: peak RSS can't be reset in-process
+    out = subprocess.run(
+        [sys.executable, __file__, backend],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return float(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    print("--- Cascade Spilling State Backend Benchmark ---")
+    total = LANES * (STEPS + 1) * CHUNK_MB
+    print(
+        f"Pipeline: {LANES} lanes x {STEPS + 1} chunks of {CHUNK_MB} MiB"
+        f" ({total} MiB of intermediate results)\n"
+    )
+
+    in_memory = peak_rss("in_memory")
+    spilling = peak_rss("spilling")
+    print(f" InMemoryStateBackend peak RSS:  {in_memory:8.1f} MiB")
+    print(f" SpillingStateBackend peak RSS:  {spilling:8.1f} MiB")
+    print(f"\nReduction: {in_memory / spilling:.1f}x")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        run_pipeline(sys.argv[1])
+    else:
+        main()
@@ -0,0 +1,115 @@
+import asyncio
+import time
+import cascade as cs
+from cascade.adapters.executors.local import LocalExecutor
+from cascade.adapters.solvers.native import NativeSolver
+from cascade.adapters.state.redis import RedisStateBackend
+from cascade.runtime.bus import MessageBus
+from cascade.runtime.engine import Engine
+
+try:
+    import fakeredis
+except ImportError:
+    fakeredis = None
+
+# Simulated network latency of one Redis round-trip
+LATENCY = 0.0005
+
+# --- Task Definitions ---
+
+
+@cs.task
+def leaf(i: int) -> int:
+    return i
+
+
+@cs.task
+def total(*values: int) -> int:
+    return sum(values)
+
+
+class LatencyClient:
+    """Wraps a Redis client, adding (and counting) one latency per round-trip."""
+
+    def __init__(self, client):
+        self._client = client
+        self.round_trips = 0
+
+    def _trip(self):
+        self.round_trips += 1
+        time.sleep(LATENCY)
+
+    def __getattr__(self, name):
+        attr = getattr(self._client, name)
+        if name == "pipeline":
+            return lambda: _LatencyPipeline(self, attr())
+        if callable(attr):
+
+            def call(*args, **kwargs):
+                self._trip()
+                return attr(*args, **kwargs)
+
+            return call
+        return attr
+
+
+class _LatencyPipeline:
+    def __init__(self, owner, pipe):
+        self._owner = owner
+        self._pipe = pipe
+
+    def __getattr__(self, name):
+        return getattr(self._pipe, name)
+
+    def execute(self):
+        self._owner._trip()
+        return self._pipe.execute()
+
+
+class PerKeyBackend:
+    """Hides a backend's batched operations, forcing per-key calls."""
+
+    def __init__(self, backend):
+        self._backend = backend
+
+    def __getattr__(self, name):
+        if name in ("get_many", "has_many", "put_many"):
+            raise AttributeError(name)
+        return getattr(self._backend, name)
+
+
+async def measure(label: str, width: int, batched: bool) -> None:
+    client = LatencyClient(fakeredis.FakeRedis())
+
+    def factory(run_id):
+        backend = RedisStateBackend(run_id, client)
+        return backend if batched else PerKeyBackend(backend)
+
+    engine = Engine(
+        solver=NativeSolver(),
+        executor=LocalExecutor(),
+        bus=MessageBus(),
+        state_backend_factory=factory,
+    )
+    start = time.perf_counter()
+    result = await engine.run(total(*[leaf(i) for i in range(width)]))
+    elapsed = time.perf_counter() - start
+
+    assert result == sum(range(width))
+    print(f" {label:<22} {client.round_trips:6d} round-trips, {elapsed:7.3f} s")
+
+
+async def main():
+    if fakeredis is None:
+        print("This benchmark needs the 'fakeredis' package.")
+        return
+
+    width = 500
+    print("--- Cascade State Batching Benchmark ---")
+    print(f"fan-in of {width} tasks, RedisStateBackend, {LATENCY * 1e3} ms/trip\n")
+    await measure("per-key operations", width, batched=False)
+    await measure("batched operations", width, batched=True)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
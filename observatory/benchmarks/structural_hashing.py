@@ -0,0 +1,111 @@
+import hashlib
+import time
+from typing import Any, Dict, List
+
+import cascade as cs
+from cascade.graph.build import build_graph
+from cascade.graph.hashing import HASH_ALGORITHMS, HashingService
+from cascade.graph.model import Node
+from cascade.spec.lazy_types import LazyResult, MappedLazyResult
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# --- Task Definitions ---
+
+
+@cs.task(pure=True)
+def load(config):
+    return config
+
+
+@cs.task(pure=True)
+def process(data, params):
+    return data
+
+
+def legacy_components(obj: Any, dep_nodes: Dict[str, Node]) -> List[str]:
+    """The previous repr()/string-concatenation argument encoding, for reference."""
+    if isinstance(obj, (LazyResult, MappedLazyResult)):
+        return [f"LAZY({dep_nodes[obj._uuid].structural_id})"]
+    if isinstance(obj, (list, tuple)):
+        components = ["List["]
+        for item in obj:
+            components.extend(legacy_components(item, dep_nodes))
+        components.append("]")
+        return components
+    if isinstance(obj, dict):
+        components = ["Dict{"]
+        for k in sorted(obj.keys()):
+            components.append(f"{k}:")
+            components.extend(legacy_components(obj[k], dep_nodes))
+        components.append("}")
+        return components
+    return [repr(obj)]
+
+
+def legacy_hash(result: LazyResult, dep_nodes: Dict[str, Node]) -> str:
+    components = [f"Task({result.task.name})", "Args:"]
+    components += legacy_components(result.args, dep_nodes)
+    components += ["Kwargs:"] + legacy_components(result.kwargs, dep_nodes)
+    return hashlib.sha256("|".join(components).encode("utf-8")).hexdigest()
+
+
+def make_workload(n_nodes: int, payload):
+    """Returns (LazyResult, dep_nodes) pairs whose arguments carry `payload`."""
+    upstream = load({"source": "bench"})
+    _, instance_map = build_graph(upstream)
+    dep_nodes = {upstream._uuid: instance_map[upstream._uuid]}
+    return [
+        (process(upstream, {"index": i, "payload": payload}), dep_nodes)
+        for i in range(n_nodes)
+    ]
+
+
+def measure(hash_fn, workload, repeats: int = 3) -> float:
+    """Returns the best per-node hashing time in microseconds."""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for result, dep_nodes in workload:
+            hash_fn(result, dep_nodes)
+        best = min(best, time.perf_counter() - start)
+    return best / len(workload) * 1e6
+
+
+def main():
+    n_nodes = 2000
+    payloads = {
+        "small literals": [1, 2.5, "x", None, True],
+        "10k int list": list(range(10_000)),
+        "nested config": {f"k{i}": {"a": i, "b": [i, str(i)]} for i in range(50)},
+    }
+    if np is not None:
+        payloads["1MB ndarray"] = np.arange(125_000, dtype=np.float64)
+
+    services = {}
+    for algorithm in HASH_ALGORITHMS:
+        try:
+            services[algorithm] = HashingService(algorithm=algorithm)
+        except ImportError:
+            print(f"(skipping {algorithm}: optional dependency not installed)")
+
+    print("--- Cascade Structural Hashing Benchmark ---")
+    print(f"Nodes per workload: {n_nodes}\n")
+    header = f"{'payload':<16} {'legacy':>10}" + "".join(
+        f" {name:>10}" for name in services
+    )
+    print(header + "   (us/node)")
+
+    for label, payload in payloads.items():
+        workload = make_workload(n_nodes, payload)
+        row = f"{label:<16} {measure(legacy_hash, workload):>10.2f}"
+        for service in services.values():
+            row += f" {measure(service.compute_structural_hash, workload):>10.2f}"
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
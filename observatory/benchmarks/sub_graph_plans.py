@@ -0,0 +1,54 @@
+import asyncio
+import time
+import cascade as cs
+from cascade.adapters.executors.local import LocalExecutor
+from cascade.adapters.solvers.csp import CSPSolver
+from cascade.runtime.bus import MessageBus
+from cascade.runtime.engine import Engine
+
+# --- Task Definitions ---
+
+
+@cs.task
+def score(x: int) -> int:
+    return x * x
+
+
+class CountingSolver(CSPSolver):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.calls = 0
+
+    def resolve(self, graph):
+        self.calls += 1
+        return super().resolve(graph)
+
+
+async def main():
+    items = 1_000
+
+    print("--- Cascade Sub-Graph Plan Caching Benchmark ---")
+    print(f"map over {items} elements, one sub-graph per element, CSPSolver\n")
+
+    solver = CountingSolver(system_resources={"gpu": 2})
+    engine = Engine(
+        solver=solver,
+        executor=LocalExecutor(),
+        bus=MessageBus(),
+        system_resources={"gpu": 2},
+        map_chunk_size=0,
+    )
+    mapped = score.map(x=list(range(items))).with_constraints(gpu=1)
+
+    start = time.perf_counter()
+    await engine.run(mapped)
+    elapsed = time.perf_counter() - start
+
+    stats = engine.graph_strategy.plan_cache.stats()
+    print(f" Elapsed:         {elapsed:7.3f} s ({elapsed / items * 1e6:.1f} us/item)")
+    print(f" solver.resolve:  {solver.calls} calls")
+    print(f" Plan cache:      {stats['hits']} hits, {stats['misses']} misses")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
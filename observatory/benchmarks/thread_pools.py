@@ -0,0 +1,67 @@
+import asyncio
+import threading
+import time
+import cascade as cs
+from cascade.adapters.executors.local import LocalExecutor
+from cascade.adapters.solvers.native import NativeSolver
+from cascade.runtime.bus import MessageBus
+from cascade.runtime.engine import Engine
+from cascade.runtime.events import ThreadPoolGauge
+
+peak_threads = 0
+
+
+@cs.task(mode="io-heavy")
+def fetch(i: int) -> int:
+    """A blocking call, e.g. an HTTP request."""
+    global peak_threads
+    peak_threads = max(peak_threads, threading.active_count())
+    time.sleep(0.01)
+    return i
+
+
+async def timed_runs(make_executor, engines: int, bus: MessageBus) -> float:
+    """Runs many small workflows concurrently, as nested subflows would."""
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(
+            Engine(solver=NativeSolver(), executor=make_executor(), bus=bus).run(
+                fetch(i)
+            )
+            for i in range(engines)
+        )
+    )
+    return time.perf_counter() - start
+
+
+async def main():
+    global peak_threads
+    engines, workers = 200, 16
+
+    print("--- Cascade Thread Pools Benchmark ---")
+    print(f"{engines} concurrent engines, one blocking 10 ms task each\n")
+
+    peak_threads = 0
+    per_engine = await timed_runs(LocalExecutor, engines, MessageBus())
+    print(f" New LocalExecutor per engine: {per_engine:7.3f} s, {peak_threads} threads")
+
+    bus = MessageBus()
+    max_queued = 0
+
+    def on_gauge(event: ThreadPoolGauge):
+        nonlocal max_queued
+        max_queued = max(max_queued, event.queued)
+
+    bus.subscribe(ThreadPoolGauge, on_gauge)
+    shared = LocalExecutor(max_workers={"io-heavy": workers})
+    peak_threads = 0
+    shared_time = await timed_runs(lambda: shared, engines, bus)
+    print(
+        f" Shared pools ({workers} workers):  {shared_time:7.3f} s, "
+        f"{peak_threads} threads, max queue depth {max_queued}"
+    )
+    print(f"  {shared.pools.stats()}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
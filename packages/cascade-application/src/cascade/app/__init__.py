@@ -53,6 +53,10 @@ def _create_state_backend_factory(
                 return RedisStateBackend(run_id=run_id, client=client)
 
             return factory
+        elif backend_spec.startswith("sqlite:///"):
+            from cascade.adapters.state.sqlite import SqliteStateBackend
+
+            return SqliteStateBackend.factory(backend_spec[len("sqlite:///") :])
         else:
             raise ValueError(f"Unsupported state backend URI scheme: {backend_spec}")
 
@@ -1,27 +1,262 @@
-from typing import Any, Dict, Optional
+import asyncio
+import heapq
+import pickle
+import sys
+import threading
 import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+# Listeners receive a snapshot of the cache's counters (see `stats`)
+StatsListener = Callable[[Dict[str, int]], None]
 
-class InMemoryCacheBackend:
+EVICTION_POLICIES = ("lru", "lfu")
+
+
+def estimate_size(value: Any) -> int:
     """
-    A simple in-memory implementation of the CacheBackend protocol.
+    Estimates the memory held by a cached value: the size of its buffer for
+    bytes-like objects (e.g. NumPy arrays), or of its pickle otherwise.
     """
+    try:
+        return memoryview(value).nbytes
+    except (TypeError, ValueError, BufferError):
+        pass
+    try:
+        return len(pickle.dumps(value, protocol=5))
+    except Exception:
+        return sys.getsizeof(value)
+
+
+class _LruOrder:
+    """Evicts the least recently used key."""
 
     def __init__(self):
+        self._keys: "OrderedDict[str, None]" = OrderedDict()
+
+    def add(self, key: str) -> None:
+        self._keys[key] = None
+        self._keys.move_to_end(key)
+
+    def touch(self, key: str) -> None:
+        self._keys.move_to_end(key)
+
+    def remove(self, key: str) -> None:
+        del self._keys[key]
+
+    def victim(self) -> str:
+        return next(iter(self._keys))
+
+
+class _LfuOrder:
+    """
+    Evicts the least frequently used key (the least recently used one among
+    ties), in O(1): keys are kept in one insertion-ordered bucket per count.
+    """
+
+    def __init__(self):
+        self._counts: Dict[str, int] = {}
+        self._buckets: Dict[int, "OrderedDict[str, None]"] = {}
+        self._min_count = 0
+
+    def _unlink(self, key: str, count: int) -> None:
+        bucket = self._buckets[count]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[count]
+            if self._min_count == count:
+                self._min_count = count + 1
+
+    def add(self, key: str) -> None:
+        self._counts[key] = 1
+        self._buckets.setdefault(1, OrderedDict())[key] = None
+        self._min_count = 1
+
+    def touch(self, key: str) -> None:
+        count = self._counts[key]
+        self._unlink(key, count)
+        self._counts[key] = count + 1
+        self._buckets.setdefault(count + 1, OrderedDict())[key] = None
+
+    def remove(self, key: str) -> None:
+        count = self._counts.pop(key)
+        self._unlink(key, count)
+        if self._counts and self._min_count not in self._buckets:
+            self._min_count = min(self._buckets)
+
+    def victim(self) -> str:
+        return next(iter(self._buckets[self._min_count]))
+
+
+class InMemoryCacheBackend:
+    """
+    An in-memory implementation of the CacheBackend protocol.
+
+    The cache can be bounded by number of entries and by total size (estimated
+    with `sizeof`, see `estimate_size`); when a bound is exceeded, entries are
+    evicted in LRU or LFU order. Values larger than `max_bytes` are not stored.
+    Sizes are only computed when `max_bytes` is set.
+
+    Expired entries are dropped when read, and by a sweeper task that pops an
+    expiry heap every `sweep_interval` seconds, so entries that are never read
+    again don't stay in memory. The sweeper starts with the first TTL entry on
+    the running event loop. After each sweep, listeners receive the counters;
+    the Engine publishes them as `CacheGauge` events when the backend is its
+    `cache_backend`.
+
+    All operations are guarded by a lock, so the cache can be shared by runs on
+    several threads or event loops.
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        eviction: str = "lru",
+        sweep_interval: Optional[float] = 60.0,
+        sizeof: Callable[[Any], int] = estimate_size,
+    ):
+        if eviction not in EVICTION_POLICIES:
+            raise ValueError(
+                f"Unknown eviction policy '{eviction}'. "
+                f"Expected one of {EVICTION_POLICIES}."
+            )
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.eviction = eviction
+        self.sweep_interval = sweep_interval
+        self.sizeof = sizeof
+
         self._store: Dict[str, Any] = {}
         self._expiry: Dict[str, float] = {}
+        self._sizes: Dict[str, int] = {}
+        self._order = _LruOrder() if eviction == "lru" else _LfuOrder()
+        # (expires_at, key); entries whose key was since rewritten are stale
+        self._heap: List[Tuple[float, str]] = []
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._sweeper: Optional[asyncio.Task] = None
+        self._listeners: List[StatsListener] = []
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
 
     async def get(self, key: str) -> Optional[Any]:
-        if key in self._expiry:
-            if time.time() > self._expiry[key]:
-                del self._store[key]
-                del self._expiry[key]
+        with self._lock:
+            if key in self._expiry and time.time() > self._expiry[key]:
+                self._remove(key)
+                self.expirations += 1
+            if key not in self._store:
+                self.misses += 1
                 return None
-        return self._store.get(key)
+            self.hits += 1
+            self._order.touch(key)
+            return self._store[key]
 
     async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
-        self._store[key] = value
+        size = self.sizeof(value) if self.max_bytes is not None else 0
+        with self._lock:
+            if key in self._store:
+                self._remove(key)
+            if self.max_bytes is not None and size > self.max_bytes:
+                return
+
+            # Make room first, so the new entry is never the one evicted
+            self._evict(size)
+            self._store[key] = value
+            self._sizes[key] = size
+            self._bytes += size
+            self._order.add(key)
+            if ttl is not None:
+                expires_at = time.time() + ttl
+                self._expiry[key] = expires_at
+                heapq.heappush(self._heap, (expires_at, key))
         if ttl is not None:
-            self._expiry[key] = time.time() + ttl
-        elif key in self._expiry:
-            del self._expiry[key]
+            self._ensure_sweeper()
+
+    def _remove(self, key: str) -> None:
+        del self._store[key]
+        self._bytes -= self._sizes.pop(key)
+        self._expiry.pop(key, None)
+        self._order.remove(key)
+
+    def _evict(self, incoming: int) -> None:
+        """Evicts entries until one of `incoming` bytes fits within the bounds."""
+        while self._store and (
+            (self.max_entries is not None and len(self._store) >= self.max_entries)
+            or (self.max_bytes is not None and self._bytes + incoming > self.max_bytes)
+        ):
+            self._remove(self._order.victim())
+            self.evictions += 1
+
+    def sweep(self) -> int:
+        """Drops the expired entries and returns how many there were."""
+        now = time.time()
+        expired = 0
+        with self._lock:
+            heap = self._heap
+            while heap and heap[0][0] <= now:
+                expires_at, key = heapq.heappop(heap)
+                if self._expiry.get(key) == expires_at:
+                    self._remove(key)
+                    expired += 1
+            # Rewritten and evicted keys leave stale heap entries behind
+            if len(heap) > 2 * len(self._expiry) + 64:
+                self._heap = [(t, k) for k, t in self._expiry.items()]
+                heapq.heapify(self._heap)
+            self.expirations += expired
+        self._notify()
+        return expired
+
+    def _ensure_sweeper(self) -> None:
+        if self.sweep_interval is None:
+            return
+        sweeper = self._sweeper
+        loop = asyncio.get_running_loop()
+        if sweeper is not None and not sweeper.done() and sweeper.get_loop() is loop:
+            return
+        self._sweeper = loop.create_task(self._sweep_periodically())
+
+    async def _sweep_periodically(self) -> None:
+        while self._expiry:
+            await asyncio.sleep(self.sweep_interval)
+            self.sweep()
+
+    async def close(self) -> None:
+        """Stops the sweeper."""
+        sweeper, self._sweeper = self._sweeper, None
+        if sweeper is not None and not sweeper.done():
+            sweeper.cancel()
+            try:
+                await sweeper
+            except asyncio.CancelledError:
+                pass
+
+    def add_listener(self, listener: StatsListener) -> None:
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: StatsListener) -> None:
+        try:
+            self._listeners.remove(listener)
+        except ValueError:
+            pass
+
+    def _notify(self) -> None:
+        if not self._listeners:
+            return
+        stats = self.stats()
+        for listener in list(self._listeners):
+            listener(stats)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._store),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
@@ -1,3 +1,4 @@
+from .content_hash import ContentHashCache, code_fingerprint
 from .file_existence import FileExistenceCache
 
-__all__ = ["FileExistenceCache"]
+__all__ = ["ContentHashCache", "FileExistenceCache", "code_fingerprint"]
@@ -0,0 +1,195 @@
+import functools
+import hashlib
+import inspect
+import marshal
+import pickle
+import weakref
+from types import CodeType
+from typing import Any, Callable, Dict, Optional
+
+from cascade.graph.hashing import HashingService
+from cascade.spec.protocols import CacheBackend
+
+
+class UnhashableInputError(TypeError):
+    """Raised when a task input has no stable digest (it can't be pickled)."""
+
+
+class InputHasher(HashingService):
+    """
+    Digests resolved task inputs. Values are fed like literals in structural
+    hashes, except that objects without a buffer are pickled instead of using
+    their repr(), which often embeds a memory address.
+    """
+
+    def digest(self, value: Any) -> str:
+        h = self._new_hash()
+        self._feed(h, value, {})
+        return h.hexdigest()
+
+    def _feed_object(self, h: Any, obj: Any) -> None:
+        try:
+            memoryview(obj)
+        except (TypeError, ValueError, BufferError):
+            pass
+        else:
+            return super()._feed_object(h, obj)
+
+        try:
+            data = pickle.dumps(obj, protocol=4)
+        except Exception as e:
+            raise UnhashableInputError(
+                f"Can't digest input of type {type(obj).__name__}: {e}"
+            ) from e
+        h.update(b"p" + len(data).to_bytes(8, "little"))
+        h.update(data)
+
+
+def _feed_code(h: Any, code: CodeType) -> None:
+    # Bytecode, names and constants; not the file name or line numbers, so that
+    # moving a function around doesn't invalidate its entries.
+    h.update(code.co_code)
+    h.update(marshal.dumps((code.co_names, code.co_varnames, code.co_freevars)))
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            h.update(b"c")
+            _feed_code(h, const)
+        elif isinstance(const, frozenset):
+            # Set order depends on the process' hash seed
+            h.update(b"f" + marshal.dumps(tuple(sorted(const, key=repr))))
+        else:
+            h.update(b"k" + marshal.dumps(const))
+
+
+def code_fingerprint(func: Callable) -> str:
+    """
+    Returns a digest of a function's code (including nested functions) and
+    default values. Editing the function changes it; changes to other functions
+    it calls don't. Partials are fingerprinted with their bound arguments,
+    callable objects by their `__call__`, and builtins by name.
+    """
+    func = inspect.unwrap(func)
+    h = hashlib.sha256()
+    if isinstance(func, functools.partial):
+        h.update(b"partial" + code_fingerprint(func.func).encode())
+        h.update(InputHasher().digest((func.args, func.keywords)).encode())
+        return h.hexdigest()
+
+    code = getattr(func, "__code__", None)
+    if code is None and not inspect.isroutine(func):
+        # A callable object
+        h.update(f"{type(func).__module__}.{type(func).__qualname__}".encode())
+        func = getattr(type(func), "__call__", None)
+        code = getattr(func, "__code__", None)
+    if code is not None:
+        _feed_code(h, code)
+    else:
+        name = getattr(func, "__qualname__", None) or repr(func)
+        h.update(f"{getattr(func, '__module__', None)}.{name}".encode())
+    # Builtins have no defaults of their own
+    defaults = (
+        getattr(func, "__defaults__", None),
+        getattr(func, "__kwdefaults__", None),
+    )
+    h.update(InputHasher().digest(defaults).encode())
+    return h.hexdigest()
+
+
+class ContentHashCache:
+    """
+    A cache policy that stores task results in any CacheBackend, under a key
+    derived from:
+
+    - the node's structural id (the task and the structure of its inputs),
+    - a digest of the resolved arguments (literals and upstream results),
+    - a fingerprint of the task's code, so editing the function invalidates
+      its entries (or an explicit `version`).
+
+    Impure tasks get a new structural id per instance, so their entries are only
+    reused by the same workflow object (e.g. a service running it repeatedly, or
+    TCO iterations). Results of pure tasks are reused across runs and processes.
+    Tasks with inputs that can't be pickled, and None results, are not cached.
+    """
+
+    # Lets the NodeProcessor pass the task's function to `check` and `save`
+    code_versioned = True
+
+    def __init__(
+        self,
+        backend: Optional[CacheBackend] = None,
+        ttl: Optional[int] = None,
+        version: Optional[str] = None,
+        namespace: str = "cascade:cache",
+        algorithm: str = "sha256",
+    ):
+        if backend is None:
+            from cascade.adapters.cache import InMemoryCacheBackend
+
+            backend = InMemoryCacheBackend()
+        self.backend = backend
+        self.ttl = ttl
+        self.version = version
+        self.namespace = namespace
+        self._hasher = InputHasher(algorithm)
+        # Keyed by function: functions made by one factory share their code
+        # object but not their defaults.
+        self._fingerprints: "weakref.WeakKeyDictionary[Callable, str]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self.hits = 0
+        self.misses = 0
+        self.unhashable = 0
+
+    def _fingerprint(self, func: Optional[Callable]) -> str:
+        if func is None:
+            return ""
+        try:
+            fingerprint = self._fingerprints.get(func)
+        except TypeError:
+            # Not weak-referenceable (e.g. some builtins)
+            return code_fingerprint(func)
+        if fingerprint is None:
+            fingerprint = self._fingerprints[func] = code_fingerprint(func)
+        return fingerprint
+
+    def key(
+        self, task_id: str, inputs: Dict[str, Any], func: Optional[Callable] = None
+    ) -> str:
+        """Returns the cache key of a task; raises UnhashableInputError."""
+        digest = self._hasher.digest(
+            (task_id, self._fingerprint(func), self.version, inputs)
+        )
+        return f"{self.namespace}:{digest}"
+
+    async def check(
+        self, task_id: str, inputs: Dict[str, Any], func: Optional[Callable] = None
+    ) -> Any:
+        try:
+            key = self.key(task_id, inputs, func)
+        except UnhashableInputError:
+            self.unhashable += 1
+            return None
+        value = await self.backend.get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    async def save(
+        self,
+        task_id: str,
+        inputs: Dict[str, Any],
+        output: Any,
+        func: Optional[Callable] = None,
+    ) -> None:
+        if output is None:
+            return
+        try:
+            key = self.key(task_id, inputs, func)
+        except UnhashableInputError:
+            return
+        await self.backend.set(key, output, ttl=self.ttl)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"hits": self.hits, "misses": self.misses, "unhashable": self.unhashable}
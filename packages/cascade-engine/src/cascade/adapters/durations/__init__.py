@@ -0,0 +1,9 @@
+from .in_memory import DurationStats, InMemoryDurationStore, estimate_weights
+from .sqlite import SqliteDurationStore
+
+__all__ = [
+    "DurationStats",
+    "InMemoryDurationStore",
+    "SqliteDurationStore",
+    "estimate_weights",
+]
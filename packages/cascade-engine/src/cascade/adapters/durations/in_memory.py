@@ -0,0 +1,166 @@
+import math
+from collections import OrderedDict, deque
+from typing import Deque, Dict, Iterable, Optional
+
+from cascade.graph.model import Node
+from cascade.spec.protocols import DurationStore
+
+# Statistics are kept at two granularities: per node (structural_id) and per task
+# (name). A node that has never run falls back to the history of its task.
+BY_NODE = "node"
+BY_TASK = "task"
+
+
+class DurationStats:
+    """Running statistics of one node's or task's execution times."""
+
+    __slots__ = ("count", "ewma", "samples")
+
+    def __init__(self, window: int):
+        self.count = 0
+        self.ewma = 0.0
+        # The most recent durations, used for percentiles
+        self.samples: Deque[float] = deque(maxlen=window)
+
+    def add(self, duration: float, smoothing: float) -> None:
+        if self.count == 0:
+            self.ewma = duration
+        else:
+            self.ewma = smoothing * duration + (1 - smoothing) * self.ewma
+        self.count += 1
+        self.samples.append(duration)
+
+    def percentile(self, q: float) -> float:
+        """Nearest-rank percentile of the recent samples."""
+        ordered = sorted(self.samples)
+        rank = math.ceil(q / 100 * len(ordered))
+        return ordered[min(max(rank, 1), len(ordered)) - 1]
+
+
+class InMemoryDurationStore:
+    """
+    An in-memory implementation of the DurationStore protocol.
+
+    For every node and every task it keeps an exponentially weighted moving
+    average (EWMA) of the observed durations, and the last `window` samples for
+    percentiles. Engines feed it from `TaskExecutionFinished` events.
+
+    Impure nodes get a new structural_id in every workflow they are built in, so
+    the per-node statistics are an LRU bounded by `max_nodes`; per-task ones are
+    bounded by the number of tasks.
+    """
+
+    def __init__(
+        self, smoothing: float = 0.3, window: int = 128, max_nodes: Optional[int] = 4096
+    ):
+        """
+        Args:
+            smoothing: Weight of the newest sample in the EWMA, in (0, 1].
+            window: Number of recent samples kept for percentiles.
+            max_nodes: Number of nodes with their own statistics (None: unbounded).
+        """
+        if not 0 < smoothing <= 1:
+            raise ValueError("smoothing must be in (0, 1].")
+        if window < 1:
+            raise ValueError("window must be a positive integer.")
+        if max_nodes is not None and max_nodes < 1:
+            raise ValueError("max_nodes must be a positive integer or None.")
+
+        self.smoothing = smoothing
+        self.window = window
+        self.max_nodes = max_nodes
+        # Ordered from least to most recently used
+        self._stats: Dict[str, "OrderedDict[str, DurationStats]"] = {
+            BY_NODE: OrderedDict(),
+            BY_TASK: OrderedDict(),
+        }
+        self.samples = 0
+        self.evictions = 0
+
+    def record(
+        self, task_name: str, structural_id: Optional[str], duration: float
+    ) -> None:
+        for kind, key in ((BY_NODE, structural_id), (BY_TASK, task_name)):
+            if key is None:
+                continue
+            stats = self._lookup(kind, key)
+            if stats is None:
+                stats = self._remember(kind, key, DurationStats(self.window))
+            stats.add(duration, self.smoothing)
+            self._updated(kind, key, stats)
+        self.samples += 1
+
+    def get(self, node: Node) -> Optional[DurationStats]:
+        """Returns the statistics for a node, falling back to those of its task."""
+        stats = self._lookup(BY_NODE, node.structural_id)
+        if stats is None:
+            stats = self._lookup(BY_TASK, node.name)
+        return stats
+
+    def estimate(self, node: Node) -> Optional[float]:
+        stats = self.get(node)
+        return None if stats is None else stats.ewma
+
+    def percentile(self, node: Node, q: float) -> Optional[float]:
+        if not 0 <= q <= 100:
+            raise ValueError("q must be in [0, 100].")
+        stats = self.get(node)
+        return None if stats is None else stats.percentile(q)
+
+    def _lookup(self, kind: str, key: str) -> Optional[DurationStats]:
+        table = self._stats[kind]
+        stats = table.get(key)
+        if stats is not None:
+            table.move_to_end(key)
+        return stats
+
+    def _remember(self, kind: str, key: str, stats: DurationStats) -> DurationStats:
+        """Adds statistics to memory, evicting the least recently used node's."""
+        table = self._stats[kind]
+        table[key] = stats
+        if (
+            kind == BY_NODE
+            and self.max_nodes is not None
+            and len(table) > self.max_nodes
+        ):
+            table.popitem(last=False)
+            self.evictions += 1
+        return stats
+
+    def _updated(self, kind: str, key: str, stats: DurationStats) -> None:
+        """Called after every update; persistent subclasses write `stats` back."""
+
+    def clear(self) -> None:
+        """Removes all statistics. Counters are preserved."""
+        for table in self._stats.values():
+            table.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Returns a snapshot of the store's size and counters."""
+        return {
+            "nodes": len(self._stats[BY_NODE]),
+            "tasks": len(self._stats[BY_TASK]),
+            "samples": self.samples,
+            "evictions": self.evictions,
+        }
+
+
+def estimate_weights(
+    store: Optional[DurationStore], nodes: Iterable[Node]
+) -> Dict[str, float]:
+    """
+    Returns the estimated duration of every node, keyed by structural_id.
+
+    Nodes without any history are weighted with the mean of the known estimates,
+    or with 1.0 if nothing is known (i.e. every node counts as one unit of work).
+    """
+    estimates = {
+        node.structural_id: None if store is None else store.estimate(node)
+        for node in nodes
+    }
+    known = [d for d in estimates.values() if d is not None]
+    default = sum(known) / len(known) if known else 1.0
+    return {
+        node_id: default if duration is None else duration
+        for node_id, duration in estimates.items()
+    }
@@ -0,0 +1,110 @@
+import json
+import sqlite3
+from typing import Dict, Optional, Tuple
+
+from cascade.adapters.durations.in_memory import (
+    BY_TASK,
+    DurationStats,
+    InMemoryDurationStore,
+)
+
+
+class SqliteDurationStore(InMemoryDurationStore):
+    """
+    An InMemoryDurationStore backed by a sqlite database, so that duration
+    history survives restarts and can be shared by workers using the same file.
+
+    Only per-task statistics are persisted: structural ids of impure nodes are
+    salted per build, so per-node rows would rarely be read again. Per-node
+    statistics stay in memory, as in InMemoryDurationStore.
+
+    Statistics are loaded lazily on first use. Updates are buffered and written
+    in one transaction by `flush`, which the Engine calls when a run ends (the
+    duration events of a run arrive on the event loop, one per task).
+    """
+
+    # Bump when the meaning of a stored row changes; old rows are then ignored.
+    SCHEMA_VERSION = 1
+
+    def __init__(
+        self,
+        path: str,
+        smoothing: float = 0.3,
+        window: int = 128,
+        max_nodes: Optional[int] = 4096,
+    ):
+        super().__init__(smoothing=smoothing, window=window, max_nodes=max_nodes)
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = self._open(path)
+        # Statistics updated since the last flush, by (kind, key)
+        self._dirty: Dict[Tuple[str, str], DurationStats] = {}
+        self.flushes = 0
+
+    def _open(self, path: str) -> sqlite3.Connection:
+        conn = sqlite3.connect(path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS durations ("
+            "kind TEXT NOT NULL, key TEXT NOT NULL, version INTEGER NOT NULL, "
+            "count INTEGER NOT NULL, ewma REAL NOT NULL, samples TEXT NOT NULL, "
+            "PRIMARY KEY (kind, key))"
+        )
+        conn.commit()
+        return conn
+
+    def _lookup(self, kind: str, key: str) -> Optional[DurationStats]:
+        stats = super()._lookup(kind, key)
+        if stats is not None or kind != BY_TASK or self._conn is None:
+            return stats
+
+        # Evicted from memory before being written
+        stats = self._dirty.get((kind, key))
+        if stats is not None:
+            return self._remember(kind, key, stats)
+
+        row = self._conn.execute(
+            "SELECT count, ewma, samples FROM durations "
+            "WHERE kind = ? AND key = ? AND version = ?",
+            (kind, key, self.SCHEMA_VERSION),
+        ).fetchone()
+        if row is None:
+            return None
+
+        stats = DurationStats(self.window)
+        stats.count, stats.ewma = row[0], row[1]
+        stats.samples.extend(json.loads(row[2]))
+        return self._remember(kind, key, stats)
+
+    def _updated(self, kind: str, key: str, stats: DurationStats) -> None:
+        if kind == BY_TASK:
+            self._dirty[(kind, key)] = stats
+
+    def flush(self) -> None:
+        """Writes the statistics updated since the last flush."""
+        if not self._dirty or self._conn is None:
+            return
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO durations "
+                "(kind, key, version, count, ewma, samples) VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        kind,
+                        key,
+                        self.SCHEMA_VERSION,
+                        stats.count,
+                        stats.ewma,
+                        json.dumps(list(stats.samples)),
+                    )
+                    for (kind, key), stats in self._dirty.items()
+                ],
+            )
+        self._dirty.clear()
+        self.flushes += 1
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self.flush()
+            self._conn.close()
+            self._conn = None
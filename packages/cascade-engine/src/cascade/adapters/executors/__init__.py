@@ -1,3 +1,5 @@
 from .local import LocalExecutor
+from .pools import ThreadPools
+from .process import ProcessExecutor
 
-__all__ = ["LocalExecutor"]
+__all__ = ["LocalExecutor", "ProcessExecutor", "ThreadPools"]
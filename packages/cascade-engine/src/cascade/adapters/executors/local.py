@@ -1,8 +1,7 @@
-import asyncio
 import functools
-from concurrent.futures import ThreadPoolExecutor
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 from cascade.graph.model import Node
+from cascade.adapters.executors.pools import ThreadPools
 from cascade.spec.lazy_types import LazyResult, MappedLazyResult
 from cascade.graph.exceptions import StaticGraphError
 
@@ -11,18 +10,28 @@ class LocalExecutor:
     """
     An executor that runs tasks in the current process, using dedicated thread
     pools to isolate blocking I/O tasks from CPU-bound tasks.
+
+    Synchronous tasks run in the pool named after their mode: "blocking" (the
+    default), "compute", or any custom mode, e.g. `@task(mode="io-heavy")`.
+    Pools are created on first use and shut down by the Engine when the last
+    run using them finishes.
     """
 
-    def __init__(self):
-        # NOTE: These executors are created per-engine-run.
-        # Their lifecycle is tied to the LocalExecutor instance.
-        # Python's ThreadPoolExecutor finalizer handles shutdown on garbage collection.
-        self._blocking_executor = ThreadPoolExecutor(
-            thread_name_prefix="cascade_blocking"
-        )
-        self._compute_executor = ThreadPoolExecutor(
-            thread_name_prefix="cascade_compute"
-        )
+    def __init__(
+        self,
+        max_workers: Optional[Dict[str, int]] = None,
+        pools: Optional[ThreadPools] = None,
+    ):
+        """
+        Args:
+            max_workers: Size of the thread pool of each mode, e.g.
+                         `{"blocking": 64, "compute": 4, "io-heavy": 128}`.
+            pools: A ThreadPools registry to share with other executors.
+                   Mutually exclusive with `max_workers`.
+        """
+        if pools is not None and max_workers:
+            raise ValueError("Pass either max_workers or pools, not both.")
+        self.pools = pools if pools is not None else ThreadPools(max_workers)
 
     async def execute(
         self,
@@ -42,18 +51,7 @@ class LocalExecutor:
         if node.is_async:
             result = await node.callable_obj(*args, **kwargs)
         else:
-            loop = asyncio.get_running_loop()
-
-            # Select the appropriate executor based on the task's declared mode
-            if node.execution_mode == "compute":
-                executor = self._compute_executor
-            else:  # Default to "blocking" for I/O, etc.
-                executor = self._blocking_executor
-
-            # Use functools.partial to handle keyword arguments, as
-            # run_in_executor only accepts positional arguments for the target function.
-            func_to_run = functools.partial(node.callable_obj, *args, **kwargs)
-            result = await loop.run_in_executor(executor, func_to_run)
+            result = await self._run_sync(node, args, kwargs)
 
         # Runtime guard against the "task returns LazyResult" anti-pattern.
         if isinstance(result, (LazyResult, MappedLazyResult)):
@@ -63,3 +61,13 @@ class LocalExecutor:
             )
 
         return result
+
+    async def _run_sync(self, node: Node, args: List[Any], kwargs: Dict[str, Any]):
+        """Runs a synchronous callable in the thread pool matching its mode."""
+        # The pools run zero-argument callables: bind the arguments first
+        func_to_run = functools.partial(node.callable_obj, *args, **kwargs)
+        return await self.pools.run(node.execution_mode or "blocking", func_to_run)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shuts down the thread pools."""
+        self.pools.shutdown(wait=wait)
@@ -0,0 +1,193 @@
+import asyncio
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+# Listeners receive the pool name and a snapshot of its gauges
+GaugeListener = Callable[[str, Dict[str, int]], None]
+
+# Shutdown hooks receive the `wait` argument of the shutdown
+ShutdownHook = Callable[[bool], None]
+
+
+def _default_max_workers() -> int:
+    # Same default as ThreadPoolExecutor, made explicit so it can be reported
+    return min(32, (os.cpu_count() or 1) + 4)
+
+
+class _Pool:
+    """A thread pool and its gauges. The gauges are guarded by ThreadPools._lock."""
+
+    __slots__ = ("name", "executor", "max_workers", "queued", "active")
+
+    def __init__(self, name: str, max_workers: int):
+        self.name = name
+        self.max_workers = max_workers
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=f"cascade_{name}"
+        )
+        self.queued = 0
+        self.active = 0
+
+
+class ThreadPools:
+    """
+    A registry of named thread pools, one per task mode ("blocking", "compute",
+    or any custom mode such as "io-heavy"), created on first use.
+
+    Pools are shared by every run using them. Runs lease the registry with
+    `acquire()` / `release()`; when the last lease is released the pools are
+    shut down, and they are created again on next use. This bounds the number
+    of threads by the configured sizes, however many (nested) runs share them.
+
+    Every submission and completion notifies the listeners with the pool's
+    queue depth and number of active workers. Listeners are called from the
+    event loop thread.
+    """
+
+    def __init__(self, max_workers: Optional[Dict[str, int]] = None):
+        """
+        Args:
+            max_workers: Size of the pool of each mode, e.g.
+                         `{"compute": 4, "io-heavy": 64}`. Pools of other modes
+                         get ThreadPoolExecutor's default size.
+        """
+        max_workers = dict(max_workers or {})
+        for name, size in max_workers.items():
+            if not isinstance(size, int) or size < 1:
+                raise ValueError(
+                    f"max_workers of pool '{name}' must be a positive integer."
+                )
+
+        self.max_workers = max_workers
+        self._pools: Dict[str, _Pool] = {}
+        self._lock = threading.Lock()
+        self._leases = 0
+        self._listeners: List[GaugeListener] = []
+        self._shutdown_hooks: List[ShutdownHook] = []
+
+        self.pools_created = 0
+        self.shutdowns = 0
+
+    def get(self, name: str) -> ThreadPoolExecutor:
+        """Returns the pool of the given mode, creating it if needed."""
+        return self._pool(name).executor
+
+    async def run(self, name: str, func: Callable[[], Any]) -> Any:
+        """Runs `func` in the pool of the given mode and returns its result."""
+        pool = self._pool(name)
+        # [started, abandoned]: tells apart calls that left the queue by
+        # starting from those cancelled while still queued.
+        state = [False, False]
+
+        def call():
+            with self._lock:
+                if not state[1]:
+                    pool.queued -= 1
+                    state[0] = True
+                pool.active += 1
+            try:
+                return func()
+            finally:
+                with self._lock:
+                    pool.active -= 1
+
+        with self._lock:
+            pool.queued += 1
+        self._notify(pool)
+
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(pool.executor, call)
+        finally:
+            with self._lock:
+                if not state[0]:
+                    state[1] = True
+                    pool.queued -= 1
+            self._notify(pool)
+
+    def gauges(self) -> Dict[str, Dict[str, int]]:
+        """Returns the current gauges of every pool, by mode."""
+        with self._lock:
+            return {name: self._snapshot(pool) for name, pool in self._pools.items()}
+
+    def add_listener(self, listener: GaugeListener) -> None:
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: GaugeListener) -> None:
+        try:
+            self._listeners.remove(listener)
+        except ValueError:
+            pass
+
+    def add_shutdown_hook(self, hook: ShutdownHook) -> None:
+        """
+        Registers `hook(wait)`, called whenever the pools are shut down, so that
+        resources living as long as the pools (e.g. a process pool) go with them.
+        """
+        self._shutdown_hooks.append(hook)
+
+    def acquire(self) -> None:
+        """Takes a lease on the pools, keeping them alive until `release()`."""
+        with self._lock:
+            self._leases += 1
+
+    def release(self) -> None:
+        """Releases a lease; the last one shuts the pools down without waiting."""
+        with self._lock:
+            self._leases = max(self._leases - 1, 0)
+            last = self._leases == 0
+        if last:
+            self.shutdown(wait=False)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Shuts down every pool. Work already submitted still runs to completion;
+        with `wait=False` the threads finish it in the background.
+        """
+        with self._lock:
+            pools = list(self._pools.values())
+            self._pools.clear()
+        for pool in pools:
+            pool.executor.shutdown(wait=wait)
+        if pools:
+            self.shutdowns += 1
+        for hook in self._shutdown_hooks:
+            hook(wait)
+
+    def stats(self) -> Dict[str, int]:
+        """Returns the number of live pools and how often pools were (re)built."""
+        return {
+            "pools": len(self._pools),
+            "pools_created": self.pools_created,
+            "shutdowns": self.shutdowns,
+        }
+
+    def _pool(self, name: str) -> _Pool:
+        pool = self._pools.get(name)
+        if pool is not None:
+            return pool
+        with self._lock:
+            pool = self._pools.get(name)
+            if pool is None:
+                pool = self._pools[name] = _Pool(
+                    name, self.max_workers.get(name) or _default_max_workers()
+                )
+                self.pools_created += 1
+        return pool
+
+    def _snapshot(self, pool: _Pool) -> Dict[str, int]:
+        return {
+            "max_workers": pool.max_workers,
+            "queued": pool.queued,
+            "active": pool.active,
+        }
+
+    def _notify(self, pool: _Pool) -> None:
+        if not self._listeners:
+            return
+        with self._lock:
+            gauges = self._snapshot(pool)
+        for listener in list(self._listeners):
+            listener(pool.name, gauges)
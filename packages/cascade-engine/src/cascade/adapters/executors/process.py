@@ -0,0 +1,239 @@
+import asyncio
+import importlib
+import io
+import multiprocessing
+import os
+import pickle
+import threading
+import types
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from cascade.graph.model import Node
+from cascade.graph.serialize import _get_func_path, _load_func_from_path
+from cascade.adapters.executors.local import LocalExecutor
+from cascade.adapters.executors.pools import ThreadPools
+
+# Worker-side cache of callables already imported, by (module, qualname)
+_worker_callables: Dict[Tuple[str, str], Any] = {}
+
+
+class _UnresolvableCallable(Exception):
+    """Raised in a worker that cannot restore a task's callable or arguments."""
+
+
+def _default_context() -> multiprocessing.context.BaseContext:
+    # Forking a process whose thread pools are running can copy locks held by
+    # other threads into the child; a fork server (or spawning) avoids that.
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+def _initialize_worker(preload: Sequence[str]) -> None:
+    for module_name in preload:
+        importlib.import_module(module_name)
+
+
+def _ping() -> int:
+    return os.getpid()
+
+
+def _load_callable(module: str, qualname: str) -> Any:
+    key = (module, qualname)
+    func = _worker_callables.get(key)
+    if func is None:
+        func = _worker_callables[key] = _load_func_from_path(
+            {"module": module, "qualname": qualname}
+        )
+    return func
+
+
+def _run_in_worker(payload: bytes) -> Any:
+    try:
+        path, args, kwargs = pickle.loads(payload)
+        func = _load_callable(path["module"], path["qualname"])
+    except Exception as e:
+        raise _UnresolvableCallable(f"{type(e).__name__}: {e}")
+    return func(*args, **kwargs)
+
+
+class _ReferencePickler(pickle.Pickler):
+    """
+    Pickles functions found in arguments by module and qualname, like the task
+    callables themselves. Unlike plain pickle, this also handles functions
+    wrapped by `@cs.task`, e.g. the task function of a batched `.map()`.
+    """
+
+    def __init__(self, file: io.BytesIO, executor: "ProcessExecutor"):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._executor = executor
+
+    def reducer_override(self, obj: Any) -> Any:
+        if isinstance(obj, types.FunctionType) and obj is not _load_callable:
+            reference = self._executor._reference(obj)
+            if reference is not None:
+                return _load_callable, (reference["module"], reference["qualname"])
+        return NotImplemented
+
+
+class ProcessExecutor(LocalExecutor):
+    """
+    A LocalExecutor that runs synchronous `mode="compute"` tasks in a pool of
+    worker processes, so CPU-bound Python code is not serialised by the GIL.
+
+    Callables are sent to the workers by module and qualname (as in
+    `cascade.graph.serialize`), arguments and results are pickled. A compute task
+    that cannot be sent (e.g. a function defined inside another function, or
+    unpicklable arguments) falls back to the compute thread pool, as with
+    LocalExecutor. Async and blocking tasks are not affected.
+
+    The worker processes live as long as the thread pools: they are started on
+    the first compute task (or by `warm_up()`) and stopped when the pools shut
+    down, i.e. when the last run leasing them ends (see ThreadPools).
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        warm_up: bool = False,
+        preload: Sequence[str] = (),
+        mp_context: Optional[multiprocessing.context.BaseContext] = None,
+        pools: Optional[ThreadPools] = None,
+    ):
+        """
+        Args:
+            max_workers: Size of the process pool. Defaults to the number of CPUs.
+            warm_up: Start all worker processes (and import `preload`) right away,
+                     instead of on the first compute task.
+            preload: Modules every worker imports on start, e.g. the modules
+                     defining the compute tasks or heavy libraries they use.
+            mp_context: The multiprocessing context used to start the workers.
+                        Defaults to "forkserver" ("spawn" where unavailable),
+                        as forking while thread pools run is unsafe.
+            pools: The thread pools used by blocking tasks and thread fallbacks.
+        """
+        super().__init__(pools=pools)
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.preload = tuple(preload)
+        self.mp_context = mp_context if mp_context is not None else _default_context()
+        self._process_executor: Optional[ProcessPoolExecutor] = None
+        self._process_lock = threading.Lock()
+        self.pools.add_shutdown_hook(self._shutdown_processes)
+        # Callable -> {"module", "qualname"}, or None if it can't be sent by reference
+        self._references: "weakref.WeakKeyDictionary[Any, Optional[Dict[str, str]]]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+        self.process_runs = 0
+        self.thread_fallbacks = 0
+        self.process_pools_created = 0
+
+        if warm_up:
+            self.warm_up()
+
+    def warm_up(self) -> None:
+        """Starts every worker process and waits until all of them are ready."""
+        processes = self._processes()
+        futures = [processes.submit(_ping) for _ in range(self.max_workers)]
+        for future in futures:
+            future.result()
+
+    async def _run_sync(self, node: Node, args: List[Any], kwargs: Dict[str, Any]):
+        if node.execution_mode != "compute":
+            return await super()._run_sync(node, args, kwargs)
+
+        func = node.callable_obj
+        payload = None
+        reference = self._reference(func)
+        if reference is not None:
+            try:
+                buffer = io.BytesIO()
+                _ReferencePickler(buffer, self).dump((reference, args, kwargs))
+                payload = buffer.getvalue()
+            except Exception:
+                pass
+
+        if payload is not None:
+            loop = asyncio.get_running_loop()
+            try:
+                result = await loop.run_in_executor(
+                    self._processes(), _run_in_worker, payload
+                )
+                self.process_runs += 1
+                return result
+            except _UnresolvableCallable:
+                # E.g. the callable was defined after the workers were started
+                self._remember(func, None)
+
+        self.thread_fallbacks += 1
+        return await super()._run_sync(node, args, kwargs)
+
+    def _processes(self) -> ProcessPoolExecutor:
+        """Returns the process pool, starting a new one if needed."""
+        processes = self._process_executor
+        if processes is not None:
+            return processes
+        with self._process_lock:
+            if self._process_executor is None:
+                self._process_executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=self.mp_context,
+                    initializer=_initialize_worker,
+                    initargs=(self.preload,),
+                )
+                self.process_pools_created += 1
+            return self._process_executor
+
+    def _shutdown_processes(self, wait: bool) -> None:
+        with self._process_lock:
+            processes, self._process_executor = self._process_executor, None
+        if processes is not None:
+            processes.shutdown(wait=wait)
+
+    def _reference(self, func: Any) -> Optional[Dict[str, str]]:
+        """Returns the module/qualname of `func` if it can be imported back by them."""
+        try:
+            return self._references[func]
+        except KeyError:
+            pass
+        except TypeError:
+            # Not weak-referenceable: resolve it every time
+            return self._resolve(func)
+
+        reference = self._resolve(func)
+        self._remember(func, reference)
+        return reference
+
+    def _resolve(self, func: Any) -> Optional[Dict[str, str]]:
+        try:
+            reference = _get_func_path(func)
+            if _load_func_from_path(reference) is func:
+                return reference
+        except Exception:
+            pass
+        return None
+
+    def _remember(self, func: Any, reference: Optional[Dict[str, str]]) -> None:
+        try:
+            self._references[func] = reference
+        except TypeError:
+            pass
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns how many compute tasks ran in processes and in threads, and how
+        many process pools were started.
+        """
+        return {
+            "max_workers": self.max_workers,
+            "process_runs": self.process_runs,
+            "thread_fallbacks": self.thread_fallbacks,
+            "process_pools_created": self.process_pools_created,
+        }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stops the worker processes and the thread pools."""
+        # The pools' shutdown hook stops the worker processes
+        super().shutdown(wait=wait)
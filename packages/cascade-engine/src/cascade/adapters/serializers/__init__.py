@@ -0,0 +1,21 @@
+from .codec import ResultCodec, SerializerRegistry, default_registry
+from .formats import (
+    Lz4Compressor,
+    MsgpackSerializer,
+    NumpySerializer,
+    PickleSerializer,
+    ZlibCompressor,
+    ZstdCompressor,
+)
+
+__all__ = [
+    "ResultCodec",
+    "SerializerRegistry",
+    "default_registry",
+    "PickleSerializer",
+    "MsgpackSerializer",
+    "NumpySerializer",
+    "ZlibCompressor",
+    "ZstdCompressor",
+    "Lz4Compressor",
+]
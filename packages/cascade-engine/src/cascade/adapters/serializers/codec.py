@@ -0,0 +1,141 @@
+import pickle
+from typing import Any, Callable, Dict, Optional
+
+from cascade.spec.protocols import Serializer
+from .formats import (
+    Lz4Compressor,
+    MsgpackSerializer,
+    NumpySerializer,
+    PickleSerializer,
+    ZlibCompressor,
+    ZstdCompressor,
+)
+
+# Plain pickle streams are stored bare: they are recognised by their first byte
+_PICKLE_PROTO = pickle.PROTO[0]
+_UNCOMPRESSED = b"0"
+
+
+class SerializerRegistry:
+    """
+    Maps names (used in backend settings) and one-byte tags (stored in each
+    payload) to serializers and compressors. Formats are registered as factories
+    and created on first use, so optional libraries are only required by the
+    backends that select them.
+    """
+
+    def __init__(self):
+        self._factories: Dict[str, Callable[[], Any]] = {}
+        self._tags: Dict[bytes, str] = {}
+        self._instances: Dict[str, Any] = {}
+
+    def register(self, name: str, tag: bytes, factory: Callable[[], Any]) -> None:
+        """Registers a serializer or compressor factory under `name` and `tag`."""
+        if len(tag) != 1 or tag[0] == _PICKLE_PROTO or tag == _UNCOMPRESSED:
+            raise ValueError(f"Invalid format tag {tag!r} for '{name}'.")
+        owner = self._tags.get(tag)
+        if owner is not None and owner != name:
+            raise ValueError(f"Format tag {tag!r} is already used by '{owner}'.")
+        self._factories[name] = factory
+        self._tags[tag] = name
+        self._instances.pop(name, None)
+
+    def get(self, name: str) -> Any:
+        instance = self._instances.get(name)
+        if instance is None:
+            if name not in self._factories:
+                raise ValueError(
+                    f"Unknown format '{name}'. Registered: {sorted(self._factories)}"
+                )
+            # setdefault: threads racing on first use all get the same instance
+            instance = self._instances.setdefault(name, self._factories[name]())
+        return instance
+
+    def by_tag(self, tag: bytes) -> Any:
+        if tag not in self._tags:
+            raise ValueError(f"Unknown format tag {tag!r} in payload.")
+        return self.get(self._tags[tag])
+
+
+def _default_registry() -> SerializerRegistry:
+    registry = SerializerRegistry()
+    for cls in (
+        PickleSerializer,
+        MsgpackSerializer,
+        NumpySerializer,
+        ZlibCompressor,
+        ZstdCompressor,
+        Lz4Compressor,
+    ):
+        registry.register(cls.name, cls.tag, cls)
+    return registry
+
+
+# The registry used by codecs that aren't given one
+default_registry = _default_registry()
+
+
+class ResultCodec:
+    """
+    Encodes results for remote state and cache backends.
+
+    Values the selected serializer can't represent (e.g. non-arrays for "numpy")
+    fall back to pickle. Payloads larger than `compress_threshold` bytes are
+    compressed if a `compression` is set. Each payload records its format, so
+    any codec can decode what another one wrote. Uncompressed values pickled
+    without out-of-band buffers stay plain pickle streams, as they were before
+    codecs existed.
+
+    Decoded arrays own a writable copy of their data, like plain pickles. With
+    `zero_copy=True` they are read-only views of the payload instead, which
+    saves a copy of large results that are only read.
+    """
+
+    def __init__(
+        self,
+        serializer: str = "pickle",
+        compression: Optional[str] = None,
+        compress_threshold: int = 64 * 1024,
+        registry: Optional[SerializerRegistry] = None,
+        zero_copy: bool = False,
+    ):
+        self.registry = registry if registry is not None else default_registry
+        self.serializer: Serializer = self.registry.get(serializer)
+        self.compressor = (
+            self.registry.get(compression) if compression is not None else None
+        )
+        self.compress_threshold = compress_threshold
+        self.zero_copy = zero_copy
+        self._fallback: Serializer = self.registry.get("pickle")
+
+    def encode(self, obj: Any) -> bytes:
+        serializer = self.serializer
+        try:
+            chunks = serializer.dumps(obj)
+        except TypeError:
+            serializer = self._fallback
+            chunks = serializer.dumps(obj)
+
+        if self.compressor is not None:
+            size = sum(memoryview(c).nbytes for c in chunks)
+            if size > self.compress_threshold:
+                data = self.compressor.compress(b"".join(chunks))
+                return b"".join((serializer.tag, self.compressor.tag, data))
+        if len(chunks) == 1 and chunks[0][:1] == pickle.PROTO:
+            # Readable by plain pickle.loads, as before codecs existed
+            return chunks[0]
+        return b"".join((serializer.tag, _UNCOMPRESSED, *chunks))
+
+    def decode(self, data: bytes) -> Any:
+        view = memoryview(data)
+        if view[0] == _PICKLE_PROTO:
+            return pickle.loads(view)
+        serializer = self.registry.by_tag(bytes(view[:1]))
+        payload = view[2:]
+        compression = bytes(view[1:2])
+        if compression != _UNCOMPRESSED:
+            payload = self.registry.by_tag(compression).decompress(payload)
+        if not self.zero_copy:
+            # Buffers taken from a bytes payload would be read-only
+            payload = bytearray(payload)
+        return serializer.loads(memoryview(payload))
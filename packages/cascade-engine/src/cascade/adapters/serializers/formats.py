@@ -0,0 +1,204 @@
+import io
+import pickle
+import struct
+import threading
+import zlib
+from typing import Any, List
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:
+    lz4_frame = None
+
+
+# --- Serializers ---
+
+
+class PickleSerializer:
+    """
+    Pickle protocol 5. Large buffers (NumPy arrays, PickleBuffers, ...) are
+    taken out-of-band: they are appended to the payload as-is instead of being
+    copied into the pickle stream, and come back as views of the payload
+    (see ResultCodec's `zero_copy`).
+
+    Values without such buffers are plain pickle streams. Otherwise the layout
+    is: b"B", buffer count (u32), buffer lengths (u64 each), pickle stream,
+    buffers.
+    """
+
+    name = "pickle"
+    tag = b"P"
+
+    def dumps(self, obj: Any) -> List[Any]:
+        buffers: List[pickle.PickleBuffer] = []
+        data = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+        if not buffers:
+            return [data]
+        raws = [b.raw() for b in buffers]
+        header = struct.pack(
+            f"<cI{len(raws)}Q", b"B", len(raws), *(r.nbytes for r in raws)
+        )
+        return [header, data, *raws]
+
+    def loads(self, data: memoryview) -> Any:
+        if data[0] == pickle.PROTO[0]:
+            return pickle.loads(data)
+        (count,) = struct.unpack_from("<I", data, 1)
+        lengths = struct.unpack_from(f"<{count}Q", data, 5)
+        end = len(data)
+        buffers = []
+        for length in reversed(lengths):
+            buffers.append(data[end - length : end])
+            end -= length
+        buffers.reverse()
+        return pickle.loads(data[5 + 8 * count : end], buffers=buffers)
+
+
+class MsgpackSerializer:
+    """
+    MessagePack, for plain data (dicts, lists, strings, numbers, bytes) that
+    must be readable from other languages. Tuples come back as lists.
+    """
+
+    name = "msgpack"
+    tag = b"M"
+
+    def __init__(self):
+        if msgpack is None:
+            raise ImportError(
+                "The 'msgpack' library is required to use MsgpackSerializer."
+            )
+
+    def dumps(self, obj: Any) -> List[Any]:
+        return [msgpack.packb(obj, use_bin_type=True)]
+
+    def loads(self, data: memoryview) -> Any:
+        return msgpack.unpackb(data, raw=False)
+
+
+class NumpySerializer:
+    """
+    NumPy arrays in `.npy` format. The array data is written without a copy and
+    read back as a view of the payload. Object and datetime arrays (which have
+    no buffer) and other values are not supported.
+    """
+
+    name = "numpy"
+    tag = b"N"
+
+    def __init__(self):
+        if np is None:
+            raise ImportError("The 'numpy' library is required to use NumpySerializer.")
+
+    def dumps(self, obj: Any) -> List[Any]:
+        if not isinstance(obj, np.ndarray) or obj.dtype.hasobject:
+            raise TypeError(f"NumpySerializer can't serialize {type(obj).__name__}")
+        if obj.dtype.kind in "Mm":
+            raise TypeError(f"NumpySerializer can't serialize {obj.dtype} arrays")
+        if not (obj.flags.c_contiguous or obj.flags.f_contiguous):
+            obj = np.ascontiguousarray(obj)
+        header = io.BytesIO()
+        np.lib.format.write_array_header_2_0(
+            header, np.lib.format.header_data_from_array_1_0(obj)
+        )
+        data = obj.T if obj.flags.f_contiguous and not obj.flags.c_contiguous else obj
+        return [header.getvalue(), memoryview(data.reshape(-1)).cast("B")]
+
+    def loads(self, data: memoryview) -> Any:
+        # Magic (6 bytes), version (2), header length (u4 in version 2.0)
+        (header_len,) = struct.unpack_from("<I", data, 8)
+        offset = 12 + header_len
+        shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(
+            io.BytesIO(bytes(data[8:offset]))
+        )
+        count = 1
+        for dim in shape:
+            count *= dim
+        array = np.frombuffer(data, dtype=dtype, count=count, offset=offset)
+        return array.reshape(shape, order="F" if fortran_order else "C")
+
+
+# --- Compressors ---
+
+
+class ZlibCompressor:
+    """zlib (from the standard library), always available."""
+
+    name = "zlib"
+    tag = b"z"
+
+    def __init__(self, level: int = 6):
+        self.level = level
+
+    def compress(self, data: bytes) -> bytes:
+        return zlib.compress(data, self.level)
+
+    def decompress(self, data: memoryview) -> bytes:
+        return zlib.decompress(data)
+
+
+class ZstdCompressor:
+    """
+    Zstandard: zlib-like ratios at several times the speed.
+
+    One instance is shared by every codec of a registry, and codecs run in
+    worker threads (e.g. the Redis backends), but zstandard's compressor and
+    decompressor objects are not thread-safe: each thread gets its own.
+    """
+
+    name = "zstd"
+    tag = b"s"
+
+    def __init__(self, level: int = 3):
+        if zstandard is None:
+            raise ImportError(
+                "The 'zstandard' library is required to use ZstdCompressor."
+            )
+        self.level = level
+        self._local = threading.local()
+
+    def compress(self, data: bytes) -> bytes:
+        compressor = getattr(self._local, "compressor", None)
+        if compressor is None:
+            compressor = self._local.compressor = zstandard.ZstdCompressor(
+                level=self.level
+            )
+        return compressor.compress(data)
+
+    def decompress(self, data: memoryview) -> bytes:
+        decompressor = getattr(self._local, "decompressor", None)
+        if decompressor is None:
+            decompressor = self._local.decompressor = zstandard.ZstdDecompressor()
+        return decompressor.decompress(data)
+
+
+class Lz4Compressor:
+    """LZ4: lower ratios, but fast enough to pay off on fast networks."""
+
+    name = "lz4"
+    tag = b"l"
+
+    def __init__(self):
+        if lz4_frame is None:
+            raise ImportError("The 'lz4' library is required to use Lz4Compressor.")
+
+    def compress(self, data: bytes) -> bytes:
+        return lz4_frame.compress(data)
+
+    def decompress(self, data: memoryview) -> bytes:
+        return lz4_frame.decompress(data)
@@ -1,4 +1,5 @@
 from .native import NativeSolver
 from .csp import CSPSolver
+from .vectorized import VectorizedSolver
 
-__all__ = ["NativeSolver", "CSPSolver"]
+__all__ = ["NativeSolver", "CSPSolver", "VectorizedSolver"]
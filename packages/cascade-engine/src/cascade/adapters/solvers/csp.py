@@ -1,8 +1,11 @@
-from typing import Dict, Optional
+import math
+import time
 from collections import defaultdict
-from cascade.graph.model import Graph
-from cascade.spec.protocols import ExecutionPlan
+from typing import Callable, Dict, List, Optional, Set, Tuple
+from cascade.graph.model import Graph, EdgeType
+from cascade.spec.protocols import DurationStore, ExecutionPlan
 from cascade.spec.lazy_types import LazyResult, MappedLazyResult
+from cascade.adapters.durations import estimate_weights
 
 try:
     import constraint
@@ -10,20 +13,141 @@ except ImportError:
     constraint = None
 
 
+class _SearchTimeout(Exception):
+    """Raised from inside the CSP search once the solver's time budget is spent."""
+
+
+class _PrecedenceConstraint(constraint.Constraint if constraint else object):
+    """
+    All dependency constraints (stage(A) < stage(B) for every edge A -> B) as one
+    constraint with bounds propagation.
+
+    Pairwise constraints only prune the direct neighbours of an assigned node, so
+    the search discovers violated chains late and thrashes. This constraint
+    tightens the stage window of every node along whole chains after each
+    assignment.
+    """
+
+    def __init__(
+        self,
+        order: List[str],
+        preds: Dict[str, List[str]],
+        succs: Dict[str, List[str]],
+    ):
+        self._order = order
+        self._preds = preds
+        self._succs = succs
+
+    def __call__(self, variables, domains, assignments, forwardcheck=False):
+        lower: Dict[str, int] = {}
+        for nid in self._order:
+            stage = assignments.get(nid)
+            low = min(domains[nid]) if stage is None else stage
+            for pred in self._preds[nid]:
+                low = max(low, lower[pred] + 1)
+            lower[nid] = low
+
+        upper: Dict[str, int] = {}
+        for nid in reversed(self._order):
+            stage = assignments.get(nid)
+            high = max(domains[nid]) if stage is None else stage
+            for succ in self._succs[nid]:
+                high = min(high, upper[succ] - 1)
+            if high < lower[nid]:
+                return False
+            upper[nid] = high
+
+        if forwardcheck:
+            for nid in self._order:
+                if nid in assignments:
+                    continue
+                domain = domains[nid]
+                for stage in domain[:]:
+                    if stage < lower[nid] or stage > upper[nid]:
+                        domain.hideValue(stage)
+                if not domain:
+                    return False
+        return True
+
+
+class _StageCapacityConstraint(constraint.Constraint if constraint else object):
+    """
+    A cumulative resource constraint: for every stage, the summed usage of one
+    resource by the variables assigned to that stage must not exceed `limit`.
+
+    Unlike a plain function constraint, it is checked on partial assignments and
+    forward-checks the domains of unassigned variables, so overloaded stages are
+    pruned as soon as they appear. It also enforces the solver's deadline.
+    """
+
+    def __init__(self, amounts: List[float], limit: float, deadline: float):
+        self._amounts = amounts
+        self._limit = limit
+        self._deadline = deadline
+
+    def __call__(self, variables, domains, assignments, forwardcheck=False):
+        if time.monotonic() > self._deadline:
+            raise _SearchTimeout()
+
+        usage: Dict[int, float] = defaultdict(float)
+        for variable, amount in zip(variables, self._amounts):
+            stage = assignments.get(variable)
+            if stage is not None:
+                usage[stage] += amount
+                if usage[stage] > self._limit:
+                    return False
+
+        if forwardcheck:
+            for variable, amount in zip(variables, self._amounts):
+                if variable in assignments:
+                    continue
+                domain = domains[variable]
+                for stage in domain[:]:
+                    if usage.get(stage, 0.0) + amount > self._limit:
+                        domain.hideValue(stage)
+                if not domain:
+                    return False
+        return True
+
+
 class CSPSolver:
     """
     A solver that uses Constraint Satisfaction Problem (CSP) techniques to produce
-    a resource-aware execution plan.
+    a resource-aware execution plan with the minimum number of stages (Makespan)
+    that satisfies all dependency and resource constraints.
 
-    It employs Iterative Deepening Search to find the schedule with the minimum
-    number of stages (Makespan) that satisfies all dependency and resource constraints.
+    The search is bounded from both sides before any CSP is built:
+
+    - Lower bound: the critical path length, and for every resource the total
+      demand divided by the system capacity.
+    - Upper bound: the best of a few greedy resource-constrained list schedules,
+      which prefer nodes on long or resource-heavy paths.
+
+    If the bounds meet, the greedy plan is optimal and is returned directly.
+    Otherwise the stage count is binary-searched between them. Each probe is a
+    CSP with per-node stage windows, one propagating precedence constraint and
+    one cumulative constraint per resource. Once `time_budget` seconds are
+    spent, the best plan found so far is returned.
+
+    With a `duration_store`, greedy schedules also prioritise by duration-weighted
+    critical path, and among plans with the same number of stages the one with
+    the shortest estimated makespan (the sum of each stage's longest node) wins.
     """
 
-    def __init__(self, system_resources: Dict[str, float]):
+    def __init__(
+        self,
+        system_resources: Dict[str, float],
+        time_budget: Optional[float] = 0.5,
+        duration_store: Optional[DurationStore] = None,
+    ):
         """
         Args:
             system_resources: A dictionary defining the total available capacity
                               for each resource (e.g., {"gpu": 2, "memory_gb": 32}).
+            time_budget: Maximum number of seconds to spend on the CSP search.
+                         None means the search always runs to the optimum.
+            duration_store: Observed task durations (usually the Engine's), used
+                            as node costs. Without it every node costs one unit.
         """
         if constraint is None:
             raise ImportError(
@@ -31,6 +155,8 @@ class CSPSolver:
                 "Please install it with: pip install cascade-py[csp_solver]"
             )
         self.system_resources = system_resources
+        self.time_budget = time_budget
+        self.duration_store = duration_store
 
     def resolve(self, graph: Graph) -> ExecutionPlan:
         # 0. Active Nodes
@@ -39,6 +165,8 @@ class CSPSolver:
         if not active_nodes:
             return []
 
+        variables = [n.structural_id for n in active_nodes]
+
         # 1. Preprocessing: Extract static resource requirements
         # node_id -> {resource_name: amount}
         node_resources: Dict[str, Dict[str, float]] = {}
@@ -52,29 +180,71 @@ class CSPSolver:
                         reqs[res] = float(amount)
             node_resources[node.structural_id] = reqs
 
-        # 2. Iterative Deepening Search
-        # Try to find a schedule with K stages, starting from K=1 up to N (serial execution).
-        # Optimization: Start K from the length of the critical path (longest dependency chain)
-        # could be faster, but K=1 is a safe, simple start.
+        for reqs in node_resources.values():
+            for res, limit in self.system_resources.items():
+                if reqs.get(res, 0.0) > limit:
+                    self._fail()
 
-        n_nodes = len(active_nodes)
-        solution = None
+        # 2. Dependency structure and bounds
+        preds, succs = self._dependencies(graph, variables)
+        order = self._topological_order(variables, preds, succs)
+        earliest, tail = self._path_lengths(order, preds, succs)
+        critical_path = max(earliest[nid] + tail[nid] for nid in variables) + 1
 
-        # We try max_stages from 1 to n_nodes.
-        # In the worst case (full serial), we need n_nodes stages.
-        for max_stages in range(1, n_nodes + 1):
-            solution = self._solve_csp(graph, active_nodes, node_resources, max_stages)
-            if solution:
-                break
+        weights = None
+        if self.duration_store is not None:
+            weights = estimate_weights(self.duration_store, active_nodes)
 
-        if not solution:
-            raise RuntimeError(
-                "CSPSolver failed to find a valid schedule. "
-                "This usually implies circular dependencies or unsatisfiable resource constraints "
-                "(e.g., a single task requires more resources than system total)."
-            )
+        def cost(candidate: Dict[str, int]) -> Tuple[int, float]:
+            return max(candidate.values()), self._makespan(candidate, weights)
 
-        # 3. Convert solution to ExecutionPlan
+        lower = max(critical_path, self._resource_bound(node_resources))
+        solution = min(
+            (
+                self._greedy_schedule(order, preds, succs, node_resources, priority)
+                for priority in self._priorities(
+                    order, succs, tail, node_resources, weights
+                )
+            ),
+            key=cost,
+        )
+        upper = max(solution.values()) + 1
+
+        # 3. Binary search on the stage count between the bounds.
+        # The remaining budget is split evenly over the probes still needed. A
+        # probe that runs out of time is treated like an infeasible one: the
+        # search moves on to larger (easier) stage counts.
+        deadline = (
+            math.inf
+            if self.time_budget is None
+            else time.monotonic() + self.time_budget
+        )
+        while lower < upper:
+            max_stages = (lower + upper) // 2
+            probes_left = math.ceil(math.log2(upper - lower + 1))
+            now = time.monotonic()
+            if now >= deadline:
+                break
+            try:
+                candidate = self._solve_csp(
+                    order,
+                    preds,
+                    succs,
+                    earliest,
+                    tail,
+                    node_resources,
+                    max_stages,
+                    now + (deadline - now) / probes_left,
+                )
+            except _SearchTimeout:
+                candidate = None
+            if candidate:
+                solution = candidate
+                upper = max_stages
+            else:
+                lower = max_stages + 1
+
+        # 4. Convert solution to ExecutionPlan
         # solution is {node_id: stage_index}
         plan_dict = defaultdict(list)
         for node_id, stage_idx in solution.items():
@@ -96,60 +266,222 @@ class CSPSolver:
 
         return execution_plan
 
+    def _fail(self):
+        raise RuntimeError(
+            "CSPSolver failed to find a valid schedule. "
+            "This usually implies circular dependencies or unsatisfiable resource constraints "
+            "(e.g., a single task requires more resources than system total)."
+        )
+
+    def _dependencies(
+        self, graph: Graph, variables: List[str]
+    ) -> Tuple[Dict[str, List[str]], Dict[str, List[str]]]:
+        """Returns the (deduplicated) predecessor and successor lists of every node."""
+        scheduled = set(variables)
+        # Read from the adjacency index: iterating `graph.edges` would
+        # materialize every Edge of a CompactGraph.
+        preds = {
+            nid: _dedup_links(graph.get_in_links(nid), scheduled) for nid in variables
+        }
+        succs = {
+            nid: _dedup_links(graph.get_out_links(nid), scheduled) for nid in variables
+        }
+        return preds, succs
+
+    def _topological_order(
+        self,
+        variables: List[str],
+        preds: Dict[str, List[str]],
+        succs: Dict[str, List[str]],
+    ) -> List[str]:
+        in_degree = {nid: len(preds[nid]) for nid in variables}
+        order = [nid for nid in variables if in_degree[nid] == 0]
+        for nid in order:
+            for succ in succs[nid]:
+                in_degree[succ] -= 1
+                if in_degree[succ] == 0:
+                    order.append(succ)
+        if len(order) != len(variables):
+            self._fail()
+        return order
+
+    def _path_lengths(
+        self,
+        order: List[str],
+        preds: Dict[str, List[str]],
+        succs: Dict[str, List[str]],
+    ) -> Tuple[Dict[str, int], Dict[str, int]]:
+        """
+        Returns, for every node, the earliest stage it can run in and the number
+        of stages that must still follow it (the longest path to a sink).
+        """
+        earliest: Dict[str, int] = {}
+        for nid in order:
+            earliest[nid] = max((earliest[p] + 1 for p in preds[nid]), default=0)
+        tail: Dict[str, int] = {}
+        for nid in reversed(order):
+            tail[nid] = max((tail[s] + 1 for s in succs[nid]), default=0)
+        return earliest, tail
+
+    def _resource_bound(self, node_resources: Dict[str, Dict[str, float]]) -> int:
+        """Every stage holds at most `limit` of a resource, so demand/limit stages are needed."""
+        bound = 1
+        for res, limit in self.system_resources.items():
+            total = sum(reqs.get(res, 0.0) for reqs in node_resources.values())
+            if total > 0:
+                if limit <= 0:
+                    self._fail()
+                # Round away float noise before taking the ceiling
+                bound = max(bound, math.ceil(round(total / limit, 9)))
+        return bound
+
+    def _fits(self, usage: Dict[str, float], reqs: Dict[str, float]) -> bool:
+        for res, limit in self.system_resources.items():
+            if usage[res] + reqs.get(res, 0.0) > limit:
+                return False
+        return True
+
+    def _priorities(
+        self,
+        order: List[str],
+        succs: Dict[str, List[str]],
+        tail: Dict[str, int],
+        node_resources: Dict[str, Dict[str, float]],
+        weights: Optional[Dict[str, float]],
+    ) -> List[Callable[[str], tuple]]:
+        """
+        Returns the sort keys tried by the greedy scheduler. No single rule wins
+        on every graph, and each greedy pass is cheap, so several are tried.
+        """
+        # The largest share of any system resource a node needs
+        demand = {
+            nid: max(
+                (
+                    node_resources[nid].get(res, 0.0) / limit
+                    for res, limit in self.system_resources.items()
+                    if limit > 0
+                ),
+                default=0.0,
+            )
+            for nid in order
+        }
+        # The heaviest resource demand along any path starting at the node
+        load: Dict[str, float] = {}
+        for nid in reversed(order):
+            load[nid] = demand[nid] + max((load[s] for s in succs[nid]), default=0.0)
+
+        priorities = [
+            lambda nid: (-tail[nid], nid),
+            lambda nid: (-tail[nid], -demand[nid], nid),
+            lambda nid: (-load[nid], -tail[nid], nid),
+        ]
+        if weights is not None:
+            # The longest duration-weighted path starting at the node
+            cost_tail: Dict[str, float] = {}
+            for nid in reversed(order):
+                cost_tail[nid] = weights[nid] + max(
+                    (cost_tail[s] for s in succs[nid]), default=0.0
+                )
+            priorities.append(lambda nid: (-cost_tail[nid], -tail[nid], nid))
+        return priorities
+
+    def _makespan(
+        self, solution: Dict[str, int], weights: Optional[Dict[str, float]]
+    ) -> float:
+        """Estimated run time of a plan: every stage lasts as long as its slowest node."""
+        if weights is None:
+            return 0.0
+        longest: Dict[int, float] = defaultdict(float)
+        for nid, stage in solution.items():
+            longest[stage] = max(longest[stage], weights[nid])
+        return sum(longest.values())
+
+    def _greedy_schedule(
+        self,
+        order: List[str],
+        preds: Dict[str, List[str]],
+        succs: Dict[str, List[str]],
+        node_resources: Dict[str, Dict[str, float]],
+        priority: Callable[[str], tuple],
+    ) -> Dict[str, int]:
+        """
+        Resource-constrained list scheduling: fills one stage at a time with ready
+        nodes in `priority` order, skipping nodes that would overload the stage.
+        """
+        remaining = {nid: len(preds[nid]) for nid in order}
+        ready = [nid for nid in order if remaining[nid] == 0]
+        solution: Dict[str, int] = {}
+        stage = 0
+        while ready:
+            ready.sort(key=priority)
+            usage: Dict[str, float] = defaultdict(float)
+            deferred = []
+            placed = []
+            for nid in ready:
+                reqs = node_resources[nid]
+                if self._fits(usage, reqs):
+                    for res, amount in reqs.items():
+                        usage[res] += amount
+                    solution[nid] = stage
+                    placed.append(nid)
+                else:
+                    deferred.append(nid)
+
+            ready = deferred
+            for nid in placed:
+                for succ in succs[nid]:
+                    remaining[succ] -= 1
+                    if remaining[succ] == 0:
+                        ready.append(succ)
+            stage += 1
+        return solution
+
     def _solve_csp(
         self,
-        graph: Graph,
-        active_nodes: list,
+        order: List[str],
+        preds: Dict[str, List[str]],
+        succs: Dict[str, List[str]],
+        earliest: Dict[str, int],
+        tail: Dict[str, int],
         node_resources: Dict[str, Dict[str, float]],
         max_stages: int,
+        deadline: float,
     ) -> Optional[Dict[str, int]]:
-        from cascade.graph.model import EdgeType
-
         problem = constraint.Problem()
 
         # Variables: Node IDs (only active ones)
-        # Domain: Possible Stage Indices [0, max_stages - 1]
-        domain = list(range(max_stages))
-        variables = [n.structural_id for n in active_nodes]
-        problem.addVariables(variables, domain)
+        # Domain: the stages between the node's earliest start and the last stage
+        # that still leaves room for its longest chain of successors.
+        # Values are tried from the end of the domain, so list the earliest stage last.
+        for nid in order:
+            domain = list(range(max_stages - tail[nid] - 1, earliest[nid] - 1, -1))
+            if not domain:
+                return None
+            problem.addVariable(nid, domain)
 
         # Constraint 1: Dependencies
         # If A -> B, then stage(A) < stage(B)
-        for edge in graph.edges:
-            # Skip POTENTIAL edges
-            if edge.edge_type == EdgeType.POTENTIAL:
-                continue
+        problem.addConstraint(_PrecedenceConstraint(order, preds, succs), order)
 
-            # Note: We use a lambda that captures nothing, args are passed by value in addConstraint
+        # Constraint 2: Resources
+        # For each resource, the usage of every stage <= system_resources
+        for res, limit in self.system_resources.items():
+            users = [nid for nid in order if node_resources[nid].get(res, 0.0)]
+            if not users:
+                continue
+            amounts = [node_resources[nid][res] for nid in users]
             problem.addConstraint(
-                lambda s_src, s_tgt: s_src < s_tgt,
-                (edge.source.structural_id, edge.target.structural_id),
+                _StageCapacityConstraint(amounts, limit, deadline), users
             )
 
-        # Constraint 2: Resources
-        # Sum of resources in each stage <= system_resources
-        if self.system_resources:
-            # We define a constraint function that accepts the stage assignment for ALL nodes
-            def resource_check(*stage_assignments):
-                # Reconstruct the stage -> nodes mapping for this assignment attempt
-                stages = defaultdict(list)
-                for i, stage_idx in enumerate(stage_assignments):
-                    node_id = variables[i]  # variables list order matches args order
-                    stages[stage_idx].append(node_id)
-
-                # Check each stage
-                for stage_nodes in stages.values():
-                    stage_usage = defaultdict(float)
-                    for nid in stage_nodes:
-                        for res, amount in node_resources[nid].items():
-                            stage_usage[res] += amount
-
-                    # Verify against system limits
-                    for res, limit in self.system_resources.items():
-                        if stage_usage[res] > limit:
-                            return False
-                return True
-
-            problem.addConstraint(resource_check, variables)
-
         return problem.getSolution()
+
+
+def _dedup_links(links: List[Tuple[str, EdgeType]], scheduled: Set[str]) -> List[str]:
+    """Returns the distinct scheduled nodes of `links`, skipping POTENTIAL edges."""
+    found: Dict[str, None] = {}
+    for node_id, edge_type in links:
+        # Skip POTENTIAL edges
+        if edge_type != EdgeType.POTENTIAL and node_id in scheduled:
+            found[node_id] = None
+    return list(found)
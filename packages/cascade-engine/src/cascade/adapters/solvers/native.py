@@ -39,19 +39,21 @@ class NativeSolver(Solver):
             EdgeType.ROUTER_ROUTE,  # Considered a dependency for plan completeness
         }
 
-        for edge in graph.edges:
-            if edge.edge_type not in EXECUTION_EDGE_TYPES:
-                continue
+        # The adjacency index gives the topology without materializing every
+        # Edge of a CompactGraph.
+        for node in executable_nodes:
+            source_id = node.structural_id
+            for target_id, edge_type in graph.get_out_links(source_id):
+                if edge_type not in EXECUTION_EDGE_TYPES:
+                    continue
 
-            # Ensure edge connects executable nodes
-            if (
-                edge.source.structural_id not in node_map
-                or edge.target.structural_id not in node_map
-            ):
-                continue
+                # Ensure edge connects executable nodes
+                target = node_map.get(target_id)
+                if target is None:
+                    continue
 
-            adj[edge.source.structural_id].append(edge.target)
-            in_degree[edge.target.structural_id] += 1
+                adj[source_id].append(target)
+                in_degree[target_id] += 1
 
         # Kahn's algorithm for topological sorting
         queue = deque(
@@ -0,0 +1,142 @@
+from typing import List
+
+from cascade.graph.model import CompactGraph, EdgeType, Graph
+from cascade.spec.protocols import Solver, ExecutionPlan
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# Edge types that represent actual execution dependencies (same as NativeSolver).
+EXECUTION_EDGE_TYPES = (
+    EdgeType.DATA,
+    EdgeType.CONDITION,
+    EdgeType.CONSTRAINT,
+    EdgeType.IMPLICIT,
+    EdgeType.SEQUENCE,
+    EdgeType.ROUTER_ROUTE,
+)
+
+
+class VectorizedSolver(Solver):
+    """
+    A drop-in replacement for NativeSolver for very large graphs.
+
+    The graph is converted to a CSR adjacency (NumPy arrays) and the stage of every
+    node is computed with vectorized frontier operations: each iteration releases a
+    whole stage at once. Stages are then ordered by structural_id with a single
+    global sort, so the plan is identical to NativeSolver's.
+
+    Best suited to wide graphs. Every stage costs a few NumPy calls, so long narrow
+    chains gain nothing over NativeSolver.
+    """
+
+    def __init__(self):
+        if np is None:
+            raise ImportError(
+                "The 'numpy' library is required to use the VectorizedSolver. "
+                "Please install it with: pip install cascade-engine[vectorized]"
+            )
+
+    def resolve(self, graph: Graph) -> ExecutionPlan:
+        """
+        Resolves a dependency graph into a list of execution stages.
+
+        Raises:
+            ValueError: If a cycle is detected in the graph.
+        """
+        nodes = graph.nodes
+        n_nodes = len(nodes)
+        if n_nodes == 0:
+            return []
+
+        sources, targets = self._execution_edges(graph)
+        levels = self._compute_levels(sources, targets, n_nodes)
+
+        # Deterministic output: order by (stage, structural_id), like NativeSolver
+        ranks = np.empty(n_nodes, dtype=np.int64)
+        ranks[np.argsort(np.array([n.structural_id for n in nodes]), kind="stable")] = (
+            np.arange(n_nodes)
+        )
+        order = np.lexsort((ranks, levels))
+        stage_sizes = np.bincount(levels)
+
+        plan: ExecutionPlan = []
+        start = 0
+        for size in stage_sizes.tolist():
+            plan.append([nodes[i] for i in order[start : start + size].tolist()])
+            start += size
+        return plan
+
+    def _execution_edges(self, graph: Graph):
+        """Returns (sources, targets) node index arrays of all execution edges."""
+        if isinstance(graph, CompactGraph):
+            # FAST PATH: The edge columns already hold node indexes
+            columns = graph.edge_columns()
+            allowed = [list(EdgeType).index(t) for t in EXECUTION_EDGE_TYPES]
+            mask = np.isin(columns["type"], allowed)
+            return (
+                columns["source"][mask].astype(np.int64),
+                columns["target"][mask].astype(np.int64),
+            )
+
+        positions = {node.structural_id: i for i, node in enumerate(graph.nodes)}
+        allowed_types = set(EXECUTION_EDGE_TYPES)
+        sources: List[int] = []
+        targets: List[int] = []
+        for edge in graph.edges:
+            if edge.edge_type not in allowed_types:
+                continue
+            # Ensure edge connects executable nodes
+            source = positions.get(edge.source.structural_id)
+            target = positions.get(edge.target.structural_id)
+            if source is None or target is None:
+                continue
+            sources.append(source)
+            targets.append(target)
+        return (
+            np.array(sources, dtype=np.int64),
+            np.array(targets, dtype=np.int64),
+        )
+
+    def _compute_levels(self, sources, targets, n_nodes: int):
+        """
+        Computes the stage of every node with Kahn's algorithm, one whole frontier
+        (stage) per iteration.
+        """
+        # CSR adjacency: the successors of node i are succ[offsets[i]:offsets[i + 1]]
+        succ = targets[np.argsort(sources, kind="stable")]
+        offsets = np.zeros(n_nodes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=n_nodes), out=offsets[1:])
+
+        in_degree = np.bincount(targets, minlength=n_nodes)
+        levels = np.full(n_nodes, -1, dtype=np.int64)
+
+        frontier = np.flatnonzero(in_degree == 0)
+        level = 0
+        processed = 0
+        while frontier.size:
+            levels[frontier] = level
+            processed += frontier.size
+
+            # Gather the successor ranges of all frontier nodes at once
+            starts = offsets[frontier]
+            counts = offsets[frontier + 1] - starts
+            total = int(counts.sum())
+            if total == 0:
+                break
+            first = np.repeat(starts - np.cumsum(counts) + counts, counts)
+            released = succ[first + np.arange(total)]
+
+            in_degree -= np.bincount(released, minlength=n_nodes)
+            candidates = np.unique(released)
+            frontier = candidates[in_degree[candidates] == 0]
+            level += 1
+
+        # If not all nodes were processed, a cycle must exist.
+        if processed != n_nodes:
+            raise ValueError("Cycle detected in the dependency graph.")
+
+        return levels
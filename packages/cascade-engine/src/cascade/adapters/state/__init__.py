@@ -1,4 +1,6 @@
 from .in_memory import InMemoryStateBackend
+from .spilling import SpillingStateBackend
+from .sqlite import SqliteStateBackend
 
 # We don't import RedisStateBackend by default to avoid hard dependency on redis
-__all__ = ["InMemoryStateBackend"]
+__all__ = ["InMemoryStateBackend", "SpillingStateBackend", "SqliteStateBackend"]
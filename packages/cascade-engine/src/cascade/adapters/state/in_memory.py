@@ -1,4 +1,4 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Sequence, Set
 
 
 class InMemoryStateBackend:
@@ -35,6 +35,16 @@ class InMemoryStateBackend:
     async def has_result(self, node_id: str) -> bool:
         return node_id in self._results
 
+    async def get_many(self, node_ids: Sequence[str]) -> Dict[str, Any]:
+        results = self._results
+        return {node_id: results[node_id] for node_id in node_ids if node_id in results}
+
+    async def has_many(self, node_ids: Sequence[str]) -> Set[str]:
+        return {node_id for node_id in node_ids if node_id in self._results}
+
+    async def put_many(self, results: Dict[str, Any]) -> None:
+        self._results.update(results)
+
     async def mark_skipped(self, node_id: str, reason: str) -> None:
         self._skipped[node_id] = reason
 
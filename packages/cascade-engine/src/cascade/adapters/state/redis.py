@@ -1,19 +1,29 @@
 import asyncio
-import pickle
-from typing import Any, Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+from cascade.adapters.serializers import ResultCodec
 
 try:
     import redis
+    import redis.asyncio as aioredis
 except ImportError:
     redis = None
+    aioredis = None
 
 
 class RedisStateBackend:
     """
     A StateBackend implementation that persists results to Redis.
+    Results are encoded with `codec` (pickle by default, see ResultCodec).
     """
 
-    def __init__(self, run_id: str, client: "redis.Redis", ttl: int = 86400):
+    def __init__(
+        self,
+        run_id: str,
+        client: "redis.Redis",
+        ttl: int = 86400,
+        codec: Optional[ResultCodec] = None,
+    ):
         if redis is None:
             raise ImportError(
                 "The 'redis' library is required to use RedisStateBackend."
@@ -22,30 +32,68 @@ class RedisStateBackend:
         self._run_id = run_id
         self._client = client
         self._ttl = ttl
+        self._codec = codec if codec is not None else ResultCodec()
 
         # Keys
         self._results_key = f"cascade:run:{run_id}:results"
         self._skipped_key = f"cascade:run:{run_id}:skipped"
 
     async def put_result(self, node_id: str, result: Any) -> None:
-        data = pickle.dumps(result)
-        await asyncio.to_thread(self._sync_put, node_id, data)
+        await asyncio.to_thread(self._sync_put, node_id, result)
 
-    def _sync_put(self, node_id: str, data: bytes):
+    def _sync_put(self, node_id: str, result: Any):
         pipe = self._client.pipeline()
-        pipe.hset(self._results_key, node_id, data)
+        pipe.hset(self._results_key, node_id, self._codec.encode(result))
         pipe.expire(self._results_key, self._ttl)
         pipe.execute()
 
     async def get_result(self, node_id: str) -> Optional[Any]:
-        data = await asyncio.to_thread(self._client.hget, self._results_key, node_id)
+        return await asyncio.to_thread(self._sync_get, node_id)
+
+    def _sync_get(self, node_id: str) -> Optional[Any]:
+        data = self._client.hget(self._results_key, node_id)
         if data is None:
             return None
-        return pickle.loads(data)
+        return self._codec.decode(data)
 
     async def has_result(self, node_id: str) -> bool:
         return await asyncio.to_thread(self._client.hexists, self._results_key, node_id)
 
+    async def get_many(self, node_ids: Sequence[str]) -> Dict[str, Any]:
+        return await asyncio.to_thread(self._sync_get_many, list(node_ids))
+
+    def _sync_get_many(self, node_ids: List[str]) -> Dict[str, Any]:
+        values = self._client.hmget(self._results_key, node_ids)
+        return {
+            node_id: self._codec.decode(data)
+            for node_id, data in zip(node_ids, values)
+            if data is not None
+        }
+
+    async def has_many(self, node_ids: Sequence[str]) -> Set[str]:
+        node_ids = list(node_ids)
+        flags = await asyncio.to_thread(self._sync_has_many, node_ids)
+        return {node_id for node_id, flag in zip(node_ids, flags) if flag}
+
+    def _sync_has_many(self, node_ids: Sequence[str]):
+        pipe = self._client.pipeline()
+        for node_id in node_ids:
+            pipe.hexists(self._results_key, node_id)
+        return pipe.execute()
+
+    async def put_many(self, results: Dict[str, Any]) -> None:
+        await asyncio.to_thread(self._sync_put_many, results)
+
+    def _sync_put_many(self, results: Dict[str, Any]):
+        encode = self._codec.encode
+        pipe = self._client.pipeline()
+        pipe.hset(
+            self._results_key,
+            mapping={node_id: encode(result) for node_id, result in results.items()},
+        )
+        pipe.expire(self._results_key, self._ttl)
+        pipe.execute()
+
     async def mark_skipped(self, node_id: str, reason: str) -> None:
         await asyncio.to_thread(self._sync_mark_skipped, node_id, reason)
 
@@ -70,3 +118,261 @@ class RedisStateBackend:
         relying on key overwrite semantics.
         """
         pass
+
+
+class AsyncRedisStateBackend:
+    """
+    A StateBackend on `redis.asyncio`, for runs that keep their state in Redis.
+
+    - Writes are buffered and sent in one pipeline by `flush()`, which the
+      engine calls at stage boundaries. The pipeline runs in the background;
+      `close()` (and `clear()`) wait for it.
+    - Keys are scoped by a generation counter, so `clear()` (called between TCO
+      iterations) is O(1): it bumps the generation and unlinks the old keys.
+    - Values written by this process are served from a local cache, so reads
+      never wait for a flush. A backend that started the current generation
+      (the engine clears state before every run and TCO iteration) owns it:
+      with `cache_writes`, its cache then holds the whole generation and reads
+      need no round-trip at all.
+
+    Results are encoded with `codec` (pickle by default, see ResultCodec).
+    Backends of different runs can share a client (and its connection pool);
+    see `factory()`.
+    """
+
+    def __init__(
+        self,
+        run_id: str,
+        client: "aioredis.Redis",
+        ttl: int = 86400,
+        cache_writes: bool = True,
+        codec: Optional[ResultCodec] = None,
+    ):
+        if aioredis is None:
+            raise ImportError(
+                "The 'redis' library is required to use AsyncRedisStateBackend."
+            )
+
+        self._run_id = run_id
+        self._client = client
+        self._ttl = ttl
+        self._cache_writes = cache_writes
+        self._codec = codec if codec is not None else ResultCodec()
+
+        self._generation_key = f"cascade:run:{run_id}:generation"
+        self._generation: Optional[int] = None
+        # Whether this backend started the current generation
+        self._owned = False
+        # Whether anything was written to Redis in the current generation
+        self._dirty = False
+
+        # Values written by this process. Unflushed values always stay here;
+        # flushed ones only if `cache_writes` is set.
+        self._results: Dict[str, Any] = {}
+        self._skipped: Dict[str, str] = {}
+        self._pending_results: Dict[str, Any] = {}
+        self._pending_skipped: Dict[str, str] = {}
+        self._flushing: Optional[asyncio.Future] = None
+
+        self.flushes = 0
+
+    @classmethod
+    def factory(
+        cls,
+        client: Optional["aioredis.Redis"] = None,
+        url: str = "redis://localhost:6379/0",
+        **kwargs: Any,
+    ) -> Callable[[str], "AsyncRedisStateBackend"]:
+        """
+        Returns a `state_backend_factory` for the Engine whose backends all share
+        one client, and therefore one connection pool.
+        """
+        if aioredis is None:
+            raise ImportError(
+                "The 'redis' library is required to use AsyncRedisStateBackend."
+            )
+        shared = client if client is not None else aioredis.Redis.from_url(url)
+        return lambda run_id: cls(run_id, shared, **kwargs)
+
+    def _keys(self) -> Tuple[str, str]:
+        prefix = f"cascade:run:{self._run_id}:{self._generation}"
+        return f"{prefix}:results", f"{prefix}:skipped"
+
+    @property
+    def _local_only(self) -> bool:
+        """True if every value of the generation is in the local cache."""
+        return self._owned and self._cache_writes
+
+    async def _ensure_generation(self) -> None:
+        if self._generation is None:
+            value = await self._client.get(self._generation_key)
+            self._generation = int(value) if value is not None else 0
+
+    async def put_result(self, node_id: str, result: Any) -> None:
+        self._results[node_id] = result
+        self._pending_results[node_id] = result
+
+    async def put_many(self, results: Dict[str, Any]) -> None:
+        self._results.update(results)
+        self._pending_results.update(results)
+
+    async def get_result(self, node_id: str) -> Optional[Any]:
+        if node_id in self._results:
+            return self._results[node_id]
+        if self._local_only:
+            return None
+        await self._ensure_generation()
+        data = await self._client.hget(self._keys()[0], node_id)
+        if data is None:
+            return None
+        return self._codec.decode(data)
+
+    async def get_many(self, node_ids: Sequence[str]) -> Dict[str, Any]:
+        found = {n: self._results[n] for n in node_ids if n in self._results}
+        remote = [n for n in node_ids if n not in found]
+        if remote and not self._local_only:
+            await self._ensure_generation()
+            values = await self._client.hmget(self._keys()[0], remote)
+            for node_id, data in zip(remote, values):
+                if data is not None:
+                    found[node_id] = self._codec.decode(data)
+        return found
+
+    async def has_result(self, node_id: str) -> bool:
+        if node_id in self._results:
+            return True
+        if self._local_only:
+            return False
+        await self._ensure_generation()
+        return bool(await self._client.hexists(self._keys()[0], node_id))
+
+    async def has_many(self, node_ids: Sequence[str]) -> Set[str]:
+        found = {n for n in node_ids if n in self._results}
+        remote = [n for n in node_ids if n not in found]
+        if remote and not self._local_only:
+            await self._ensure_generation()
+            results_key = self._keys()[0]
+            async with self._client.pipeline(transaction=False) as pipe:
+                for node_id in remote:
+                    pipe.hexists(results_key, node_id)
+                flags = await pipe.execute()
+            found.update(n for n, flag in zip(remote, flags) if flag)
+        return found
+
+    async def mark_skipped(self, node_id: str, reason: str) -> None:
+        self._skipped[node_id] = reason
+        self._pending_skipped[node_id] = reason
+
+    async def get_skip_reason(self, node_id: str) -> Optional[str]:
+        if node_id in self._skipped:
+            return self._skipped[node_id]
+        if self._local_only:
+            return None
+        await self._ensure_generation()
+        data = await self._client.hget(self._keys()[1], node_id)
+        if data:
+            return data.decode("utf-8")
+        return None
+
+    async def flush(self) -> None:
+        """
+        Sends the buffered writes in one pipeline, in the background. A failed
+        write is raised by the next `flush()`, `clear()` or `close()`; its
+        writes are buffered again, to be sent by the following `flush()`.
+
+        Writes still buffered when `clear()` runs are dropped unsent, so a TCO
+        iteration whose state is cleared right away costs no round-trip.
+        """
+        if not self._pending_results and not self._pending_skipped:
+            return
+        if self._flushing is not None:
+            if not self._flushing.done():
+                # The running writer picks up the new writes
+                return
+            flushing, self._flushing = self._flushing, None
+            # A failed write put its batch back: the next flush() retries it
+            flushing.result()
+        self._flushing = asyncio.ensure_future(self._write())
+
+    async def _write(self) -> None:
+        while self._pending_results or self._pending_skipped:
+            results, self._pending_results = self._pending_results, {}
+            skipped, self._pending_skipped = self._pending_skipped, {}
+
+            try:
+                await self._ensure_generation()
+                results_key, skipped_key = self._keys()
+                async with self._client.pipeline(transaction=False) as pipe:
+                    if results:
+                        # Encoding large results must not block the loop
+                        encoded = await asyncio.to_thread(self._encode_all, results)
+                        pipe.hset(results_key, mapping=encoded)
+                        pipe.expire(results_key, self._ttl)
+                    if skipped:
+                        pipe.hset(skipped_key, mapping=skipped)
+                        pipe.expire(skipped_key, self._ttl)
+                    await pipe.execute()
+            except BaseException:
+                # Put the unsent batch back; writes buffered since then are newer
+                self._pending_results = {**results, **self._pending_results}
+                self._pending_skipped = {**skipped, **self._pending_skipped}
+                # Part of the pipeline may have reached Redis
+                self._dirty = True
+                raise
+            self._dirty = True
+            self.flushes += 1
+
+            if not self._cache_writes:
+                for node_id, value in results.items():
+                    if self._results.get(node_id) is value:
+                        del self._results[node_id]
+                for node_id, reason in skipped.items():
+                    if self._skipped.get(node_id) == reason:
+                        del self._skipped[node_id]
+
+    def _encode_all(self, results: Dict[str, Any]) -> Dict[str, bytes]:
+        encode = self._codec.encode
+        return {node_id: encode(result) for node_id, result in results.items()}
+
+    async def _drain(self) -> None:
+        flushing, self._flushing = self._flushing, None
+        if flushing is not None:
+            await flushing
+
+    async def clear(self) -> None:
+        """
+        Starts a new generation: unflushed writes are dropped, and the previous
+        generation's keys are unlinked. Used between TCO iterations.
+        """
+        self._pending_results.clear()
+        self._pending_skipped.clear()
+        self._results.clear()
+        self._skipped.clear()
+        try:
+            await self._drain()
+        finally:
+            # A failed write put its batch back, but it belongs to the old generation
+            self._pending_results.clear()
+            self._pending_skipped.clear()
+
+        if self._owned and not self._dirty:
+            # Nothing reached Redis in our generation: it is already empty
+            return
+        stale = self._keys() if self._generation is not None else None
+        async with self._client.pipeline(transaction=False) as pipe:
+            pipe.incr(self._generation_key)
+            pipe.expire(self._generation_key, self._ttl)
+            if stale:
+                pipe.unlink(*stale)
+            generation, *_ = await pipe.execute()
+        self._generation = int(generation)
+        self._owned = True
+        self._dirty = False
+
+    async def close(self) -> None:
+        """
+        Writes out the remaining buffered state. The client is left open, as it
+        may be shared with other runs.
+        """
+        await self.flush()
+        await self._drain()
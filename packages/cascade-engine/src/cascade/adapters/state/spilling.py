@@ -0,0 +1,297 @@
+import asyncio
+import mmap
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+import weakref
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+# Results of these types are never spilled: they are small by construction.
+_INLINE_TYPES = (type(None), bool, int, float, complex)
+
+# Raw buffers are written as-is and come back as read-only memoryviews.
+_RAW_BUFFER_TYPES = (bytes, bytearray, memoryview)
+
+# Builtin containers whose pickled size is bounded by walking their items.
+_CONTAINER_TYPES = (list, tuple, dict, set, frozenset)
+
+# How many objects _size_bound looks at before giving up on a result.
+_SIZE_WALK_LIMIT = 10_000
+
+# Upper bound of the pickle framing of one object (opcodes, memo entries, and
+# the class and shape metadata of buffer-protocol objects such as arrays).
+_PICKLE_OVERHEAD = 1024
+
+
+def _size_bound(result: Any) -> Optional[int]:
+    """
+    Returns an upper bound of the pickled size of `result` without pickling it,
+    or None for results it can't bound cheaply: objects of other types, and
+    containers with more than _SIZE_WALK_LIMIT objects.
+    """
+    bound = _PICKLE_OVERHEAD
+    pending = [result]
+    walked = 0
+    while pending:
+        walked += 1
+        if walked > _SIZE_WALK_LIMIT:
+            return None
+        obj = pending.pop()
+        if isinstance(obj, _INLINE_TYPES):
+            # Always at least as large as their pickled form
+            bound += sys.getsizeof(obj)
+        elif isinstance(obj, str):
+            # At most four UTF-8 bytes per character
+            bound += len(obj) * 4 + 16
+        elif type(obj) in _CONTAINER_TYPES:
+            bound += 16
+            pending.extend(obj.items() if type(obj) is dict else obj)
+        else:
+            try:
+                # bytes, arrays and other buffer-protocol objects
+                nbytes = memoryview(obj).nbytes
+            except TypeError:
+                return None
+            bound += nbytes + _PICKLE_OVERHEAD
+    return bound
+
+
+class _SpilledResult:
+    """A result stored in a file of the scratch directory."""
+
+    __slots__ = ("path", "size", "buffers", "pickle_size")
+
+    def __init__(
+        self,
+        path: str,
+        size: int,
+        pickle_size: Optional[int] = None,
+        buffers: Tuple[Tuple[int, int], ...] = (),
+    ):
+        self.path = path
+        self.size = size
+        # None for raw buffers; otherwise the length of the in-band pickle data,
+        # followed in the file by the out-of-band buffers at (offset, length).
+        self.pickle_size = pickle_size
+        self.buffers = buffers
+
+    def load(self) -> Any:
+        if self.size == 0:
+            # Only empty raw buffers (with threshold_bytes=0); these can't be mapped
+            return memoryview(b"")
+        # A fresh mapping per read: it is unmapped (and its pages leave RSS) as
+        # soon as the last view of it is released.
+        with open(self.path, "rb") as f:
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        view = memoryview(mapping)
+        if self.pickle_size is None:
+            return view
+        return pickle.loads(
+            view[: self.pickle_size],
+            buffers=[view[offset : offset + length] for offset, length in self.buffers],
+        )
+
+
+class SpillingStateBackend:
+    """
+    A StateBackend that keeps small results in memory and spills results larger
+    than `threshold_bytes` to files in a per-run scratch directory, so that large
+    intermediate results of wide pipelines don't accumulate in RAM.
+
+    Spilled results are read back through read-only memory maps:
+
+    - bytes, bytearray and memoryview results come back as zero-copy
+      `memoryview`s of the mapped file.
+    - Other results are pickled (protocol 5). Out-of-band buffers, such as the
+      data of NumPy arrays, are stored raw and come back as zero-copy (read-only)
+      views of the mapped file.
+
+    Spill files are deleted on `clear()` and `close()` (called by the Engine at
+    the end of every run). Views handed out earlier stay valid on POSIX systems,
+    where a mapped file can outlive its directory entry.
+
+    Results that cannot be pickled are kept in memory.
+    """
+
+    def __init__(
+        self,
+        run_id: str,
+        threshold_bytes: int = 32 * 1024 * 1024,
+        directory: Optional[str] = None,
+    ):
+        """
+        Args:
+            run_id: The run this backend stores state for.
+            threshold_bytes: Results at least this large are spilled to disk.
+            directory: Where the run's scratch directory is created. Defaults to
+                       the system's temporary directory.
+        """
+        if threshold_bytes < 0:
+            raise ValueError("threshold_bytes must be a non-negative integer.")
+
+        self._run_id = run_id
+        self.threshold_bytes = threshold_bytes
+        self._directory = directory
+        self._scratch_dir: Optional[str] = None
+        self._finalizer: Optional[weakref.finalize] = None
+        self._file_counter = 0
+
+        self._results: Dict[str, Any] = {}
+        self._skipped: Dict[str, str] = {}
+
+        self.spilled_results = 0
+        self.spilled_bytes = 0
+        # Results that were pickled to measure their size
+        self.measured_results = 0
+
+    @property
+    def scratch_dir(self) -> Optional[str]:
+        """The run's scratch directory, or None if nothing was spilled yet."""
+        return self._scratch_dir
+
+    async def put_result(self, node_id: str, result: Any) -> None:
+        self._discard(node_id)
+        if self._is_small(result):
+            self._results[node_id] = result
+        else:
+            self.measured_results += 1
+            # Pickling and writing hundreds of megabytes must not block the loop
+            self._results[node_id] = await asyncio.to_thread(
+                self._spill_or_keep, result
+            )
+
+    async def get_result(self, node_id: str) -> Optional[Any]:
+        value = self._results.get(node_id)
+        if isinstance(value, _SpilledResult):
+            return value.load()
+        return value
+
+    async def has_result(self, node_id: str) -> bool:
+        return node_id in self._results
+
+    async def get_many(self, node_ids: Sequence[str]) -> Dict[str, Any]:
+        return {
+            node_id: await self.get_result(node_id)
+            for node_id in node_ids
+            if node_id in self._results
+        }
+
+    async def has_many(self, node_ids: Sequence[str]) -> Set[str]:
+        return {node_id for node_id in node_ids if node_id in self._results}
+
+    # No put_many: results are stored (and spilled) one by one as tasks finish,
+    # rather than being held in memory until the end of a stage.
+
+    async def mark_skipped(self, node_id: str, reason: str) -> None:
+        self._skipped[node_id] = reason
+
+    async def get_skip_reason(self, node_id: str) -> Optional[str]:
+        return self._skipped.get(node_id)
+
+    async def clear(self) -> None:
+        """
+        Clears all results and skip reasons, deleting their spill files.
+        Used between TCO iterations.
+        """
+        for node_id in list(self._results):
+            self._discard(node_id)
+        self._skipped.clear()
+
+    async def close(self) -> None:
+        """Clears the backend and removes its scratch directory."""
+        await self.clear()
+        if self._finalizer is not None:
+            self._finalizer()
+            self._finalizer = None
+            self._scratch_dir = None
+
+    def stats(self) -> Dict[str, int]:
+        """Returns how many results (and bytes) were measured and spilled so far."""
+        return {
+            "in_memory": sum(
+                not isinstance(v, _SpilledResult) for v in self._results.values()
+            ),
+            "spilled": sum(
+                isinstance(v, _SpilledResult) for v in self._results.values()
+            ),
+            "spilled_results": self.spilled_results,
+            "spilled_bytes": self.spilled_bytes,
+            "measured_results": self.measured_results,
+        }
+
+    def _is_small(self, result: Any) -> bool:
+        """
+        A cheap check that avoids pickling results that obviously fit in memory.
+        Only results it can't bound (see _size_bound) are measured by pickling.
+        """
+        if isinstance(result, _INLINE_TYPES):
+            return True
+        if isinstance(result, _RAW_BUFFER_TYPES):
+            return memoryview(result).nbytes < self.threshold_bytes
+        bound = _size_bound(result)
+        return bound is not None and bound < self.threshold_bytes
+
+    def _spill_or_keep(self, result: Any) -> Any:
+        if isinstance(result, _RAW_BUFFER_TYPES):
+            view = memoryview(result)
+            if not view.c_contiguous:
+                view = memoryview(view.tobytes())
+            return self._write([view.cast("B")], None, ())
+
+        buffers: List[pickle.PickleBuffer] = []
+        try:
+            data = pickle.dumps(result, protocol=5, buffer_callback=buffers.append)
+            raw_buffers = [b.raw() for b in buffers]
+        except Exception:
+            # Unpicklable (or non-contiguous buffers): keep it in memory
+            return result
+
+        size = len(data) + sum(b.nbytes for b in raw_buffers)
+        if size < self.threshold_bytes:
+            return result
+
+        layout = []
+        offset = len(data)
+        for buffer in raw_buffers:
+            layout.append((offset, buffer.nbytes))
+            offset += buffer.nbytes
+        return self._write([memoryview(data)] + raw_buffers, len(data), tuple(layout))
+
+    def _write(
+        self,
+        chunks: List[memoryview],
+        pickle_size: Optional[int],
+        buffers: Tuple[Tuple[int, int], ...],
+    ) -> _SpilledResult:
+        if self._scratch_dir is None:
+            self._scratch_dir = tempfile.mkdtemp(
+                prefix=f"cascade-{self._run_id}-", dir=self._directory
+            )
+            # Also clean up if the backend is dropped without being closed
+            self._finalizer = weakref.finalize(
+                self, shutil.rmtree, self._scratch_dir, ignore_errors=True
+            )
+
+        self._file_counter += 1
+        path = os.path.join(self._scratch_dir, f"{self._file_counter}.bin")
+        size = 0
+        with open(path, "wb") as f:
+            for chunk in chunks:
+                f.write(chunk)
+                size += chunk.nbytes
+
+        self.spilled_results += 1
+        self.spilled_bytes += size
+        return _SpilledResult(path, size, pickle_size, buffers)
+
+    def _discard(self, node_id: str) -> None:
+        value = self._results.pop(node_id, None)
+        if isinstance(value, _SpilledResult):
+            try:
+                os.remove(value.path)
+            except OSError:
+                # E.g. still mapped on Windows; removed with the scratch directory
+                pass
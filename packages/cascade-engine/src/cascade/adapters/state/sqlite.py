@@ -0,0 +1,260 @@
+import sqlite3
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Set
+
+from cascade.adapters.serializers import ResultCodec
+
+# Stay well below SQLITE_MAX_VARIABLE_NUMBER (999 on older sqlite builds)
+_CHUNK = 500
+
+
+def _chunks(node_ids: Sequence[str]) -> Iterator[List[str]]:
+    node_ids = list(node_ids)
+    for i in range(0, len(node_ids), _CHUNK):
+        yield node_ids[i : i + _CHUNK]
+
+
+class SqliteStateBackend:
+    """
+    A StateBackend stored in a sqlite database (WAL mode), so that a run can be
+    resumed after a crash: calling `Engine.run(target, run_id=...)` with the id
+    of the failed run skips the nodes whose results were already stored.
+
+    Writes are buffered and committed in one transaction per stage (see `flush`),
+    and when the run ends, so a crash only loses the results of the stage that
+    was running. Values are encoded with a ResultCodec.
+
+    Rows are keyed by the ids bound with `set_node_keys` (the engine binds the
+    stable ids of the top-level graph, see StableIdHasher), not by structural
+    ids, which impure tasks salt per LazyResult: a process that crashed can
+    rebuild the same workflow and resume it. Other nodes, e.g. the elements of
+    a map that hadn't finished, are stored by structural id, so only the pure
+    ones resume.
+
+    Results are kept for the graph of the current TCO iteration only. A run that
+    crashed during its first iteration resumes where it stopped; one that had
+    already jumped restarts its loop from the beginning.
+
+    Finished runs stay in the database until `delete_run` is called.
+    """
+
+    # Bump when the meaning of a stored row changes; old runs are then discarded.
+    SCHEMA_VERSION = 1
+
+    def __init__(self, run_id: str, path: str, codec: Optional[ResultCodec] = None):
+        self._run_id = run_id
+        self.path = path
+        self.codec = codec if codec is not None else ResultCodec()
+        self._pending: Dict[str, Any] = {}
+        self._pending_skips: Dict[str, str] = {}
+        # Structural id -> stored key, for the nodes of the current iteration
+        self._keys: Dict[str, str] = {}
+        self._conn: Optional[sqlite3.Connection] = self._open(path)
+        self._iterations = 0
+        self.flushes = 0
+        # True while the state holds results stored by an earlier attempt of the run
+        self.resumed = self._load_run()
+
+    @classmethod
+    def factory(cls, path: str, codec: Optional[ResultCodec] = None):
+        """Returns a `state_backend_factory` storing every run in `path`."""
+
+        def create(run_id: str) -> "SqliteStateBackend":
+            return cls(run_id, path, codec=codec)
+
+        return create
+
+    def _open(self, path: str) -> sqlite3.Connection:
+        conn = sqlite3.connect(path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS runs ("
+            "run_id TEXT PRIMARY KEY, version INTEGER NOT NULL, "
+            "iteration INTEGER NOT NULL)"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            "run_id TEXT NOT NULL, node_id TEXT NOT NULL, value BLOB NOT NULL, "
+            "PRIMARY KEY (run_id, node_id)) WITHOUT ROWID"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS skipped ("
+            "run_id TEXT NOT NULL, node_id TEXT NOT NULL, reason TEXT NOT NULL, "
+            "PRIMARY KEY (run_id, node_id)) WITHOUT ROWID"
+        )
+        conn.commit()
+        return conn
+
+    def _load_run(self) -> bool:
+        """Registers the run, returning whether it has resumable results."""
+        conn = self._conn
+        row = conn.execute(
+            "SELECT version, iteration FROM runs WHERE run_id = ?", (self._run_id,)
+        ).fetchone()
+        if row is not None and row[0] == self.SCHEMA_VERSION:
+            # Only the first iteration's graph is rebuilt by a resumed run
+            return (
+                row[1] == 1
+                and conn.execute(
+                    "SELECT 1 FROM results WHERE run_id = ? LIMIT 1", (self._run_id,)
+                ).fetchone()
+                is not None
+            )
+        with conn:
+            self._delete_rows()
+            conn.execute(
+                "INSERT OR REPLACE INTO runs (run_id, version, iteration) "
+                "VALUES (?, ?, 0)",
+                (self._run_id, self.SCHEMA_VERSION),
+            )
+        return False
+
+    def _delete_rows(self) -> None:
+        for table in ("results", "skipped"):
+            self._conn.execute(f"DELETE FROM {table} WHERE run_id = ?", (self._run_id,))
+
+    def set_node_keys(self, keys: Dict[str, str]) -> None:
+        """
+        Stores the results of the given nodes (by structural id) under the given
+        keys, until the next `clear`.
+        """
+        self._keys.update(keys)
+
+    async def put_result(self, node_id: str, result: Any) -> None:
+        self._pending[self._keys.get(node_id, node_id)] = result
+
+    async def get_result(self, node_id: str) -> Optional[Any]:
+        key = self._keys.get(node_id, node_id)
+        if key in self._pending:
+            return self._pending[key]
+        row = self._conn.execute(
+            "SELECT value FROM results WHERE run_id = ? AND node_id = ?",
+            (self._run_id, key),
+        ).fetchone()
+        return self.codec.decode(row[0]) if row is not None else None
+
+    async def has_result(self, node_id: str) -> bool:
+        key = self._keys.get(node_id, node_id)
+        if key in self._pending:
+            return True
+        row = self._conn.execute(
+            "SELECT 1 FROM results WHERE run_id = ? AND node_id = ?",
+            (self._run_id, key),
+        ).fetchone()
+        return row is not None
+
+    def _by_key(self, node_ids: Sequence[str]) -> Dict[str, str]:
+        keys = self._keys
+        return {keys.get(node_id, node_id): node_id for node_id in node_ids}
+
+    async def get_many(self, node_ids: Sequence[str]) -> Dict[str, Any]:
+        pending = self._pending
+        by_key = self._by_key(node_ids)
+        results = {
+            node_id: pending[key] for key, node_id in by_key.items() if key in pending
+        }
+        stored = [key for key in by_key if key not in pending]
+        for chunk in _chunks(stored):
+            rows = self._conn.execute(
+                "SELECT node_id, value FROM results WHERE run_id = ? "
+                f"AND node_id IN ({','.join('?' * len(chunk))})",
+                (self._run_id, *chunk),
+            )
+            for key, value in rows:
+                results[by_key[key]] = self.codec.decode(value)
+        return results
+
+    async def has_many(self, node_ids: Sequence[str]) -> Set[str]:
+        pending = self._pending
+        by_key = self._by_key(node_ids)
+        found = {node_id for key, node_id in by_key.items() if key in pending}
+        stored = [key for key in by_key if key not in pending]
+        for chunk in _chunks(stored):
+            rows = self._conn.execute(
+                "SELECT node_id FROM results WHERE run_id = ? "
+                f"AND node_id IN ({','.join('?' * len(chunk))})",
+                (self._run_id, *chunk),
+            )
+            found.update(by_key[key] for (key,) in rows)
+        return found
+
+    async def put_many(self, results: Dict[str, Any]) -> None:
+        keys = self._keys
+        self._pending.update(
+            (keys.get(node_id, node_id), value) for node_id, value in results.items()
+        )
+
+    async def mark_skipped(self, node_id: str, reason: str) -> None:
+        self._pending_skips[self._keys.get(node_id, node_id)] = reason
+
+    async def get_skip_reason(self, node_id: str) -> Optional[str]:
+        key = self._keys.get(node_id, node_id)
+        if key in self._pending_skips:
+            return self._pending_skips[key]
+        row = self._conn.execute(
+            "SELECT reason FROM skipped WHERE run_id = ? AND node_id = ?",
+            (self._run_id, key),
+        ).fetchone()
+        return row[0] if row is not None else None
+
+    async def flush(self) -> None:
+        """Writes the buffered results and skip reasons in one transaction."""
+        if not (self._pending or self._pending_skips) or self._conn is None:
+            return
+        encode = self.codec.encode
+        run_id = self._run_id
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO results (run_id, node_id, value) "
+                "VALUES (?, ?, ?)",
+                [
+                    (run_id, node_id, encode(value))
+                    for node_id, value in self._pending.items()
+                ],
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO skipped (run_id, node_id, reason) "
+                "VALUES (?, ?, ?)",
+                [
+                    (run_id, node_id, reason)
+                    for node_id, reason in self._pending_skips.items()
+                ],
+            )
+        self._pending.clear()
+        self._pending_skips.clear()
+        self.flushes += 1
+
+    async def clear(self) -> None:
+        """
+        Starts a new TCO iteration. The first one of a resumed run keeps the
+        stored results; every other one discards them.
+        """
+        self._pending.clear()
+        self._pending_skips.clear()
+        self._keys.clear()
+        self._iterations += 1
+        keep = self.resumed and self._iterations == 1
+        with self._conn:
+            if not keep:
+                self._delete_rows()
+            self._conn.execute(
+                "UPDATE runs SET iteration = ? WHERE run_id = ?",
+                (self._iterations, self._run_id),
+            )
+        self.resumed = keep
+
+    async def delete_run(self) -> None:
+        """Removes everything stored for this run."""
+        self._pending.clear()
+        self._pending_skips.clear()
+        with self._conn:
+            self._delete_rows()
+            self._conn.execute("DELETE FROM runs WHERE run_id = ?", (self._run_id,))
+        self.resumed = False
+
+    async def close(self) -> None:
+        """Writes what is still buffered (e.g. when a stage failed) and closes."""
+        if self._conn is not None:
+            await self.flush()
+            self._conn.close()
+            self._conn = None
@@ -1,6 +1,6 @@
 from .bus import MessageBus
 from .engine import Engine
-from .subscribers import HumanReadableLogSubscriber
+from .subscribers import HumanReadableLogSubscriber, DurationRecorder
 from .events import Event
 from .exceptions import DependencyMissingError
 from .resource_manager import ResourceManager
@@ -10,6 +10,7 @@ __all__ = [
     "MessageBus",
     "Engine",
     "HumanReadableLogSubscriber",
+    "DurationRecorder",
     "Event",
     "DependencyMissingError",
     "ResourceManager",
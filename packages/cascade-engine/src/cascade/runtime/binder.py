@@ -0,0 +1,114 @@
+import inspect
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from cascade.graph.model import Node
+from cascade.spec.resource import Inject
+
+# A positional index, or a keyword name
+Slot = Union[int, str]
+
+_POSITIONAL_KINDS = (
+    inspect.Parameter.POSITIONAL_ONLY,
+    inspect.Parameter.POSITIONAL_OR_KEYWORD,
+)
+
+
+def slot_of(name: str) -> Slot:
+    """Bindings and edges name positional arguments by their index, e.g. "0"."""
+    return int(name) if name.isdigit() else name
+
+
+def place(args: List[Any], kwargs: Dict[str, Any], slot: Slot, value: Any) -> None:
+    """Puts `value` in its slot, padding missing positional arguments with None."""
+    if slot.__class__ is int:
+        if slot >= len(args):
+            args.extend([None] * (slot + 1 - len(args)))
+        args[slot] = value
+    else:
+        kwargs[slot] = value
+
+
+def _has_inject(value: Any) -> bool:
+    if isinstance(value, Inject):
+        return True
+    if isinstance(value, (list, tuple)):
+        return any(_has_inject(v) for v in value)
+    if isinstance(value, dict):
+        return any(_has_inject(v) for v in value.values())
+    return False
+
+
+class ArgumentBinder:
+    """
+    The compiled argument layout of a Node: the slot of every literal binding
+    and data edge, which literals hold Inject markers, and which parameters
+    default to an injected resource.
+
+    A binder is compiled on a node's first resolution and cached on the Node
+    (which is interned, so it is shared by every graph using the node). Resolving
+    arguments then only copies the literal templates and fills in edge values.
+    """
+
+    __slots__ = (
+        "args",
+        "kwargs",
+        "slots",
+        "inject_args",
+        "inject_kwargs",
+        "inject_defaults",
+        "params_context",
+    )
+
+    def __init__(self, node: Node, edge_names: Iterable[str] = ()):
+        self.slots: Dict[str, Slot] = {}
+        for name in node.input_bindings:
+            self.slots[name] = slot_of(name)
+        for name in edge_names:
+            self.slots[name] = slot_of(name)
+
+        # Templates holding the literal bindings; edge slots are filled per call
+        self.args: List[Any] = []
+        self.kwargs: Dict[str, Any] = {}
+        for name, value in node.input_bindings.items():
+            place(self.args, self.kwargs, self.slots[name], value)
+        for slot in self.slots.values():
+            if slot.__class__ is int and slot >= len(self.args):
+                self.args.extend([None] * (slot + 1 - len(self.args)))
+
+        # Literals with Inject markers inside, resolved on every call
+        self.inject_args: List[int] = []
+        self.inject_kwargs: List[str] = []
+        # (name, position or None, marker) of parameters defaulting to a resource
+        self.inject_defaults: List[Tuple[str, Optional[int], Inject]] = []
+        self.params_context = False
+
+        if not node.has_complex_inputs:
+            return
+
+        for name, value in node.input_bindings.items():
+            if _has_inject(value):
+                slot = self.slots[name]
+                if slot.__class__ is int:
+                    self.inject_args.append(slot)
+                else:
+                    self.inject_kwargs.append(slot)
+
+        if node.signature:
+            for position, param in enumerate(node.signature.parameters.values()):
+                if isinstance(param.default, Inject):
+                    self.inject_defaults.append(
+                        (
+                            param.name,
+                            position if param.kind in _POSITIONAL_KINDS else None,
+                            param.default,
+                        )
+                    )
+
+        # Param tasks read the run's parameters
+        from cascade.internal.inputs import _get_param_value
+
+        self.params_context = node.callable_obj is _get_param_value.func
+
+    def slot(self, name: str) -> Slot:
+        slot = self.slots.get(name)
+        return slot_of(name) if slot is None else slot
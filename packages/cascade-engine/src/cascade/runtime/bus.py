@@ -22,6 +22,10 @@ class MessageBus:
         else:
             self._subscribers[event_type].append(handler)
 
+    def has_subscribers(self, event_type: Type[Event]) -> bool:
+        """Whether publishing an event of `event_type` would reach any handler."""
+        return bool(self._subscribers.get(event_type) or self._wildcard_subscribers)
+
     def publish(self, event: Event):
         """Dispatch an event to all relevant subscribers."""
         # 1. Dispatch to handlers explicitly subscribed to this event type
@@ -115,6 +115,10 @@ class ConstraintManager:
             # We add a small buffer (0.1s) to ensure we wake up strictly after expiration
             self.request_wakeup(max(0, next_expiry - now + 0.1))
 
+    def has_constraints(self) -> bool:
+        """Returns True if any global constraint is active."""
+        return bool(self._constraints)
+
     def check_permission(self, task: Node) -> bool:
         """
         Evaluates all active constraints against a task. If any handler denies
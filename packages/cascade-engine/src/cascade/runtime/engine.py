@@ -1,7 +1,7 @@
 import sys
 import time
 import asyncio
-from typing import Any, Dict, Optional, Callable
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from uuid import uuid4
 from contextlib import ExitStack
 
@@ -14,8 +14,18 @@ from cascade.runtime.events import (
     RunFinished,
     ConnectorConnected,
     ConnectorDisconnected,
+    CacheGauge,
+    ThreadPoolGauge,
 )
-from cascade.spec.protocols import Solver, Executor, StateBackend, Connector
+from cascade.spec.protocols import (
+    Solver,
+    Executor,
+    StateBackend,
+    Connector,
+    DurationStore,
+)
+from cascade.graph.build import BuildMemo
+from cascade.graph.registry import NodeRegistry
 from cascade.runtime.resource_manager import ResourceManager
 from cascade.runtime.constraints import ConstraintManager
 from cascade.runtime.constraints.handlers import (
@@ -24,9 +34,29 @@ from cascade.runtime.constraints.handlers import (
     RateLimitConstraintHandler,
 )
 from cascade.adapters.state import InMemoryStateBackend
+from cascade.adapters.durations import InMemoryDurationStore
 from cascade.runtime.processor import NodeProcessor
+from cascade.runtime.plan_cache import PlanCache
+from cascade.runtime.subscribers import DurationRecorder
 from cascade.runtime.resource_container import ResourceContainer
-from cascade.runtime.strategies import GraphExecutionStrategy, VMExecutionStrategy
+from cascade.runtime.strategies import (
+    GraphExecutionStrategy,
+    ReadyQueueExecutionStrategy,
+    VMExecutionStrategy,
+)
+
+# Thread pool gauges are published at most once per pool per interval (in
+# seconds) during a run, and once more when it ends.
+_GAUGE_INTERVAL = 0.1
+
+# Graph scheduling modes:
+# - "stages": run the solver's plan stage by stage (barrier between stages)
+# - "critical_path": dispatch each node as soon as its dependencies are done,
+#   longest critical path first
+SCHEDULING_STRATEGIES = {
+    "stages": GraphExecutionStrategy,
+    "critical_path": ReadyQueueExecutionStrategy,
+}
 
 
 class Engine:
@@ -44,6 +74,13 @@ class Engine:
         connector: Optional[Connector] = None,
         cache_backend: Optional[Any] = None,
         resource_manager: Optional[ResourceManager] = None,
+        node_registry: Optional[NodeRegistry] = None,
+        plan_cache: Optional[PlanCache] = None,
+        build_memo: Optional[BuildMemo] = None,
+        compact_graphs: bool = False,
+        scheduling: str = "stages",
+        duration_store: Optional[DurationStore] = None,
+        map_chunk_size: int = 1024,
     ):
         self.solver = solver
         self.executor = executor
@@ -74,6 +111,13 @@ class Engine:
 
         self.resource_container = ResourceContainer(self.bus)
 
+        # Learn task durations from every run; pass the same store to a
+        # duration-aware solver (e.g. CSPSolver) to plan with real costs.
+        self.duration_store = (
+            duration_store if duration_store is not None else InMemoryDurationStore()
+        )
+        self._duration_recorder = DurationRecorder(self.bus, self.duration_store)
+
         # Delegate node execution logic to NodeProcessor
         self.node_processor = NodeProcessor(
             executor=self.executor,
@@ -81,16 +125,29 @@ class Engine:
             resource_manager=self.resource_manager,
             constraint_manager=self.constraint_manager,
             solver=self.solver,
+            # Constraints pushed by a connector mid-run must be checked for
+            # every mapped element, so connected engines don't batch maps.
+            map_chunk_size=0 if connector else map_chunk_size,
         )
 
         # Initialize Strategies
-        self.graph_strategy = GraphExecutionStrategy(
+        if scheduling not in SCHEDULING_STRATEGIES:
+            raise ValueError(
+                f"Unknown scheduling '{scheduling}'. "
+                f"Expected one of {sorted(SCHEDULING_STRATEGIES)}."
+            )
+        self.graph_strategy = SCHEDULING_STRATEGIES[scheduling](
             solver=self.solver,
             node_processor=self.node_processor,
             resource_container=self.resource_container,
             constraint_manager=self.constraint_manager,
             bus=self.bus,
             wakeup_event=self._wakeup_event,
+            node_registry=node_registry,
+            plan_cache=plan_cache,
+            build_memo=build_memo,
+            compact_graphs=compact_graphs,
+            duration_store=self.duration_store,
         )
 
         self.vm_strategy = VMExecutionStrategy(
@@ -140,6 +197,18 @@ class Engine:
 
         return True
 
+    def get_cache_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns hit/miss/eviction metrics for the engine's JIT caches.
+        """
+        stats = {
+            "plan_cache": self.graph_strategy.plan_cache.stats(),
+            "node_registry": self.graph_strategy.node_registry.stats(),
+        }
+        if self.graph_strategy.build_memo is not None:
+            stats["build_memo"] = self.graph_strategy.build_memo.stats()
+        return stats
+
     def get_resource_provider(self, name: str) -> Callable:
         return self.resource_container.get_provider(name)
 
@@ -151,7 +220,15 @@ class Engine:
         target: Any,
         params: Optional[Dict[str, Any]] = None,
         use_vm: bool = False,
+        run_id: Optional[str] = None,
     ) -> Any:
+        """
+        Runs `target` and returns its result.
+
+        Passing the `run_id` of an earlier run resumes it, if the state backend
+        persists results (e.g. SqliteStateBackend): nodes whose results it still
+        holds are not executed again.
+        """
         # Handle Auto-Gathering
         from cascade.internal.inputs import _internal_gather
 
@@ -162,7 +239,8 @@ class Engine:
         else:
             workflow_target = target
 
-        run_id = str(uuid4())
+        if run_id is None:
+            run_id = str(uuid4())
         start_time = time.time()
 
         # Robustly determine initial target name for logging
@@ -176,6 +254,35 @@ class Engine:
         # Initialize State Backend using the factory
         state_backend = self.state_backend_factory(run_id)
 
+        # Keep the executor's thread pools alive for the run, and report their
+        # gauges if anyone listens
+        pools = getattr(self.executor, "pools", None)
+        report_pools = pools is not None and self.bus.has_subscribers(ThreadPoolGauge)
+        if pools is not None:
+            last_published: Dict[str, float] = {}
+
+            def publish_gauge(pool: str, gauges: Dict[str, int]) -> None:
+                # Called on every submission and completion: sample the gauges
+                # rather than dispatching an event per task
+                now = time.monotonic()
+                if now - last_published.get(pool, -_GAUGE_INTERVAL) < _GAUGE_INTERVAL:
+                    return
+                last_published[pool] = now
+                self.bus.publish(ThreadPoolGauge(run_id=run_id, pool=pool, **gauges))
+
+            pools.acquire()
+            if report_pools:
+                pools.add_listener(publish_gauge)
+
+        # Report the counters of the cache backend (e.g. after its TTL sweeps)
+        cache = self.cache_backend
+        if cache is not None and hasattr(cache, "add_listener"):
+
+            def publish_cache_gauge(stats: Dict[str, int]) -> None:
+                self.bus.publish(CacheGauge(run_id=run_id, **stats))
+
+            cache.add_listener(publish_cache_gauge)
+
         try:
             # 1. Establish Infrastructure Connection FIRST
             if self.connector:
@@ -237,14 +344,83 @@ class Engine:
             )
             raise
         finally:
+            # Every cleanup step runs even if an earlier one fails. Their errors
+            # never replace the run's own exception (see _cleanup_error).
+            in_flight = sys.exc_info()[1]
+            errors = []
+
+            # Let backends release per-run storage (e.g. spill files)
+            close_state = getattr(state_backend, "close", None)
+            if close_state is not None:
+                try:
+                    await close_state()
+                except Exception as e:
+                    errors.append(("closing the state backend", e))
+
+            # Write-behind duration stores commit once per run
+            flush_durations = getattr(self.duration_store, "flush", None)
+            if flush_durations is not None:
+                try:
+                    flush_durations()
+                except Exception as e:
+                    errors.append(("flushing the duration store", e))
+
+            if cache is not None and hasattr(cache, "add_listener"):
+                try:
+                    cache.remove_listener(publish_cache_gauge)
+                    self.bus.publish(CacheGauge(run_id=run_id, **cache.stats()))
+                except Exception as e:
+                    errors.append(("reporting the cache gauges", e))
+
+            # The last run using the pools shuts them down (without blocking the loop)
+            if pools is not None:
+                try:
+                    if report_pools:
+                        pools.remove_listener(publish_gauge)
+                        # The final state of the pools, which sampling may have missed
+                        for pool, gauges in pools.gauges().items():
+                            self.bus.publish(
+                                ThreadPoolGauge(run_id=run_id, pool=pool, **gauges)
+                            )
+                except Exception as e:
+                    errors.append(("reporting the thread pool gauges", e))
+                finally:
+                    pools.release()
+
             # Gracefully shut down any managed subscribers BEFORE disconnecting the connector
             for sub in self._managed_subscribers:
                 if hasattr(sub, "shutdown"):
-                    await sub.shutdown()
+                    try:
+                        await sub.shutdown()
+                    except Exception as e:
+                        errors.append((f"shutting down {type(sub).__name__}", e))
 
             if self.connector:
-                await self.connector.disconnect()
-                self.bus.publish(ConnectorDisconnected(run_id=run_id))
+                try:
+                    await self.connector.disconnect()
+                    self.bus.publish(ConnectorDisconnected(run_id=run_id))
+                except Exception as e:
+                    errors.append(("disconnecting the connector", e))
+
+            error = self._cleanup_error(run_id, errors, in_flight)
+            if error is not None:
+                raise error
+
+    def _cleanup_error(
+        self, run_id: str, errors: List[Tuple[str, Exception]], in_flight: Any
+    ) -> Optional[Exception]:
+        """
+        Reports the errors of a run's cleanup steps. Returns the first one, to be
+        raised, unless the run is already failing: it keeps its own exception.
+        """
+        for step, e in errors:
+            print(
+                f"[Engine] Error {step} after run '{run_id}': {type(e).__name__}: {e}",
+                file=sys.stderr,
+            )
+        if not errors or in_flight is not None:
+            return None
+        return errors[0][1]
 
     async def _on_constraint_update(self, topic: str, payload: Dict[str, Any]):
         """Callback to handle incoming constraint messages."""
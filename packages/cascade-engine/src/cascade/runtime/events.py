@@ -59,6 +59,9 @@ class TaskExecutionFinished(TaskEvent):
     duration: float = 0.0
     result_preview: Optional[str] = None
     error: Optional[str] = None
+    # False for map elements (or chunks) called without a sub-graph: their
+    # task_id is the map node's id plus an index, not the id of a graph node.
+    graph_node: bool = True
 
 
 @dataclass(frozen=True)
@@ -126,3 +129,31 @@ class ConnectorDisconnected(Event):
     """Fired when the engine disconnects from an external connector."""
 
     pass
+
+
+@dataclass(frozen=True)
+class CacheGauge(Event):
+    """
+    Fired with the counters of the engine's cache backend, after each of its
+    TTL sweeps and when a run finishes.
+    """
+
+    entries: int = 0
+    bytes: int = 0
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+
+@dataclass(frozen=True)
+class ThreadPoolGauge(Event):
+    """
+    The gauges of an executor thread pool: sampled during a run (at most every
+    0.1 s per pool), and once more when the run ends.
+    """
+
+    pool: str = ""
+    max_workers: int = 0
+    queued: int = 0
+    active: int = 0
@@ -18,29 +18,34 @@ class FlowManager:
         self.target_node_id = target_node_id
         self.instance_map = instance_map
 
-        self.in_edges: Dict[str, List[Edge]] = defaultdict(list)
         self.routers_by_selector: Dict[str, List[Edge]] = defaultdict(list)
+        # The first Router-carrying edge pointing at each node
+        self.router_edges: Dict[str, Edge] = {}
         self.route_source_map: Dict[str, Dict[str, Any]] = defaultdict(dict)
 
         # Reference counting for pruning
         # Initial demand = Out-degree (number of consumers)
         self.downstream_demand: Dict[str, int] = defaultdict(int)
 
-        for edge in self.graph.edges:
-            self.in_edges[edge.target.structural_id].append(edge)
-            self.downstream_demand[edge.source.structural_id] += 1
+        # Only the topology is read here: on a CompactGraph, iterating
+        # `graph.edges` would materialize an Edge object per edge.
+        for node in self.graph.nodes:
+            out_degree = len(self.graph.get_out_links(node.structural_id))
+            if out_degree:
+                self.downstream_demand[node.structural_id] += out_degree
 
-            if edge.router:
-                selector_node = self._get_node_from_instance(edge.router.selector)
-                if selector_node:
-                    self.routers_by_selector[selector_node.structural_id].append(edge)
+        for edge in self.graph.get_router_edges():
+            self.router_edges.setdefault(edge.target.structural_id, edge)
+            selector_node = self._get_node_from_instance(edge.router.selector)
+            if selector_node:
+                self.routers_by_selector[selector_node.structural_id].append(edge)
 
-                for key, route_result in edge.router.routes.items():
-                    route_node = self._get_node_from_instance(route_result)
-                    if route_node:
-                        self.route_source_map[edge.target.structural_id][
-                            route_node.structural_id
-                        ] = key
+            for key, route_result in edge.router.routes.items():
+                route_node = self._get_node_from_instance(route_result)
+                if route_node:
+                    self.route_source_map[edge.target.structural_id][
+                        route_node.structural_id
+                    ] = key
 
         # The final target always has at least 1 implicit demand (the user wants it)
         self.downstream_demand[target_node_id] += 1
@@ -97,13 +102,11 @@ class FlowManager:
             await state_backend.mark_skipped(node_id, "Pruned")
 
             # Recursively reduce demand for inputs of the pruned node
-            for edge in self.in_edges[node_id]:
+            for source_id, _ in self.graph.get_in_links(node_id):
                 # Special case: If the edge is from a Router, do we prune the Router selector?
                 # No, the selector might be used by other branches.
                 # Standard dependency logic applies: reduce demand on source.
-                await self._decrement_demand_and_prune(
-                    edge.source.structural_id, state_backend
-                )
+                await self._decrement_demand_and_prune(source_id, state_backend)
 
     async def should_skip(
         self, node: Node, state_backend: StateBackend
@@ -116,30 +119,28 @@ class FlowManager:
         if reason := await state_backend.get_skip_reason(node.structural_id):
             return reason
 
+        in_links = self.graph.get_in_links(node.structural_id)
+
         # 2. Condition Check (run_if)
-        for edge in self.in_edges[node.structural_id]:
-            if edge.edge_type == EdgeType.CONDITION:
-                if not await state_backend.has_result(edge.source.structural_id):
-                    if await state_backend.get_skip_reason(edge.source.structural_id):
+        for source_id, edge_type in in_links:
+            if edge_type == EdgeType.CONDITION:
+                if not await state_backend.has_result(source_id):
+                    if await state_backend.get_skip_reason(source_id):
                         return "UpstreamSkipped_Condition"
                     return "ConditionMissing"
 
-                condition_result = await state_backend.get_result(
-                    edge.source.structural_id
-                )
+                condition_result = await state_backend.get_result(source_id)
                 if not condition_result:
                     return "ConditionFalse"
 
             # New explicit check for sequence abortion
-            elif edge.edge_type == EdgeType.SEQUENCE:
-                if await state_backend.get_skip_reason(edge.source.structural_id):
+            elif edge_type == EdgeType.SEQUENCE:
+                if await state_backend.get_skip_reason(source_id):
                     return "UpstreamSkipped_Sequence"
 
         # 3. Upstream Skip Propagation
         active_route_key = None
-        router_edge = next(
-            (e for e in self.in_edges[node.structural_id] if e.router), None
-        )
+        router_edge = self.router_edges.get(node.structural_id)
         if router_edge:
             selector_node = self._get_node_from_instance(router_edge.router.selector)
             if selector_node:
@@ -147,30 +148,27 @@ class FlowManager:
                 if await state_backend.has_result(selector_id):
                     active_route_key = await state_backend.get_result(selector_id)
 
-        for edge in self.in_edges[node.structural_id]:
-            if edge.edge_type == EdgeType.ROUTER_ROUTE:
+        for source_id, edge_type in in_links:
+            if edge_type == EdgeType.ROUTER_ROUTE:
                 if active_route_key is not None:
-                    edge_key = self.route_source_map[node.structural_id].get(
-                        edge.source.structural_id
-                    )
+                    edge_key = self.route_source_map[node.structural_id].get(source_id)
                     if edge_key != active_route_key:
                         continue
 
-                if await state_backend.get_skip_reason(edge.source.structural_id):
+                if await state_backend.get_skip_reason(source_id):
                     return "UpstreamSkipped_Route"
 
-            elif edge.edge_type in (EdgeType.DATA, EdgeType.IMPLICIT):
-                if await state_backend.get_skip_reason(edge.source.structural_id):
+            elif edge_type in (EdgeType.DATA, EdgeType.IMPLICIT):
+                if await state_backend.get_skip_reason(source_id):
                     # Check for data penetration possibility (for pipelines)
                     can_penetrate = False
-                    # Look for inputs to the skipped node (edge.source)
-                    for upstream_edge in self.in_edges[edge.source.structural_id]:
+                    # Look for inputs to the skipped node (the edge's source)
+                    for upstream_id, upstream_type in self.graph.get_in_links(
+                        source_id
+                    ):
                         # If the skipped node has a DATA input, and that input has a result...
-                        if (
-                            upstream_edge.edge_type == EdgeType.DATA
-                            and await state_backend.has_result(
-                                upstream_edge.source.structural_id
-                            )
+                        if upstream_type == EdgeType.DATA and (
+                            await state_backend.has_result(upstream_id)
                         ):
                             can_penetrate = True
                             break
@@ -180,8 +178,8 @@ class FlowManager:
                     # If it can penetrate, we don't return a skip reason.
                     # We let the node proceed to execution, where ArgumentResolver will handle it.
 
-            elif edge.edge_type == EdgeType.SEQUENCE:
-                if await state_backend.get_skip_reason(edge.source.structural_id):
+            elif edge_type == EdgeType.SEQUENCE:
+                if await state_backend.get_skip_reason(source_id):
                     return "UpstreamSkipped_Sequence"
 
         return None
@@ -0,0 +1,127 @@
+import json
+import sqlite3
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+# An IndexedPlan stores node positions (indexes into Graph.nodes) instead of Nodes,
+# so it can be rehydrated against any graph with the same topology.
+IndexedPlan = List[List[int]]
+
+
+class PlanCache:
+    """
+    A size-bounded LRU cache of indexed execution plans, keyed by topology hash
+    (see BlueprintHasher.compute_topology_hash).
+
+    If `path` is given, plans are also persisted to a sqlite database, so that
+    a freshly started engine can skip `solver.resolve` for every topology it
+    (or another worker sharing the file) has already seen.
+
+    NOTE: Lookups in the on-disk store are synchronous. They only happen on an
+    in-memory miss and are a single primary-key read against a local file.
+    """
+
+    # Bump when the meaning of a stored plan changes; old rows are then ignored.
+    SCHEMA_VERSION = 1
+
+    def __init__(self, max_size: Optional[int] = 1024, path: Optional[str] = None):
+        if max_size is not None and max_size < 1:
+            raise ValueError("max_size must be a positive integer or None.")
+
+        self.max_size = max_size
+        self.path = path
+        self._entries: "OrderedDict[str, IndexedPlan]" = OrderedDict()
+        self._conn: Optional[sqlite3.Connection] = None
+        if path is not None:
+            self._conn = self._open(path)
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _open(self, path: str) -> sqlite3.Connection:
+        conn = sqlite3.connect(path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS plans ("
+            "key TEXT PRIMARY KEY, version INTEGER NOT NULL, plan TEXT NOT NULL)"
+        )
+        conn.commit()
+        return conn
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def get(self, key: str) -> Optional[IndexedPlan]:
+        """Returns the cached plan for `key`, consulting the on-disk store on a miss."""
+        plan = self._entries.get(key)
+        if plan is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return plan
+
+        if self._conn is not None:
+            row = self._conn.execute(
+                "SELECT plan FROM plans WHERE key = ? AND version = ?",
+                (key, self.SCHEMA_VERSION),
+            ).fetchone()
+            if row is not None:
+                plan = json.loads(row[0])
+                self._remember(key, plan)
+                self.hits += 1
+                self.disk_hits += 1
+                return plan
+
+        self.misses += 1
+        return None
+
+    def put(self, key: str, plan: IndexedPlan) -> None:
+        """Stores a plan in memory and, if configured, in the on-disk store."""
+        self._remember(key, plan)
+        if self._conn is not None:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO plans (key, version, plan) VALUES (?, ?, ?)",
+                (key, self.SCHEMA_VERSION, json.dumps(plan)),
+            )
+            self._conn.commit()
+
+    def discard(self, key: str) -> None:
+        """Removes a plan, e.g. one found to be incompatible with its graph."""
+        self._entries.pop(key, None)
+        if self._conn is not None:
+            self._conn.execute("DELETE FROM plans WHERE key = ?", (key,))
+            self._conn.commit()
+
+    def _remember(self, key: str, plan: IndexedPlan) -> None:
+        self._entries[key] = plan
+        self._entries.move_to_end(key)
+        if self.max_size is not None:
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        """Returns a snapshot of the cache's size and hit/miss/eviction counters."""
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hit_rate,
+        }
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
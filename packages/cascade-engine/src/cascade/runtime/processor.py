@@ -1,13 +1,36 @@
+import os
 import time
 import asyncio
-from typing import Any, Dict, List, Callable, Awaitable
+import inspect
+from collections import deque
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
 from cascade.graph.model import Node, Graph
+from cascade.graph.exceptions import StaticGraphError
+from cascade.spec.jump import Jump
+from cascade.spec.lazy_types import LazyResult, MappedLazyResult
+from cascade.spec.resource import Inject
+from cascade.spec.routing import Router
+from cascade.spec.task import Task
 from cascade.spec.protocols import Executor, StateBackend, Solver
 from cascade.runtime.bus import MessageBus
 from cascade.runtime.resource_manager import ResourceManager
 from cascade.runtime.constraints.manager import ConstraintManager
 from cascade.runtime.resolvers import ArgumentResolver, ConstraintResolver
+from cascade.runtime.state import get_many, has_many
 from cascade.runtime.events import (
     TaskExecutionStarted,
     TaskExecutionFinished,
@@ -17,6 +40,144 @@ from cascade.runtime.events import (
 )
 
 
+# Elements in flight for streamed maps without an explicit max_concurrency
+DEFAULT_STREAM_WINDOW = 64
+
+
+def _is_plain(value: Any) -> bool:
+    """True if a mapped element holds no values the graph builder would resolve."""
+    if isinstance(value, (LazyResult, MappedLazyResult, Router, Inject)):
+        return False
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return all(_is_plain(v) for v in value)
+    if isinstance(value, dict):
+        return all(_is_plain(v) for v in value.values())
+    return True
+
+
+def _call_each(
+    func: Callable, columns: Dict[str, Any]
+) -> Tuple[List[Any], List[float]]:
+    """
+    Calls `func` once per element of the mapped columns. Returns the results and
+    the duration of each call.
+    """
+    names = list(columns)
+    results, durations = [], []
+    for values in zip(*columns.values()):
+        start = time.perf_counter()
+        results.append(func(**dict(zip(names, values))))
+        durations.append(time.perf_counter() - start)
+    return results, durations
+
+
+class _ElementStateBackend:
+    """
+    The state of one windowed map element: reads fall through to the run's
+    state, writes stay local and are dropped with the element, so windowed and
+    streamed maps don't accumulate the results of every sub-graph in the run.
+    """
+
+    def __init__(self, parent: StateBackend):
+        self._parent = parent
+        self._results: Dict[str, Any] = {}
+        self._skipped: Dict[str, str] = {}
+
+    async def put_result(self, node_id: str, result: Any) -> None:
+        self._results[node_id] = result
+
+    async def get_result(self, node_id: str) -> Optional[Any]:
+        if node_id in self._results:
+            return self._results[node_id]
+        return await self._parent.get_result(node_id)
+
+    async def has_result(self, node_id: str) -> bool:
+        return node_id in self._results or await self._parent.has_result(node_id)
+
+    async def get_many(self, node_ids: Sequence[str]) -> Dict[str, Any]:
+        found = {n: self._results[n] for n in node_ids if n in self._results}
+        if len(found) < len(node_ids):
+            rest = [n for n in node_ids if n not in found]
+            found.update(await get_many(self._parent, rest))
+        return found
+
+    async def has_many(self, node_ids: Sequence[str]) -> Set[str]:
+        found = {n for n in node_ids if n in self._results}
+        if len(found) < len(node_ids):
+            found |= await has_many(
+                self._parent, [n for n in node_ids if n not in found]
+            )
+        return found
+
+    async def put_many(self, results: Dict[str, Any]) -> None:
+        self._results.update(results)
+
+    async def mark_skipped(self, node_id: str, reason: str) -> None:
+        self._skipped[node_id] = reason
+
+    async def get_skip_reason(self, node_id: str) -> Optional[str]:
+        if node_id in self._skipped:
+            return self._skipped[node_id]
+        return await self._parent.get_skip_reason(node_id)
+
+    async def clear(self) -> None:
+        self._results.clear()
+        self._skipped.clear()
+
+
+async def _gather_window(
+    run: Callable[[int], Awaitable[Any]], count: int, window: Optional[int]
+) -> List[Any]:
+    """
+    Returns `[await run(i) for i in range(count)]`, running them concurrently
+    with at most `window` in flight (all at once if `window` is None).
+    """
+    if not window or window >= count:
+        return await asyncio.gather(*(run(i) for i in range(count)))
+
+    results: List[Any] = [None] * count
+    indices = iter(range(count))
+
+    async def worker():
+        for i in indices:
+            results[i] = await run(i)
+
+    workers = [asyncio.ensure_future(worker()) for _ in range(window)]
+    try:
+        await asyncio.gather(*workers)
+    except BaseException:
+        for w in workers:
+            w.cancel()
+        raise
+    return results
+
+
+async def _stream_window(
+    run: Callable[[int], Awaitable[Any]], count: int, window: int, chunked: bool
+) -> AsyncIterator[Any]:
+    """
+    Yields the results of `run(0..count-1)` in order, keeping at most `window`
+    of them in flight. With `chunked`, every result is a list to yield from.
+    """
+    pending: Deque[asyncio.Future] = deque()
+    next_index = 0
+    try:
+        while pending or next_index < count:
+            while next_index < count and len(pending) < window:
+                pending.append(asyncio.ensure_future(run(next_index)))
+                next_index += 1
+            result = await pending.popleft()
+            if chunked:
+                for item in result:
+                    yield item
+            else:
+                yield result
+    finally:
+        # The consumer stopped early (or failed): drop the work in flight
+        for future in pending:
+            future.cancel()
+
+
 class NodeProcessor:
     """
     Responsible for executing a single node within a workflow graph.
@@ -30,12 +191,17 @@ class NodeProcessor:
         resource_manager: ResourceManager,
         constraint_manager: ConstraintManager,
         solver: Solver,  # Needed for map nodes
+        map_chunk_size: int = 1024,
     ):
         self.executor = executor
         self.bus = bus
         self.resource_manager = resource_manager
         self.constraint_manager = constraint_manager
         self.solver = solver
+        # Simple mapped tasks are called directly, without a sub-graph per
+        # element. Batch and compute tasks get up to this many elements per
+        # call; 0 disables the fast path.
+        self.map_chunk_size = map_chunk_size
 
         # Resolvers are owned by the processor
         self.arg_resolver = ArgumentResolver()
@@ -130,12 +296,17 @@ class NodeProcessor:
         start_time = time.time()
 
         # 4. Cache Check
-        if node.cache_policy:
-            inputs_for_cache = await self._resolve_inputs_for_cache(
-                node, graph, state_backend
+        cache_policy = node.cache_policy
+        if cache_policy:
+            inputs_for_cache = self._inputs_for_cache(node, args, kwargs)
+            # Policies keyed by the task's code get its function
+            cache_kwargs = (
+                {"func": node.callable_obj}
+                if getattr(cache_policy, "code_versioned", False)
+                else {}
             )
-            cached_value = await node.cache_policy.check(
-                node.structural_id, inputs_for_cache
+            cached_value = await cache_policy.check(
+                node.structural_id, inputs_for_cache, **cache_kwargs
             )
             if cached_value is not None:
                 self.bus.publish(
@@ -194,12 +365,9 @@ class NodeProcessor:
                     )
                 )
                 # Cache Save
-                if node.cache_policy:
-                    inputs_for_save = await self._resolve_inputs_for_cache(
-                        node, graph, state_backend
-                    )
-                    await node.cache_policy.save(
-                        node.structural_id, inputs_for_save, result
+                if cache_policy:
+                    await cache_policy.save(
+                        node.structural_id, inputs_for_cache, result, **cache_kwargs
                     )
                 return result
             except Exception as e:
@@ -233,25 +401,25 @@ class NodeProcessor:
                     raise last_exception
         raise RuntimeError("Unexpected execution state")
 
-    async def _resolve_inputs_for_cache(
-        self, node: Node, graph: Graph, state_backend: StateBackend
+    def _inputs_for_cache(
+        self, node: Node, args: List[Any], kwargs: Dict[str, Any]
     ) -> Dict[str, Any]:
-        # TODO: This needs to be smarter for caching.
-        # It should probably include data from input_bindings too?
-        # For now, keeping legacy behavior (edge results only).
-        inputs = {}
-        incoming_edges = [
-            edge
-            for edge in graph.edges
-            if edge.target.structural_id == node.structural_id
-        ]
-        for edge in incoming_edges:
-            if edge.arg_name.startswith("_"):
-                continue
-            if await state_backend.has_result(edge.source.structural_id):
-                inputs[edge.arg_name] = await state_backend.get_result(
-                    edge.source.structural_id
-                )
+        """
+        The resolved inputs of a task, named like its bindings ("0", "1", ... for
+        positional arguments): literals, upstream results and TCO overrides.
+        Injected resources are represented by their Inject markers.
+        """
+        inputs = {str(i): value for i, value in enumerate(args)}
+        inputs.update(kwargs)
+        binder = node.binder
+        if binder is not None and node.has_complex_inputs:
+            for idx in binder.inject_args:
+                inputs[str(idx)] = binder.args[idx]
+            for name in binder.inject_kwargs:
+                inputs[name] = binder.kwargs[name]
+            for name, _, inject in binder.inject_defaults:
+                if name in kwargs and name not in binder.slots:
+                    inputs[name] = inject
         return inputs
 
     async def _execute_map_node(
@@ -263,31 +431,236 @@ class NodeProcessor:
         params: Dict[str, Any],
         parent_state_backend: StateBackend,
         sub_graph_runner: Callable,
-    ) -> List[Any]:
+    ) -> Union[List[Any], AsyncIterator[Any]]:
         factory = node.mapping_factory
-        if not kwargs:
-            return []
         lengths = {k: len(v) for k, v in kwargs.items()}
-        first_len = list(lengths.values())[0]
-        if not all(length == first_len for length in lengths.values()):
+        length = next(iter(lengths.values()), 0)
+        if not all(n == length for n in lengths.values()):
             raise ValueError(f"Mapped inputs have mismatched lengths: {lengths}")
 
-        sub_targets = []
-        for i in range(first_len):
-            item_kwargs = {k: v[i] for k, v in kwargs.items()}
-            sub_target = factory(**item_kwargs)
-            # Propagate policies
-            if node.retry_policy:
-                sub_target._retry_policy = node.retry_policy
-            if node.cache_policy:
-                sub_target._cache_policy = node.cache_policy
-            if node.constraints:
-                sub_target._constraints = node.constraints
-            sub_targets.append(sub_target)
-
-        # Execute sub-targets in parallel using the provided runner
-        coros = [
-            sub_graph_runner(target, params, parent_state_backend)
-            for target in sub_targets
-        ]
-        return await asyncio.gather(*coros)
+        if self._can_batch(node, kwargs):
+            count, run_unit, window, chunked = self._direct_units(
+                node, kwargs, length, run_id
+            )
+        else:
+            # A vectorised task is given one-element slices
+            batch = getattr(factory, "batch", False)
+            isolated = bool(node.max_concurrency or node.streaming)
+
+            async def run_element(i: int) -> Any:
+                # Sub-targets are created as they start, so with a window only
+                # `max_concurrency` sub-graphs exist at any time.
+                if batch:
+                    item_kwargs = {k: v[i : i + 1] for k, v in kwargs.items()}
+                else:
+                    item_kwargs = {k: v[i] for k, v in kwargs.items()}
+                sub_target = factory(**item_kwargs)
+                # Propagate policies
+                if node.retry_policy:
+                    sub_target._retry_policy = node.retry_policy
+                if node.cache_policy:
+                    sub_target._cache_policy = node.cache_policy
+                if node.constraints:
+                    sub_target._constraints = node.constraints
+                state = (
+                    _ElementStateBackend(parent_state_backend)
+                    if isolated
+                    else parent_state_backend
+                )
+                result = await sub_graph_runner(sub_target, params, state)
+                return self._check_batch(factory, result, 1)[0] if batch else result
+
+            count, run_unit, window = length, run_element, node.max_concurrency
+            chunked = False
+
+        if node.streaming:
+            return _stream_window(
+                run_unit, count, window or DEFAULT_STREAM_WINDOW, chunked
+            )
+        results = await _gather_window(run_unit, count, window)
+        if chunked:
+            return [result for chunk in results for result in chunk]
+        return results
+
+    def _can_batch(self, node: Node, kwargs: Dict[str, Any]) -> bool:
+        """
+        Checks whether a map node can skip building a sub-graph per element:
+        it maps a plain task over plain data, without per-element policies.
+        """
+        factory = node.mapping_factory
+        if not self.map_chunk_size or not isinstance(factory, Task):
+            return False
+        if node.retry_policy or node.cache_policy or node.constraints:
+            return False
+        # Global constraints (pause, rate limits, ...) are checked per element
+        if self.constraint_manager.has_constraints():
+            return False
+        try:
+            parameters = inspect.signature(factory.func).parameters.values()
+        except (TypeError, ValueError):
+            return False
+        if any(isinstance(p.default, Inject) for p in parameters):
+            return False
+        return all(
+            _is_plain(v)
+            for column in kwargs.values()
+            if isinstance(column, (list, tuple))
+            for v in column
+        )
+
+    def _direct_units(
+        self, node: Node, kwargs: Dict[str, Any], length: int, run_id: str
+    ) -> Tuple[int, Callable[[int], Awaitable[Any]], Optional[int], bool]:
+        """
+        Splits a batchable map into units run directly by the executor. Returns
+        the number of units, a function running the i-th unit, how many units
+        may run at once to honour `max_concurrency`, and whether units are
+        chunks (lists of results).
+
+        Blocking and async tasks are called once per element, so that elements
+        waiting on I/O overlap as they do in sub-graphs. Batch tasks are called
+        once per chunk of `map_chunk_size` elements. Other compute tasks run in
+        chunks as well, split so that every CPU gets one; the events of their
+        elements are published when their chunk finishes.
+
+        Every call publishes TaskExecutionStarted/Finished events, with the
+        element's index (or the chunk's range) appended to the map node's id.
+        """
+        factory = node.mapping_factory
+        window = node.max_concurrency
+        unit_node = Node(
+            structural_id=node.structural_id,
+            name=factory.name,
+            execution_mode=factory.mode,
+            callable_obj=factory.func,
+        )
+
+        if not (factory.batch or (factory.mode == "compute" and not factory.is_async)):
+
+            async def run_element(i: int) -> Any:
+                element_kwargs = {k: v[i] for k, v in kwargs.items()}
+                result = await self._call_unit(
+                    unit_node, f"{node.structural_id}[{i}]", [], element_kwargs, run_id
+                )
+                self._check_element_result(factory, result)
+                return result
+
+            return length, run_element, window, False
+
+        if factory.batch:
+            size = self.map_chunk_size
+            if window:
+                # All elements of a chunk are in flight together
+                size = min(size, window)
+                window = max(1, window // size)
+        else:
+            # One chunk per CPU, so that the whole compute pool is busy
+            size = min(self.map_chunk_size, -(-length // (os.cpu_count() or 1)))
+            chunk_node = Node(
+                structural_id=node.structural_id,
+                name=factory.name,
+                execution_mode=factory.mode,
+                callable_obj=_call_each,
+            )
+
+        async def run_chunk(i: int) -> List[Any]:
+            start = i * size
+            stop = min(start + size, length)
+            columns = {k: v[start:stop] for k, v in kwargs.items()}
+            if factory.batch:
+                results = await self._call_unit(
+                    unit_node,
+                    f"{node.structural_id}[{start}:{stop}]",
+                    [],
+                    columns,
+                    run_id,
+                )
+                results = self._check_batch(factory, results, stop - start)
+            else:
+                results, durations = await self.executor.execute(
+                    chunk_node, [factory.func, columns], {}
+                )
+                for offset, duration in enumerate(durations):
+                    task_id = f"{node.structural_id}[{start + offset}]"
+                    self.bus.publish(
+                        TaskExecutionStarted(
+                            run_id=run_id, task_id=task_id, task_name=factory.name
+                        )
+                    )
+                    self._publish_finished(run_id, task_id, factory.name, duration)
+            for result in results:
+                self._check_element_result(factory, result)
+            return results
+
+        return -(-length // size), run_chunk, window, True
+
+    async def _call_unit(
+        self,
+        node: Node,
+        task_id: str,
+        args: List[Any],
+        kwargs: Dict[str, Any],
+        run_id: str,
+    ) -> Any:
+        """Runs one executor call of a map's fast path, publishing its events."""
+        self.bus.publish(
+            TaskExecutionStarted(run_id=run_id, task_id=task_id, task_name=node.name)
+        )
+        start_time = time.time()
+        try:
+            result = await self.executor.execute(node, args, kwargs)
+        except Exception as e:
+            self._publish_finished(
+                run_id,
+                task_id,
+                node.name,
+                time.time() - start_time,
+                status="Failed",
+                error=f"{type(e).__name__}: {e}",
+            )
+            raise
+        self._publish_finished(run_id, task_id, node.name, time.time() - start_time)
+        return result
+
+    def _publish_finished(
+        self,
+        run_id: str,
+        task_id: str,
+        task_name: str,
+        duration: float,
+        status: str = "Succeeded",
+        error: Optional[str] = None,
+    ) -> None:
+        self.bus.publish(
+            TaskExecutionFinished(
+                run_id=run_id,
+                task_id=task_id,
+                task_name=task_name,
+                status=status,
+                duration=duration,
+                error=error,
+                graph_node=False,
+            )
+        )
+
+    def _check_element_result(self, factory: Task, result: Any) -> None:
+        """The guards the executor and graph strategy apply to each sub-graph."""
+        if isinstance(result, (LazyResult, MappedLazyResult)):
+            raise StaticGraphError(
+                f"Task '{factory.name}' illegally returned a LazyResult. "
+                "Tasks must return data. For control flow, return a cs.Jump(...) signal instead."
+            )
+        if isinstance(result, Jump):
+            raise RuntimeError(
+                f"Task '{factory.name}' returned a Jump signal inside a map, "
+                "which has no bound 'select_jump'."
+            )
+
+    def _check_batch(self, factory: Task, results: Any, expected: int) -> List[Any]:
+        results = list(results)
+        if len(results) != expected:
+            raise ValueError(
+                f"Batch task '{factory.name}' returned {len(results)} results "
+                f"for {expected} inputs."
+            )
+        return results
@@ -3,6 +3,8 @@ from typing import Any, Dict, List, Tuple
 from cascade.graph.model import Node, Graph, Edge, EdgeType
 from cascade.spec.resource import Inject
 from cascade.spec.lazy_types import LazyResult, MappedLazyResult
+from cascade.runtime.binder import ArgumentBinder, place
+from cascade.runtime.state import get_many
 from cascade.runtime.exceptions import DependencyMissingError, ResourceNotFoundError
 from cascade.spec.protocols import StateBackend
 
@@ -13,6 +15,9 @@ class ArgumentResolver:
     1. Structural bindings (Literal values stored in Node)
     2. Upstream dependencies (Edges)
     3. Resource injections
+
+    Each node's argument layout is compiled once into an ArgumentBinder, so
+    resolution is a fill loop over pre-computed slots.
     """
 
     async def resolve(
@@ -25,141 +30,83 @@ class ArgumentResolver:
         user_params: Dict[str, Any] = None,
         input_overrides: Dict[str, Any] = None,
     ) -> Tuple[List[Any], Dict[str, Any]]:
-        # FAST PATH: If node is simple (no Injects, no magic params), skip the ceremony.
-        if not node.has_complex_inputs:
-            # Reconstruct args/kwargs from Bindings (Literals) and Overrides
-            bindings = node.input_bindings
-            if input_overrides:
-                bindings = bindings.copy()
-                bindings.update(input_overrides)
-
-            # 1. Fill from bindings
-            f_args: List[Any] = []
-            f_kwargs: Dict[str, Any] = {}
-            for k, v in bindings.items():
-                if k.isdigit():
-                    idx = int(k)
-                    while len(f_args) <= idx:
-                        f_args.append(None)
-                    f_args[idx] = v
-                else:
-                    f_kwargs[k] = v
+        incoming_edges = graph.get_in_edges(node.structural_id, EdgeType.DATA)
+
+        binder = node.binder
+        if binder is None:
+            binder = ArgumentBinder(node, (edge.arg_name for edge in incoming_edges))
+            node.binder = binder
+
+        # 1. Literal bindings, pre-placed in their slots
+        args = binder.args.copy()
+        kwargs = binder.kwargs.copy()
+        if node.has_complex_inputs:
+            # Resolve nested Injects in the literals that hold them
+            for idx in binder.inject_args:
+                args[idx] = self._resolve_structure(
+                    args[idx],
+                    node.structural_id,
+                    state_backend,
+                    resource_context,
+                    graph,
+                )
+            for name in binder.inject_kwargs:
+                kwargs[name] = self._resolve_structure(
+                    kwargs[name],
+                    node.structural_id,
+                    state_backend,
+                    resource_context,
+                    graph,
+                )
 
-            # 2. Fill from edges using the unified helper
-            resolved_edge_values = await self._resolve_data_edges(
-                node, graph, state_backend, instance_map, input_overrides
+        # 2. Upstream dependencies. Overrides from TCO Jumps take precedence
+        # over the static graph.
+        if input_overrides:
+            incoming_edges = [
+                e for e in incoming_edges if e.arg_name not in input_overrides
+            ]
+        if incoming_edges:
+            # Fetch all plain upstream results in one batch; routers and
+            # skipped upstreams take the per-edge path.
+            found = await get_many(
+                state_backend,
+                [e.source.structural_id for e in incoming_edges if e.router is None],
             )
-            for k, v in resolved_edge_values.items():
-                if k.isdigit():
-                    idx = int(k)
-                    while len(f_args) <= idx:
-                        f_args.append(None)
-                    f_args[idx] = v
+            for edge in incoming_edges:
+                source_id = edge.source.structural_id
+                if edge.router is None and source_id in found:
+                    value = found[source_id]
                 else:
-                    f_kwargs[k] = v
-
-            return f_args, f_kwargs
+                    value = await self._resolve_dependency(
+                        edge, node.structural_id, state_backend, graph, instance_map
+                    )
+                place(args, kwargs, binder.slot(edge.arg_name), value)
 
-        # --- COMPLEX PATH ---
-        args: List[Any] = []
-        kwargs: Dict[str, Any] = {}
-
-        # 1. Reconstruct initial args/kwargs from Bindings (Literals)
-        bindings = node.input_bindings
+        # 3. Overrides
         if input_overrides:
-            bindings = bindings.copy()
-            bindings.update(input_overrides)
-
-        positional_args_dict = {}
-        for name, value_raw in bindings.items():
-            # Always resolve structures to handle nested Injects correctly
-            value = self._resolve_structure(
-                value_raw, node.structural_id, state_backend, resource_context, graph
-            )
-
-            if name.isdigit():
-                positional_args_dict[int(name)] = value
-            else:
-                kwargs[name] = value
-
-        sorted_indices = sorted(positional_args_dict.keys())
-        args = [positional_args_dict[i] for i in sorted_indices]
-
-        # 2. Overlay Dependencies from Edges using the unified helper
-        resolved_edge_values = await self._resolve_data_edges(
-            node, graph, state_backend, instance_map, input_overrides
-        )
-        for k, v in resolved_edge_values.items():
-            if k.isdigit():
-                idx = int(k)
-                while len(args) <= idx:
-                    args.append(None)
-                args[idx] = v
-            else:
-                kwargs[k] = v
-
-        # 3. Handle Resource Injection in Defaults
-        if node.signature:
-            # Create a bound arguments object to see which args are not yet filled
-            try:
-                bound_args = node.signature.bind_partial(*args, **kwargs)
-                for param in node.signature.parameters.values():
-                    if (
-                        isinstance(param.default, Inject)
-                        and param.name not in bound_args.arguments
-                    ):
-                        kwargs[param.name] = self._resolve_inject(
-                            param.default, node.name, resource_context
-                        )
-            except TypeError:
-                # This can happen if args/kwargs are not yet valid, but we can still try a simpler check
-                pass
-
-        # 4. Handle internal param fetching context
-        # [CRITICAL] This logic must always run for Param tasks
-        from cascade.internal.inputs import _get_param_value
+            for name, value in input_overrides.items():
+                if node.has_complex_inputs:
+                    value = self._resolve_structure(
+                        value,
+                        node.structural_id,
+                        state_backend,
+                        resource_context,
+                        graph,
+                    )
+                place(args, kwargs, binder.slot(name), value)
+
+        # 4. Resource injection in defaults, for parameters left unbound
+        for name, position, inject in binder.inject_defaults:
+            if name in kwargs or (position is not None and position < len(args)):
+                continue
+            kwargs[name] = self._resolve_inject(inject, node.name, resource_context)
 
-        if node.callable_obj is _get_param_value.func:
+        # 5. Param tasks read the run's parameters
+        if binder.params_context:
             kwargs["params_context"] = user_params or {}
 
         return args, kwargs
 
-    async def _resolve_data_edges(
-        self,
-        node: Node,
-        graph: Graph,
-        state_backend: StateBackend,
-        instance_map: Dict[str, Node],
-        input_overrides: Dict[str, Any] | None,
-    ) -> Dict[str, Any]:
-        """
-        Shared helper to resolve all incoming DATA edges for a node,
-        respecting the priority of input_overrides from TCO Jumps.
-        """
-        resolved_values = {}
-        incoming_edges = [
-            e
-            for e in graph.edges
-            if e.target.structural_id == node.structural_id
-            and e.edge_type == EdgeType.DATA
-        ]
-
-        if not incoming_edges:
-            return {}
-
-        for edge in incoming_edges:
-            # [CRITICAL] Unified Priority Check:
-            # Overrides from Jump must take precedence over the static graph.
-            if input_overrides and edge.arg_name in input_overrides:
-                continue
-
-            val = await self._resolve_dependency(
-                edge, node.structural_id, state_backend, graph, instance_map
-            )
-            resolved_values[edge.arg_name] = val
-
-        return resolved_values
-
     def _resolve_structure(
         self,
         obj: Any,
@@ -257,10 +204,7 @@ class ArgumentResolver:
         # Slow Path: Check for skip/penetration
         skip_reason = await state_backend.get_skip_reason(node_id)
         if skip_reason:
-            upstream_edges = [
-                e for e in graph.edges if e.target.structural_id == node_id
-            ]
-            data_inputs = [e for e in upstream_edges if e.edge_type == EdgeType.DATA]
+            data_inputs = graph.get_in_edges(node_id, EdgeType.DATA)
             if data_inputs:
                 # Recursively try to penetrate the skipped node
                 return await self._get_node_result(
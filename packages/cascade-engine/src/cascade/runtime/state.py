@@ -0,0 +1,46 @@
+from typing import Any, Dict, Sequence, Set
+
+from cascade.spec.protocols import StateBackend
+
+# Batched StateBackend operations. Backends may implement them natively; the
+# per-key defaults of the StateBackend protocol are used for those that don't.
+
+
+async def get_many(
+    state_backend: StateBackend, node_ids: Sequence[str]
+) -> Dict[str, Any]:
+    """Retrieves the results of several tasks; tasks without one are omitted."""
+    if not node_ids:
+        return {}
+    native = getattr(state_backend, "get_many", None)
+    if native is not None:
+        return await native(node_ids)
+    return await StateBackend.get_many(state_backend, node_ids)
+
+
+async def has_many(state_backend: StateBackend, node_ids: Sequence[str]) -> Set[str]:
+    """Returns the IDs, among `node_ids`, of the tasks that have a result."""
+    if not node_ids:
+        return set()
+    native = getattr(state_backend, "has_many", None)
+    if native is not None:
+        return await native(node_ids)
+    return await StateBackend.has_many(state_backend, node_ids)
+
+
+async def put_many(state_backend: StateBackend, results: Dict[str, Any]) -> None:
+    """Stores the results of several completed tasks."""
+    if not results:
+        return
+    native = getattr(state_backend, "put_many", None)
+    if native is not None:
+        await native(results)
+    else:
+        await StateBackend.put_many(state_backend, results)
+
+
+async def flush(state_backend: StateBackend) -> None:
+    """Lets write-behind backends send their buffered writes (at stage boundaries)."""
+    native = getattr(state_backend, "flush", None)
+    if native is not None:
+        await native()
@@ -1,5 +1,11 @@
 from .base import ExecutionStrategy
 from .graph import GraphExecutionStrategy
+from .ready_queue import ReadyQueueExecutionStrategy
 from .vm import VMExecutionStrategy
 
-__all__ = ["ExecutionStrategy", "GraphExecutionStrategy", "VMExecutionStrategy"]
+__all__ = [
+    "ExecutionStrategy",
+    "GraphExecutionStrategy",
+    "ReadyQueueExecutionStrategy",
+    "VMExecutionStrategy",
+]
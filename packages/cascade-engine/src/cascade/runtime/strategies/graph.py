@@ -1,21 +1,24 @@
 import asyncio
 from contextlib import ExitStack
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Set
 from dataclasses import dataclass
 
 from cascade.graph.model import Graph, Node, EdgeType
-from cascade.graph.build import build_graph
+from cascade.graph.build import build_graph, BuildMemo
 from cascade.graph.registry import NodeRegistry
-from cascade.graph.hashing import BlueprintHasher
-from cascade.spec.protocols import Solver, StateBackend
+from cascade.graph.hashing import BlueprintHasher, StableIdHasher
+from cascade.spec.protocols import DurationStore, Solver, StateBackend
 from cascade.spec.jump import Jump
 from cascade.runtime.bus import MessageBus
 from cascade.runtime.resource_container import ResourceContainer
 from cascade.runtime.processor import NodeProcessor
 from cascade.runtime.flow import FlowManager
+from cascade.runtime.state import flush, has_many
 from cascade.runtime.exceptions import DependencyMissingError
 from cascade.runtime.events import TaskSkipped, TaskBlocked
 from cascade.runtime.constraints.manager import ConstraintManager
+from cascade.runtime.plan_cache import PlanCache
+from cascade.adapters.durations import InMemoryDurationStore
 
 
 @dataclass
@@ -40,6 +43,11 @@ class GraphExecutionStrategy:
         constraint_manager: ConstraintManager,
         bus: MessageBus,
         wakeup_event: asyncio.Event,
+        node_registry: NodeRegistry | None = None,
+        plan_cache: PlanCache | None = None,
+        build_memo: BuildMemo | None = None,
+        compact_graphs: bool = False,
+        duration_store: DurationStore | None = None,
     ):
         self.solver = solver
         self.node_processor = node_processor
@@ -48,13 +56,45 @@ class GraphExecutionStrategy:
         self.bus = bus
         self.wakeup_event = wakeup_event
         self.blueprint_hasher = BlueprintHasher()
+        self.stable_id_hasher = StableIdHasher()
 
         # JIT Compilation Cache
-        # Maps a graph's blueprint hash to an IndexedExecutionPlan (List[List[int]])
-        self._template_plan_cache: Dict[str, List[List[int]]] = {}
+        # Maps a graph's topology hash to an IndexedExecutionPlan (List[List[int]])
+        self._template_plan_cache = (
+            plan_cache if plan_cache is not None else PlanCache()
+        )
+        # Plans depend on the solver, so the solver type is part of the cache key.
+        # This keeps a shared on-disk store safe across differently-solved engines.
+        self._plan_key_prefix = f"{type(solver).__qualname__}:"
 
         # Persistent registry for node interning
-        self._node_registry = NodeRegistry()
+        self._node_registry = (
+            node_registry if node_registry is not None else NodeRegistry()
+        )
+
+        # Cross-run memo of already-built LazyResults (incremental graph builds).
+        # Opt-in: it keeps the memoized LazyResults and their literals alive.
+        self._build_memo = build_memo
+
+        # Build CompactGraphs (columnar edge storage) for very large workflows
+        self.compact_graphs = compact_graphs
+
+        # Observed task durations, the cost model for duration-aware scheduling
+        self.duration_store = (
+            duration_store if duration_store is not None else InMemoryDurationStore()
+        )
+
+    @property
+    def plan_cache(self) -> PlanCache:
+        return self._template_plan_cache
+
+    @property
+    def node_registry(self) -> NodeRegistry:
+        return self._node_registry
+
+    @property
+    def build_memo(self) -> BuildMemo | None:
+        return self._build_memo
 
     def _index_plan(self, graph: Graph, plan: Any) -> List[List[int]]:
         """
@@ -67,6 +107,16 @@ class GraphExecutionStrategy:
             indexed_plan.append(indexed_stage)
         return indexed_plan
 
+    def _is_plan_compatible(self, graph: Graph, indexed_plan: List[List[int]]) -> bool:
+        """
+        Sanity-checks a cached IndexedPlan against the current graph.
+        Plans loaded from a persistent store may come from an older build.
+        """
+        n_nodes = len(graph.nodes)
+        return sum(len(stage) for stage in indexed_plan) == n_nodes and all(
+            0 <= idx < n_nodes for stage in indexed_plan for idx in stage
+        )
+
     def _rehydrate_plan(self, graph: Graph, indexed_plan: List[List[int]]) -> Any:
         """
         Converts an IndexedPlan back into a Plan using the nodes from the current graph.
@@ -77,6 +127,58 @@ class GraphExecutionStrategy:
             plan.append(stage_nodes)
         return plan
 
+    def _resolve_plan(self, graph: Graph) -> Any:
+        """
+        Resolves the plan of a graph, reusing the cached plan of any earlier graph
+        with the same topology (literals and instance salts aside), including
+        graphs solved by other engines sharing a persistent PlanCache.
+        """
+        plan_key = self._plan_key_prefix + self.blueprint_hasher.compute_topology_hash(
+            graph
+        )
+        indexed_plan = self._template_plan_cache.get(plan_key)
+        if indexed_plan is not None and self._is_plan_compatible(graph, indexed_plan):
+            return self._rehydrate_plan(graph, indexed_plan)
+
+        plan = self.solver.resolve(graph)
+        self._template_plan_cache.put(plan_key, self._index_plan(graph, plan))
+        return plan
+
+    async def _run_sub_graph(
+        self,
+        target: Any,
+        params: Dict[str, Any],
+        active_resources: Dict[str, Any],
+        run_id: str,
+        state_backend: StateBackend,
+        registry: NodeRegistry,
+    ) -> Any:
+        """
+        Runs the sub-graph of one map element and returns its raw value.
+
+        Sub-graphs are planned through the plan cache like top-level graphs, so
+        the identical structures of a map's elements are solved once. Their nodes
+        are interned in `registry`, a scratch registry of the graph running the
+        map: element nodes hold the element's inputs and are rarely shared across
+        runs, so they are released with that graph instead of staying in the
+        engine's registry. Sub-graphs also bypass the build memo: element targets
+        are built exactly once, and would only evict useful fragments.
+        """
+        sub_graph, sub_instance_map = build_graph(
+            target, registry=registry, compact=self.compact_graphs
+        )
+        result_obj = await self._execute_graph(
+            target,
+            params,
+            active_resources,
+            run_id,
+            state_backend,
+            graph=sub_graph,
+            plan=self._resolve_plan(sub_graph),
+            instance_map=sub_instance_map,
+        )
+        return result_obj.value
+
     async def execute(
         self,
         target: Any,
@@ -92,6 +194,13 @@ class GraphExecutionStrategy:
         # Optimization: Local Graph Cache for the duration of this run
         # Maps LazyResult._uuid -> (Graph, InstanceMap, Plan)
         local_context_cache = {}
+        # Backends that store results across processes (e.g. SqliteStateBackend)
+        # key the top-level graph's results by ids that survive a rebuild.
+        set_node_keys = getattr(state_backend, "set_node_keys", None)
+        node_keys_cache: Dict[str, Dict[str, str]] = {}
+
+        # Each run is a new registry generation; stale interned nodes may be swept.
+        self._node_registry.begin_generation()
 
         while True:
             # The step stack holds "task" (step) scoped resources
@@ -112,7 +221,10 @@ class GraphExecutionStrategy:
                     # SLOW PATH: First time building this structure in this run
                     # 2.1 Build Graph
                     graph, instance_map = build_graph(
-                        current_target, registry=self._node_registry
+                        current_target,
+                        registry=self._node_registry,
+                        memo=self._build_memo,
+                        compact=self.compact_graphs,
                     )
 
                     if current_target._uuid not in instance_map:
@@ -121,14 +233,7 @@ class GraphExecutionStrategy:
                         )
 
                     # 2.2 Resolve Plan (with caching based on blueprint hash)
-                    blueprint_hash = self.blueprint_hasher.compute_hash(graph)
-                    if blueprint_hash in self._template_plan_cache:
-                        indexed_plan = self._template_plan_cache[blueprint_hash]
-                        plan = self._rehydrate_plan(graph, indexed_plan)
-                    else:
-                        plan = self.solver.resolve(graph)
-                        indexed_plan = self._index_plan(graph, plan)
-                        self._template_plan_cache[blueprint_hash] = indexed_plan
+                    plan = self._resolve_plan(graph)
 
                     # Update local cache
                     local_context_cache[current_target._uuid] = (
@@ -137,6 +242,14 @@ class GraphExecutionStrategy:
                         plan,
                     )
 
+                if set_node_keys is not None:
+                    node_keys = node_keys_cache.get(current_target._uuid)
+                    if node_keys is None:
+                        node_keys = node_keys_cache[current_target._uuid] = (
+                            self.stable_id_hasher.compute_ids(graph)
+                        )
+                    set_node_keys(node_keys)
+
                 # 3. Setup Resources
                 required_resources = self.resource_container.scan(graph)
                 self.resource_container.setup(
@@ -176,15 +289,10 @@ class GraphExecutionStrategy:
                 # Handle Explicit Jump
                 source_node_id = graph_result.source_node_id
 
-                jump_edge = next(
-                    (
-                        e
-                        for e in graph.edges
-                        if e.source.structural_id == source_node_id
-                        and e.edge_type == EdgeType.ITERATIVE_JUMP
-                    ),
-                    None,
+                jump_edges = graph.get_out_edges(
+                    source_node_id, EdgeType.ITERATIVE_JUMP
                 )
+                jump_edge = jump_edges[0] if jump_edges else None
 
                 if not jump_edge or not jump_edge.jump_selector:
                     raise RuntimeError(
@@ -212,6 +320,40 @@ class GraphExecutionStrategy:
                 # Normal termination
                 return result
 
+    async def _restore_results(
+        self,
+        plan: Any,
+        state_backend: StateBackend,
+        flow_manager: FlowManager,
+        run_id: str,
+    ) -> Set[str]:
+        """
+        Returns the IDs of the planned nodes whose results were stored by an
+        earlier attempt of a resumed run (see SqliteStateBackend). They are
+        reported as skipped, and their Router decisions are replayed.
+        """
+        if not getattr(state_backend, "resumed", False):
+            return set()
+        nodes = [node for stage in plan for node in stage if node.node_type != "param"]
+        restored = await has_many(state_backend, [node.structural_id for node in nodes])
+        for node in nodes:
+            node_id = node.structural_id
+            if node_id not in restored:
+                continue
+            if node_id in flow_manager.routers_by_selector:
+                await flow_manager.register_result(
+                    node_id, await state_backend.get_result(node_id), state_backend
+                )
+            self.bus.publish(
+                TaskSkipped(
+                    run_id=run_id,
+                    task_id=node_id,
+                    task_name=node.name,
+                    reason="Resumed",
+                )
+            )
+        return restored
+
     async def _execute_graph(
         self,
         target: Any,
@@ -234,9 +376,16 @@ class GraphExecutionStrategy:
 
         flow_manager = FlowManager(graph, target_node.structural_id, instance_map)
         blocked_nodes = set()
+        restored = await self._restore_results(
+            plan, state_backend, flow_manager, run_id
+        )
+        # Interns the sub-graphs of map elements (see _run_sub_graph)
+        element_registry = NodeRegistry()
 
         for stage in plan:
-            pending_nodes_in_stage = list(stage)
+            pending_nodes_in_stage = [
+                node for node in stage if node.structural_id not in restored
+            ]
 
             while pending_nodes_in_stage:
                 executable_this_pass: List[Node] = []
@@ -282,21 +431,14 @@ class GraphExecutionStrategy:
                 if executable_this_pass:
                     # Callback for map nodes
                     async def sub_graph_runner(target, sub_params, parent_state):
-                        # Recursive call: must build new graph
-                        sub_graph, sub_instance_map = build_graph(target)
-                        sub_plan = self.solver.resolve(sub_graph)
-                        # The map node expects the raw value, not the result object
-                        result_obj = await self._execute_graph(
+                        return await self._run_sub_graph(
                             target,
                             sub_params,
                             active_resources,
                             run_id,
                             parent_state,
-                            graph=sub_graph,
-                            plan=sub_plan,
-                            instance_map=sub_instance_map,
+                            element_registry,
                         )
-                        return result_obj.value
 
                     tasks_to_run = []
                     for node in executable_this_pass:
@@ -331,22 +473,38 @@ class GraphExecutionStrategy:
                             await flow_manager.register_result(
                                 node.structural_id, res, state_backend
                             )
+                    elif hasattr(state_backend, "put_many"):
+                        # Standard parallel execution, storing the stage's
+                        # results in one batch (one round-trip for remote state)
+                        results = await asyncio.gather(
+                            *(coro for _, coro in tasks_to_run)
+                        )
+                        await state_backend.put_many(
+                            {
+                                node.structural_id: res
+                                for (node, _), res in zip(tasks_to_run, results)
+                            }
+                        )
+                        for (node, _), res in zip(tasks_to_run, results):
+                            await flow_manager.register_result(
+                                node.structural_id, res, state_backend
+                            )
                     else:
-                        # Standard parallel execution
-                        nodes_in_pass = [t[0] for t in tasks_to_run]
-                        coros = [t[1] for t in tasks_to_run]
-                        pass_results = await asyncio.gather(*coros)
-
-                        for node, res in zip(nodes_in_pass, pass_results):
+                        # Backends without put_many (e.g. spilling ones) get
+                        # each result as soon as its task finishes, so the state
+                        # backend (not this stage) decides how many large
+                        # results stay in RAM.
+                        async def run_and_store(node, coro):
+                            res = await coro
                             await state_backend.put_result(node.structural_id, res)
                             if flow_manager:
                                 await flow_manager.register_result(
                                     node.structural_id, res, state_backend
                                 )
-                        if flow_manager:
-                            await flow_manager.register_result(
-                                node.structural_id, res, state_backend
-                            )
+
+                        await asyncio.gather(
+                            *(run_and_store(node, coro) for node, coro in tasks_to_run)
+                        )
 
                 pending_nodes_in_stage = deferred_this_pass
 
@@ -355,7 +513,14 @@ class GraphExecutionStrategy:
                     self.wakeup_event.clear()
                     self.constraint_manager.cleanup_expired_constraints()
 
+            await flush(state_backend)
+
         # Use the mapped canonical node ID to check for the final result
+        return await self._collect_target_result(target, target_node, state_backend)
+
+    async def _collect_target_result(
+        self, target: Any, target_node: Node, state_backend: StateBackend
+    ) -> GraphExecutionResult:
         if not await state_backend.has_result(target_node.structural_id):
             # For debugging, check if the instance was skipped
             if skip_reason := await state_backend.get_skip_reason(
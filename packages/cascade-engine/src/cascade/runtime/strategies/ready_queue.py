@@ -0,0 +1,376 @@
+import asyncio
+import heapq
+from typing import Any, Dict, List, Optional, Tuple
+
+from cascade.graph.model import Graph, Node, EdgeType
+from cascade.graph.registry import NodeRegistry
+from cascade.spec.protocols import StateBackend
+from cascade.adapters.durations import estimate_weights
+from cascade.runtime.flow import FlowManager
+from cascade.runtime.state import flush, put_many
+from cascade.runtime.events import TaskSkipped, TaskBlocked
+from cascade.runtime.strategies.graph import (
+    GraphExecutionStrategy,
+    GraphExecutionResult,
+)
+
+# Edge types that make a node wait for its source (same as the solvers' whitelist).
+EXECUTION_EDGE_TYPES = frozenset(
+    {
+        EdgeType.DATA,
+        EdgeType.CONDITION,
+        EdgeType.CONSTRAINT,
+        EdgeType.IMPLICIT,
+        EdgeType.SEQUENCE,
+        EdgeType.ROUTER_ROUTE,
+    }
+)
+
+
+class ReadyQueueExecutionStrategy(GraphExecutionStrategy):
+    """
+    A list-scheduling variant of GraphExecutionStrategy.
+
+    Instead of running the plan stage by stage, every node keeps a count of its
+    unfinished dependencies and is dispatched as soon as that count reaches zero,
+    so a slow node only delays its own successors. When more nodes are ready than
+    can run (constraints or resource contention), the one with the longest
+    remaining critical path goes first.
+
+    Critical paths are weighted by the expected duration of each node, taken
+    from the strategy's DurationStore (fed from `TaskExecutionFinished` events).
+    Nodes without history get the mean known duration, or unit weights before
+    anything has been observed.
+
+    The solver's plan is still computed (and cached): it validates the graph
+    (e.g. cycle detection) and provides the topological order used to compute
+    the priorities.
+    """
+
+    def estimate_duration(self, node: Node) -> Optional[float]:
+        """Returns the historical duration of a node, if known."""
+        return self.duration_store.estimate(node)
+
+    def _compute_priorities(self, graph: Graph, plan: Any) -> Dict[str, float]:
+        """
+        Computes the critical-path length (the node's own weight plus the longest
+        weighted path to any sink) of every node, in reverse topological order.
+        """
+        weights = estimate_weights(
+            self.duration_store, (node for stage in plan for node in stage)
+        )
+
+        priorities: Dict[str, float] = {}
+        for stage in reversed(plan):
+            for node in stage:
+                node_id = node.structural_id
+                longest_tail = 0.0
+                for edge in graph.get_out_edges(node_id):
+                    if edge.edge_type in EXECUTION_EDGE_TYPES:
+                        tail = priorities.get(edge.target.structural_id, 0.0)
+                        if tail > longest_tail:
+                            longest_tail = tail
+                priorities[node_id] = weights[node_id] + longest_tail
+        return priorities
+
+    async def _execute_graph(
+        self,
+        target: Any,
+        params: Dict[str, Any],
+        active_resources: Dict[str, Any],
+        run_id: str,
+        state_backend: StateBackend,
+        graph: Graph,
+        plan: Any,
+        instance_map: Dict[str, Node],
+        root_input_overrides: Dict[str, Any] = None,
+    ) -> GraphExecutionResult:
+        # Locate the canonical node for the current target instance
+        if target._uuid not in instance_map:
+            raise RuntimeError(
+                f"Critical: Target instance {target._uuid} not found in InstanceMap."
+            )
+
+        target_node = instance_map[target._uuid]
+
+        flow_manager = FlowManager(graph, target_node.structural_id, instance_map)
+        blocked_nodes = set()
+        restored = await self._restore_results(
+            plan, state_backend, flow_manager, run_id
+        )
+
+        # Callback for map nodes
+        # Interns the sub-graphs of map elements (see _run_sub_graph)
+        element_registry = NodeRegistry()
+
+        async def sub_graph_runner(target, sub_params, parent_state):
+            return await self._run_sub_graph(
+                target,
+                sub_params,
+                active_resources,
+                run_id,
+                parent_state,
+                element_registry,
+            )
+
+        # 1. Dependency counting
+        plan_nodes = [node for stage in plan for node in stage]
+        plan_ids = {node.structural_id for node in plan_nodes}
+        priorities = self._compute_priorities(graph, plan)
+        remaining_deps: Dict[str, int] = {}
+        for node in plan_nodes:
+            remaining_deps[node.structural_id] = sum(
+                1
+                for edge in graph.get_in_edges(node.structural_id)
+                if edge.edge_type in EXECUTION_EDGE_TYPES
+                and edge.source.structural_id in plan_ids
+            )
+
+        # Router branches that the stage plan runs after their selector must keep
+        # waiting for it, so that unselected branches are pruned before they start.
+        gated_by_selector = self._router_gates(graph, plan, instance_map)
+        for gated in gated_by_selector.values():
+            for node in gated:
+                remaining_deps[node.structural_id] += 1
+
+        # Ready heap entries: (-priority, tie-breaker, node). Ties keep plan order.
+        ready: List[Tuple[float, int, Node]] = []
+        order = {node.structural_id: i for i, node in enumerate(plan_nodes)}
+
+        def push_ready(node: Node):
+            heapq.heappush(
+                ready,
+                (-priorities[node.structural_id], order[node.structural_id], node),
+            )
+
+        def release(successor: Node):
+            successor_id = successor.structural_id
+            if successor_id in remaining_deps:
+                remaining_deps[successor_id] -= 1
+                if remaining_deps[successor_id] == 0:
+                    push_ready(successor)
+
+        def complete(node: Node):
+            """Releases the successors of a finished (or skipped) node."""
+            for edge in graph.get_out_edges(node.structural_id):
+                if edge.edge_type in EXECUTION_EDGE_TYPES:
+                    release(edge.target)
+            for gated in gated_by_selector.get(node.structural_id, ()):
+                release(gated)
+
+        for node in plan_nodes:
+            if remaining_deps[node.structural_id] == 0:
+                push_ready(node)
+
+        running: Dict[asyncio.Task, Node] = {}
+        deferred: List[Node] = []
+
+        try:
+            while ready or running or deferred:
+                # 2. Dispatch ready nodes by priority
+                claimed: Dict[str, Any] = {}
+                waiting_for_resources: List[Node] = []
+                while ready:
+                    _, _, node = heapq.heappop(ready)
+
+                    if node.node_type == "param" or node.structural_id in restored:
+                        complete(node)
+                        continue
+
+                    # ASYNC CHECK
+                    skip_reason = await flow_manager.should_skip(node, state_backend)
+                    if skip_reason:
+                        await state_backend.mark_skipped(
+                            node.structural_id, skip_reason
+                        )
+                        self.bus.publish(
+                            TaskSkipped(
+                                run_id=run_id,
+                                task_id=node.structural_id,
+                                task_name=node.name,
+                                reason=skip_reason,
+                            )
+                        )
+                        complete(node)
+                        continue
+
+                    if not self.constraint_manager.check_permission(node):
+                        deferred.append(node)
+                        if node.structural_id not in blocked_nodes:
+                            self.bus.publish(
+                                TaskBlocked(
+                                    run_id=run_id,
+                                    task_id=node.structural_id,
+                                    task_name=node.name,
+                                    reason="ConstraintViolation",
+                                )
+                            )
+                            blocked_nodes.add(node.structural_id)
+                        continue
+                    blocked_nodes.discard(node.structural_id)
+
+                    # Keep lower-priority nodes out of the resource queue while
+                    # higher-priority ones are still waiting for capacity.
+                    if running or claimed:
+                        requirements = await self._resolve_requirements(
+                            node, graph, state_backend, instance_map
+                        )
+                        if requirements:
+                            wanted = dict(claimed)
+                            for res, amount in requirements.items():
+                                wanted[res] = wanted.get(res, 0) + amount
+                            if not self.node_processor.resource_manager.can_acquire(
+                                wanted
+                            ):
+                                waiting_for_resources.append(node)
+                                continue
+                            claimed = wanted
+
+                    overrides = (
+                        root_input_overrides
+                        if node.structural_id == target_node.structural_id
+                        else None
+                    )
+                    task = asyncio.ensure_future(
+                        self.node_processor.process(
+                            node,
+                            graph,
+                            state_backend,
+                            active_resources,
+                            run_id,
+                            params,
+                            sub_graph_runner,
+                            instance_map,
+                            input_overrides=overrides,
+                        )
+                    )
+                    running[task] = node
+
+                for node in waiting_for_resources:
+                    push_ready(node)
+
+                if not running:
+                    if waiting_for_resources:
+                        # Nothing holds resources that could be released: let the
+                        # processor wait for (or reject) the request itself.
+                        continue
+                    if deferred:
+                        await self.wakeup_event.wait()
+                        self.wakeup_event.clear()
+                        self.constraint_manager.cleanup_expired_constraints()
+                        for node in deferred:
+                            push_ready(node)
+                        deferred = []
+                    continue
+
+                # 3. Wait for the next completion (or a constraint change)
+                waiters = set(running)
+                wakeup = None
+                if deferred:
+                    wakeup = asyncio.ensure_future(self.wakeup_event.wait())
+                    waiters.add(wakeup)
+                done, _ = await asyncio.wait(
+                    waiters, return_when=asyncio.FIRST_COMPLETED
+                )
+                if wakeup is not None:
+                    if wakeup in done:
+                        self.wakeup_event.clear()
+                        self.constraint_manager.cleanup_expired_constraints()
+                    else:
+                        wakeup.cancel()
+
+                # Deferred nodes are re-checked after every event, like the
+                # stage strategy re-checks them after every pass.
+                for node in deferred:
+                    push_ready(node)
+                deferred = []
+
+                finished = []
+                for task in done:
+                    if task is wakeup:
+                        continue
+                    finished.append((running.pop(task), task.result()))
+                # Tasks finishing together are stored in one batch
+                await put_many(
+                    state_backend,
+                    {node.structural_id: res for node, res in finished},
+                )
+                for node, res in finished:
+                    await flow_manager.register_result(
+                        node.structural_id, res, state_backend
+                    )
+                    complete(node)
+                await flush(state_backend)
+        finally:
+            # On failure, don't leave siblings running in the background
+            for task in running:
+                task.cancel()
+
+        # Use the mapped canonical node ID to check for the final result
+        return await self._collect_target_result(target, target_node, state_backend)
+
+    def _router_gates(
+        self, graph: Graph, plan: Any, instance_map: Dict[str, Node]
+    ) -> Dict[str, List[Node]]:
+        """
+        Maps each Router selector node to the branch nodes that must wait for it.
+
+        In the stage plan, every branch node planned in a later stage than the
+        selector only starts once the selector is done, which is what lets
+        FlowManager prune unselected branches before they run. Those nodes (a
+        route node and its upstream within these stages) are gated here. They can
+        not be upstream of the selector, so the extra wait never deadlocks.
+        """
+        stage_of = {
+            node.structural_id: i for i, stage in enumerate(plan) for node in stage
+        }
+        gates: Dict[str, Dict[str, Node]] = {}
+        for stage in plan:
+            for node in stage:
+                for edge in graph.get_in_edges(node.structural_id, EdgeType.DATA):
+                    router = edge.router
+                    if router is None:
+                        continue
+                    selector = instance_map.get(router.selector._uuid)
+                    if selector is None or selector.structural_id not in stage_of:
+                        continue
+                    selector_id = selector.structural_id
+                    min_stage = stage_of[selector_id] + 1
+                    gated = gates.setdefault(selector_id, {})
+
+                    pending = [
+                        instance_map.get(r._uuid) for r in router.routes.values()
+                    ]
+                    while pending:
+                        branch_node = pending.pop()
+                        if branch_node is None:
+                            continue
+                        branch_id = branch_node.structural_id
+                        if (
+                            branch_id in gated
+                            or stage_of.get(branch_id, -1) < min_stage
+                        ):
+                            continue
+                        gated[branch_id] = branch_node
+                        pending.extend(
+                            e.source
+                            for e in graph.get_in_edges(branch_id)
+                            if e.edge_type in EXECUTION_EDGE_TYPES
+                        )
+        return {
+            selector_id: list(gated.values())
+            for selector_id, gated in gates.items()
+            if gated
+        }
+
+    async def _resolve_requirements(
+        self,
+        node: Node,
+        graph: Graph,
+        state_backend: StateBackend,
+        instance_map: Dict[str, Node],
+    ) -> Dict[str, Any]:
+        processor = self.node_processor
+        return await processor.constraint_resolver.resolve(
+            node, graph, state_backend, self.constraint_manager, instance_map
+        )
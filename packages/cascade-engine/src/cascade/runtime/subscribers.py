@@ -17,7 +17,7 @@ from .events import (
     ConnectorDisconnected,
     Event,
 )
-from cascade.spec.protocols import Connector
+from cascade.spec.protocols import Connector, DurationStore
 
 
 class HumanReadableLogSubscriber:
@@ -104,6 +104,24 @@ class HumanReadableLogSubscriber:
         bus.info("engine.connector.disconnected")
 
 
+class DurationRecorder:
+    """
+    Listens to task completions and records the duration of every successful
+    execution in a DurationStore, turning runs into a cost model for scheduling.
+    """
+
+    def __init__(self, event_bus: MessageBus, store: DurationStore):
+        self.store = store
+        event_bus.subscribe(TaskExecutionFinished, self.on_task_finished)
+
+    def on_task_finished(self, event: TaskExecutionFinished):
+        # Failed runs stop at an arbitrary point, so they say little about cost
+        if event.status == "Succeeded":
+            # Map elements run without a sub-graph only count for their task
+            node_id = event.task_id if event.graph_node else None
+            self.store.record(event.task_name, node_id, event.duration)
+
+
 class TelemetrySubscriber:
     """
     Listens to runtime events and publishes them as structured telemetry
@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 from unittest.mock import patch
 from cascade.adapters.cache.in_memory import InMemoryCacheBackend
@@ -52,3 +53,113 @@ async def test_cache_ttl_expired():
     # Verify that the key was actually removed from the store
     assert "key_ttl" not in cache._store
     assert "key_ttl" not in cache._expiry
+
+
+@pytest.mark.asyncio
+async def test_lru_evicts_least_recently_used():
+    cache = InMemoryCacheBackend(max_entries=2)
+    await cache.set("a", 1)
+    await cache.set("b", 2)
+    await cache.get("a")
+    await cache.set("c", 3)
+
+    assert await cache.get("b") is None
+    assert await cache.get("a") == 1
+    assert await cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+
+
+@pytest.mark.asyncio
+async def test_lfu_evicts_least_frequently_used():
+    cache = InMemoryCacheBackend(max_entries=2, eviction="lfu")
+    await cache.set("a", 1)
+    await cache.set("b", 2)
+    for _ in range(3):
+        await cache.get("a")
+    await cache.get("b")
+    # Evicts "b", then "c", which has the lowest count after its insertion
+    await cache.set("c", 3)
+    await cache.set("d", 4)
+
+    assert await cache.get("b") is None
+    assert await cache.get("c") is None
+    assert await cache.get("a") == 1
+    assert await cache.get("d") == 4
+
+
+@pytest.mark.asyncio
+async def test_max_bytes_bounds_the_total_size():
+    cache = InMemoryCacheBackend(max_bytes=250, sizeof=len)
+    await cache.set("a", b"x" * 100)
+    await cache.set("b", b"x" * 100)
+    await cache.set("c", b"x" * 100)
+    await cache.set("huge", b"x" * 1000)
+
+    assert await cache.get("a") is None
+    assert await cache.get("huge") is None
+    assert cache.stats()["entries"] == 2
+    assert cache.stats()["bytes"] == 200
+
+
+@pytest.mark.asyncio
+async def test_sweep_drops_expired_entries_without_reads():
+    cache = InMemoryCacheBackend()
+    with patch("time.time", return_value=1000):
+        await cache.set("short", 1, ttl=10)
+        await cache.set("long", 2, ttl=100)
+        await cache.set("rewritten", 3, ttl=10)
+        await cache.set("rewritten", 4, ttl=100)
+        await cache.set("forever", 5)
+    await cache.close()
+
+    with patch("time.time", return_value=1050):
+        assert cache.sweep() == 1
+
+    assert set(cache._store) == {"long", "rewritten", "forever"}
+    assert cache.stats()["expirations"] == 1
+
+
+@pytest.mark.asyncio
+async def test_sweeper_runs_in_the_background():
+    cache = InMemoryCacheBackend(sweep_interval=0.01)
+    published = []
+    cache.add_listener(published.append)
+    await cache.set("a", 1, ttl=0)
+
+    await asyncio.sleep(0.05)
+
+    assert "a" not in cache._store
+    assert published[0]["expirations"] == 1
+    # The sweeper stops once no entry has a TTL
+    assert cache._sweeper.done()
+
+
+def test_engine_publishes_cache_gauges():
+    import cascade as cs
+    from cascade.adapters.caching import ContentHashCache
+    from cascade.adapters.executors.local import LocalExecutor
+    from cascade.adapters.solvers.native import NativeSolver
+    from cascade.runtime.bus import MessageBus
+    from cascade.runtime.engine import Engine
+    from cascade.runtime.events import CacheGauge
+
+    @cs.task(pure=True)
+    def square(x):
+        return x * x
+
+    cache = InMemoryCacheBackend(max_entries=10)
+    bus = MessageBus()
+    gauges = []
+    bus.subscribe(CacheGauge, gauges.append)
+    engine = Engine(
+        solver=NativeSolver(),
+        executor=LocalExecutor(),
+        bus=bus,
+        cache_backend=cache,
+    )
+    policy = ContentHashCache(cache)
+
+    for _ in range(2):
+        assert asyncio.run(engine.run(square(3).with_cache(policy))) == 9
+
+    assert (gauges[-1].hits, gauges[-1].misses, gauges[-1].entries) == (1, 1, 1)
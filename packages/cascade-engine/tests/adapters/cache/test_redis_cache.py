@@ -33,9 +33,13 @@ async def test_set_cache(mock_redis_client):
     await backend.set("cache_key_1", value, ttl=300)
 
     expected_key = "cascade:cache:cache_key_1"
-    expected_data = pickle.dumps(value)
 
-    mock_redis_client.set.assert_called_once_with(expected_key, expected_data, ex=300)
+    mock_redis_client.set.assert_called_once()
+    key, data = mock_redis_client.set.call_args.args
+    assert key == expected_key
+    assert mock_redis_client.set.call_args.kwargs == {"ex": 300}
+    # Plain values are stored as plain pickles
+    assert pickle.loads(data) == value
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,124 @@
+import functools
+import threading
+
+import pytest
+import cascade as cs
+from cascade.adapters.cache import InMemoryCacheBackend
+from cascade.adapters.caching import ContentHashCache, code_fingerprint
+
+calls = []
+
+
+@cs.task(pure=True)
+def double(x: int) -> int:
+    calls.append(("double", x))
+    return x * 2
+
+
+@cs.task(pure=True)
+def scale(x: int, factor: int = 1) -> int:
+    calls.append(("scale", x, factor))
+    return x * factor
+
+
+@pytest.fixture(autouse=True)
+def reset_calls():
+    calls.clear()
+
+
+def test_repeat_runs_hit_the_cache():
+    policy = ContentHashCache(InMemoryCacheBackend())
+
+    def workflow(x):
+        return scale(double(x), factor=3).with_cache(policy)
+
+    assert cs.run(workflow(2)) == 12
+    assert cs.run(workflow(2)) == 12
+    assert calls == [("double", 2), ("scale", 4, 3), ("double", 2)]
+    assert policy.stats() == {"hits": 1, "misses": 1, "unhashable": 0}
+
+
+def test_literal_bindings_are_part_of_the_key():
+    policy = ContentHashCache()
+
+    assert cs.run(scale(5, factor=2).with_cache(policy)) == 10
+    assert cs.run(scale(5, factor=3).with_cache(policy)) == 15
+    assert cs.run(scale(5, factor=3).with_cache(policy)) == 15
+    assert calls == [("scale", 5, 2), ("scale", 5, 3)]
+
+
+@pytest.mark.asyncio
+async def test_key_depends_on_inputs_code_and_version():
+    policy = ContentHashCache()
+
+    def first(x):
+        return x + 1
+
+    def second(x):
+        return x + 2
+
+    key = policy.key("id", {"0": 1}, first)
+    assert key == policy.key("id", {"0": 1}, first)
+    assert key != policy.key("id", {"0": 2}, first)
+    assert key != policy.key("other", {"0": 1}, first)
+    assert key != policy.key("id", {"0": 1}, second)
+    assert key != ContentHashCache(version="2").key("id", {"0": 1}, first)
+
+    await policy.save("id", {"0": 1}, 2, func=first)
+    assert await policy.check("id", {"0": 1}, func=first) == 2
+    assert await policy.check("id", {"0": 1}, func=second) is None
+
+
+def test_functions_sharing_code_keep_their_own_defaults():
+    def make(n):
+        def scale_by(x, n=n):
+            return x * n
+
+        return cs.task(scale_by, pure=True)
+
+    policy = ContentHashCache()
+    assert cs.run(make(2)(10).with_cache(policy)) == 20
+    assert cs.run(make(3)(10).with_cache(policy)) == 30
+    assert cs.run(make(3)(10).with_cache(policy)) == 30
+    assert policy.hits == 1
+
+
+def test_code_fingerprint_ignores_location_but_not_defaults():
+    namespace = {}
+    source = "def f(x, y={default}):\n    return [x + i for i in (1, 2)]\n"
+    exec(compile(source.format(default=1), "a.py", "exec"), namespace)
+    moved = {}
+    exec(compile("\n\n" + source.format(default=1), "b.py", "exec"), moved)
+    changed = {}
+    exec(compile(source.format(default=2), "a.py", "exec"), changed)
+
+    assert code_fingerprint(namespace["f"]) == code_fingerprint(moved["f"])
+    assert code_fingerprint(namespace["f"]) != code_fingerprint(changed["f"])
+
+
+@pytest.mark.asyncio
+async def test_inputs_without_a_stable_digest_are_not_cached():
+    policy = ContentHashCache()
+    inputs = {"lock": threading.Lock()}
+
+    await policy.save("id", inputs, 1)
+    assert await policy.check("id", inputs) is None
+    assert policy.unhashable == 1
+
+
+def test_non_function_callables_can_be_cached():
+    policy = ContentHashCache()
+
+    assert cs.run(cs.task(len, pure=True)("abc").with_cache(policy)) == 3
+    assert cs.run(cs.task(len, pure=True)("abc").with_cache(policy)) == 3
+    assert policy.hits == 1
+    base2 = code_fingerprint(functools.partial(int, base=2))
+    assert base2 == code_fingerprint(functools.partial(int, base=2))
+    assert base2 != code_fingerprint(functools.partial(int, base=3))
+    assert code_fingerprint(len) != code_fingerprint(abs)
+
+    class Scale:
+        def __call__(self, x, factor=2):
+            return x * factor
+
+    assert code_fingerprint(Scale()) == code_fingerprint(Scale())
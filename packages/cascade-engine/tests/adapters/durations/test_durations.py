@@ -0,0 +1,187 @@
+import sqlite3
+
+import pytest
+
+import cascade as cs
+from cascade.adapters.durations import (
+    InMemoryDurationStore,
+    SqliteDurationStore,
+    estimate_weights,
+)
+from cascade.adapters.executors.local import LocalExecutor
+from cascade.adapters.solvers.native import NativeSolver
+from cascade.graph.model import Node
+from cascade.runtime.bus import MessageBus
+from cascade.runtime.engine import Engine
+
+
+def test_store_tracks_ewma_and_percentiles():
+    store = InMemoryDurationStore(smoothing=0.5)
+    node = Node(structural_id="n1", name="fetch")
+    for duration in (1.0, 3.0, 2.0):
+        store.record("fetch", "n1", duration)
+
+    # 1.0 -> 0.5 * 3 + 0.5 * 1 = 2.0 -> 0.5 * 2 + 0.5 * 2 = 2.0
+    assert store.estimate(node) == pytest.approx(2.0)
+    assert store.percentile(node, 50) == 2.0
+    assert store.percentile(node, 100) == 3.0
+    assert store.get(node).count == 3
+    assert store.stats() == {"nodes": 1, "tasks": 1, "samples": 3, "evictions": 0}
+
+
+def test_store_falls_back_to_task_history():
+    store = InMemoryDurationStore()
+    store.record("fetch", "n1", 2.0)
+
+    assert store.estimate(Node(structural_id="n2", name="fetch")) == 2.0
+    assert store.estimate(Node(structural_id="n3", name="other")) is None
+
+
+def test_store_percentile_window_is_bounded():
+    store = InMemoryDurationStore(window=2)
+    node = Node(structural_id="n1", name="fetch")
+    for duration in (10.0, 1.0, 2.0):
+        store.record("fetch", "n1", duration)
+
+    assert store.percentile(node, 100) == 2.0
+
+
+def test_store_bounds_per_node_statistics():
+    store = InMemoryDurationStore(max_nodes=2)
+    store.record("fetch", "n1", 1.0)
+    store.record("fetch", "n2", 2.0)
+    store.estimate(Node(structural_id="n1", name="fetch"))
+    store.record("fetch", "n3", 3.0)
+
+    # n2 was the least recently used node; its task's history remains
+    assert store.stats() == {"nodes": 2, "tasks": 1, "samples": 3, "evictions": 1}
+    assert store.get(Node(structural_id="n1", name="fetch")).count == 1
+    assert store.get(Node(structural_id="n2", name="fetch")).count == 3
+
+
+def test_store_rejects_invalid_arguments():
+    with pytest.raises(ValueError):
+        InMemoryDurationStore(smoothing=0)
+    with pytest.raises(ValueError):
+        InMemoryDurationStore(window=0)
+    with pytest.raises(ValueError):
+        InMemoryDurationStore(max_nodes=0)
+    with pytest.raises(ValueError):
+        InMemoryDurationStore().percentile(Node(structural_id="n", name="n"), 101)
+
+
+def test_estimate_weights_defaults_to_mean_of_known_durations():
+    store = InMemoryDurationStore()
+    store.record("a", "a1", 1.0)
+    store.record("b", "b1", 3.0)
+    nodes = [
+        Node(structural_id="a1", name="a"),
+        Node(structural_id="b1", name="b"),
+        Node(structural_id="c1", name="c"),
+    ]
+
+    assert estimate_weights(store, nodes) == {"a1": 1.0, "b1": 3.0, "c1": 2.0}
+    assert estimate_weights(None, nodes) == {"a1": 1.0, "b1": 1.0, "c1": 1.0}
+
+
+def test_sqlite_store_persists_across_instances(tmp_path):
+    path = str(tmp_path / "durations.sqlite")
+    node = Node(structural_id="n1", name="fetch")
+
+    first = SqliteDurationStore(path, smoothing=0.5)
+    first.record("fetch", "n1", 1.0)
+    first.record("fetch", "n1", 3.0)
+    first.close()
+
+    second = SqliteDurationStore(path, smoothing=0.5)
+    assert second.estimate(node) == pytest.approx(2.0)
+    assert second.percentile(node, 100) == 3.0
+
+    # Updates continue from the persisted (per-task) statistics
+    second.record("fetch", "n1", 2.0)
+    assert second.get(Node(structural_id="n2", name="fetch")).count == 3
+    second.close()
+
+
+def test_sqlite_store_writes_task_statistics_once_per_flush(tmp_path):
+    path = str(tmp_path / "durations.sqlite")
+    store = SqliteDurationStore(path)
+    for i in range(10):
+        store.record("fetch", f"n{i}", 1.0)
+    store.record("fetch", None, 1.0)
+
+    assert store.get(Node(structural_id="n0", name="other")).count == 1
+    assert (
+        SqliteDurationStore(path).estimate(Node(structural_id="x", name="fetch"))
+        is None
+    )
+
+    store.flush()
+    assert store.flushes == 1
+    # Per-node statistics aren't persisted; the task's are
+    reader = SqliteDurationStore(path)
+    assert reader.get(Node(structural_id="n0", name="other")) is None
+    assert reader.get(Node(structural_id="x", name="fetch")).count == 11
+    reader.close()
+    store.close()
+    assert store.flushes == 1
+    with sqlite3.connect(path) as conn:
+        assert conn.execute("SELECT kind, key FROM durations").fetchall() == [
+            ("task", "fetch")
+        ]
+
+
+@pytest.mark.asyncio
+async def test_map_elements_are_recorded_as_task_executions():
+    @cs.task
+    def inc(x):
+        return x + 1
+
+    store = InMemoryDurationStore()
+    engine = Engine(
+        solver=NativeSolver(),
+        executor=LocalExecutor(),
+        bus=MessageBus(),
+        duration_store=store,
+    )
+
+    assert await engine.run(inc.map(x=list(range(50)))) == list(range(1, 51))
+    assert store.stats() == {"nodes": 0, "tasks": 1, "samples": 50, "evictions": 0}
+
+
+@pytest.mark.asyncio
+async def test_engine_flushes_the_duration_store_after_a_run(tmp_path):
+    @cs.task
+    def add(a, b):
+        return a + b
+
+    store = SqliteDurationStore(str(tmp_path / "durations.sqlite"))
+    engine = Engine(
+        solver=NativeSolver(),
+        executor=LocalExecutor(),
+        bus=MessageBus(),
+        duration_store=store,
+    )
+
+    assert await engine.run(add(add(1, 2), 3)) == 6
+    assert store.flushes == 1
+    store.close()
+
+
+@pytest.mark.asyncio
+async def test_engine_records_task_durations():
+    @cs.task
+    def add(a, b):
+        return a + b
+
+    store = InMemoryDurationStore()
+    engine = Engine(
+        solver=NativeSolver(),
+        executor=LocalExecutor(),
+        bus=MessageBus(),
+        duration_store=store,
+    )
+
+    assert await engine.run(add(add(1, 2), 3)) == 6
+    assert engine.graph_strategy.duration_store is store
+    assert store.stats() == {"nodes": 2, "tasks": 1, "samples": 2, "evictions": 0}
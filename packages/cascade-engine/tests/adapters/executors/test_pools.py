@@ -0,0 +1,207 @@
+import asyncio
+import threading
+
+import pytest
+
+import cascade as cs
+from cascade.adapters.executors import LocalExecutor, ThreadPools
+from cascade.adapters.solvers.native import NativeSolver
+from cascade.adapters.state.in_memory import InMemoryStateBackend
+from cascade.graph.model import Node
+from cascade.runtime.bus import MessageBus
+from cascade.runtime.engine import Engine
+from cascade.runtime.events import ThreadPoolGauge
+
+
+def _node(func, mode="blocking") -> Node:
+    return Node(
+        structural_id=func.__name__,
+        name=func.__name__,
+        callable_obj=func,
+        execution_mode=mode,
+    )
+
+
+def _thread_name() -> str:
+    return threading.current_thread().name
+
+
+def test_modes_run_in_named_pools_of_configured_size():
+    executor = LocalExecutor(max_workers={"compute": 2, "io-heavy": 7})
+
+    async def main():
+        return [
+            await executor.execute(_node(_thread_name, mode), [], {})
+            for mode in ("blocking", "compute", "io-heavy")
+        ]
+
+    blocking, compute, io_heavy = asyncio.run(main())
+    assert blocking.startswith("cascade_blocking")
+    assert compute.startswith("cascade_compute")
+    assert io_heavy.startswith("cascade_io-heavy")
+
+    gauges = executor.pools.gauges()
+    assert gauges["compute"]["max_workers"] == 2
+    assert gauges["io-heavy"]["max_workers"] == 7
+    executor.shutdown()
+    assert executor.pools.gauges() == {}
+
+
+def test_invalid_pool_configuration_raises():
+    with pytest.raises(ValueError):
+        ThreadPools({"compute": 0})
+    with pytest.raises(ValueError):
+        LocalExecutor(max_workers={"compute": 2}, pools=ThreadPools())
+
+
+def test_gauges_track_queue_depth_and_active_workers():
+    pools = ThreadPools({"blocking": 1})
+    seen = []
+    pools.add_listener(lambda name, gauges: seen.append((name, dict(gauges))))
+    release = threading.Event()
+
+    async def main():
+        first = asyncio.ensure_future(pools.run("blocking", release.wait))
+        second = asyncio.ensure_future(pools.run("blocking", lambda: 42))
+        await asyncio.sleep(0.05)
+        during = pools.gauges()["blocking"]
+        release.set()
+        await asyncio.gather(first, second)
+        return during
+
+    during = asyncio.run(main())
+    assert during == {"max_workers": 1, "queued": 1, "active": 1}
+    assert pools.gauges()["blocking"] == {"max_workers": 1, "queued": 0, "active": 0}
+    # One notification on submission and one on completion of each call
+    assert len(seen) == 4
+    # Both calls were in the pool when the second one was submitted
+    assert seen[1][1]["queued"] + seen[1][1]["active"] == 2
+    pools.shutdown()
+
+
+def test_cancelled_queued_call_leaves_the_queue():
+    pools = ThreadPools({"blocking": 1})
+    release = threading.Event()
+
+    async def main():
+        first = asyncio.ensure_future(pools.run("blocking", release.wait))
+        second = asyncio.ensure_future(pools.run("blocking", lambda: 42))
+        await asyncio.sleep(0.05)
+        second.cancel()
+        await asyncio.gather(second, return_exceptions=True)
+        release.set()
+        await first
+
+    asyncio.run(main())
+    assert pools.gauges()["blocking"]["queued"] == 0
+    pools.shutdown()
+
+
+def test_last_lease_shuts_the_pools_down():
+    pools = ThreadPools()
+    pools.acquire()
+    pools.acquire()
+    pools.get("blocking")
+
+    pools.release()
+    assert pools.stats()["pools"] == 1
+
+    pools.release()
+    assert pools.stats() == {"pools": 0, "pools_created": 1, "shutdowns": 1}
+
+    # Pools are created again on next use
+    pools.get("blocking")
+    assert pools.stats()["pools_created"] == 2
+    pools.shutdown()
+
+
+def test_engine_publishes_gauges_and_releases_pools_after_run():
+    @cs.task(mode="io-heavy")
+    def fetch(x):
+        return x + 1
+
+    bus = MessageBus()
+    gauges = []
+    bus.subscribe(ThreadPoolGauge, gauges.append)
+    executor = LocalExecutor(max_workers={"io-heavy": 3})
+    engine = Engine(solver=NativeSolver(), executor=executor, bus=bus)
+
+    for _ in range(2):
+        assert asyncio.run(engine.run(fetch(1))) == 2
+        # The run's pools are shut down when it ends
+        assert executor.pools.gauges() == {}
+
+    assert executor.pools.stats()["pools_created"] == 2
+    assert {g.pool for g in gauges} == {"io-heavy"}
+    assert all(g.max_workers == 3 and g.run_id for g in gauges)
+    assert gauges[-1].queued == 0 and gauges[-1].active == 0
+
+
+def test_engine_samples_gauges_only_when_subscribed():
+    executor = LocalExecutor(max_workers={"io-heavy": 2})
+    notified = []
+    executor.pools.add_listener(lambda pool, gauges: notified.append(pool))
+    listening = []
+
+    @cs.task(mode="io-heavy")
+    def fetch(x):
+        listening.append(len(executor.pools._listeners))
+        return x
+
+    @cs.task
+    def total(*values):
+        return sum(values)
+
+    workflow = total(*[fetch(i) for i in range(50)])
+
+    # Nobody listens: the engine adds no listener of its own to the pools
+    engine = Engine(solver=NativeSolver(), executor=executor, bus=MessageBus())
+    assert asyncio.run(engine.run(workflow)) == sum(range(50))
+    assert set(listening) == {1}
+
+    # 50 tasks notify the pool 100 times, but gauges are only sampled
+    notified.clear()
+    bus = MessageBus()
+    gauges = []
+    bus.subscribe(ThreadPoolGauge, gauges.append)
+    engine = Engine(solver=NativeSolver(), executor=executor, bus=bus)
+    assert asyncio.run(engine.run(workflow)) == sum(range(50))
+    assert notified.count("io-heavy") == 100
+    assert 1 <= len([g for g in gauges if g.pool == "io-heavy"]) < 20
+    # The final state of the pools is always reported
+    assert gauges[-1].queued == 0 and gauges[-1].active == 0
+
+
+class _FailingCloseBackend(InMemoryStateBackend):
+    async def close(self):
+        raise OSError("disk gone")
+
+
+def test_failing_cleanup_step_still_releases_pools_and_keeps_run_error(capsys):
+    @cs.task(mode="io-heavy")
+    def fetch(x):
+        return x + 1
+
+    @cs.task(mode="io-heavy")
+    def explode(x):
+        raise ValueError("boom")
+
+    executor = LocalExecutor()
+    engine = Engine(
+        solver=NativeSolver(),
+        executor=executor,
+        bus=MessageBus(),
+        state_backend_factory=_FailingCloseBackend,
+    )
+
+    # The task's own error is not masked by the failing close
+    with pytest.raises(ValueError, match="boom"):
+        asyncio.run(engine.run(explode(fetch(1))))
+    assert executor.pools._leases == 0
+    assert executor.pools.gauges() == {}
+    assert "OSError: disk gone" in capsys.readouterr().err
+
+    # A run that otherwise succeeded surfaces the cleanup error
+    with pytest.raises(OSError, match="disk gone"):
+        asyncio.run(engine.run(fetch(1)))
+    assert executor.pools._leases == 0
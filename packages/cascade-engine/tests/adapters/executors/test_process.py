@@ -0,0 +1,123 @@
+import asyncio
+import os
+
+import pytest
+
+import cascade as cs
+from cascade.adapters.executors.process import ProcessExecutor
+from cascade.adapters.solvers.native import NativeSolver
+from cascade.graph.model import Node
+from cascade.runtime.bus import MessageBus
+from cascade.runtime.engine import Engine
+
+
+@cs.task(mode="compute")
+def worker_pid(x: int) -> int:
+    return os.getpid()
+
+
+@cs.task(mode="compute")
+def square(x: int) -> int:
+    return x * x
+
+
+@cs.task(mode="compute")
+def explode(x: int) -> int:
+    raise ValueError(f"bad input {x}")
+
+
+def compute_node(func) -> Node:
+    return Node(
+        structural_id=func.__name__,
+        name=func.__name__,
+        callable_obj=func,
+        execution_mode="compute",
+    )
+
+
+@pytest.fixture
+def executor():
+    executor = ProcessExecutor(max_workers=2)
+    yield executor
+    executor.shutdown()
+
+
+def test_process_executor_runs_compute_tasks_in_workers(executor):
+    pid = asyncio.run(executor.execute(compute_node(worker_pid.func), [1], {}))
+
+    assert pid != os.getpid()
+    assert executor.stats() == {
+        "max_workers": 2,
+        "process_runs": 1,
+        "thread_fallbacks": 0,
+        "process_pools_created": 1,
+    }
+
+
+def test_process_executor_falls_back_to_threads_for_local_callables(executor):
+    def local_pid(x):
+        return os.getpid()
+
+    pid = asyncio.run(executor.execute(compute_node(local_pid), [1], {}))
+
+    assert pid == os.getpid()
+    assert executor.thread_fallbacks == 1
+
+
+def test_process_executor_falls_back_to_threads_for_unpicklable_args(executor):
+    pid = asyncio.run(
+        executor.execute(compute_node(worker_pid.func), [lambda: None], {})
+    )
+
+    assert pid == os.getpid()
+    assert executor.thread_fallbacks == 1
+
+
+def test_process_executor_keeps_blocking_tasks_in_threads(executor):
+    node = compute_node(worker_pid.func)
+    node.execution_mode = "blocking"
+
+    assert asyncio.run(executor.execute(node, [1], {})) == os.getpid()
+    assert executor.process_runs == 0
+
+
+def test_process_executor_propagates_task_errors(executor):
+    with pytest.raises(ValueError, match="bad input 3"):
+        asyncio.run(executor.execute(compute_node(explode.func), [3], {}))
+
+
+@pytest.mark.asyncio
+async def test_engine_maps_compute_task_over_warm_process_pool():
+    executor = ProcessExecutor(max_workers=2, warm_up=True, preload=["json"])
+    try:
+        engine = Engine(
+            solver=NativeSolver(),
+            executor=executor,
+            bus=MessageBus(),
+            map_chunk_size=2,
+        )
+        result = await engine.run(square.map(x=list(range(8))))
+    finally:
+        executor.shutdown()
+
+    assert result == [x * x for x in range(8)]
+    # One process run per chunk of the batched map
+    assert executor.process_runs == 4
+    assert executor.thread_fallbacks == 0
+
+
+def test_engine_runs_lease_the_process_pool():
+    executor = ProcessExecutor(max_workers=1)
+    # Never fork while the run's thread pools are live
+    assert executor.mp_context.get_start_method() in ("forkserver", "spawn")
+
+    engine = Engine(solver=NativeSolver(), executor=executor, bus=MessageBus())
+    try:
+        for run in range(2):
+            assert asyncio.run(engine.run(square(3))) == 9
+            # The workers are stopped with the run's pools
+            assert executor._process_executor is None
+            assert executor.stats()["process_pools_created"] == run + 1
+    finally:
+        executor.shutdown()
+    assert executor.process_runs == 2
@@ -0,0 +1,139 @@
+import pickle
+
+import pytest
+from cascade.adapters.serializers import ResultCodec, SerializerRegistry
+from cascade.adapters.serializers import formats
+
+np = pytest.importorskip("numpy")
+
+
+@pytest.mark.parametrize(
+    "value",
+    [None, 42, "text", {"a": [1, 2.5]}, (1, "b"), b"x" * 1000],
+)
+def test_plain_values_round_trip_as_plain_pickles(value):
+    codec = ResultCodec()
+    data = codec.encode(value)
+
+    assert codec.decode(data) == value
+    assert pickle.loads(data) == value
+
+
+def test_pickle_takes_large_buffers_out_of_band():
+    codec = ResultCodec()
+    array = np.arange(100_000, dtype=np.float64)
+
+    data = codec.encode(array)
+    decoded = codec.decode(data)
+
+    assert data[:2] == b"P0"
+    assert np.array_equal(decoded, array)
+    # Writable, like arrays from plain pickles
+    decoded[0] = -1
+
+    # Zero-copy decoding returns a read-only view of the payload
+    view = ResultCodec(zero_copy=True).decode(data)
+    assert np.array_equal(view, array)
+    assert not view.flags.owndata
+    assert not view.flags.writeable
+
+
+@pytest.mark.parametrize(
+    "array",
+    [
+        np.arange(12, dtype=np.int32).reshape(3, 4),
+        np.asfortranarray(np.arange(12.0).reshape(3, 4)),
+        np.arange(10)[::2],
+        np.zeros((0, 3)),
+        np.array(3.5),
+    ],
+)
+def test_numpy_round_trips_npy_payloads(array):
+    codec = ResultCodec("numpy")
+
+    decoded = codec.decode(codec.encode(array))
+
+    assert decoded.dtype == array.dtype
+    assert np.array_equal(decoded, array)
+    assert decoded.flags.writeable
+
+
+def test_numpy_falls_back_to_pickle_for_other_values():
+    codec = ResultCodec("numpy")
+
+    assert codec.decode(codec.encode({"a": 1})) == {"a": 1}
+    objects = np.array([{"a": 1}], dtype=object)
+    assert codec.decode(codec.encode(objects))[0] == {"a": 1}
+    for dtype in ("M8[D]", "m8[s]"):
+        times = np.arange(3).astype(dtype)
+        assert np.array_equal(codec.decode(codec.encode(times)), times)
+
+
+def test_compression_applies_above_the_threshold():
+    codec = ResultCodec(compression="zlib", compress_threshold=1024)
+
+    small = codec.encode(b"x" * 100)
+    large = codec.encode(b"x" * 100_000)
+
+    assert pickle.loads(small) == b"x" * 100
+    assert large[:2] == b"Pz"
+    assert len(large) < 1000
+    assert codec.decode(large) == b"x" * 100_000
+
+
+def test_any_codec_decodes_any_payload():
+    written = ResultCodec("numpy", compression="zlib", compress_threshold=0)
+    reader = ResultCodec()
+
+    array = np.arange(1000)
+    assert np.array_equal(reader.decode(written.encode(array)), array)
+
+
+def test_missing_optional_libraries_are_reported(monkeypatch):
+    monkeypatch.setattr(formats, "msgpack", None)
+    registry = SerializerRegistry()
+    registry.register("pickle", b"P", formats.PickleSerializer)
+    registry.register("msgpack", b"M", formats.MsgpackSerializer)
+
+    with pytest.raises(ImportError, match="'msgpack' library is required"):
+        ResultCodec("msgpack", registry=registry)
+
+
+def test_custom_formats_can_be_registered():
+    class Upper:
+        name = "upper"
+        tag = b"U"
+
+        def dumps(self, obj):
+            if not isinstance(obj, str):
+                raise TypeError(obj)
+            return [obj.upper().encode()]
+
+        def loads(self, data):
+            return bytes(data).decode()
+
+    registry = SerializerRegistry()
+    registry.register("pickle", b"P", formats.PickleSerializer)
+    registry.register("upper", b"U", Upper)
+    codec = ResultCodec("upper", registry=registry)
+
+    assert codec.decode(codec.encode("abc")) == "ABC"
+    assert codec.decode(codec.encode(7)) == 7
+    with pytest.raises(ValueError, match="already used"):
+        registry.register("other", b"U", Upper)
+    with pytest.raises(ValueError, match="Unknown format"):
+        ResultCodec("nope", registry=registry)
+
+
+def test_zstd_is_safe_to_share_across_threads():
+    pytest.importorskip("zstandard")
+    from concurrent.futures import ThreadPoolExecutor
+
+    codec = ResultCodec(compression="zstd", compress_threshold=0)
+    values = [bytes([i]) * 100_000 + np.arange(i).tobytes() for i in range(64)]
+
+    def round_trip(value):
+        return codec.decode(codec.encode(value)) == value
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        assert all(pool.map(round_trip, values))
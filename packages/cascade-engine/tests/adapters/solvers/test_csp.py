@@ -1,7 +1,13 @@
+import random
+import time
+
 import pytest
 from cascade.spec.task import task
+from cascade.spec.constraint import ResourceConstraint
 from cascade.graph.build import build_graph
+from cascade.graph.model import Edge, Graph, Node
 from cascade.adapters.solvers.csp import CSPSolver
+from cascade.adapters.durations import InMemoryDurationStore
 
 # Skip tests if python-constraint is not installed
 pytest.importorskip("constraint")
@@ -123,3 +129,145 @@ def test_csp_solver_serial_when_resources_insufficient():
     # Verify content
     assert stage_0_names.union(stage_1_names) == {"t_a", "t_b"}
     assert plan[2][0].name == "gather"
+
+
+def _graph(requirements, edges):
+    """Builds a graph of nodes named after their ids, e.g. {"a": {"gpu": 1}}."""
+    graph = Graph()
+    nodes = {}
+    for nid, reqs in requirements.items():
+        nodes[nid] = Node(
+            structural_id=nid,
+            name=nid,
+            constraints=ResourceConstraint(requirements=reqs) if reqs else None,
+        )
+        graph.add_node(nodes[nid])
+    for source, target in edges:
+        graph.add_edge(Edge(nodes[source], nodes[target], "x"))
+    return graph
+
+
+def _assert_valid(plan, graph, system_resources):
+    stage_of = {n.structural_id: i for i, stage in enumerate(plan) for n in stage}
+    assert len(stage_of) == len(graph.nodes)
+    for edge in graph.edges:
+        assert stage_of[edge.source.structural_id] < stage_of[edge.target.structural_id]
+    for stage in plan:
+        for res, limit in system_resources.items():
+            usage = sum(
+                n.constraints.requirements.get(res, 0) for n in stage if n.constraints
+            )
+            assert usage <= limit
+
+
+def test_csp_solver_finds_optimum_beyond_greedy_schedule():
+    """
+    Total demand is 15 GPUs on a 4-GPU system, so 4 stages is the lower bound.
+    The greedy list schedules need 5 stages; the CSP search finds a 4-stage plan:
+    [n3, n5], [n0, n1], [n2, n4], [n6].
+    """
+    requirements = {
+        "n0": {"gpu": 2},
+        "n1": {"gpu": 2},
+        "n2": {"gpu": 2},
+        "n3": {"gpu": 1},
+        "n4": {"gpu": 2},
+        "n5": {"gpu": 3},
+        "n6": {"gpu": 3},
+    }
+    graph = _graph(requirements, [("n0", "n2"), ("n3", "n6")])
+
+    greedy_plan = CSPSolver({"gpu": 4}, time_budget=0).resolve(graph)
+    plan = CSPSolver({"gpu": 4}, time_budget=None).resolve(graph)
+
+    assert len(greedy_plan) == 5
+    assert len(plan) == 4
+    _assert_valid(greedy_plan, graph, {"gpu": 4})
+    _assert_valid(plan, graph, {"gpu": 4})
+
+
+def test_csp_solver_long_chain_uses_critical_path():
+    """A 300-node chain is solved from the critical-path bound without any search."""
+    requirements = {f"n{i:03d}": {"gpu": 1} for i in range(300)}
+    edges = [(f"n{i:03d}", f"n{i + 1:03d}") for i in range(299)]
+    graph = _graph(requirements, edges)
+
+    plan = CSPSolver({"gpu": 1}).resolve(graph)
+
+    assert [stage[0].name for stage in plan] == sorted(requirements)
+
+
+def test_csp_solver_large_constrained_graph_within_budget():
+    rng = random.Random(0)
+    requirements = {}
+    edges = []
+    previous = []
+    for layer in range(20):
+        current = [f"L{layer:02d}_{i:02d}" for i in range(20)]
+        for nid in current:
+            if rng.random() < 0.3:
+                requirements[nid] = {
+                    "gpu": rng.choice([1, 2, 3]),
+                    "memory_gb": rng.choice([8, 16, 24]),
+                }
+            else:
+                requirements[nid] = {}
+            sources = rng.sample(previous, min(2, len(previous)))
+            edges.extend((source, nid) for source in sources)
+        previous = current
+    graph = _graph(requirements, edges)
+    system_resources = {"gpu": 4, "memory_gb": 48}
+
+    start = time.monotonic()
+    plan = CSPSolver(system_resources, time_budget=0.2).resolve(graph)
+    elapsed = time.monotonic() - start
+
+    _assert_valid(plan, graph, system_resources)
+    assert elapsed < 2.0
+
+
+def test_csp_solver_rejects_unsatisfiable_graphs():
+    solver = CSPSolver({"gpu": 2})
+
+    with pytest.raises(RuntimeError, match="failed to find a valid schedule"):
+        solver.resolve(_graph({"a": {"gpu": 3}}, []))
+
+    with pytest.raises(RuntimeError, match="failed to find a valid schedule"):
+        solver.resolve(_graph({"a": {}, "b": {}}, [("a", "b"), ("b", "a")]))
+
+
+def test_csp_solver_handles_zero_resource_limits():
+    graph = _graph({"a": {"cpu": 1}, "b": {"cpu": 1}}, [("a", "b")])
+    system_resources = {"gpu": 0, "cpu": 2}
+
+    plan = CSPSolver(system_resources).resolve(graph)
+
+    _assert_valid(plan, graph, system_resources)
+    with pytest.raises(RuntimeError, match="failed to find a valid schedule"):
+        CSPSolver(system_resources).resolve(_graph({"a": {"gpu": 1}}, []))
+
+
+def test_csp_solver_uses_durations_to_break_ties():
+    """
+    Every plan needs 2 stages: `a1 -> a2` is a chain and the two GPU tasks cannot
+    share a stage. Pairing the slow nodes ([a1, y_slow], [a2, x_fast]) is
+    estimated at 10 + 1 seconds, instead of 10 + 10 for the plan that unit
+    weights lead to ([a1, x_fast], [a2, y_slow]).
+    """
+    requirements = {"a1": {}, "a2": {}, "x_fast": {"gpu": 1}, "y_slow": {"gpu": 1}}
+    graph = _graph(requirements, [("a1", "a2")])
+    store = InMemoryDurationStore()
+    for nid, duration in (("a1", 10), ("a2", 1), ("x_fast", 1), ("y_slow", 10)):
+        store.record(nid, nid, duration)
+
+    unweighted = CSPSolver({"gpu": 1}).resolve(graph)
+    weighted = CSPSolver({"gpu": 1}, duration_store=store).resolve(graph)
+
+    assert [{n.name for n in stage} for stage in unweighted] == [
+        {"a1", "x_fast"},
+        {"a2", "y_slow"},
+    ]
+    assert [{n.name for n in stage} for stage in weighted] == [
+        {"a1", "y_slow"},
+        {"a2", "x_fast"},
+    ]
@@ -0,0 +1,67 @@
+import random
+
+import pytest
+
+from cascade.adapters.solvers.native import NativeSolver
+from cascade.graph.model import CompactGraph, Edge, EdgeType, Graph, Node
+
+pytest.importorskip("numpy")
+
+from cascade.adapters.solvers.vectorized import VectorizedSolver  # noqa: E402
+
+
+def _random_dag(graph_cls, n_nodes: int, n_edges: int, seed: int):
+    rng = random.Random(seed)
+    # Shuffled ids, so that insertion order differs from structural_id order
+    nodes = [
+        Node(structural_id=f"n{rng.random():.12f}", name=str(i)) for i in range(n_nodes)
+    ]
+    graph = graph_cls()
+    for node in nodes:
+        graph.add_node(node)
+    edge_types = list(EdgeType)
+    for _ in range(n_edges):
+        a, b = sorted(rng.sample(range(n_nodes), 2))
+        graph.add_edge(Edge(nodes[a], nodes[b], "x", edge_type=rng.choice(edge_types)))
+    return graph
+
+
+def _ids(plan):
+    return [[node.structural_id for node in stage] for stage in plan]
+
+
+@pytest.mark.parametrize("graph_cls", [Graph, CompactGraph])
+@pytest.mark.parametrize("seed", range(5))
+def test_vectorized_solver_matches_native_solver(graph_cls, seed):
+    graph = _random_dag(graph_cls, n_nodes=300, n_edges=900, seed=seed)
+
+    assert _ids(VectorizedSolver().resolve(graph)) == _ids(
+        NativeSolver().resolve(graph)
+    )
+
+
+def test_vectorized_solver_ignores_foreign_nodes_and_non_execution_edges():
+    a, b, c, outside = (Node(structural_id=i, name=i) for i in ("a", "b", "c", "z"))
+    graph = Graph(nodes=[c, b, a])
+    graph.add_edge(Edge(a, b, "0"))
+    graph.add_edge(Edge(a, b, "1"))  # parallel edge
+    graph.add_edge(Edge(outside, c, "0"))  # source is not part of the graph
+    graph.add_edge(Edge(c, a, "jump", edge_type=EdgeType.ITERATIVE_JUMP))
+
+    plan = VectorizedSolver().resolve(graph)
+
+    assert _ids(plan) == [["a", "c"], ["b"]] == _ids(NativeSolver().resolve(graph))
+
+
+def test_vectorized_solver_detects_cycles():
+    a, b = Node(structural_id="a", name="a"), Node(structural_id="b", name="b")
+    graph = Graph(nodes=[a, b])
+    graph.add_edge(Edge(a, b, "0"))
+    graph.add_edge(Edge(b, a, "0"))
+
+    with pytest.raises(ValueError, match="Cycle detected"):
+        VectorizedSolver().resolve(graph)
+
+
+def test_vectorized_solver_empty_graph():
+    assert VectorizedSolver().resolve(Graph()) == []
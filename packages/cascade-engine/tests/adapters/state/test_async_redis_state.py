@@ -0,0 +1,189 @@
+import asyncio
+import pickle
+
+import pytest
+import cascade as cs
+from cascade.adapters.executors.local import LocalExecutor
+from cascade.adapters.solvers.native import NativeSolver
+from cascade.adapters.state import redis as redis_state_module
+from cascade.adapters.state.redis import AsyncRedisStateBackend
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+@pytest.fixture
+def client():
+    return fakeredis.FakeAsyncRedis()
+
+
+def test_dependency_check(monkeypatch):
+    monkeypatch.setattr(redis_state_module, "aioredis", None)
+    with pytest.raises(ImportError, match="The 'redis' library is required"):
+        AsyncRedisStateBackend(run_id="test", client=None)
+
+
+@pytest.mark.asyncio
+async def test_writes_are_buffered_until_flush(client):
+    backend = AsyncRedisStateBackend("run", client)
+    await backend.clear()
+
+    await backend.put_result("a", {"v": 1})
+    await backend.mark_skipped("b", "ConditionFalse")
+
+    # Readable locally before anything reaches Redis
+    assert await backend.get_result("a") == {"v": 1}
+    assert await backend.get_skip_reason("b") == "ConditionFalse"
+    assert await client.keys("cascade:run:run:1:*") == []
+
+    await backend.flush()
+    await backend.close()
+
+    assert pickle.loads(await client.hget("cascade:run:run:1:results", "a")) == {"v": 1}
+    assert await client.hget("cascade:run:run:1:skipped", "b") == b"ConditionFalse"
+    assert backend.flushes == 1
+
+
+@pytest.mark.asyncio
+async def test_reads_values_written_by_other_processes(client):
+    writer = AsyncRedisStateBackend("run", client)
+    await writer.clear()
+    await writer.put_many({"a": 1, "b": 2})
+    await writer.mark_skipped("c", "Pruned")
+    await writer.close()
+
+    reader = AsyncRedisStateBackend("run", client)
+    assert await reader.get_result("a") == 1
+    assert await reader.has_result("b")
+    assert not await reader.has_result("c")
+    assert await reader.get_many(["a", "b", "c"]) == {"a": 1, "b": 2}
+    assert await reader.has_many(["a", "c"]) == {"a"}
+    assert await reader.get_skip_reason("c") == "Pruned"
+
+
+@pytest.mark.asyncio
+async def test_clear_bumps_the_generation_and_unlinks_old_keys(client):
+    backend = AsyncRedisStateBackend("run", client)
+    await backend.clear()
+    await backend.put_result("a", 1)
+    await backend.close()
+    assert await client.exists("cascade:run:run:1:results")
+
+    await backend.clear()
+
+    assert await client.get("cascade:run:run:generation") == b"2"
+    assert not await client.exists("cascade:run:run:1:results")
+    assert not await backend.has_result("a")
+
+
+@pytest.mark.asyncio
+async def test_clear_drops_unflushed_writes(client):
+    backend = AsyncRedisStateBackend("run", client)
+    await backend.clear()
+    await backend.put_result("a", 1)
+
+    await backend.clear()
+    await backend.close()
+
+    assert backend.flushes == 0
+    assert await client.keys("cascade:run:run:*:results") == []
+
+
+@pytest.mark.asyncio
+async def test_flushed_values_can_be_evicted_from_the_local_cache(client):
+    backend = AsyncRedisStateBackend("run", client, cache_writes=False)
+    await backend.clear()
+    await backend.put_result("a", 1)
+    await backend.close()
+
+    assert backend._results == {}
+    assert await backend.get_result("a") == 1
+
+
+@pytest.mark.asyncio
+async def test_engine_flushes_per_stage(client):
+    backends = []
+    make_backend = AsyncRedisStateBackend.factory(client)
+
+    def factory(run_id):
+        backends.append(make_backend(run_id))
+        return backends[-1]
+
+    @cs.task
+    def leaf(i):
+        return i
+
+    @cs.task
+    def total(*values):
+        return sum(values)
+
+    engine = cs.Engine(
+        solver=NativeSolver(),
+        executor=LocalExecutor(),
+        bus=cs.MessageBus(),
+        state_backend_factory=factory,
+    )
+
+    assert await engine.run(total(*[leaf(i) for i in range(5)])) == 10
+    # At most one pipeline per stage, never one per write
+    assert 1 <= backends[0].flushes <= 2
+    assert len(await client.keys("cascade:run:*:results")) == 1
+    (results_key,) = await client.keys("cascade:run:*:results")
+    assert await client.hlen(results_key) == 6
+    # The run owns its generation: every read was served locally
+    assert backends[0]._local_only
+
+
+@pytest.mark.asyncio
+async def test_tco_iterations_do_not_see_stale_results(client):
+    seen = []
+
+    @cs.task
+    def countdown(n):
+        seen.append(n)
+        if n <= 0:
+            return cs.Jump(target_key="exit", data="done")
+        return cs.Jump(target_key="loop", data=n - 1)
+
+    step = countdown(3)
+    cs.bind(step, cs.select_jump({"loop": step, "exit": None}))
+
+    engine = cs.Engine(
+        solver=NativeSolver(),
+        executor=LocalExecutor(),
+        bus=cs.MessageBus(),
+        state_backend_factory=AsyncRedisStateBackend.factory(client),
+    )
+
+    assert await engine.run(step) == "done"
+    assert seen == [3, 2, 1, 0]
+    # Only the last iteration's generation is left
+    assert len(await client.keys("cascade:run:*:results")) == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_keeps_its_writes_for_the_next_one(client, monkeypatch):
+    backend = AsyncRedisStateBackend("run", client)
+    await backend.clear()
+    await backend.put_result("a", 1)
+    await backend.mark_skipped("b", "ConditionFalse")
+
+    execute = type(client.pipeline()).execute
+
+    async def failing_execute(self, *args, **kwargs):
+        raise ConnectionError("redis went away")
+
+    monkeypatch.setattr(type(client.pipeline()), "execute", failing_execute)
+    await backend.flush()
+    await asyncio.wait([backend._flushing])
+    await backend.put_result("c", 3)
+    with pytest.raises(ConnectionError):
+        await backend.flush()
+
+    # The failed batch is sent again with the writes buffered since
+    monkeypatch.setattr(type(client.pipeline()), "execute", execute)
+    await backend.flush()
+    await backend.close()
+
+    results = await client.hgetall("cascade:run:run:1:results")
+    assert {k: pickle.loads(v) for k, v in results.items()} == {b"a": 1, b"c": 3}
+    assert await client.hget("cascade:run:run:1:skipped", "b") == b"ConditionFalse"
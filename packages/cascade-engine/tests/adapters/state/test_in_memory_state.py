@@ -29,3 +29,13 @@ async def test_in_memory_functional():
     await backend.clear()
     assert await backend.has_result("node_a") is False
     assert await backend.get_skip_reason("node_b") is None
+
+
+@pytest.mark.asyncio
+async def test_in_memory_batched_operations():
+    backend = InMemoryStateBackend("test_run")
+
+    await backend.put_many({"a": 1, "b": None})
+
+    assert await backend.has_many(["a", "b", "c"]) == {"a", "b"}
+    assert await backend.get_many(["a", "b", "c"]) == {"a": 1, "b": None}
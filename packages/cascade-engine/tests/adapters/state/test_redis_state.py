@@ -39,10 +39,13 @@ async def test_put_result(mock_redis_client):
     await backend.put_result("node_a", test_result)
 
     expected_key = "cascade:run:run123:results"
-    expected_data = pickle.dumps(test_result)
 
     client.pipeline.assert_called_once()
-    pipeline.hset.assert_called_once_with(expected_key, "node_a", expected_data)
+    pipeline.hset.assert_called_once()
+    key, field, data = pipeline.hset.call_args.args
+    assert (key, field) == (expected_key, "node_a")
+    # Plain values are stored as plain pickles
+    assert pickle.loads(data) == test_result
     pipeline.expire.assert_called_once_with(expected_key, 86400)
     pipeline.execute.assert_called_once()
 
@@ -68,3 +71,41 @@ async def test_get_result(mock_redis_client):
     # Case 2: Result not found
     client.hget.return_value = None
     assert await backend.get_result("node_c") is None
+
+
+@pytest.mark.asyncio
+async def test_put_many_uses_a_single_pipeline(mock_redis_client):
+    client, pipeline = mock_redis_client
+    backend = redis_state_module.RedisStateBackend(run_id="run123", client=client)
+
+    await backend.put_many({"a": 1, "b": [2]})
+
+    expected_key = "cascade:run:run123:results"
+    client.pipeline.assert_called_once()
+    pipeline.hset.assert_called_once()
+    assert pipeline.hset.call_args.args == (expected_key,)
+    mapping = pipeline.hset.call_args.kwargs["mapping"]
+    assert {k: pickle.loads(v) for k, v in mapping.items()} == {"a": 1, "b": [2]}
+    pipeline.expire.assert_called_once_with(expected_key, 86400)
+    pipeline.execute.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_get_many_uses_a_single_hmget(mock_redis_client):
+    client, _ = mock_redis_client
+    backend = redis_state_module.RedisStateBackend(run_id="run123", client=client)
+    client.hmget.return_value = [pickle.dumps(1), None]
+
+    assert await backend.get_many(["a", "b"]) == {"a": 1}
+    client.hmget.assert_called_once_with("cascade:run:run123:results", ["a", "b"])
+
+
+@pytest.mark.asyncio
+async def test_has_many_pipelines_hexists(mock_redis_client):
+    client, pipeline = mock_redis_client
+    backend = redis_state_module.RedisStateBackend(run_id="run123", client=client)
+    pipeline.execute.return_value = [True, False]
+
+    assert await backend.has_many(["a", "b"]) == {"a"}
+    assert pipeline.hexists.call_count == 2
+    pipeline.execute.assert_called_once()
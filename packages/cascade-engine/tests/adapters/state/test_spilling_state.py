@@ -0,0 +1,145 @@
+import os
+
+import pytest
+
+import cascade as cs
+from cascade.adapters.executors.local import LocalExecutor
+from cascade.adapters.solvers.native import NativeSolver
+from cascade.adapters.state.spilling import SpillingStateBackend
+from cascade.runtime.bus import MessageBus
+from cascade.runtime.engine import Engine
+
+
+def spill_files(backend):
+    return sorted(os.listdir(backend.scratch_dir)) if backend.scratch_dir else []
+
+
+@pytest.mark.asyncio
+async def test_small_results_stay_in_memory(tmp_path):
+    backend = SpillingStateBackend("run", threshold_bytes=1024, directory=str(tmp_path))
+
+    await backend.put_result("a", {"foo": "bar"})
+    await backend.put_result("b", b"x" * 10)
+
+    assert await backend.get_result("a") == {"foo": "bar"}
+    assert await backend.get_result("b") == b"x" * 10
+    assert backend.scratch_dir is None
+    assert backend.stats()["spilled"] == 0
+
+
+@pytest.mark.asyncio
+async def test_large_bytes_come_back_as_mmap_views(tmp_path):
+    backend = SpillingStateBackend("run", threshold_bytes=1024, directory=str(tmp_path))
+    payload = os.urandom(4096)
+
+    await backend.put_result("a", payload)
+    value = await backend.get_result("a")
+
+    assert isinstance(value, memoryview)
+    assert value.readonly
+    assert value == payload
+    assert await backend.has_result("a")
+    assert len(spill_files(backend)) == 1
+    assert backend.stats()["spilled_bytes"] == 4096
+
+
+@pytest.mark.asyncio
+async def test_large_objects_are_pickled_to_disk(tmp_path):
+    backend = SpillingStateBackend("run", threshold_bytes=1024, directory=str(tmp_path))
+    rows = [{"id": i, "name": f"row-{i}"} for i in range(500)]
+
+    await backend.put_result("a", rows)
+
+    assert await backend.get_result("a") == rows
+    assert len(spill_files(backend)) == 1
+
+
+@pytest.mark.asyncio
+async def test_results_bounded_below_threshold_are_not_pickled(tmp_path):
+    class Opaque:
+        pass
+
+    backend = SpillingStateBackend(
+        "run", threshold_bytes=1024 * 1024, directory=str(tmp_path)
+    )
+    rows = [{"id": i, "name": f"row-{i}", "tags": ("a", "b")} for i in range(500)]
+
+    await backend.put_result("rows", rows)
+    await backend.put_result("text", "x" * 1000)
+    assert backend.stats()["measured_results"] == 0
+
+    # Objects the bound can't see into are still measured
+    await backend.put_result("opaque", Opaque())
+    await backend.put_result("many", list(range(20_000)))
+    assert backend.stats()["measured_results"] == 2
+    assert backend.stats()["spilled"] == 0
+    assert await backend.get_result("rows") == rows
+
+
+@pytest.mark.asyncio
+async def test_numpy_arrays_come_back_zero_copy(tmp_path):
+    np = pytest.importorskip("numpy")
+    backend = SpillingStateBackend("run", threshold_bytes=1024, directory=str(tmp_path))
+    array = np.arange(10_000, dtype=np.float32).reshape(100, 100)
+
+    await backend.put_result("a", {"matrix": array})
+    value = (await backend.get_result("a"))["matrix"]
+
+    assert value.dtype == array.dtype and value.shape == array.shape
+    assert np.array_equal(value, array)
+    # Backed by the memory map, not by a private copy
+    assert not value.flags.owndata
+    assert not value.flags.writeable
+
+
+@pytest.mark.asyncio
+async def test_clear_and_close_delete_spill_files(tmp_path):
+    backend = SpillingStateBackend("run", threshold_bytes=16, directory=str(tmp_path))
+    await backend.put_result("a", b"a" * 64)
+    await backend.put_result("b", b"b" * 64)
+    view = await backend.get_result("a")
+
+    # Overwriting a result replaces its file
+    await backend.put_result("b", b"c" * 64)
+    assert len(spill_files(backend)) == 2
+
+    await backend.clear()
+    assert spill_files(backend) == []
+    assert not await backend.has_result("a")
+    # Views handed out before stay readable
+    assert view == b"a" * 64
+
+    scratch_dir = backend.scratch_dir
+    await backend.close()
+    assert not os.path.exists(scratch_dir)
+
+
+@pytest.mark.asyncio
+async def test_engine_closes_spilling_backend_at_run_end(tmp_path):
+    @cs.task
+    def produce(i: int) -> bytes:
+        return bytes([i]) * 4096
+
+    @cs.task
+    def total(*chunks) -> int:
+        return sum(chunk[0] for chunk in chunks)
+
+    backends = []
+
+    def factory(run_id):
+        backend = SpillingStateBackend(
+            run_id, threshold_bytes=1024, directory=str(tmp_path)
+        )
+        backends.append(backend)
+        return backend
+
+    engine = Engine(
+        solver=NativeSolver(),
+        executor=LocalExecutor(),
+        bus=MessageBus(),
+        state_backend_factory=factory,
+    )
+
+    assert await engine.run(total(*[produce(i) for i in range(4)])) == 6
+    assert backends[0].spilled_results == 4
+    assert os.listdir(tmp_path) == []
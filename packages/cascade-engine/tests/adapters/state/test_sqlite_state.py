@@ -0,0 +1,128 @@
+import pytest
+import cascade as cs
+from cascade.adapters.executors.local import LocalExecutor
+from cascade.adapters.solvers.native import NativeSolver
+from cascade.adapters.state.sqlite import SqliteStateBackend
+from cascade.runtime.bus import MessageBus
+from cascade.runtime.engine import Engine
+from cascade.runtime.events import TaskSkipped
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "state.db")
+
+
+@pytest.mark.asyncio
+async def test_writes_are_committed_on_flush(path):
+    backend = SqliteStateBackend("run", path)
+    await backend.clear()
+
+    await backend.put_many({"a": {"v": 1}, "b": [2]})
+    await backend.mark_skipped("c", "ConditionFalse")
+
+    # Readable before the stage's transaction is committed
+    assert await backend.get_result("a") == {"v": 1}
+    assert await backend.has_many(["a", "b", "x"]) == {"a", "b"}
+    reader = SqliteStateBackend("run", path)
+    assert await reader.get_result("a") is None
+
+    await backend.flush()
+
+    assert await reader.get_many(["a", "b", "x"]) == {"a": {"v": 1}, "b": [2]}
+    assert await reader.has_result("b")
+    assert await reader.get_skip_reason("c") == "ConditionFalse"
+    assert backend.flushes == 1
+    await reader.close()
+    await backend.close()
+
+
+@pytest.mark.asyncio
+async def test_reopened_run_keeps_first_iteration_results(path):
+    backend = SqliteStateBackend("run", path)
+    await backend.clear()
+    await backend.put_result("a", 1)
+    await backend.close()
+
+    resumed = SqliteStateBackend("run", path)
+    assert resumed.resumed
+    await resumed.clear()
+    assert await resumed.get_result("a") == 1
+
+    # Later iterations start from an empty state
+    await resumed.clear()
+    assert not resumed.resumed
+    assert await resumed.get_result("a") is None
+    await resumed.close()
+
+
+@pytest.mark.asyncio
+async def test_results_of_later_iterations_are_not_resumed(path):
+    backend = SqliteStateBackend("run", path)
+    await backend.clear()
+    await backend.clear()
+    await backend.put_result("a", 1)
+    await backend.close()
+
+    reopened = SqliteStateBackend("run", path)
+    assert not reopened.resumed
+    await reopened.clear()
+    assert await reopened.get_result("a") is None
+
+    await reopened.delete_run()
+    await reopened.close()
+    assert not SqliteStateBackend("run", path).resumed
+
+
+calls = []
+
+
+@cs.task
+def step(i: int) -> int:
+    calls.append(i)
+    return i * 10
+
+
+@cs.task
+def crash_once(*values: int) -> int:
+    if len(calls) <= 4:
+        raise RuntimeError("crash")
+    return sum(values)
+
+
+def make_engine(path, scheduling, bus=None):
+    return Engine(
+        solver=NativeSolver(),
+        executor=LocalExecutor(),
+        bus=bus or MessageBus(),
+        state_backend_factory=SqliteStateBackend.factory(path),
+        scheduling=scheduling,
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("scheduling", ["stages", "critical_path"])
+async def test_engine_resumes_a_crashed_run(path, scheduling):
+    calls.clear()
+
+    def make_workflow():
+        # Two identical impure calls are still told apart
+        return crash_once(step(1), step(2), step(2), step(3))
+
+    with pytest.raises(RuntimeError, match="crash"):
+        await make_engine(path, scheduling).run(make_workflow(), run_id="run-1")
+    assert sorted(calls) == [1, 2, 2, 3]
+
+    bus = MessageBus()
+    resumed = []
+    bus.subscribe(
+        TaskSkipped,
+        lambda e: resumed.append(e.task_name) if e.reason == "Resumed" else None,
+    )
+    engine = make_engine(path, scheduling, bus=bus)
+    calls.append(0)  # Lets crash_once succeed
+
+    # The process that resumes the run rebuilds the workflow
+    assert await engine.run(make_workflow(), run_id="run-1") == 80
+    assert sorted(calls) == [0, 1, 2, 2, 3]
+    assert resumed == ["step"] * 4
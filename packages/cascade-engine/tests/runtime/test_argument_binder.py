@@ -0,0 +1,116 @@
+import pytest
+import cascade as cs
+from cascade.adapters.state.in_memory import InMemoryStateBackend
+from cascade.graph.build import build_graph
+from cascade.graph.registry import NodeRegistry
+from cascade.runtime.binder import ArgumentBinder
+from cascade.runtime.resolvers import ArgumentResolver
+
+
+@cs.task
+def source():
+    return "from_edge"
+
+
+async def resolve_root(target, resources=None, overrides=None):
+    graph, instance_map = build_graph(target, registry=NodeRegistry())
+    state = InMemoryStateBackend("test")
+    for node in graph.nodes:
+        await state.put_result(node.structural_id, "from_edge")
+    root = instance_map[target._uuid]
+    args, kwargs = await ArgumentResolver().resolve(
+        root,
+        graph,
+        state,
+        resources or {},
+        instance_map,
+        input_overrides=overrides,
+    )
+    return root, args, kwargs
+
+
+@pytest.mark.asyncio
+async def test_literals_and_edges_fill_their_slots():
+    @cs.task
+    def target(a, b, c, d=None):
+        return a
+
+    root, args, kwargs = await resolve_root(target(1, source(), 3, d=source()))
+
+    assert args == [1, "from_edge", 3]
+    assert kwargs == {"d": "from_edge"}
+    assert isinstance(root.binder, ArgumentBinder)
+
+
+@pytest.mark.asyncio
+async def test_positional_gaps_are_kept_on_complex_nodes():
+    @cs.task
+    def target(a, b, c, conn=cs.inject("db")):
+        return a
+
+    _, args, kwargs = await resolve_root(
+        target(1, source(), 3), resources={"db": "connection"}
+    )
+
+    assert args == [1, "from_edge", 3]
+    assert kwargs == {"conn": "connection"}
+
+
+@pytest.mark.asyncio
+async def test_injected_default_is_skipped_when_bound():
+    @cs.task
+    def target(a, conn=cs.inject("db")):
+        return a
+
+    _, args, kwargs = await resolve_root(target(1, "explicit"))
+
+    assert args == [1, "explicit"]
+    assert kwargs == {}
+
+
+@pytest.mark.asyncio
+async def test_nested_injects_in_literals_are_resolved():
+    @cs.task
+    def target(conns):
+        return conns
+
+    _, args, _ = await resolve_root(
+        target([cs.inject("db"), "plain"]), resources={"db": "connection"}
+    )
+
+    assert args == [["connection", "plain"]]
+
+
+@pytest.mark.asyncio
+async def test_overrides_take_precedence_over_edges_and_literals():
+    @cs.task
+    def target(a, b, c=0):
+        return a
+
+    _, args, kwargs = await resolve_root(
+        target(source(), 2, c=3), overrides={"0": "jumped", "c": 4}
+    )
+
+    assert args == ["jumped", 2]
+    assert kwargs == {"c": 4}
+
+
+@pytest.mark.asyncio
+async def test_binder_is_compiled_once_per_node():
+    @cs.task
+    def target(a):
+        return a
+
+    t = target(source())
+    graph, instance_map = build_graph(t, registry=NodeRegistry())
+    state = InMemoryStateBackend("test")
+    for node in graph.nodes:
+        await state.put_result(node.structural_id, "from_edge")
+    root = instance_map[t._uuid]
+    resolver = ArgumentResolver()
+
+    await resolver.resolve(root, graph, state, {}, instance_map)
+    binder = root.binder
+    await resolver.resolve(root, graph, state, {}, instance_map)
+
+    assert root.binder is binder
@@ -1,7 +1,8 @@
+import asyncio
 from unittest.mock import MagicMock
 import pytest
 
-from cascade.graph.model import Node, Edge, EdgeType
+from cascade.graph.model import CompactGraph, Node, Edge, EdgeType, Graph
 from cascade.spec.routing import Router
 from cascade.spec.lazy_types import LazyResult
 from cascade.runtime.flow import FlowManager
@@ -69,9 +70,7 @@ async def test_flow_manager_pruning_logic():
         ),
     ]
 
-    graph = MagicMock()
-    graph.nodes = nodes
-    graph.edges = edges
+    graph = Graph(nodes=nodes, edges=edges)
 
     # Create a mock instance_map for the test
     instance_map = {
@@ -97,3 +96,51 @@ async def test_flow_manager_pruning_logic():
     assert await state_backend.get_skip_reason("B") == "Pruned"
     # Node B_UP, which only B depends on, should be recursively pruned.
     assert await state_backend.get_skip_reason("B_UP") == "Pruned"
+
+
+def test_compact_graph_runs_without_materializing_its_edges(monkeypatch):
+    import cascade as cs
+    from cascade.adapters.executors.local import LocalExecutor
+    from cascade.adapters.solvers.csp import CSPSolver
+    from cascade.adapters.solvers.native import NativeSolver
+    from cascade.graph.build import build_graph
+    from cascade.runtime.bus import MessageBus
+    from cascade.runtime.engine import Engine
+
+    @cs.task
+    def leaf(i):
+        return i
+
+    @cs.task
+    def total(*values):
+        return sum(values)
+
+    workflow = total(*[leaf(i) for i in range(200)])
+    graph, instance_map = build_graph(workflow, compact=True)
+    assert isinstance(graph, CompactGraph)
+
+    materialized = []
+    edge_at = CompactGraph._edge_at
+    monkeypatch.setattr(
+        CompactGraph,
+        "_edge_at",
+        lambda self, i: materialized.append(i) or edge_at(self, i),
+    )
+
+    # Scheduling and flow control only read the adjacency index
+    FlowManager(graph, instance_map[workflow._uuid].structural_id, instance_map)
+    NativeSolver().resolve(graph)
+    CSPSolver(system_resources={}).resolve(graph)
+    assert materialized == []
+
+    # A run only materializes the edges its argument resolution reads
+    for solver in (NativeSolver(), CSPSolver(system_resources={})):
+        materialized.clear()
+        engine = Engine(
+            solver=solver,
+            executor=LocalExecutor(),
+            bus=MessageBus(),
+            compact_graphs=True,
+        )
+        assert asyncio.run(engine.run(workflow)) == sum(range(200))
+        assert len(materialized) <= len(graph.edges)
@@ -0,0 +1,184 @@
+import asyncio
+import os
+import time
+
+import pytest
+import cascade as cs
+from cascade.adapters.executors.local import LocalExecutor
+from cascade.adapters.solvers.native import NativeSolver
+from cascade.runtime.events import TaskExecutionFinished
+from cascade.spec.constraint import GlobalConstraint
+
+
+class CountingExecutor(LocalExecutor):
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    async def execute(self, node, args, kwargs):
+        self.calls += 1
+        return await super().execute(node, args, kwargs)
+
+
+def make_engine(**kwargs):
+    executor = CountingExecutor()
+    engine = cs.Engine(
+        solver=NativeSolver(), executor=executor, bus=cs.MessageBus(), **kwargs
+    )
+    return engine, executor
+
+
+@cs.task
+def add(x: int, y: int) -> int:
+    return x + y
+
+
+@pytest.mark.asyncio
+async def test_blocking_map_calls_elements_concurrently():
+    @cs.task
+    def nap(x: int) -> int:
+        time.sleep(0.1)
+        return x
+
+    engine, executor = make_engine()
+    finished = []
+    engine.bus.subscribe(TaskExecutionFinished, finished.append)
+
+    start = time.perf_counter()
+    assert await engine.run(nap.map(x=list(range(8)))) == list(range(8))
+
+    # One executor call per element, without a sub-graph, in the blocking pool
+    assert time.perf_counter() - start < 0.5
+    assert executor.calls == 8
+    elements = [e for e in finished if e.task_name == "nap"]
+    assert sorted(e.task_id[-3:] for e in elements) == [f"[{i}]" for i in range(8)]
+    assert all(e.duration >= 0.1 for e in elements)
+
+
+@pytest.mark.asyncio
+async def test_async_map_calls_elements_concurrently():
+    @cs.task
+    async def slow_double(x: int) -> int:
+        await asyncio.sleep(0.1)
+        return x * 2
+
+    engine, executor = make_engine()
+
+    start = time.perf_counter()
+    assert await engine.run(slow_double.map(x=list(range(10)))) == [
+        2 * i for i in range(10)
+    ]
+    assert time.perf_counter() - start < 0.5
+    assert executor.calls == 10
+
+
+@pytest.mark.asyncio
+async def test_compute_map_runs_in_chunks(monkeypatch):
+    @cs.task(mode="compute")
+    def square(x: int) -> int:
+        return x * x
+
+    monkeypatch.setattr(os, "cpu_count", lambda: 1)
+    engine, executor = make_engine(map_chunk_size=4)
+    finished = []
+    engine.bus.subscribe(TaskExecutionFinished, finished.append)
+
+    assert await engine.run(square.map(x=list(range(10)))) == [i * i for i in range(10)]
+    assert executor.calls == 3
+    # Elements still report their own executions
+    assert len([e for e in finished if e.task_name == "square"]) == 10
+
+
+@pytest.mark.asyncio
+async def test_map_chunk_size_zero_builds_a_sub_graph_per_element():
+    engine, executor = make_engine(map_chunk_size=0)
+
+    assert await engine.run(add.map(x=[1, 2, 3], y=[1, 1, 1])) == [2, 3, 4]
+    assert executor.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_batch_task_receives_column_slices():
+    slices = []
+
+    @cs.task(batch=True)
+    def scale(x, factor):
+        slices.append((list(x), list(factor)))
+        return [a * b for a, b in zip(x, factor)]
+
+    engine, _ = make_engine(map_chunk_size=4)
+    result = await engine.run(scale.map(x=list(range(6)), factor=[10] * 6))
+
+    assert result == [10 * i for i in range(6)]
+    assert sorted(slices) == [([0, 1, 2, 3], [10] * 4), ([4, 5], [10] * 2)]
+
+
+@pytest.mark.asyncio
+async def test_batch_task_must_return_one_result_per_input():
+    @cs.task(batch=True)
+    def broken(x):
+        return [sum(x)]
+
+    engine, _ = make_engine()
+    with pytest.raises(ValueError, match="returned 1 results for 3 inputs"):
+        await engine.run(broken.map(x=[1, 2, 3]))
+
+
+@pytest.mark.asyncio
+async def test_batch_task_with_retry_gets_one_element_slices():
+    calls = []
+
+    @cs.task(batch=True)
+    def square(x):
+        calls.append(list(x))
+        return [v * v for v in x]
+
+    engine, _ = make_engine()
+    result = await engine.run(square.map(x=[1, 2, 3]).with_retry(max_attempts=2))
+
+    assert result == [1, 4, 9]
+    assert sorted(calls) == [[1], [2], [3]]
+
+
+@pytest.mark.asyncio
+async def test_lazy_elements_fall_back_to_sub_graphs():
+    @cs.task
+    def one() -> int:
+        return 1
+
+    @cs.task
+    def make_inputs() -> list:
+        return [one(), 5]
+
+    engine, executor = make_engine()
+    result = await engine.run(add.map(x=make_inputs(), y=[10, 10]))
+
+    assert result == [11, 15]
+    # make_inputs(), then one sub-graph per element (one of them runs one())
+    assert executor.calls == 4
+
+
+@pytest.mark.asyncio
+async def test_global_constraints_disable_batching():
+    engine, executor = make_engine()
+    engine.constraint_manager.update_constraint(
+        GlobalConstraint(
+            id="c1", scope="task:other", type="concurrency", params={"limit": 1}
+        )
+    )
+
+    assert await engine.run(add.map(x=[1, 2], y=[1, 1])) == [2, 3]
+    assert executor.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_errors_in_batched_map_propagate():
+    @cs.task
+    def fail_on_three(x: int) -> int:
+        if x == 3:
+            raise ValueError("three")
+        return x
+
+    engine, _ = make_engine()
+    with pytest.raises(ValueError, match="three"):
+        await engine.run(fail_on_three.map(x=[1, 2, 3]))
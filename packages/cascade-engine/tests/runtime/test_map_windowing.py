@@ -0,0 +1,131 @@
+import asyncio
+
+import pytest
+import cascade as cs
+from cascade.adapters.executors.local import LocalExecutor
+from cascade.adapters.solvers.native import NativeSolver
+from cascade.adapters.state import InMemoryStateBackend
+
+
+class InFlight:
+    """Tracks how many mapped elements run at the same time."""
+
+    def __init__(self):
+        self.current = 0
+        self.peak = 0
+        self.started = 0
+
+    async def run(self, x):
+        self.current += 1
+        self.started += 1
+        self.peak = max(self.peak, self.current)
+        await asyncio.sleep(0.005)
+        self.current -= 1
+        return x * 2
+
+
+def make_engine(**kwargs):
+    return cs.Engine(
+        solver=NativeSolver(), executor=LocalExecutor(), bus=cs.MessageBus(), **kwargs
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("map_chunk_size", [0, 4, 1024])
+async def test_max_concurrency_bounds_elements_in_flight(map_chunk_size):
+    tracker = InFlight()
+
+    @cs.task
+    async def work(x):
+        return await tracker.run(x)
+
+    engine = make_engine(map_chunk_size=map_chunk_size)
+    result = await engine.run(work.map(x=list(range(20))).with_concurrency(3))
+
+    assert result == [2 * i for i in range(20)]
+    assert tracker.peak <= 3
+
+
+@pytest.mark.asyncio
+async def test_sync_map_with_concurrency_runs_chunks_in_order():
+    @cs.task
+    def double(x):
+        return x * 2
+
+    engine = make_engine(map_chunk_size=2)
+    result = await engine.run(double.map(x=list(range(9))).with_concurrency(2))
+
+    assert result == [2 * i for i in range(9)]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("map_chunk_size", [0, 1024])
+async def test_streamed_map_yields_results_in_order(map_chunk_size):
+    tracker = InFlight()
+
+    @cs.task
+    async def work(x):
+        return await tracker.run(x)
+
+    @cs.task
+    async def consume(results):
+        return [r async for r in results]
+
+    mapped = work.map(x=list(range(12))).with_concurrency(4).as_stream()
+    engine = make_engine(map_chunk_size=map_chunk_size)
+
+    assert await engine.run(consume(mapped)) == [2 * i for i in range(12)]
+    assert tracker.peak <= 4
+
+
+@pytest.mark.asyncio
+async def test_streamed_map_stops_when_consumer_stops():
+    tracker = InFlight()
+
+    @cs.task
+    async def work(x):
+        return await tracker.run(x)
+
+    @cs.task
+    async def first_three(results):
+        taken = []
+        async for r in results:
+            taken.append(r)
+            if len(taken) == 3:
+                break
+        return taken
+
+    mapped = work.map(x=list(range(1000))).with_concurrency(2).as_stream()
+    engine = make_engine(map_chunk_size=0)
+
+    assert await engine.run(first_three(mapped)) == [0, 2, 4]
+    assert tracker.started < 10
+
+
+def test_max_concurrency_must_be_positive():
+    @cs.task
+    def double(x):
+        return x * 2
+
+    with pytest.raises(ValueError):
+        double.map(x=[1]).with_concurrency(0)
+
+
+@pytest.mark.asyncio
+async def test_windowed_elements_do_not_accumulate_in_run_state():
+    backends = []
+
+    def factory(run_id):
+        backends.append(InMemoryStateBackend(run_id))
+        return backends[-1]
+
+    @cs.task
+    def double(x):
+        return x * 2
+
+    engine = make_engine(map_chunk_size=0, state_backend_factory=factory)
+    result = await engine.run(double.map(x=list(range(50))).with_concurrency(5))
+
+    assert result == [2 * i for i in range(50)]
+    # Only the map node's own result is stored in the run's state
+    assert len(backends[0]._results) == 1
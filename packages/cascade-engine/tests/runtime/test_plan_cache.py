@@ -0,0 +1,157 @@
+import asyncio
+import gc
+import tracemalloc
+
+import pytest
+
+import cascade as cs
+from cascade.adapters.executors.local import LocalExecutor
+from cascade.adapters.solvers.native import NativeSolver
+from cascade.graph.registry import NodeRegistry
+from cascade.runtime.plan_cache import PlanCache
+
+
+def test_plan_cache_lru_eviction_and_stats():
+    cache = PlanCache(max_size=2)
+    cache.put("a", [[0]])
+    cache.put("b", [[0], [1]])
+
+    assert cache.get("a") == [[0]]  # "b" is now least recently used
+    cache.put("c", [[1, 0]])
+
+    assert "b" not in cache
+    assert cache.get("b") is None
+    assert cache.get("c") == [[1, 0]]
+
+    stats = cache.stats()
+    assert stats["size"] == 2
+    assert stats["hits"] == 2
+    assert stats["misses"] == 1
+    assert stats["evictions"] == 1
+    assert cache.hit_rate == pytest.approx(2 / 3)
+
+
+def test_plan_cache_persists_plans_across_instances(tmp_path):
+    path = str(tmp_path / "plans.sqlite")
+
+    first = PlanCache(path=path)
+    first.put("solver:hash", [[0, 1], [2]])
+    first.close()
+
+    second = PlanCache(path=path)
+    assert len(second) == 0
+    assert second.get("solver:hash") == [[0, 1], [2]]
+    assert second.disk_hits == 1
+
+    # Now served from memory
+    assert second.get("solver:hash") == [[0, 1], [2]]
+    assert second.disk_hits == 1
+
+    second.discard("solver:hash")
+    second.close()
+
+    third = PlanCache(path=path)
+    assert third.get("solver:hash") is None
+    third.close()
+
+
+@pytest.mark.asyncio
+async def test_engines_share_plans_of_multi_node_graphs(tmp_path):
+    @cs.task
+    def add(a, b):
+        return a + b
+
+    @cs.task(pure=True)
+    def double(x):
+        return x * 2
+
+    path = str(tmp_path / "plans.sqlite")
+    solvers = []
+    for i in range(2):
+        solver = CountingSolver()
+        solvers.append(solver)
+        engine = cs.Engine(
+            solver=solver,
+            executor=LocalExecutor(),
+            bus=cs.MessageBus(),
+            plan_cache=PlanCache(path=path),
+        )
+        # Impure ids are salted, pure ones depend on the literals
+        assert await engine.run(add(add(i, 1), double(i))) == 3 * i + 1
+        engine.graph_strategy.plan_cache.close()
+
+    assert [solver.calls for solver in solvers] == [1, 0]
+    stats = engine.get_cache_stats()["plan_cache"]
+    assert (stats["hits"], stats["disk_hits"], stats["misses"]) == (1, 1, 0)
+
+
+def test_plan_cache_rejects_invalid_size():
+    with pytest.raises(ValueError):
+        PlanCache(max_size=0)
+
+
+class CountingSolver(NativeSolver):
+    def __init__(self):
+        self.calls = 0
+
+    def resolve(self, graph):
+        self.calls += 1
+        return super().resolve(graph)
+
+
+@pytest.mark.parametrize("scheduling", ["stages", "critical_path"])
+def test_map_elements_share_one_cached_plan(scheduling):
+    @cs.task
+    def add(a, b):
+        return a + b
+
+    solver = CountingSolver()
+    engine = cs.Engine(
+        solver=solver,
+        executor=LocalExecutor(),
+        bus=cs.MessageBus(),
+        scheduling=scheduling,
+        # Force a sub-graph per element
+        map_chunk_size=0,
+    )
+
+    mapped = add.map(a=list(range(20)), b=[2] * 20)
+    assert asyncio.run(engine.run(mapped)) == [i + 2 for i in range(20)]
+
+    # The top-level graph, then one solve for all 20 element sub-graphs
+    assert solver.calls == 2
+    assert engine.graph_strategy.plan_cache.hits >= 19
+    # Element nodes aren't kept in the engine's registry: only the map node is
+    assert engine.graph_strategy.node_registry.stats()["size"] == 1
+
+
+def test_engine_does_not_retain_finished_workflows():
+    @cs.task
+    def size(data):
+        return len(data)
+
+    engine = cs.Engine(
+        solver=NativeSolver(),
+        executor=LocalExecutor(),
+        bus=cs.MessageBus(),
+        node_registry=NodeRegistry(weak_values=True),
+    )
+
+    async def run_many(count):
+        for _ in range(count):
+            assert await engine.run(size(bytes(2**20))) == 2**20
+
+    asyncio.run(run_many(2))
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        asyncio.run(run_many(50))
+        gc.collect()
+        growth = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+
+    # 50 MiB of literals went through the engine; none of them is kept
+    assert growth < 4 * 2**20
+    assert "build_memo" not in engine.get_cache_stats()
@@ -0,0 +1,121 @@
+import asyncio
+import time
+
+import pytest
+import cascade as cs
+from cascade.adapters.executors.local import LocalExecutor
+from cascade.adapters.solvers.native import NativeSolver
+from cascade.graph.build import BuildMemo
+from cascade.runtime.bus import MessageBus
+from cascade.runtime.engine import Engine
+from cascade.runtime.strategies import ReadyQueueExecutionStrategy
+
+
+def make_engine(**kwargs) -> Engine:
+    return Engine(
+        solver=NativeSolver(),
+        executor=LocalExecutor(),
+        bus=MessageBus(),
+        scheduling="critical_path",
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+async def test_ready_queue_does_not_wait_for_slow_stage_siblings():
+    """
+    `fast_next` only depends on `fast`. With stage barriers it would wait for
+    `slow` (same stage as `fast`); the ready queue starts it right away.
+    """
+    finished = {}
+
+    @cs.task
+    async def slow():
+        await asyncio.sleep(0.2)
+        finished["slow"] = time.perf_counter()
+        return 1
+
+    @cs.task
+    async def fast():
+        return 2
+
+    @cs.task
+    async def fast_next(x):
+        finished["fast_next"] = time.perf_counter()
+        return x
+
+    @cs.task
+    def join(a, b):
+        return a + b
+
+    engine = make_engine()
+    assert isinstance(engine.graph_strategy, ReadyQueueExecutionStrategy)
+
+    result = await engine.run(join(slow(), fast_next(fast())))
+
+    assert result == 3
+    assert finished["fast_next"] < finished["slow"]
+
+
+@pytest.mark.asyncio
+async def test_ready_queue_prioritises_critical_path_under_contention():
+    """
+    With a single slot, the head of the long chain must run before the
+    independent short task, even though both are ready at the same time.
+    """
+    order = []
+
+    @cs.task
+    def short():
+        order.append("short")
+        return 0
+
+    @cs.task
+    def head():
+        order.append("head")
+        return 0
+
+    @cs.task
+    def link(x):
+        order.append("link")
+        return x
+
+    @cs.task
+    def join(*xs):
+        return len(xs)
+
+    chain = link(link(link(head().with_constraints(slot=1)).with_constraints(slot=1)))
+    workflow = join(short().with_constraints(slot=1), chain)
+
+    engine = make_engine(system_resources={"slot": 1})
+    assert await engine.run(workflow) == 2
+    assert order[0] == "head"
+
+
+@pytest.mark.asyncio
+async def test_ready_queue_learns_task_durations():
+    @cs.task
+    async def nap():
+        await asyncio.sleep(0.01)
+        return 1
+
+    engine = make_engine(build_memo=BuildMemo())
+    strategy = engine.graph_strategy
+
+    target = nap()
+    await engine.run(target)
+
+    node = strategy.node_registry.get(
+        strategy.build_memo.get(target._uuid).node.structural_id
+    )
+    assert strategy.estimate_duration(node) >= 0.01
+
+
+def test_engine_rejects_unknown_scheduling():
+    with pytest.raises(ValueError, match="Unknown scheduling"):
+        Engine(
+            solver=NativeSolver(),
+            executor=LocalExecutor(),
+            bus=MessageBus(),
+            scheduling="random",
+        )
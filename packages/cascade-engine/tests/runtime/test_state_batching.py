@@ -0,0 +1,117 @@
+import pytest
+import cascade as cs
+from cascade.adapters.executors.local import LocalExecutor
+from cascade.adapters.solvers.native import NativeSolver
+from cascade.adapters.state import InMemoryStateBackend
+from cascade.runtime.state import get_many, has_many, put_many
+
+
+class PerKeyStateBackend:
+    """A backend implementing only the per-key StateBackend methods."""
+
+    def __init__(self, run_id=None):
+        self._results = {}
+        self._skipped = {}
+
+    async def put_result(self, node_id, result):
+        self._results[node_id] = result
+
+    async def get_result(self, node_id):
+        return self._results.get(node_id)
+
+    async def has_result(self, node_id):
+        return node_id in self._results
+
+    async def mark_skipped(self, node_id, reason):
+        self._skipped[node_id] = reason
+
+    async def get_skip_reason(self, node_id):
+        return self._skipped.get(node_id)
+
+    async def clear(self):
+        self._results.clear()
+        self._skipped.clear()
+
+
+class CountingStateBackend(InMemoryStateBackend):
+    def __init__(self, run_id):
+        super().__init__(run_id)
+        self.calls = {"get_result": 0, "get_many": 0, "put_result": 0, "put_many": 0}
+
+    async def get_result(self, node_id):
+        self.calls["get_result"] += 1
+        return await super().get_result(node_id)
+
+    async def get_many(self, node_ids):
+        self.calls["get_many"] += 1
+        return await super().get_many(node_ids)
+
+    async def put_result(self, node_id, result):
+        self.calls["put_result"] += 1
+        await super().put_result(node_id, result)
+
+    async def put_many(self, results):
+        self.calls["put_many"] += 1
+        await super().put_many(results)
+
+
+@pytest.mark.asyncio
+async def test_batched_operations_fall_back_to_per_key_calls():
+    backend = PerKeyStateBackend()
+
+    await put_many(backend, {"a": 1, "b": None})
+
+    assert await has_many(backend, ["a", "b", "c"]) == {"a", "b"}
+    assert await get_many(backend, ["a", "b", "c"]) == {"a": 1, "b": None}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("backend_class", [PerKeyStateBackend, InMemoryStateBackend])
+async def test_engine_runs_with_and_without_batched_operations(backend_class):
+    @cs.task
+    def leaf(i):
+        return i
+
+    @cs.task
+    def total(*values):
+        return sum(values)
+
+    engine = cs.Engine(
+        solver=NativeSolver(),
+        executor=LocalExecutor(),
+        bus=cs.MessageBus(),
+        state_backend_factory=backend_class,
+    )
+
+    assert await engine.run(total(*[leaf(i) for i in range(5)])) == 10
+
+
+@pytest.mark.asyncio
+async def test_stage_inputs_and_results_are_batched():
+    backends = []
+
+    def factory(run_id):
+        backends.append(CountingStateBackend(run_id))
+        return backends[-1]
+
+    @cs.task
+    def leaf(i):
+        return i
+
+    @cs.task
+    def total(*values):
+        return sum(values)
+
+    engine = cs.Engine(
+        solver=NativeSolver(),
+        executor=LocalExecutor(),
+        bus=cs.MessageBus(),
+        state_backend_factory=factory,
+    )
+
+    assert await engine.run(total(*[leaf(i) for i in range(5)])) == 10
+    calls = backends[0].calls
+    # One batch for the five leaves' results, one fetch of total's five inputs
+    assert calls["put_many"] == 1
+    assert calls["get_many"] == 1
+    assert calls["get_result"] == 1  # the run's final result
@@ -1,14 +1,16 @@
-from .model import Graph, Node, Edge, EdgeType
-from .build import build_graph
+from .model import Graph, CompactGraph, Node, Edge, EdgeType
+from .build import build_graph, BuildMemo
 from .registry import NodeRegistry
 from .exceptions import StaticGraphError
 
 __all__ = [
     "Graph",
+    "CompactGraph",
     "Node",
     "Edge",
     "EdgeType",
     "build_graph",
+    "BuildMemo",
     "NodeRegistry",
     "StaticGraphError",
 ]
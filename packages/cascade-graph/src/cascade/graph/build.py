@@ -1,6 +1,8 @@
-from typing import Dict, Any, Tuple
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, Any, Generator, List, Optional, Tuple
 import inspect
-from cascade.graph.model import Graph, Node, Edge, EdgeType
+from cascade.graph.model import CompactGraph, Graph, Node, Edge, EdgeType
 from cascade.spec.lazy_types import LazyResult, MappedLazyResult
 from cascade.spec.routing import Router
 from cascade.spec.jump import JumpSelector
@@ -8,23 +10,129 @@ from cascade.spec.jump import JumpSelector
 from .registry import NodeRegistry
 from .hashing import HashingService
 
+# A single visit on the builder's explicit stack: yields the LazyResults it depends
+# on, is resumed with their Nodes, and returns its own Node.
+_VisitSteps = Generator[Any, Optional[Node], Node]
+
+
+@dataclass
+class BuildFragment:
+    """
+    Everything a single visit of a LazyResult contributed to a graph, in order:
+    dependencies visited before the node was added, the edges added right after it,
+    then jump targets visited afterwards and the remaining edges.
+    Replaying a fragment reproduces the exact node and edge order of a full visit.
+    """
+
+    node: Node
+    deps: List[Any] = field(default_factory=list)
+    edges: List[Edge] = field(default_factory=list)
+    post_deps: List[Any] = field(default_factory=list)
+    post_edges: List[Edge] = field(default_factory=list)
+
+
+class BuildMemo:
+    """
+    A cross-build memo of visited LazyResults, keyed by instance identity (_uuid).
+
+    When a builder meets a LazyResult it has already built in an earlier build,
+    it replays the recorded fragment instead of re-scanning arguments and
+    re-hashing the subtree. Only new LazyResults pay the full build cost, which
+    makes repeated builds of almost identical structures (e.g. agent loops that
+    add a few tasks per iteration on top of a shared context) cheap.
+
+    LazyResults are assumed not to be mutated (e.g. via `.run_if()`) after they
+    have been built. The memo is an LRU bounded by `max_size` fragments; it
+    keeps the memoized LazyResults, their literal arguments and their Nodes
+    alive, so only pass one to an Engine (`build_memo=`) when workflows are
+    actually rebuilt from shared parts.
+    """
+
+    def __init__(self, max_size: Optional[int] = 4096):
+        if max_size is not None and max_size < 1:
+            raise ValueError("max_size must be a positive integer or None.")
+        self.max_size = max_size
+        self._fragments: "OrderedDict[str, BuildFragment]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._fragments)
+
+    def get(self, uuid: str) -> Optional[BuildFragment]:
+        fragment = self._fragments.get(uuid)
+        if fragment is None:
+            self.misses += 1
+            return None
+        self._fragments.move_to_end(uuid)
+        self.hits += 1
+        return fragment
+
+    def put(self, uuid: str, fragment: BuildFragment) -> None:
+        self._fragments[uuid] = fragment
+        self._fragments.move_to_end(uuid)
+        if self.max_size is not None:
+            while len(self._fragments) > self.max_size:
+                self._fragments.popitem(last=False)
+
+    def clear(self) -> None:
+        self._fragments.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {"size": len(self._fragments), "hits": self.hits, "misses": self.misses}
+
 
 class GraphBuilder:
-    def __init__(self, registry: NodeRegistry | None = None):
-        self.graph = Graph()
+    def __init__(
+        self,
+        registry: NodeRegistry | None = None,
+        memo: BuildMemo | None = None,
+        hashing_service: HashingService | None = None,
+        compact: bool = False,
+    ):
+        # Compact graphs trade per-edge objects for columnar storage (see CompactGraph)
+        self.graph = CompactGraph() if compact else Graph()
         # InstanceMap: Dict[LazyResult._uuid, Node]
         # Connecting the world of volatile instances to the world of stable structures.
         self._visited_instances: Dict[str, Node] = {}
 
         self.registry = registry if registry is not None else NodeRegistry()
-        self.hashing_service = HashingService()
+        self.memo = memo
+        self.hashing_service = (
+            hashing_service if hashing_service is not None else HashingService()
+        )
 
     def build(self, target: Any) -> Tuple[Graph, Dict[str, Node]]:
         self._visit(target)
         return self.graph, self._visited_instances
 
     def _visit(self, value: Any) -> Node:
-        """Central dispatcher for the post-order traversal."""
+        """
+        Central dispatcher for the post-order traversal.
+
+        The traversal runs on an explicit stack instead of the Python call stack,
+        so arbitrarily deep dependency chains neither hit the recursion limit nor
+        pay for nested calls. Each visit is a generator that yields the
+        LazyResults it depends on and is resumed with their Nodes.
+        """
+        visited = self._visited_instances
+        stack: List[_VisitSteps] = [self._visit_steps(value)]
+        sent: Optional[Node] = None
+        while stack:
+            try:
+                dep = stack[-1].send(sent)
+            except StopIteration as stop:
+                stack.pop()
+                sent = stop.value
+                continue
+
+            # FAST PATH: Already visited dependencies don't need a frame
+            sent = visited.get(dep._uuid)
+            if sent is None:
+                stack.append(self._visit_steps(dep))
+        return sent
+
+    def _visit_steps(self, value: Any) -> "_VisitSteps":
         if isinstance(value, LazyResult):
             return self._visit_lazy_result(value)
         elif isinstance(value, MappedLazyResult):
@@ -32,37 +140,68 @@ class GraphBuilder:
         else:
             raise TypeError(f"Cannot build graph from type {type(value)}")
 
-    def _find_dependencies(self, obj: Any, dep_nodes: Dict[str, Node]):
-        """Helper for post-order traversal: finds and visits all nested LazyResults."""
-        if isinstance(obj, (LazyResult, MappedLazyResult)):
-            if obj._uuid not in dep_nodes:
-                dep_node = self._visit(obj)
-                dep_nodes[obj._uuid] = dep_node
-        elif isinstance(obj, Router):
-            self._find_dependencies(obj.selector, dep_nodes)
-            for route in obj.routes.values():
-                self._find_dependencies(route, dep_nodes)
-        elif isinstance(obj, (list, tuple)):
-            for item in obj:
-                self._find_dependencies(item, dep_nodes)
-        elif isinstance(obj, dict):
-            for v in obj.values():
-                self._find_dependencies(v, dep_nodes)
-
-    def _visit_lazy_result(self, result: LazyResult) -> Node:
+    def _find_dependencies(self, obj: Any, dep_objs: List[Any], seen: set):
+        """
+        Helper for post-order traversal: collects all nested LazyResults of `obj`
+        (in traversal order, without duplicates) into `dep_objs`.
+        """
+        pending = [obj]
+        while pending:
+            obj = pending.pop()
+            if isinstance(obj, (LazyResult, MappedLazyResult)):
+                if obj._uuid not in seen:
+                    seen.add(obj._uuid)
+                    dep_objs.append(obj)
+            elif isinstance(obj, Router):
+                pending.extend(reversed(list(obj.routes.values())))
+                pending.append(obj.selector)
+            elif isinstance(obj, (list, tuple)):
+                pending.extend(reversed(obj))
+            elif isinstance(obj, dict):
+                pending.extend(reversed(list(obj.values())))
+
+    def _replay_fragment(self, uuid: str, fragment: BuildFragment) -> "_VisitSteps":
+        """Re-applies a memoized visit without re-scanning or re-hashing."""
+        for dep in fragment.deps:
+            yield dep
+
+        node = fragment.node
+        self._visited_instances[uuid] = node
+        self.graph.add_node(node)
+        for edge in fragment.edges:
+            self.graph.add_edge(edge)
+
+        for dep in fragment.post_deps:
+            yield dep
+        for edge in fragment.post_edges:
+            self.graph.add_edge(edge)
+
+        return node
+
+    def _visit_lazy_result(self, result: LazyResult) -> "_VisitSteps":
         if result._uuid in self._visited_instances:
             return self._visited_instances[result._uuid]
 
+        if self.memo is not None:
+            fragment = self.memo.get(result._uuid)
+            if fragment is not None:
+                return (yield from self._replay_fragment(result._uuid, fragment))
+
         # 1. Post-order: Resolve all dependencies first
-        dep_nodes: Dict[str, Node] = {}
-        self._find_dependencies(result.args, dep_nodes)
-        self._find_dependencies(result.kwargs, dep_nodes)
+        dep_objs: List[Any] = []
+        seen: set = set()
+        self._find_dependencies(result.args, dep_objs, seen)
+        self._find_dependencies(result.kwargs, dep_objs, seen)
         if result._condition:
-            self._find_dependencies(result._condition, dep_nodes)
+            self._find_dependencies(result._condition, dep_objs, seen)
         if result._constraints:
-            self._find_dependencies(result._constraints.requirements, dep_nodes)
+            self._find_dependencies(result._constraints.requirements, dep_objs, seen)
         if result._dependencies:
-            self._find_dependencies(result._dependencies, dep_nodes)
+            self._find_dependencies(result._dependencies, dep_objs, seen)
+
+        dep_nodes: Dict[str, Node] = {}
+        for dep in dep_objs:
+            dep_nodes[dep._uuid] = yield dep
 
         # 2. Compute structural hash using HashingService
         structural_hash = self.hashing_service.compute_structural_hash(
@@ -82,8 +221,9 @@ class GraphBuilder:
                 if not isinstance(val, (LazyResult, MappedLazyResult, Router)):
                     input_bindings[k] = val
 
-            sig = None
-            if result.task.func:
+            # Reuse the signature cached by Task when available
+            sig = getattr(result.task, "_signature", None)
+            if sig is None and result.task.func:
                 try:
                     sig = inspect.signature(result.task.func)
                 except (ValueError, TypeError):
@@ -132,17 +272,21 @@ class GraphBuilder:
                 input_bindings=input_bindings,
                 has_complex_inputs=has_complex,
             )
-            self.registry._registry[structural_hash] = node
+            self.registry.put(structural_hash, node)
 
         self._visited_instances[result._uuid] = node
 
         # Always add the node to the current graph, even if it was reused from the registry.
         self.graph.add_node(node)
+        edges_start = len(self.graph.edges)
 
         # 4. Finalize edges (idempotent)
         self._scan_and_add_edges(node, result.args)
         self._scan_and_add_edges(node, result.kwargs)
 
+        edges_end = len(self.graph.edges)
+        post_deps: List[Any] = []
+
         # 4.1 Handle Explicit Jump Binding
         if result._jump_selector:
             selector = result._jump_selector
@@ -150,8 +294,15 @@ class GraphBuilder:
                 # Ensure all potential targets in the selector are built/visited
                 for route_target in selector.routes.values():
                     if route_target is not None:
-                        self._visit(route_target)
+                        yield route_target
+                        post_deps.append(route_target)
+
+        # Visiting jump targets may have added edges of their own
+        post_edges_start = len(self.graph.edges)
 
+        if result._jump_selector:
+            selector = result._jump_selector
+            if isinstance(selector, JumpSelector):
                 # Create a distinct ITERATIVE_JUMP edge for each potential jump target.
                 # This makes the static graph correctly represent all potential control flows.
                 for key, route_target_lr in selector.routes.items():
@@ -205,19 +356,41 @@ class GraphBuilder:
                 )
             )
 
+        if self.memo is not None:
+            self.memo.put(
+                result._uuid,
+                BuildFragment(
+                    node=node,
+                    deps=dep_objs,
+                    edges=self.graph.edges[edges_start:edges_end],
+                    post_deps=post_deps,
+                    post_edges=self.graph.edges[post_edges_start:],
+                ),
+            )
+
         return node
 
-    def _visit_mapped_result(self, result: MappedLazyResult) -> Node:
+    def _visit_mapped_result(self, result: MappedLazyResult) -> "_VisitSteps":
         if result._uuid in self._visited_instances:
             return self._visited_instances[result._uuid]
 
+        if self.memo is not None:
+            fragment = self.memo.get(result._uuid)
+            if fragment is not None:
+                return (yield from self._replay_fragment(result._uuid, fragment))
+
         # 1. Post-order traversal for mapped inputs
-        dep_nodes: Dict[str, Node] = {}
-        self._find_dependencies(result.mapping_kwargs, dep_nodes)
+        dep_objs: List[Any] = []
+        seen: set = set()
+        self._find_dependencies(result.mapping_kwargs, dep_objs, seen)
         if result._condition:
-            self._find_dependencies(result._condition, dep_nodes)
+            self._find_dependencies(result._condition, dep_objs, seen)
         if result._dependencies:
-            self._find_dependencies(result._dependencies, dep_nodes)
+            self._find_dependencies(result._dependencies, dep_objs, seen)
+
+        dep_nodes: Dict[str, Node] = {}
+        for dep in dep_objs:
+            dep_nodes[dep._uuid] = yield dep
 
         # 2. Compute structural hash using HashingService
         structural_hash = self.hashing_service.compute_structural_hash(
@@ -236,6 +409,8 @@ class GraphBuilder:
                 name=f"map({getattr(result.factory, 'name', 'factory')})",
                 node_type="map",
                 mapping_factory=result.factory,
+                max_concurrency=result._max_concurrency,
+                streaming=result._stream,
                 retry_policy=result._retry_policy,
                 cache_policy=result._cache_policy,
                 constraints=result._constraints,
@@ -247,6 +422,7 @@ class GraphBuilder:
 
         # Always add the node to the current graph
         self.graph.add_node(node)
+        edges_start = len(self.graph.edges)
 
         # 4. Add data edges
         self._scan_and_add_edges(node, result.mapping_kwargs)
@@ -271,57 +447,75 @@ class GraphBuilder:
                 )
             )
 
+        if self.memo is not None:
+            self.memo.put(
+                result._uuid,
+                BuildFragment(
+                    node=node, deps=dep_objs, edges=self.graph.edges[edges_start:]
+                ),
+            )
+
         return node
 
     def _scan_and_add_edges(self, target_node: Node, obj: Any, path: str = ""):
         """Idempotently adds DATA and ROUTER edges based on pre-visited instances."""
-        if isinstance(obj, (LazyResult, MappedLazyResult)):
-            source_node = self._visited_instances[obj._uuid]
-            self.graph.add_edge(
-                Edge(
-                    source=source_node,
-                    target=target_node,
-                    arg_name=path or "dep",
-                    edge_type=EdgeType.DATA,
-                )
-            )
+        pending = [(obj, path)]
+        while pending:
+            obj, path = pending.pop()
 
-        elif isinstance(obj, Router):
-            selector_node = self._visited_instances[obj.selector._uuid]
-            self.graph.add_edge(
-                Edge(
-                    source=selector_node,
-                    target=target_node,
-                    arg_name=path,
-                    router=obj,
-                    edge_type=EdgeType.DATA,
-                )
-            )
-            for key, route_res in obj.routes.items():
-                route_node = self._visited_instances[route_res._uuid]
+            if isinstance(obj, (LazyResult, MappedLazyResult)):
+                source_node = self._visited_instances[obj._uuid]
                 self.graph.add_edge(
                     Edge(
-                        source=route_node,
+                        source=source_node,
                         target=target_node,
-                        arg_name=f"{path}.route[{key}]",
-                        edge_type=EdgeType.ROUTER_ROUTE,
+                        arg_name=path or "dep",
+                        edge_type=EdgeType.DATA,
                     )
                 )
 
-        elif isinstance(obj, (list, tuple)):
-            for i, item in enumerate(obj):
-                self._scan_and_add_edges(
-                    target_node, item, path=f"{path}[{i}]" if path else str(i)
+            elif isinstance(obj, Router):
+                selector_node = self._visited_instances[obj.selector._uuid]
+                self.graph.add_edge(
+                    Edge(
+                        source=selector_node,
+                        target=target_node,
+                        arg_name=path,
+                        router=obj,
+                        edge_type=EdgeType.DATA,
+                    )
                 )
+                for key, route_res in obj.routes.items():
+                    route_node = self._visited_instances[route_res._uuid]
+                    self.graph.add_edge(
+                        Edge(
+                            source=route_node,
+                            target=target_node,
+                            arg_name=f"{path}.route[{key}]",
+                            edge_type=EdgeType.ROUTER_ROUTE,
+                        )
+                    )
 
-        elif isinstance(obj, dict):
-            for k, v in obj.items():
-                self._scan_and_add_edges(
-                    target_node, v, path=f"{path}.{k}" if path else str(k)
-                )
+            # Children are pushed in reverse so that they are popped in order
+            elif isinstance(obj, (list, tuple)):
+                for i in range(len(obj) - 1, -1, -1):
+                    pending.append((obj[i], f"{path}[{i}]" if path else str(i)))
+
+            elif isinstance(obj, dict):
+                for k, v in reversed(list(obj.items())):
+                    pending.append((v, f"{path}.{k}" if path else str(k)))
 
 
 def build_graph(
-    target: Any, registry: NodeRegistry | None = None
+    target: Any,
+    registry: NodeRegistry | None = None,
+    memo: BuildMemo | None = None,
+    hashing_service: HashingService | None = None,
+    compact: bool = False,
 ) -> Tuple[Graph, Dict[str, Node]]:
-    return GraphBuilder(registry=registry).build(target)
+    return GraphBuilder(
+        registry=registry,
+        memo=memo,
+        hashing_service=hashing_service,
+        compact=compact,
+    ).build(target)
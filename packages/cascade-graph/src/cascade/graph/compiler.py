@@ -1,4 +1,4 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, Generator, List, Optional
 from cascade.spec.lazy_types import LazyResult, MappedLazyResult
 from cascade.spec.blueprint import (
     Blueprint,
@@ -9,6 +9,10 @@ from cascade.spec.blueprint import (
     Instruction,
 )
 
+# A single visit on the builder's explicit stack: yields the LazyResults it depends
+# on, is resumed with their output register indexes, and returns its own.
+_VisitSteps = Generator[Any, Optional[int], int]
+
 
 class BlueprintBuilder:
     """
@@ -47,13 +51,36 @@ class BlueprintBuilder:
         self._register_counter += 1
         return reg
 
-    def _to_operand(self, value: Any) -> Operand:
+    def _to_operand(self, value: Any) -> Generator[Any, Optional[int], Operand]:
         if isinstance(value, (LazyResult, MappedLazyResult)):
-            reg_index = self._visit(value, is_root=False)
+            reg_index = yield value
             return Register(reg_index)
         return Literal(value)
 
     def _visit(self, target: Any, is_root: bool) -> int:
+        """
+        Compiles `target` and its dependencies in post-order.
+
+        The traversal runs on an explicit stack instead of the Python call stack,
+        so arbitrarily deep dependency chains don't hit the recursion limit.
+        """
+        stack: List[_VisitSteps] = [self._visit_steps(target, is_root)]
+        sent: Optional[int] = None
+        while stack:
+            try:
+                dep = stack[-1].send(sent)
+            except StopIteration as stop:
+                stack.pop()
+                sent = stop.value
+                continue
+
+            # FAST PATH: Already compiled dependencies don't need a frame
+            sent = self._visited.get(dep._uuid)
+            if sent is None:
+                stack.append(self._visit_steps(dep, is_root=False))
+        return sent
+
+    def _visit_steps(self, target: Any, is_root: bool) -> _VisitSteps:
         if not isinstance(target, (LazyResult, MappedLazyResult)):
             raise TypeError(f"Cannot compile non-LazyResult type: {type(target)}")
 
@@ -82,8 +109,10 @@ class BlueprintBuilder:
                 kwargs_operands[k] = reg
         else:
             # Concrete Mode: Compile arguments as dependencies
-            args_operands = [self._to_operand(a) for a in target.args]
-            kwargs_operands = {k: self._to_operand(v) for k, v in kwargs_source.items()}
+            for a in target.args:
+                args_operands.append((yield from self._to_operand(a)))
+            for k, v in kwargs_source.items():
+                kwargs_operands[k] = yield from self._to_operand(v)
 
         # 2. Allocate Output Register
         output_reg = self._allocate_register()
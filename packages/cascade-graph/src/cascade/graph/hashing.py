@@ -1,18 +1,65 @@
 import hashlib
-from typing import Any, List, Dict
-from cascade.graph.model import Graph, Node
+import marshal
+from typing import Any, Callable, Dict
+from cascade.graph.model import EdgeType, Graph, Node
 from cascade.spec.lazy_types import LazyResult, MappedLazyResult
 from cascade.spec.routing import Router
 from cascade.spec.resource import Inject
 
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+
+# Marshal format version used to encode literals. Versions >= 3 emit back-references
+# for repeated objects, which would make equal values encode differently.
+_MARSHAL_VERSION = 2
+
+# Types whose values are encoded directly with marshal (exact type match only,
+# so that subclasses such as str-based Enums keep their own identity).
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None), bytes, complex})
+
+HASH_ALGORITHMS = ("sha256", "blake2b", "xxh3_128")
+
+
+def _get_hash_factory(algorithm: str) -> Callable[[], Any]:
+    if algorithm == "sha256":
+        return hashlib.sha256
+    if algorithm == "blake2b":
+        return lambda: hashlib.blake2b(digest_size=32)
+    if algorithm == "xxh3_128":
+        if xxhash is None:
+            raise ImportError(
+                "The 'xxhash' library is required to use the 'xxh3_128' hash algorithm."
+            )
+        return xxhash.xxh3_128
+    raise ValueError(
+        f"Unknown hash algorithm '{algorithm}'. Expected one of {HASH_ALGORITHMS}."
+    )
+
+
+def _update_token(h: Any, tag: bytes, value: Any) -> None:
+    """Feeds a tagged, self-delimiting scalar (or tuple of scalars) into `h`."""
+    h.update(tag + marshal.dumps(value, _MARSHAL_VERSION))
+
 
 class HashingService:
     """
     Service responsible for computing a stable Merkle hash for a node instance.
     This is the `Instance Hash`, which uniquely identifies a specific, fully-parameterized
     node instance. It is used for results caching and node de-duplication within a graph.
+
+    Components are fed as tagged bytes straight into a streaming hash object:
+    scalars and scalar-only containers are encoded with `marshal` (no `repr()`),
+    buffer-protocol objects (e.g. NumPy arrays) are hashed from their raw memory,
+    and anything else falls back to `repr()`.
     """
 
+    def __init__(self, algorithm: str = "sha256"):
+        self.algorithm = algorithm
+        self._new_hash = _get_hash_factory(algorithm)
+
     def compute_structural_hash(self, result: Any, dep_nodes: Dict[str, Node]) -> str:
         """
         Computes the Structural Hash (Instance Hash) for a given result object.
@@ -24,153 +71,230 @@ class HashingService:
         else:
             raise TypeError(f"Cannot compute hash for type {type(result)}")
 
-    def _get_merkle_hash(self, components: List[str]) -> str:
-        """Computes a stable hash from a list of string components."""
-        fingerprint = "|".join(components)
-        return hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()
-
     def _compute_lazy_result_hash(
         self, result: LazyResult, dep_nodes: Dict[str, Node]
     ) -> str:
+        h = self._new_hash()
+
         # 1. Base Components (Task identity and Policies)
-        base_comps = [f"Task({getattr(result.task, 'name', 'unknown')})"]
+        _update_token(h, b"T", getattr(result.task, "name", "unknown"))
 
         # [CP-006] Purity Check
         # Default is Impure (pure=False). Impure tasks get a unique salt (UUID)
         # to ensure every instance is a unique node in the graph.
         is_pure = getattr(result.task, "pure", False)
         if not is_pure:
-            base_comps.append(f"Salt({result._uuid})")
+            _update_token(h, b"S", result._uuid)
 
         if result._retry_policy:
             rp = result._retry_policy
-            base_comps.append(f"Retry({rp.max_attempts},{rp.delay},{rp.backoff})")
+            _update_token(h, b"R", (rp.max_attempts, rp.delay, rp.backoff))
         if result._cache_policy:
-            base_comps.append(f"Cache({type(result._cache_policy).__name__})")
+            _update_token(h, b"C", type(result._cache_policy).__name__)
 
         # 2. Argument Components (Always structural)
-        struct_args = self._build_hash_components(result.args, dep_nodes)
-        struct_kwargs = self._build_hash_components(result.kwargs, dep_nodes)
+        h.update(b"A")
+        self._feed(h, result.args, dep_nodes)
+        h.update(b"K")
+        self._feed(h, result.kwargs, dep_nodes)
 
         # 3. Metadata Components (Structural properties)
-        meta_comps = []
         if result._condition:
-            meta_comps.append("Condition:PRESENT")
+            h.update(b"c")
         if result._dependencies:
-            meta_comps.append(f"Deps:{len(result._dependencies)}")
+            _update_token(h, b"D", len(result._dependencies))
 
         # 4. Constraint Components (Always structural)
-        struct_constraints = []
         if result._constraints:
-            keys = sorted(result._constraints.requirements.keys())
-            s_vals = [f"{k}={result._constraints.requirements[k]}" for k in keys]
-            struct_constraints.append(f"Constraints({','.join(s_vals)})")
-
-        # Assemble Structural ID
-        return self._get_merkle_hash(
-            base_comps
-            + ["Args:"]
-            + struct_args
-            + ["Kwargs:"]
-            + struct_kwargs
-            + meta_comps
-            + struct_constraints
-        )
+            h.update(b"X")
+            self._feed(h, result._constraints.requirements, dep_nodes)
+
+        return h.hexdigest()
 
     def _compute_mapped_result_hash(
         self, result: MappedLazyResult, dep_nodes: Dict[str, Node]
     ) -> str:
-        base_comps = [f"Map({getattr(result.factory, 'name', 'factory')})"]
+        h = self._new_hash()
+        _update_token(h, b"M", getattr(result.factory, "name", "factory"))
 
         # [CP-006] Purity Check for Map
         is_pure = getattr(result.factory, "pure", False)
         if not is_pure:
-            base_comps.append(f"Salt({result._uuid})")
+            _update_token(h, b"S", result._uuid)
+
+        # Arguments (Always structural)
+        h.update(b"K")
+        self._feed(h, result.mapping_kwargs, dep_nodes)
 
-        meta_comps = []
         if result._condition:
-            meta_comps.append("Condition:PRESENT")
+            h.update(b"c")
         if result._dependencies:
-            meta_comps.append(f"Deps:{len(result._dependencies)}")
+            _update_token(h, b"D", len(result._dependencies))
 
-        # Arguments (Always structural)
-        struct_kwargs = self._build_hash_components(result.mapping_kwargs, dep_nodes)
+        # Execution options that change the node's result or scheduling
+        if result._max_concurrency:
+            _update_token(h, b"W", result._max_concurrency)
+        if result._stream:
+            h.update(b"I")
 
-        # Assemble
-        return self._get_merkle_hash(
-            base_comps + ["MapKwargs:"] + struct_kwargs + meta_comps
-        )
+        return h.hexdigest()
 
-    def _build_hash_components(self, obj: Any, dep_nodes: Dict[str, Node]) -> List[str]:
+    def _feed(self, h: Any, obj: Any, dep_nodes: Dict[str, Node]) -> None:
         """
-        Recursively builds hash components, always including literal values.
+        Recursively feeds an argument value into the hash, always including literals.
+        Every value starts with a one-byte tag, so the encoding is unambiguous.
         """
-        components = []
+        obj_type = type(obj)
 
-        if isinstance(obj, (LazyResult, MappedLazyResult)):
-            node = dep_nodes[obj._uuid]
+        # FAST PATH: Primitives
+        if obj_type in _SCALAR_TYPES:
+            _update_token(h, b"v", obj)
+
+        elif obj_type is LazyResult or obj_type is MappedLazyResult:
             # The reference is always to the full structural ID of the dependency
-            components.append(f"LAZY({node.structural_id})")
+            _update_token(h, b"L", dep_nodes[obj._uuid].structural_id)
+
+        elif obj_type is list or obj_type is tuple:
+            # FAST PATH: Containers of scalars are encoded in a single C call.
+            # (marshal itself would also accept dicts and buffer objects, but those
+            # need canonical key order and dtype/shape, so they take the slow path.)
+            if all(type(item) in _SCALAR_TYPES for item in obj):
+                h.update(b"m")
+                h.update(marshal.dumps(obj, _MARSHAL_VERSION))
+            else:
+                h.update(b"[" if obj_type is list else b"(")
+                for item in obj:
+                    self._feed(h, item, dep_nodes)
+                h.update(b"]")
+
+        elif obj_type is dict:
+            self._feed_dict(h, obj, dep_nodes)
+
+        elif isinstance(obj, (dict, list, tuple)):
+            # Subclasses (OrderedDict, defaultdict, namedtuples...) are encoded by
+            # content, tagged with their type: their repr() may hold addresses.
+            _update_token(h, b"N", obj_type.__qualname__)
+            if isinstance(obj, dict):
+                self._feed_dict(h, obj, dep_nodes)
+            else:
+                h.update(b"[" if isinstance(obj, list) else b"(")
+                for item in obj:
+                    self._feed(h, item, dep_nodes)
+                h.update(b"]")
+
+        elif isinstance(obj, (LazyResult, MappedLazyResult)):
+            _update_token(h, b"L", dep_nodes[obj._uuid].structural_id)
 
         elif isinstance(obj, Router):
-            components.append("Router{")
-            components.append("Selector:")
-            components.extend(self._build_hash_components(obj.selector, dep_nodes))
-            components.append("Routes:")
+            h.update(b"<")
+            self._feed(h, obj.selector, dep_nodes)
             for k in sorted(obj.routes.keys()):
-                components.append(f"Key({k})->")
-                components.extend(self._build_hash_components(obj.routes[k], dep_nodes))
-            components.append("}")
-
-        elif isinstance(obj, (list, tuple)):
-            components.append("List[")
-            for item in obj:
-                components.extend(self._build_hash_components(item, dep_nodes))
-            components.append("]")
-
-        elif isinstance(obj, dict):
-            components.append("Dict{")
-            for k in sorted(obj.keys()):
-                components.append(f"{k}:")
-                components.extend(self._build_hash_components(obj[k], dep_nodes))
-            components.append("}")
+                self._feed(h, k, dep_nodes)
+                self._feed(h, obj.routes[k], dep_nodes)
+            h.update(b">")
 
         elif isinstance(obj, Inject):
-            components.append(f"Inject({obj.resource_name})")
+            _update_token(h, b"I", obj.resource_name)
 
         else:
-            try:
-                components.append(repr(obj))
-            except Exception:
-                components.append("<unreprable>")
-
-        return components
+            self._feed_object(h, obj)
+
+    def _feed_dict(
+        self, h: Any, obj: Dict[Any, Any], dep_nodes: Dict[str, Node]
+    ) -> None:
+        """Feeds a dict's items in key order (insertion order if unsortable)."""
+        try:
+            keys = sorted(obj)
+        except TypeError:
+            keys = list(obj)
+        h.update(b"{")
+        for k in keys:
+            self._feed(h, k, dep_nodes)
+            self._feed(h, obj[k], dep_nodes)
+        h.update(b"}")
+
+    def _feed_object(self, h: Any, obj: Any) -> None:
+        """Feeds a non-container object, preferring its raw buffer over repr()."""
+        try:
+            view = memoryview(obj)
+        except (TypeError, ValueError, BufferError):
+            view = None
+
+        # Buffer-protocol objects (bytearray, array.array, NumPy arrays...) are
+        # hashed from raw memory. Object buffers hold pointers, so they are excluded.
+        if view is not None and "O" not in view.format:
+            header = (type(obj).__qualname__, view.format, view.shape, view.nbytes)
+            _update_token(h, b"B", header)
+            h.update(view if view.c_contiguous else view.tobytes())
+            return
+
+        try:
+            text = repr(obj)
+        except Exception:
+            text = "<unreprable>"
+        _update_token(h, b"?", text)
 
 
 class BlueprintHasher:
     """
     Computes a hash for a Graph's topology, ignoring literal input values.
     This hash is used to cache compiled execution plans.
+
+    The digest is fed incrementally: each node contributes its cached node-local
+    fingerprint followed by its incoming edges (looked up via the graph's
+    adjacency index), so the cost is linear in the size of the graph.
+    The resulting digest is identical to hashing the '|'-joined list of all
+    node components in one go.
     """
 
     def compute_hash(self, graph: Graph) -> str:
         """Computes the blueprint hash for the entire graph."""
-        all_components = []
+        hasher = hashlib.sha256()
         # Sort nodes by structural_id to ensure deterministic traversal
-        sorted_nodes = sorted(graph.nodes, key=lambda n: n.structural_id)
+        sorted_nodes = sorted(graph.nodes, key=_structural_id_key)
 
+        separator = b""
         for node in sorted_nodes:
-            all_components.extend(self._get_node_components(node, graph))
+            hasher.update(separator)
+            hasher.update(self._get_node_fingerprint(node))
+            hasher.update(self._get_edge_fingerprint(node, graph))
+            separator = b"|"
 
-        return self._get_merkle_hash(all_components)
+        return hasher.hexdigest()
 
-    def _get_merkle_hash(self, components: List[str]) -> str:
-        """Computes a stable hash from a list of string components."""
-        fingerprint = "|".join(components)
-        return hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()
+    def compute_topology_hash(self, graph: Graph) -> str:
+        """
+        Hashes a graph's topology by node position: the node-local fingerprints in
+        `graph.nodes` order, each followed by its incoming edges as (source
+        position, edge type).
+
+        Unlike `compute_hash`, the result doesn't depend on structural ids, which
+        impure tasks salt per instance and pure tasks derive from their literals.
+        Rebuilding the same workflow, e.g. in a new process, gives the same hash,
+        and since the builder adds nodes in a deterministic order, a plan stored
+        by node position applies to every graph with that hash.
+        """
+        hasher = hashlib.sha256()
+        positions = {node.structural_id: i for i, node in enumerate(graph.nodes)}
+        for node in graph.nodes:
+            fingerprint = self._get_node_fingerprint(node)
+            hasher.update(len(fingerprint).to_bytes(4, "little"))
+            hasher.update(fingerprint)
+            edges = sorted(
+                (positions[source_id], edge_type.name)
+                for source_id, edge_type in graph.get_in_links(node.structural_id)
+            )
+            _update_token(hasher, b"E", tuple(edges))
+        return hasher.hexdigest()
+
+    def _get_node_fingerprint(self, node: Node) -> bytes:
+        """
+        Gets the graph-independent components for a single node, normalizing literals.
+        The encoded result is cached on the node, which is immutable once interned.
+        """
+        if node.blueprint_fingerprint is not None:
+            return node.blueprint_fingerprint
 
-    def _get_node_components(self, node: Node, graph: Graph) -> List[str]:
-        """Gets the hash components for a single node, normalizing literals."""
         components = [f"Node({node.name}, type={node.node_type})"]
 
         # Policies are part of the structure
@@ -184,15 +308,88 @@ class BlueprintHasher:
         if node.input_bindings:
             components.append("Bindings:?")
 
+        node.blueprint_fingerprint = "|".join(components).encode("utf-8")
+        return node.blueprint_fingerprint
+
+    def _get_edge_fingerprint(self, node: Node, graph: Graph) -> bytes:
+        """Gets the components for a node's incoming edges within this graph."""
+        incoming_edges = graph.get_in_edges(node.structural_id)
+        if not incoming_edges:
+            return b""
+
         # Dependencies are structural
         # Sort edges to ensure determinism
-        incoming_edges = sorted(
-            [e for e in graph.edges if e.target.structural_id == node.structural_id],
-            key=lambda e: e.source.structural_id,
-        )
-        for edge in incoming_edges:
-            components.append(
-                f"Edge(from={edge.source.structural_id}, to={node.structural_id}, type={edge.edge_type.name})"
-            )
+        node_id = node.structural_id
+        return "".join(
+            f"|Edge(from={edge.source.structural_id}, to={node_id}, type={edge.edge_type.name})"
+            for edge in sorted(incoming_edges, key=_source_id_key)
+        ).encode("utf-8")
+
+
+class StableIdHasher(HashingService):
+    """
+    Computes node ids that survive rebuilding a workflow, e.g. in a new process.
+
+    Structural ids of impure tasks are salted with the LazyResult's uuid, so a
+    rebuilt workflow gets new ones. A stable id covers the same components
+    without the salt: the task, the literal bindings and the stable ids of the
+    upstream nodes. Nodes that would still share an id (identical impure calls)
+    are numbered in graph order, which is the order the builder visits them in.
+    """
 
-        return components
+    # Loop edges may point upstream; they aren't part of a node's inputs.
+    _SKIPPED_EDGES = frozenset({EdgeType.POTENTIAL, EdgeType.ITERATIVE_JUMP})
+
+    def compute_ids(self, graph: Graph) -> Dict[str, str]:
+        """Maps the structural id of every node of `graph` to its stable id."""
+        ids: Dict[str, str] = {}
+        occurrences: Dict[str, int] = {}
+        for root in graph.nodes:
+            if root.structural_id in ids:
+                continue
+            # Iterative post-order walk, so deep chains don't hit the recursion limit
+            stack = [(root, False)]
+            in_progress = set()
+            while stack:
+                node, expanded = stack.pop()
+                node_id = node.structural_id
+                if node_id in ids:
+                    continue
+                if not expanded:
+                    in_progress.add(node_id)
+                    stack.append((node, True))
+                    for edge in reversed(graph.get_in_edges(node_id)):
+                        source_id = edge.source.structural_id
+                        if (
+                            edge.edge_type not in self._SKIPPED_EDGES
+                            and source_id not in ids
+                            and source_id not in in_progress
+                        ):
+                            stack.append((edge.source, False))
+                    continue
+                in_progress.discard(node_id)
+                digest = self._digest(node, graph, ids)
+                count = occurrences.get(digest, 0)
+                occurrences[digest] = count + 1
+                ids[node_id] = f"{digest}:{count}" if count else digest
+        return ids
+
+    def _digest(self, node: Node, graph: Graph, ids: Dict[str, str]) -> str:
+        h = self._new_hash()
+        _update_token(h, b"T", (node.name, node.node_type))
+        h.update(b"B")
+        self._feed(h, node.input_bindings, {})
+        for edge in graph.get_in_edges(node.structural_id):
+            if edge.edge_type in self._SKIPPED_EDGES:
+                continue
+            source_id = ids.get(edge.source.structural_id, "")
+            _update_token(h, b"E", (str(edge.arg_name), edge.edge_type.name, source_id))
+        return h.hexdigest()
+
+
+def _structural_id_key(node: Node) -> str:
+    return node.structural_id
+
+
+def _source_id_key(edge: Any) -> str:
+    return edge.source.structural_id
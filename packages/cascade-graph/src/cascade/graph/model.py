@@ -1,5 +1,16 @@
-from dataclasses import dataclass, field
-from typing import List, Callable, Optional, Any, Dict
+from array import array
+from dataclasses import dataclass, field, fields
+from typing import (
+    List,
+    Callable,
+    Optional,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    Sequence,
+    Tuple,
+)
 from enum import Enum, auto
 import inspect
 
@@ -7,6 +18,11 @@ import inspect
 from cascade.spec.input import ParamSpec
 from cascade.spec.constraint import ResourceConstraint
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 class EdgeType(Enum):
     """Defines the semantic type of a dependency edge."""
@@ -23,6 +39,39 @@ class EdgeType(Enum):
     ITERATIVE_JUMP = auto()  # An explicit state transition (Jump)
 
 
+# Stable integer codes for EdgeType, used by CompactGraph's edge columns.
+_EDGE_TYPES: List[EdgeType] = list(EdgeType)
+_EDGE_TYPE_CODES: Dict[EdgeType, int] = {t: i for i, t in enumerate(_EDGE_TYPES)}
+
+
+def _with_slots(weakref_slot: bool = False):
+    """
+    Rebuilds a dataclass with `__slots__`, like `@dataclass(slots=True)` does on
+    Python >= 3.10, so that instances don't carry a per-instance `__dict__`.
+    """
+
+    def wrap(cls):
+        field_names = tuple(f.name for f in fields(cls))
+        cls_dict = dict(cls.__dict__)
+        cls_dict["__slots__"] = field_names + (
+            ("__weakref__",) if weakref_slot else ()
+        )
+        # Defaults live in the generated __init__; as class attributes they
+        # would conflict with the slot descriptors.
+        for name in field_names:
+            cls_dict.pop(name, None)
+        cls_dict.pop("__dict__", None)
+        cls_dict.pop("__weakref__", None)
+
+        slotted = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+        slotted.__qualname__ = cls.__qualname__
+        return slotted
+
+    return wrap
+
+
+# NodeRegistry(weak_values=True) holds nodes weakly, so Node keeps a weakref slot.
+@_with_slots(weakref_slot=True)
 @dataclass
 class Node:
     """
@@ -42,6 +91,8 @@ class Node:
     signature: Optional[inspect.Signature] = None  # Cached signature for performance
     param_spec: Optional[ParamSpec] = None
     mapping_factory: Optional[Any] = None  # Implements LazyFactory
+    max_concurrency: Optional[int] = None  # Map nodes: elements in flight at once
+    streaming: bool = False  # Map nodes: resolve to an async iterator
 
     # Metadata for execution strategies
     retry_policy: Optional[Any] = None  # Typed as Any to avoid circular deps with spec
@@ -60,6 +111,14 @@ class Node:
     # Cached reflection results
     is_async: bool = False
 
+    # Cached node-local part of the blueprint hash (see BlueprintHasher)
+    blueprint_fingerprint: Optional[bytes] = field(
+        default=None, repr=False, compare=False
+    )
+
+    # Compiled argument layout (see cascade.runtime.binder), set on first resolution
+    binder: Optional[Any] = field(default=None, repr=False, compare=False)
+
     def __post_init__(self):
         if self.callable_obj:
             self.is_async = inspect.iscoroutinefunction(self.callable_obj)
@@ -68,6 +127,7 @@ class Node:
         return hash(self.structural_id)
 
 
+@_with_slots()
 @dataclass
 class Edge:
     """Represents a directed dependency from source node to target node."""
@@ -96,6 +156,28 @@ class Graph:
     # O(1) index for fast lookup
     _node_index: Dict[str, Node] = field(default_factory=dict, init=False, repr=False)
 
+    # Adjacency indexes, maintained by add_edge.
+    # node_id -> edges in insertion order, and node_id -> EdgeType -> edges.
+    _in_edges: Dict[str, List[Edge]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _out_edges: Dict[str, List[Edge]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _in_edges_by_type: Dict[str, Dict[EdgeType, List[Edge]]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _out_edges_by_type: Dict[str, Dict[EdgeType, List[Edge]]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
+    def __post_init__(self):
+        # Index any nodes/edges passed directly to the constructor.
+        for node in self.nodes:
+            self._node_index.setdefault(node.structural_id, node)
+        for edge in self.edges:
+            self._index_edge(edge)
+
     def add_node(self, node: Node):
         if node.structural_id not in self._node_index:
             self.nodes.append(node)
@@ -106,3 +188,323 @@ class Graph:
 
     def add_edge(self, edge: Edge):
         self.edges.append(edge)
+        self._index_edge(edge)
+
+    def _index_edge(self, edge: Edge):
+        source_id = edge.source.structural_id
+        target_id = edge.target.structural_id
+
+        self._in_edges.setdefault(target_id, []).append(edge)
+        self._out_edges.setdefault(source_id, []).append(edge)
+        self._in_edges_by_type.setdefault(target_id, {}).setdefault(
+            edge.edge_type, []
+        ).append(edge)
+        self._out_edges_by_type.setdefault(source_id, {}).setdefault(
+            edge.edge_type, []
+        ).append(edge)
+
+    def get_in_edges(
+        self, node_id: str, edge_type: Optional[EdgeType] = None
+    ) -> List[Edge]:
+        """
+        Returns the edges pointing at `node_id`, in insertion order.
+        If `edge_type` is given, only edges of that type are returned.
+
+        The returned list is the index itself and must not be mutated.
+        """
+        if edge_type is None:
+            return self._in_edges.get(node_id, _EMPTY_EDGES)
+        return self._in_edges_by_type.get(node_id, _EMPTY_INDEX).get(
+            edge_type, _EMPTY_EDGES
+        )
+
+    def get_out_edges(
+        self, node_id: str, edge_type: Optional[EdgeType] = None
+    ) -> List[Edge]:
+        """
+        Returns the edges leaving `node_id`, in insertion order.
+        If `edge_type` is given, only edges of that type are returned.
+
+        The returned list is the index itself and must not be mutated.
+        """
+        if edge_type is None:
+            return self._out_edges.get(node_id, _EMPTY_EDGES)
+        return self._out_edges_by_type.get(node_id, _EMPTY_INDEX).get(
+            edge_type, _EMPTY_EDGES
+        )
+
+    def get_in_links(self, node_id: str) -> List[Tuple[str, EdgeType]]:
+        """
+        Returns `(source id, edge type)` for the edges pointing at `node_id`, in
+        insertion order: the topology of `get_in_edges()`, without Edge objects.
+        """
+        return [
+            (edge.source.structural_id, edge.edge_type)
+            for edge in self._in_edges.get(node_id, _EMPTY_EDGES)
+        ]
+
+    def get_out_links(self, node_id: str) -> List[Tuple[str, EdgeType]]:
+        """
+        Returns `(target id, edge type)` for the edges leaving `node_id`, in
+        insertion order: the topology of `get_out_edges()`, without Edge objects.
+        """
+        return [
+            (edge.target.structural_id, edge.edge_type)
+            for edge in self._out_edges.get(node_id, _EMPTY_EDGES)
+        ]
+
+    def get_router_edges(self) -> List[Edge]:
+        """Returns the edges that carry a Router, in insertion order."""
+        return [edge for edge in self.edges if edge.router is not None]
+
+
+# Shared, read-only sentinels returned for nodes without edges.
+_EMPTY_EDGES: List[Edge] = []
+_EMPTY_INDEX: Dict[EdgeType, List[Edge]] = {}
+
+
+class _EdgeColumnsView(Sequence):
+    """
+    A read-only `Sequence[Edge]` over CompactGraph's edge columns.
+    Edge objects are materialized on access and are not retained.
+    """
+
+    __slots__ = ("_graph",)
+
+    def __init__(self, graph: "CompactGraph"):
+        self._graph = graph
+
+    def __len__(self) -> int:
+        return len(self._graph._edge_sources)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [
+                self._graph._edge_at(i)
+                for i in range(*index.indices(len(self._graph._edge_sources)))
+            ]
+        if index < 0:
+            index += len(self._graph._edge_sources)
+        if not 0 <= index < len(self._graph._edge_sources):
+            raise IndexError("edge index out of range")
+        return self._graph._edge_at(index)
+
+    def __iter__(self) -> Iterator[Edge]:
+        edge_at = self._graph._edge_at
+        for i in range(len(self._graph._edge_sources)):
+            yield edge_at(i)
+
+    def __repr__(self) -> str:
+        return f"<{len(self)} edges>"
+
+
+class CompactGraph(Graph):
+    """
+    A memory-compact Graph for very large (e.g. map-heavy) workflows.
+
+    Nodes get integer indexes (their position in `nodes`) and edges are stored
+    in parallel `array` columns instead of Edge objects:
+
+    - `source` / `target`: node indexes
+    - `type`: EdgeType code
+    - `arg`: id of the interned argument name
+
+    Routers and jump selectors, which only a few edges carry, live in sparse
+    side tables. The public Graph API is unchanged: `edges` is a read-only
+    sequence and `get_in_edges()`/`get_out_edges()` return lists, both of which
+    materialize short-lived Edge objects on access. Consumers that only need
+    the topology use `get_in_links()`/`get_out_links()`, which read the CSR
+    index and the columns directly.
+
+    The adjacency index is built in one pass on the first edge query after a
+    modification, so graphs should be fully built before they are queried.
+    """
+
+    def __init__(
+        self,
+        nodes: Optional[Iterable[Node]] = None,
+        edges: Optional[Iterable[Edge]] = None,
+    ):
+        self.nodes: List[Node] = []
+        self._node_index: Dict[str, Node] = {}
+        self._node_positions: Dict[str, int] = {}
+
+        self._edge_sources = array("i")
+        self._edge_targets = array("i")
+        self._edge_types = array("B")
+        self._edge_args = array("i")
+        self._arg_names: List[str] = []
+        self._arg_name_ids: Dict[str, int] = {}
+        self._routers: Dict[int, Any] = {}
+        self._jump_selectors: Dict[int, Any] = {}
+
+        # CSR adjacency (offsets per node, edge indexes grouped by node),
+        # rebuilt lazily after modifications.
+        self._csr: Optional[tuple] = None
+
+        for node in nodes or ():
+            self.add_node(node)
+        for edge in edges or ():
+            self.add_edge(edge)
+
+    @property
+    def edges(self) -> Sequence[Edge]:
+        return _EdgeColumnsView(self)
+
+    def __repr__(self) -> str:
+        return (
+            f"CompactGraph(nodes={len(self.nodes)}, "
+            f"edges={len(self._edge_sources)})"
+        )
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Graph):
+            return NotImplemented
+        return self.nodes == other.nodes and list(self.edges) == list(other.edges)
+
+    __hash__ = None
+
+    def add_node(self, node: Node):
+        if node.structural_id not in self._node_index:
+            self._node_positions[node.structural_id] = len(self.nodes)
+            self.nodes.append(node)
+            self._node_index[node.structural_id] = node
+
+    def node_position(self, node_id: str) -> Optional[int]:
+        """Returns the integer index of a node (its position in `nodes`)."""
+        return self._node_positions.get(node_id)
+
+    def add_edge(self, edge: Edge):
+        # Edges may reference nodes that were not added explicitly
+        self.add_node(edge.source)
+        self.add_node(edge.target)
+
+        arg_id = self._arg_name_ids.get(edge.arg_name)
+        if arg_id is None:
+            arg_id = len(self._arg_names)
+            self._arg_names.append(edge.arg_name)
+            self._arg_name_ids[edge.arg_name] = arg_id
+
+        index = len(self._edge_sources)
+        self._edge_sources.append(self._node_positions[edge.source.structural_id])
+        self._edge_targets.append(self._node_positions[edge.target.structural_id])
+        self._edge_types.append(_EDGE_TYPE_CODES[edge.edge_type])
+        self._edge_args.append(arg_id)
+        if edge.router is not None:
+            self._routers[index] = edge.router
+        if edge.jump_selector is not None:
+            self._jump_selectors[index] = edge.jump_selector
+        self._csr = None
+
+    def _edge_at(self, index: int) -> Edge:
+        return Edge(
+            source=self.nodes[self._edge_sources[index]],
+            target=self.nodes[self._edge_targets[index]],
+            arg_name=self._arg_names[self._edge_args[index]],
+            edge_type=_EDGE_TYPES[self._edge_types[index]],
+            router=self._routers.get(index),
+            jump_selector=self._jump_selectors.get(index),
+        )
+
+    def _build_csr(self) -> tuple:
+        n_nodes = len(self.nodes)
+        return (
+            _group_by_node(self._edge_targets, n_nodes),
+            _group_by_node(self._edge_sources, n_nodes),
+        )
+
+    def _adjacent_edges(
+        self, node_id: str, edge_type: Optional[EdgeType], incoming: bool
+    ) -> List[Edge]:
+        position = self._node_positions.get(node_id)
+        if position is None:
+            return []
+        if self._csr is None:
+            self._csr = self._build_csr()
+        offsets, order = self._csr[0] if incoming else self._csr[1]
+
+        edge_indexes = order[offsets[position] : offsets[position + 1]]
+        if edge_type is not None:
+            code = _EDGE_TYPE_CODES[edge_type]
+            types = self._edge_types
+            edge_indexes = [i for i in edge_indexes if types[i] == code]
+        return [self._edge_at(i) for i in edge_indexes]
+
+    def get_in_edges(
+        self, node_id: str, edge_type: Optional[EdgeType] = None
+    ) -> List[Edge]:
+        """Returns the edges pointing at `node_id`, in insertion order."""
+        return self._adjacent_edges(node_id, edge_type, incoming=True)
+
+    def get_out_edges(
+        self, node_id: str, edge_type: Optional[EdgeType] = None
+    ) -> List[Edge]:
+        """Returns the edges leaving `node_id`, in insertion order."""
+        return self._adjacent_edges(node_id, edge_type, incoming=False)
+
+    def _adjacent_links(
+        self, node_id: str, incoming: bool
+    ) -> List[Tuple[str, EdgeType]]:
+        position = self._node_positions.get(node_id)
+        if position is None:
+            return []
+        if self._csr is None:
+            self._csr = self._build_csr()
+        offsets, order = self._csr[0] if incoming else self._csr[1]
+
+        # Read straight from the columns: no Edge objects are created
+        ends = self._edge_sources if incoming else self._edge_targets
+        nodes = self.nodes
+        types = self._edge_types
+        return [
+            (nodes[ends[i]].structural_id, _EDGE_TYPES[types[i]])
+            for i in order[offsets[position] : offsets[position + 1]]
+        ]
+
+    def get_in_links(self, node_id: str) -> List[Tuple[str, EdgeType]]:
+        """Returns `(source id, edge type)` for the edges pointing at `node_id`."""
+        return self._adjacent_links(node_id, incoming=True)
+
+    def get_out_links(self, node_id: str) -> List[Tuple[str, EdgeType]]:
+        """Returns `(target id, edge type)` for the edges leaving `node_id`."""
+        return self._adjacent_links(node_id, incoming=False)
+
+    def get_router_edges(self) -> List[Edge]:
+        """Returns the edges that carry a Router, from the sparse side table."""
+        return [self._edge_at(i) for i in sorted(self._routers)]
+
+    def edge_columns(self) -> Dict[str, Any]:
+        """
+        Returns the raw edge columns as NumPy arrays (zero-copy views), for
+        vectorized consumers. The arrays are only valid until the next `add_edge`.
+        """
+        if np is None:
+            raise ImportError(
+                "The 'numpy' library is required to use CompactGraph.edge_columns()."
+            )
+        return {
+            "source": np.frombuffer(self._edge_sources, dtype=np.int32),
+            "target": np.frombuffer(self._edge_targets, dtype=np.int32),
+            "type": np.frombuffer(self._edge_types, dtype=np.uint8),
+            "arg": np.frombuffer(self._edge_args, dtype=np.int32),
+        }
+
+
+def _group_by_node(keys: array, n_nodes: int) -> tuple:
+    """
+    Stable counting sort of edge indexes by node index.
+    Returns (offsets, order): the edges of node `i` are
+    `order[offsets[i]:offsets[i + 1]]`, in insertion order.
+    """
+    offsets = array("i", [0]) * (n_nodes + 1)
+    for key in keys:
+        offsets[key + 1] += 1
+    for i in range(n_nodes):
+        offsets[i + 1] += offsets[i]
+
+    order = array("i", [0]) * len(keys)
+    cursor = offsets[:-1]
+    for edge_index, key in enumerate(keys):
+        order[cursor[key]] = edge_index
+        cursor[key] += 1
+    return offsets, order
@@ -1,4 +1,6 @@
-from typing import Dict, Callable
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from cascade.graph.model import Node
 
 
@@ -6,15 +8,88 @@ class NodeRegistry:
     """
     A session-level registry that ensures any structurally identical node
     is represented by a single, unique object in memory (interning).
+
+    By default the registry grows without bound. For long-lived engines it can
+    be bounded with any combination of eviction policies:
+
+    - `max_size`: keeps at most this many entries, evicting the least recently used.
+    - `weak_values`: holds nodes weakly, so entries disappear once no graph uses them.
+    - `max_generations`: on each `begin_generation()` (one per run), evicts entries
+      that have not been used during the last `max_generations` generations.
+
+    Eviction only affects interning: an evicted node is simply rebuilt (with the
+    same structural_id) the next time it is needed.
     """
 
-    def __init__(self):
-        # Maps a node's shallow structural hash to the Node object
-        self._registry: Dict[str, Node] = {}
+    def __init__(
+        self,
+        max_size: Optional[int] = None,
+        weak_values: bool = False,
+        max_generations: Optional[int] = None,
+    ):
+        if max_size is not None and max_size < 1:
+            raise ValueError("max_size must be a positive integer or None.")
+        if max_generations is not None and max_generations < 0:
+            raise ValueError("max_generations must be a non-negative integer or None.")
+
+        self.max_size = max_size
+        self.weak_values = weak_values
+        self.max_generations = max_generations
+
+        # Maps a node's shallow structural hash to (Node or weakref, last-used generation).
+        # Ordered from least to most recently used.
+        self._registry: "OrderedDict[str, Tuple[Any, int]]" = OrderedDict()
+        # Keys of weakly-held nodes that were garbage collected, purged lazily.
+        self._pending_removals: List[Tuple[str, Any]] = []
+
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        self._purge_pending()
+        return len(self._registry)
 
     def get(self, key: str) -> Node | None:
         """Gets a node by its structural hash key."""
-        return self._registry.get(key)
+        entry = self._registry.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        value, generation = entry
+        node = value() if self.weak_values else value
+        if node is None:
+            # The weakly-held node was collected but not purged yet
+            del self._registry[key]
+            self.evictions += 1
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        if generation != self.generation:
+            self._registry[key] = (value, self.generation)
+        self._registry.move_to_end(key)
+        return node
+
+    def put(self, key: str, node: Node) -> None:
+        """Registers a node under its structural hash key."""
+        self._purge_pending()
+
+        if self.weak_values:
+            pending = self._pending_removals
+            value = weakref.ref(node, lambda ref, key=key: pending.append((key, ref)))
+        else:
+            value = node
+
+        self._registry[key] = (value, self.generation)
+        self._registry.move_to_end(key)
+
+        if self.max_size is not None:
+            while len(self._registry) > self.max_size:
+                self._registry.popitem(last=False)
+                self.evictions += 1
 
     def get_or_create(
         self, key: str, node_factory: Callable[[], Node]
@@ -30,5 +105,57 @@ class NodeRegistry:
             return existing_node, False
 
         new_node = node_factory()
-        self._registry[key] = new_node
+        self.put(key, new_node)
         return new_node, True
+
+    def begin_generation(self) -> int:
+        """
+        Starts a new generation (typically one per workflow run).
+        If `max_generations` is set, stale entries are swept.
+        """
+        self.generation += 1
+        if self.max_generations is not None:
+            self.sweep(self.max_generations)
+        return self.generation
+
+    def sweep(self, max_generations: int) -> int:
+        """
+        Evicts all entries not used during the last `max_generations` generations.
+        Returns the number of evicted entries.
+        """
+        self._purge_pending()
+        cutoff = self.generation - max_generations
+        evicted = 0
+        # Entries are ordered by last use, so stale ones are all at the front.
+        while self._registry:
+            key, (_, generation) = next(iter(self._registry.items()))
+            if generation >= cutoff:
+                break
+            del self._registry[key]
+            evicted += 1
+
+        self.evictions += evicted
+        return evicted
+
+    def clear(self) -> None:
+        """Removes all entries. Counters are preserved."""
+        self._registry.clear()
+        self._pending_removals.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Returns a snapshot of the registry's size and hit/miss/eviction counters."""
+        return {
+            "size": len(self),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "generation": self.generation,
+        }
+
+    def _purge_pending(self) -> None:
+        while self._pending_removals:
+            key, ref = self._pending_removals.pop()
+            entry = self._registry.get(key)
+            if entry is not None and entry[0] is ref:
+                del self._registry[key]
+                self.evictions += 1
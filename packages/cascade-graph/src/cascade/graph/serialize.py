@@ -114,6 +114,10 @@ def _node_to_dict(node: Node) -> Dict[str, Any]:
 
     if node.mapping_factory:
         data["mapping_factory"] = _get_func_path(node.mapping_factory)
+        if node.max_concurrency:
+            data["max_concurrency"] = node.max_concurrency
+        if node.streaming:
+            data["streaming"] = True
 
     if node.param_spec:
         data["param_spec"] = {
@@ -247,6 +251,8 @@ def _dict_to_node(data: Dict[str, Any]) -> Node:
         node_type=data["node_type"],
         callable_obj=_load_func_from_path(data.get("callable")),
         mapping_factory=_load_func_from_path(data.get("mapping_factory")),
+        max_concurrency=data.get("max_concurrency"),
+        streaming=data.get("streaming", False),
         param_spec=param_spec,
         retry_policy=retry_policy,
         constraints=constraints,
@@ -1,5 +1,6 @@
 import cascade as cs
-from cascade.graph.build import build_graph
+from cascade.graph.build import build_graph, BuildMemo
+from cascade.graph.model import EdgeType
 
 
 def test_build_linear_graph():
@@ -111,3 +112,144 @@ def test_build_graph_with_nested_dependencies():
     assert "t_b" in node_names
     assert "t_c" in node_names
     assert "t_main" in node_names
+
+
+def test_graph_indexes_edges_by_node_and_type():
+    @cs.task
+    def source():
+        return 1
+
+    @cs.task
+    def flag():
+        return True
+
+    @cs.task
+    def consumer(x, y):
+        return x + y
+
+    r_src = source()
+    r_flag = flag()
+    target = consumer(r_src, y=r_src).run_if(r_flag)
+
+    graph, instance_map = build_graph(target)
+    src_id = instance_map[r_src._uuid].structural_id
+    flag_id = instance_map[r_flag._uuid].structural_id
+    target_id = instance_map[target._uuid].structural_id
+
+    # All incoming edges, in insertion order, mirror a scan of graph.edges
+    assert graph.get_in_edges(target_id) == [
+        e for e in graph.edges if e.target.structural_id == target_id
+    ]
+
+    data_edges = graph.get_in_edges(target_id, EdgeType.DATA)
+    assert [e.arg_name for e in data_edges] == ["0", "y"]
+
+    cond_edges = graph.get_in_edges(target_id, EdgeType.CONDITION)
+    assert [e.source.structural_id for e in cond_edges] == [flag_id]
+
+    assert len(graph.get_out_edges(src_id)) == 2
+    assert graph.get_out_edges(src_id, EdgeType.CONDITION) == []
+    assert graph.get_in_edges("unknown") == []
+
+
+def _graph_signature(graph):
+    return (
+        [n.structural_id for n in graph.nodes],
+        [
+            (e.source.structural_id, e.target.structural_id, e.arg_name, e.edge_type)
+            for e in graph.edges
+        ],
+    )
+
+
+def test_incremental_build_matches_full_build():
+    @cs.task
+    def fetch(i):
+        return i
+
+    @cs.task
+    def flag():
+        return True
+
+    @cs.task
+    def merge(items, extra=None):
+        return items
+
+    @cs.task
+    def step(ctx):
+        return cs.Jump(target_key="exit", data=ctx)
+
+    context = merge([fetch(i) for i in range(3)], extra=fetch.map(i=[1, 2]))
+    gated = merge(context).run_if(flag()).after(fetch(9))
+    loop = step(gated)
+    cs.bind(loop, cs.select_jump({"loop": loop, "exit": None}))
+
+    memo = BuildMemo()
+    full_graph, full_map = build_graph(loop)
+    first_graph, _ = build_graph(loop, memo=memo)
+    assert memo.hits == 0
+
+    replayed_graph, replayed_map = build_graph(loop, memo=memo)
+    # Every LazyResult is replayed from its fragment, none is rebuilt
+    assert memo.hits == memo.misses == len(memo)
+    assert _graph_signature(replayed_graph) == _graph_signature(full_graph)
+    assert _graph_signature(first_graph) == _graph_signature(full_graph)
+    assert replayed_map.keys() == full_map.keys()
+
+
+def test_incremental_build_only_visits_new_lazy_results():
+    @cs.task
+    def fetch(i):
+        return i
+
+    @cs.task
+    def think(ctx, prompt):
+        return ctx
+
+    shared_context = [fetch(i) for i in range(10)]
+    memo = BuildMemo()
+
+    build_graph(think(shared_context, "first"), memo=memo)
+    misses_after_first = memo.misses
+
+    # A new head on top of the shared context only builds the new node
+    second = think(shared_context, "second")
+    graph, instance_map = build_graph(second, memo=memo)
+
+    assert memo.misses == misses_after_first + 1
+    assert memo.hits == 10
+    assert len(graph.nodes) == 11
+    assert second._uuid in instance_map
+
+
+def test_build_chain_deeper_than_recursion_limit():
+    """The builder uses an explicit stack, so deep chains don't overflow."""
+    import sys
+
+    @cs.task
+    def step(x):
+        return x
+
+    @cs.task
+    def tick():
+        return None
+
+    depth = sys.getrecursionlimit() * 2
+    data_chain = cs.pipeline(0, [step] * depth)
+    sequenced = cs.sequence([tick() for _ in range(depth)])
+
+    for target in (data_chain, sequenced):
+        graph, instance_map = build_graph(target)
+
+        assert len(graph.nodes) == depth
+        assert len(graph.edges) == depth - 1
+        # Post-order: the target is the last node to be added
+        assert graph.nodes[-1] is instance_map[target._uuid]
+        assert graph.nodes[-1] is graph.edges[-1].target
+
+    # Replaying a deep chain from the memo doesn't overflow either
+    memo = BuildMemo()
+    build_graph(data_chain, memo=memo)
+    graph, _ = build_graph(data_chain, memo=memo)
+    assert memo.hits == depth
+    assert len(graph.nodes) == depth
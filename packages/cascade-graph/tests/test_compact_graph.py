@@ -0,0 +1,120 @@
+import pickle
+import weakref
+
+import pytest
+
+import cascade as cs
+from cascade.adapters.solvers.native import NativeSolver
+from cascade.graph.build import build_graph
+from cascade.graph.model import CompactGraph, Edge, EdgeType, Graph, Node
+from cascade.graph.registry import NodeRegistry
+
+
+def _edge_signature(edge):
+    return (
+        edge.source.structural_id,
+        edge.target.structural_id,
+        edge.arg_name,
+        edge.edge_type,
+        edge.router,
+        edge.jump_selector,
+    )
+
+
+def _build_both():
+    @cs.task(pure=True)
+    def fetch(i):
+        return i
+
+    @cs.task(pure=True)
+    def flag():
+        return True
+
+    @cs.task(pure=True)
+    def merge(items, route=None):
+        return items
+
+    router = cs.Router(selector=fetch("key"), routes={"a": fetch("a"), "b": fetch("b")})
+    target = merge([fetch(i) for i in range(5)], route=router).run_if(flag())
+    # A shared registry makes both graphs use the same Node objects
+    registry = NodeRegistry()
+    return (
+        build_graph(target, registry=registry),
+        build_graph(target, registry=registry, compact=True),
+    )
+
+
+def test_compact_graph_matches_graph_api():
+    (graph, _), (compact, _) = _build_both()
+
+    assert isinstance(compact, CompactGraph)
+    assert compact.nodes == graph.nodes
+    assert len(compact.edges) == len(graph.edges)
+    assert [_edge_signature(e) for e in compact.edges] == [
+        _edge_signature(e) for e in graph.edges
+    ]
+    assert _edge_signature(compact.edges[-1]) == _edge_signature(graph.edges[-1])
+
+    for node in graph.nodes:
+        node_id = node.structural_id
+        assert compact.get_node(node_id) is node
+        assert compact.nodes[compact.node_position(node_id)] is node
+        for edge_type in (None, EdgeType.DATA, EdgeType.ROUTER_ROUTE):
+            assert [
+                _edge_signature(e) for e in compact.get_in_edges(node_id, edge_type)
+            ] == [_edge_signature(e) for e in graph.get_in_edges(node_id, edge_type)]
+            assert [
+                _edge_signature(e) for e in compact.get_out_edges(node_id, edge_type)
+            ] == [_edge_signature(e) for e in graph.get_out_edges(node_id, edge_type)]
+        assert compact.get_in_links(node_id) == graph.get_in_links(node_id)
+        assert compact.get_out_links(node_id) == graph.get_out_links(node_id)
+
+    assert [_edge_signature(e) for e in compact.get_router_edges()] == [
+        _edge_signature(e) for e in graph.get_router_edges()
+    ]
+    assert len(graph.get_router_edges()) == 1
+    assert compact.get_in_edges("missing") == []
+    assert compact.get_in_links("missing") == []
+    assert [
+        [n.structural_id for n in stage] for stage in NativeSolver().resolve(compact)
+    ] == [[n.structural_id for n in stage] for stage in NativeSolver().resolve(graph)]
+
+
+def test_compact_graph_reindexes_after_modification():
+    a, b, c = Node("a", "a"), Node("b", "b"), Node("c", "c")
+    graph = CompactGraph(nodes=[a, b])
+    graph.add_edge(Edge(a, b, "0"))
+    assert [e.source for e in graph.get_in_edges("b")] == [a]
+
+    # Edges may introduce new nodes, and queries see edges added later
+    graph.add_edge(Edge(c, b, "1", edge_type=EdgeType.SEQUENCE))
+    assert graph.nodes == [a, b, c]
+    assert [e.source for e in graph.get_in_edges("b")] == [a, c]
+    assert [e.arg_name for e in graph.get_in_edges("b", EdgeType.SEQUENCE)] == ["1"]
+    assert graph == Graph(nodes=[a, b, c], edges=list(graph.edges))
+
+
+def test_compact_graph_edge_columns():
+    np = pytest.importorskip("numpy")
+    _, (compact, _) = _build_both()
+
+    columns = compact.edge_columns()
+    assert len(columns["source"]) == len(compact.edges)
+    for i, edge in enumerate(compact.edges):
+        assert compact.nodes[columns["source"][i]] is edge.source
+        assert compact.nodes[columns["target"][i]] is edge.target
+    assert set(np.unique(columns["type"])) == {
+        list(EdgeType).index(t) for t in {e.edge_type for e in compact.edges}
+    }
+
+
+def test_nodes_and_edges_are_slotted():
+    node = Node("a", "a")
+    edge = Edge(node, node, "0")
+    assert not hasattr(node, "__dict__")
+    assert not hasattr(edge, "__dict__")
+    # NodeRegistry(weak_values=True) relies on weak references to nodes
+    assert weakref.ref(node)() is node
+
+    restored = pickle.loads(pickle.dumps(edge))
+    assert restored == edge
@@ -117,3 +117,20 @@ def test_compile_diamond_dependency():
         if i.func == add_one.func and isinstance(i.args[0], Literal)
     ]
     assert len(root_calls) == 1
+
+
+def test_compile_chain_deeper_than_recursion_limit():
+    """The compiler uses an explicit stack, so deep chains don't overflow."""
+    import sys
+
+    depth = sys.getrecursionlimit() * 2
+    target = add_one(0)
+    for _ in range(depth - 1):
+        target = add_one(target)
+
+    blueprint = BlueprintBuilder().build(target)
+
+    assert len(blueprint.instructions) == depth
+    # Post-order: every instruction reads the register written just before it
+    for prev, instr in zip(blueprint.instructions, blueprint.instructions[1:]):
+        assert instr.args[0] == prev.output
@@ -1,5 +1,11 @@
+import hashlib
+
+import pytest
+
 from cascade import task
 from cascade.graph.build import build_graph
+from cascade.graph.hashing import BlueprintHasher, HashingService, StableIdHasher
+from cascade.graph.model import Graph
 
 
 def test_hashing_distinguishes_nested_lazy_results():
@@ -36,3 +42,174 @@ def test_hashing_distinguishes_nested_lazy_results():
     assert node1.structural_id != node2.structural_id, (
         "Hasher must distinguish between different nested LazyResult dependencies"
     )
+
+
+def _legacy_blueprint_hash(graph):
+    """Reference implementation: a single sha256 over all '|'-joined components."""
+    components = []
+    for node in sorted(graph.nodes, key=lambda n: n.structural_id):
+        components.append(f"Node({node.name}, type={node.node_type})")
+        if node.retry_policy:
+            rp = node.retry_policy
+            components.append(f"Retry({rp.max_attempts},{rp.delay},{rp.backoff})")
+        if node.cache_policy:
+            components.append(f"Cache({type(node.cache_policy).__name__})")
+        if node.input_bindings:
+            components.append("Bindings:?")
+        incoming = sorted(
+            [e for e in graph.edges if e.target.structural_id == node.structural_id],
+            key=lambda e: e.source.structural_id,
+        )
+        for edge in incoming:
+            components.append(
+                f"Edge(from={edge.source.structural_id}, to={node.structural_id}, type={edge.edge_type.name})"
+            )
+    return hashlib.sha256("|".join(components).encode("utf-8")).hexdigest()
+
+
+def test_blueprint_hash_is_stable_across_implementations():
+    @task(pure=True)
+    def source(x):
+        return x
+
+    @task(pure=True)
+    def flag():
+        return True
+
+    @task(pure=True)
+    def combine(a, b, c=None):
+        return a
+
+    a = source(1)
+    b = source(2).with_retry(max_attempts=2, delay=0.1)
+    target = combine(a, b, c=[a, b]).run_if(flag()).after(source(3))
+
+    graph, _ = build_graph(target)
+    hasher = BlueprintHasher()
+
+    expected = _legacy_blueprint_hash(graph)
+    assert hasher.compute_hash(graph) == expected
+    # Second call hits the cached per-node fingerprints
+    assert hasher.compute_hash(graph) == expected
+
+
+def test_blueprint_hash_of_empty_graph():
+    assert BlueprintHasher().compute_hash(Graph()) == hashlib.sha256(b"").hexdigest()
+
+
+def _root_id(target, hashing_service=None):
+    _, instance_map = build_graph(target, hashing_service=hashing_service)
+    return instance_map[target._uuid].structural_id
+
+
+def test_structural_hash_distinguishes_literal_types():
+    @task(pure=True)
+    def ident(x):
+        return x
+
+    ids = {_root_id(ident(v)) for v in (1, "1", True, 1.0, None, b"1", [1], (1,))}
+    assert len(ids) == 8
+
+    # Equal literals still de-duplicate
+    assert _root_id(ident([1, "a", {"k": 2.5}])) == _root_id(
+        ident([1, "a", {"k": 2.5}])
+    )
+
+
+def test_structural_hash_ignores_dict_insertion_order():
+    @task(pure=True)
+    def ident(x):
+        return x
+
+    assert _root_id(ident({"a": 1, "b": 2})) == _root_id(ident({"b": 2, "a": 1}))
+    assert _root_id(ident({"a": 1})) != _root_id(ident({"a": 2}))
+
+
+def test_structural_hash_encodes_container_subclasses_by_content():
+    from collections import OrderedDict, defaultdict, namedtuple
+
+    @task(pure=True)
+    def ident(x):
+        return x
+
+    # Their repr() holds the address of the default factory
+    def counts(**items):
+        table = defaultdict(lambda: 0)
+        table.update(items)
+        return table
+
+    assert _root_id(ident(counts(a=1))) == _root_id(ident(counts(a=1)))
+    assert _root_id(ident(counts(a=1))) != _root_id(ident(counts(a=2)))
+    # Tagged with their type
+    assert _root_id(ident(OrderedDict(a=1))) != _root_id(ident({"a": 1}))
+    assert _root_id(ident(OrderedDict(a=1))) != _root_id(ident(counts(a=1)))
+
+    Pair = namedtuple("Pair", "left right")
+    assert _root_id(ident(Pair(1, [2]))) == _root_id(ident(Pair(1, [2])))
+    assert _root_id(ident(Pair(1, [2]))) != _root_id(ident((1, [2])))
+
+    # Dependencies inside them are referenced by structural id
+    assert _root_id(ident(OrderedDict(x=ident(1)))) == _root_id(
+        ident(OrderedDict(x=ident(1)))
+    )
+    assert _root_id(ident(OrderedDict(x=ident(1)))) != _root_id(
+        ident(OrderedDict(x=ident(2)))
+    )
+
+
+def test_structural_hash_of_numpy_arrays_uses_dtype_shape_and_data():
+    np = pytest.importorskip("numpy")
+
+    @task(pure=True)
+    def ident(x):
+        return x
+
+    base = np.arange(6, dtype=np.int64)
+    assert _root_id(ident(base)) == _root_id(ident(base.copy()))
+    assert _root_id(ident(base)) != _root_id(ident(base.astype(np.int32)))
+    assert _root_id(ident(base)) != _root_id(ident(base.reshape(2, 3)))
+    assert _root_id(ident(base)) != _root_id(ident(base + 1))
+    # Non-contiguous views are hashed from a contiguous copy
+    matrix = base.reshape(2, 3)
+    assert _root_id(ident(matrix.T)) == _root_id(ident(np.ascontiguousarray(matrix.T)))
+
+
+@pytest.mark.parametrize("algorithm", ["sha256", "blake2b"])
+def test_structural_hash_algorithms(algorithm):
+    @task(pure=True)
+    def ident(x):
+        return x
+
+    service = HashingService(algorithm=algorithm)
+    node_id = _root_id(ident(ident(1)), hashing_service=service)
+    assert len(node_id) == 64
+    assert node_id == _root_id(ident(ident(1)), hashing_service=service)
+
+
+def test_structural_hash_rejects_unknown_algorithm():
+    with pytest.raises(ValueError):
+        HashingService(algorithm="md5")
+
+
+def test_stable_ids_survive_a_rebuild():
+    @task
+    def load(x):
+        return x
+
+    @task
+    def total(*values):
+        return sum(values)
+
+    def build(x):
+        graph, instance_map = build_graph(total(load(x), load(2), load(2)))
+        return graph
+
+    hasher = StableIdHasher()
+    first = hasher.compute_ids(build(1))
+
+    # Impure nodes get new structural ids, but keep their stable ids
+    assert set(first.values()) == set(hasher.compute_ids(build(1)).values())
+    assert set(first) != set(hasher.compute_ids(build(1)))
+    # Identical impure calls are still told apart
+    assert len(set(first.values())) == 4
+    assert set(first.values()) != set(hasher.compute_ids(build(3)).values())
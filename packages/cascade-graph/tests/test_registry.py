@@ -0,0 +1,82 @@
+import gc
+
+import pytest
+
+from cascade.graph.model import Node
+from cascade.graph.registry import NodeRegistry
+
+
+def make_node(key: str) -> Node:
+    return Node(structural_id=key, name=key)
+
+
+def test_registry_interns_and_counts_hits_and_misses():
+    registry = NodeRegistry()
+
+    node, created = registry.get_or_create("a", lambda: make_node("a"))
+    assert created
+    same, created_again = registry.get_or_create("a", lambda: make_node("a"))
+    assert not created_again
+    assert same is node
+
+    assert registry.stats() == {
+        "size": 1,
+        "hits": 1,
+        "misses": 1,
+        "evictions": 0,
+        "generation": 0,
+    }
+
+
+def test_registry_max_size_evicts_least_recently_used():
+    registry = NodeRegistry(max_size=2)
+    registry.put("a", make_node("a"))
+    registry.put("b", make_node("b"))
+
+    # Touch "a" so that "b" becomes the LRU entry
+    assert registry.get("a") is not None
+    registry.put("c", make_node("c"))
+
+    assert len(registry) == 2
+    assert registry.get("b") is None
+    assert registry.get("a") is not None
+    assert registry.get("c") is not None
+    assert registry.evictions == 1
+
+
+def test_registry_weak_values_drop_unreferenced_nodes():
+    registry = NodeRegistry(weak_values=True)
+    node = make_node("a")
+    registry.put("a", node)
+    assert registry.get("a") is node
+
+    del node
+    gc.collect()
+
+    assert registry.get("a") is None
+    assert len(registry) == 0
+    assert registry.evictions == 1
+
+
+def test_registry_generation_sweep_evicts_stale_entries():
+    registry = NodeRegistry(max_generations=1)
+
+    registry.begin_generation()  # generation 1
+    registry.put("old", make_node("old"))
+    registry.put("kept", make_node("kept"))
+
+    registry.begin_generation()  # generation 2: everything from gen 1 survives
+    assert len(registry) == 2
+    assert registry.get("kept") is not None  # refreshed to gen 2
+
+    registry.begin_generation()  # generation 3: "old" was last used in gen 1
+    assert registry.get("old") is None
+    assert registry.get("kept") is not None
+    assert registry.evictions == 1
+
+
+def test_registry_rejects_invalid_bounds():
+    with pytest.raises(ValueError):
+        NodeRegistry(max_size=0)
+    with pytest.raises(ValueError):
+        NodeRegistry(max_generations=-1)
@@ -9,6 +9,10 @@ from cascade.adapters.solvers.native import NativeSolver
 from cascade.adapters.executors.local import LocalExecutor
 from cascade.runtime.bus import MessageBus
 
+# Shared by all subflow engines, so that nested or repeated subflows reuse one
+# set of thread pools instead of creating new ones per call.
+_subflow_executor = LocalExecutor()
+
 
 class SubflowProvider(Provider):
     name = "subflow"
@@ -60,7 +64,7 @@ async def _subflow_task(
     sub_bus = MessageBus()
     sub_engine = Engine(
         solver=NativeSolver(),
-        executor=LocalExecutor(),
+        executor=_subflow_executor,
         bus=sub_bus,
         # TODO: Consider passing system_resources from parent?
         # For now, use default (unlimited) or let OS handle resource contention.
@@ -1,9 +1,10 @@
-import pickle
+import asyncio
 import logging
 from typing import Any, Optional
 import aiohttp
 
 from cascade.spec.protocols import CacheBackend
+from cascade.adapters.serializers import ResultCodec
 
 logger = logging.getLogger(__name__)
 
@@ -23,14 +24,17 @@ class IpfsCacheBackend(CacheBackend):
         self,
         metadata_backend: CacheBackend,
         ipfs_api_url: str = "http://127.0.0.1:5001",
+        codec: Optional[ResultCodec] = None,
     ):
         """
         Args:
             metadata_backend: A fast K-V backend to store Key->CID mappings.
             ipfs_api_url: The base URL of the IPFS RPC API (default: local Kubo node).
+            codec: How values are serialized (default: pickle, see ResultCodec).
         """
         self._meta_db = metadata_backend
         self._api_base = ipfs_api_url.rstrip("/")
+        self._codec = codec if codec is not None else ResultCodec()
 
     async def get(self, key: str) -> Optional[Any]:
         """Retrieves a CID from metadata and then fetches content from IPFS."""
@@ -53,7 +57,7 @@ class IpfsCacheBackend(CacheBackend):
                     data = await resp.read()
 
             # 3. Deserialize
-            return pickle.loads(data)
+            return await asyncio.to_thread(self._codec.decode, data)
         except Exception as e:
             logger.error(f"Error reading from IPFS cache (key={key}, cid={cid}): {e}")
             return None
@@ -62,7 +66,7 @@ class IpfsCacheBackend(CacheBackend):
         """Serializes value, adds it to IPFS to get a CID, then stores key->CID mapping."""
         try:
             # 1. Serialize
-            data = pickle.dumps(value)
+            data = await asyncio.to_thread(self._codec.encode, value)
 
             # 2. Upload to IPFS
             async with aiohttp.ClientSession() as session:
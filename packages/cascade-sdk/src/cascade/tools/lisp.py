@@ -109,12 +109,7 @@ class LispTranspiler:
                 max_pos = max(max_pos, int(k))
 
         # Check edges
-        incoming_edges = [
-            e
-            for e in self.graph.edges
-            if e.target.structural_id == node.structural_id
-            and e.edge_type == EdgeType.DATA
-        ]
+        incoming_edges = self.graph.get_in_edges(node.structural_id, EdgeType.DATA)
         edge_map = {e.arg_name: e for e in incoming_edges}
 
         for k in edge_map:
@@ -149,12 +144,7 @@ class LispTranspiler:
                 parts.append("nil")
 
         # 3. Conditions (run_if)
-        cond_edges = [
-            e
-            for e in self.graph.edges
-            if e.target.structural_id == node.structural_id
-            and e.edge_type == EdgeType.CONDITION
-        ]
+        cond_edges = self.graph.get_in_edges(node.structural_id, EdgeType.CONDITION)
         if cond_edges:
             parts.append(":run-if")
             parts.append(self._render_edge_ref(cond_edges[0]))
@@ -232,11 +222,7 @@ class LispTranspiler:
         while queue:
             n = queue.pop(0)
             # Find incoming edges
-            incoming = [
-                e.source
-                for e in self.graph.edges
-                if e.target.structural_id == n.structural_id
-            ]
+            incoming = [e.source for e in self.graph.get_in_edges(n.structural_id)]
             for source in incoming:
                 if source not in visited:
                     visited.add(source)
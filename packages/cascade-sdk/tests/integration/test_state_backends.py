@@ -123,3 +123,18 @@ def test_run_with_redis_backend_raises_if_not_installed(monkeypatch):
 
     with pytest.raises(ImportError, match="The 'redis' library is required"):
         cs.run(workflow, state_backend="redis://localhost")
+
+
+def test_run_with_sqlite_backend_uri(tmp_path):
+    """
+    Tests that cs.run with a sqlite:/// URI stores the results in that database.
+    """
+    import sqlite3
+
+    db = tmp_path / "state.db"
+    result = cs.run(add(1, 2), state_backend=f"sqlite:///{db}")
+
+    assert result == 3
+    with sqlite3.connect(db) as conn:
+        (value,) = conn.execute("SELECT value FROM results").fetchone()
+    assert pickle.loads(value) == 3
@@ -58,6 +58,8 @@ class MappedLazyResult(Generic[T]):
     _cache_policy: Optional[Any] = None  # CachePolicy
     _constraints: Optional[Any] = None  # ResourceConstraint
     _dependencies: List[LazyResult] = field(default_factory=list)
+    _max_concurrency: Optional[int] = None  # Elements in flight at once
+    _stream: bool = False  # Resolve to an async iterator instead of a list
 
     def __hash__(self):
         return hash(self._uuid)
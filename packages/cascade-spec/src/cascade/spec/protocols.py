@@ -1,4 +1,14 @@
-from typing import Protocol, List, Any, Dict, Optional, Callable, Awaitable
+from typing import (
+    Protocol,
+    List,
+    Any,
+    Dict,
+    Optional,
+    Callable,
+    Awaitable,
+    Sequence,
+    Set,
+)
 from cascade.graph.model import Graph, Node
 
 # An execution plan is a list of stages, where each stage is a list of nodes
@@ -45,9 +55,35 @@ class CacheBackend(Protocol):
         ...
 
 
+class Serializer(Protocol):
+    """
+    Protocol for a format that turns results into bytes for remote state and
+    cache backends.
+    """
+
+    name: str
+    # One byte identifying the format in encoded payloads
+    tag: bytes
+
+    def dumps(self, obj: Any) -> List[Any]:
+        """
+        Serializes `obj` into a list of bytes-like chunks, to be concatenated
+        by the caller. Raises TypeError if the format can't represent `obj`.
+        """
+        ...
+
+    def loads(self, data: memoryview) -> Any:
+        """Deserializes a payload produced by `dumps`."""
+        ...
+
+
 class CachePolicy(Protocol):
     """
     Protocol for a caching strategy.
+
+    `inputs` maps argument names ("0", "1", ... for positional arguments) to the
+    task's resolved values. Policies with a true `code_versioned` attribute are
+    also passed the task's function, as `func=`.
     """
 
     async def check(self, task_id: str, inputs: Dict[str, Any]) -> Any:
@@ -90,6 +126,54 @@ class StateBackend(Protocol):
         """Retrieves the reason a task was skipped. Returns None if not skipped."""
         ...
 
+    # Batched operations are optional. The engine uses a backend's own versions
+    # when it has them (e.g. to pipeline round-trips), and these per-key
+    # fallbacks otherwise.
+
+    async def get_many(self, node_ids: Sequence[str]) -> Dict[str, Any]:
+        """Retrieves the results of several tasks; tasks without one are omitted."""
+        results = {}
+        for node_id in node_ids:
+            if await self.has_result(node_id):
+                results[node_id] = await self.get_result(node_id)
+        return results
+
+    async def has_many(self, node_ids: Sequence[str]) -> Set[str]:
+        """Returns the IDs, among `node_ids`, of the tasks that have a result."""
+        return {node_id for node_id in node_ids if await self.has_result(node_id)}
+
+    async def put_many(self, results: Dict[str, Any]) -> None:
+        """Stores the results of several completed tasks."""
+        for node_id, result in results.items():
+            await self.put_result(node_id, result)
+
+
+class DurationStore(Protocol):
+    """
+    Protocol for a store of observed task execution times (in seconds), used to
+    turn graphs into cost models for scheduling.
+    """
+
+    def record(
+        self, task_name: str, structural_id: Optional[str], duration: float
+    ) -> None:
+        """
+        Records one successful execution of a node, or only of its task if
+        `structural_id` is None.
+        """
+        ...
+
+    def estimate(self, node: Node) -> Optional[float]:
+        """
+        Returns the expected duration of a node, preferring its own history over
+        that of its task. Returns None if neither has been observed.
+        """
+        ...
+
+    def percentile(self, node: Node, q: float) -> Optional[float]:
+        """Returns the q-th percentile (0-100) of a node's recent durations."""
+        ...
+
 
 class SubscriptionHandle(Protocol):
     """
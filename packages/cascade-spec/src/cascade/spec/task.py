@@ -28,11 +28,15 @@ class Task(Generic[T]):
         name: Optional[str] = None,
         pure: bool = False,
         mode: str = "blocking",
+        batch: bool = False,
     ):
         self.func = func
         self.name = name or func.__name__
         self.pure = pure
         self.mode = mode
+        # A vectorised task: when mapped, it receives slices of the mapped
+        # inputs (one list per argument) and returns one result per element.
+        self.batch = batch
         self._signature = inspect.signature(func)
         self.is_async = inspect.iscoroutinefunction(func)
         # Cache for AST analysis results to verify TCO paths
@@ -62,13 +66,14 @@ def task(
     name: Optional[str] = None,
     pure: bool = False,
     mode: str = "blocking",
+    batch: bool = False,
 ) -> Union[Task[T], Callable[[Callable[..., T]], Task[T]]]:
     """
     Decorator to convert a function into a Task.
     """
 
     def wrapper(f: Callable[..., T]) -> Task[T]:
-        return Task(f, name=name, pure=pure, mode=mode)
+        return Task(f, name=name, pure=pure, mode=mode, batch=batch)
 
     if func:
         return wrapper(func)
@@ -141,8 +146,34 @@ def _mapped_after(
     return self
 
 
+def _mapped_with_concurrency(
+    self: MappedLazyResult, max_concurrency: int
+) -> MappedLazyResult:
+    """
+    Limits how many elements are processed at once. Elements are started in
+    order as earlier ones finish, so only `max_concurrency` are in memory.
+    """
+    if not isinstance(max_concurrency, int) or max_concurrency < 1:
+        raise ValueError("max_concurrency must be a positive integer.")
+    self._max_concurrency = max_concurrency
+    return self
+
+
+def _mapped_as_stream(self: MappedLazyResult) -> MappedLazyResult:
+    """
+    Resolves the map to an async iterator over its results (in input order)
+    instead of a list. Elements are processed as the consumer iterates, with at
+    most `max_concurrency` in flight, so huge maps run in constant memory.
+    The iterator must be consumed by an async downstream task of the same run.
+    """
+    self._stream = True
+    return self
+
+
 MappedLazyResult.run_if = _mapped_run_if
 MappedLazyResult.after = _mapped_after
 MappedLazyResult.with_retry = _with_retry
 MappedLazyResult.with_cache = _with_cache
 MappedLazyResult.with_constraints = _with_constraints
+MappedLazyResult.with_concurrency = _mapped_with_concurrency
+MappedLazyResult.as_stream = _mapped_as_stream
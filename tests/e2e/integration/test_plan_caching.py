@@ -4,6 +4,8 @@ from cascade import task, Engine
 from cascade.adapters.executors.local import LocalExecutor
 from cascade.adapters.solvers.native import NativeSolver
 from cascade.runtime.bus import MessageBus
+from cascade.graph.registry import NodeRegistry
+from cascade.runtime.plan_cache import PlanCache
 from cascade.testing import SpySolver
 
 
@@ -54,3 +56,61 @@ async def test_engine_reuses_plan_for_structurally_identical_graphs(
 
     # Assert that the expensive solver was only called once
     mock_resolve.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_engine_node_registry_stays_bounded_across_runs():
+    """
+    Impure tasks are salted per instance, so every run interns brand-new nodes.
+    A generation-swept registry must not grow with the number of runs.
+    """
+    registry = NodeRegistry(max_generations=1)
+    engine = Engine(
+        solver=NativeSolver(),
+        executor=LocalExecutor(),
+        bus=MessageBus(),
+        node_registry=registry,
+    )
+
+    sizes = []
+    for i in range(5):
+        assert await engine.run(add(add(i, 1), 1)) == i + 2
+        sizes.append(len(registry))
+
+    # Only the current and previous runs' nodes are retained
+    assert max(sizes) <= 4
+    assert registry.evictions > 0
+
+
+@pytest.mark.asyncio
+async def test_engine_warm_starts_plans_from_disk(tmp_path):
+    """
+    A new engine pointed at an existing plan store must not call the solver
+    for topologies a previous engine has already solved.
+    """
+    path = str(tmp_path / "plans.sqlite")
+
+    first_solver = SpySolver(NativeSolver())
+    first_engine = Engine(
+        solver=first_solver,
+        executor=LocalExecutor(),
+        bus=MessageBus(),
+        plan_cache=PlanCache(path=path),
+    )
+    assert await first_engine.run(add(1, 2)) == 3
+    first_solver.resolve.assert_called_once()
+    first_engine.graph_strategy.plan_cache.close()
+
+    second_solver = SpySolver(NativeSolver())
+    second_engine = Engine(
+        solver=second_solver,
+        executor=LocalExecutor(),
+        bus=MessageBus(),
+        plan_cache=PlanCache(path=path),
+    )
+    assert await second_engine.run(add(5, 6)) == 11
+    second_solver.resolve.assert_not_called()
+
+    stats = second_engine.get_cache_stats()["plan_cache"]
+    assert stats["disk_hits"] == 1
+    assert stats["hit_rate"] == 1.0